@@ -0,0 +1,152 @@
+"""
+Dashboard WebSocket Fan-out Load Test
+
+Serves the dashboard app with uvicorn on localhost, connects N websocket
+clients (a few of which never read, to simulate stalled browsers) and
+publishes bar/position/vote updates at a high rate plus a trickle of
+trades. Compares the legacy path (a task per update that awaits
+send_json serially for every client) with the coalesced, rate-limited
+ConnectionManager fan-out.
+
+Reports frames delivered per healthy client, end-to-end latency
+percentiles, dropped frames and evicted clients.
+
+Run with: python benchmarks/dashboard_websocket_load_test.py [n_clients] [seconds]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+import numpy as np
+import uvicorn
+from websockets.asyncio.client import connect
+
+from gnosis.dashboard import dashboard_server
+from gnosis.dashboard.dashboard_server import ConnectionManager, app
+
+UPDATE_HZ = 500  # bar/positions/agent_votes updates per second
+TRADE_HZ = 5
+N_STALLED = 5
+# ~2KB payload, roughly a positions snapshot for a couple dozen symbols
+PAYLOAD = {f"SYM{i:02d}": {"qty": 100, "entry": 101.25, "pnl": -12.5} for i in range(24)}
+
+
+async def healthy_client(url: str, latencies: list, counts: list, index: int):
+    async with connect(url, max_queue=None) as ws:
+        async for frame in ws:
+            if not frame.startswith("{"):
+                continue
+            message = json.loads(frame)
+            sent = (message.get("data") or {}).get("sent")
+            if sent is not None:
+                latencies.append(time.perf_counter() - sent)
+                counts[index] += 1
+
+
+async def stalled_client(url: str, stop: asyncio.Event):
+    # Stops reading after the handshake; TCP buffers fill, sends stall
+    async with connect(url, max_queue=1) as ws:
+        ws.transport.pause_reading()
+        await stop.wait()
+
+
+async def legacy_broadcast(message: dict):
+    """The pre-coalescing fan-out: serial send_json, errors swallowed"""
+    for connection in dashboard_server.manager.active_connections:
+        try:
+            await connection.send_json(message)
+        except Exception:
+            pass
+
+
+async def produce(seconds: float, legacy: bool) -> int:
+    published = 0
+    kinds = ["bar", "positions", "agent_votes"]
+    trade_every = UPDATE_HZ // TRADE_HZ
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(10):
+            kind = kinds[published % len(kinds)]
+            if published % trade_every == 0:
+                kind = "trade"
+            data = {"seq": published, "sent": time.perf_counter(), "payload": PAYLOAD}
+            if legacy:
+                asyncio.create_task(legacy_broadcast({"type": kind, "data": data}))
+            else:
+                dashboard_server.manager.publish(kind, data)
+            published += 1
+        await asyncio.sleep(10 / UPDATE_HZ)
+    return published
+
+
+async def run(n_clients: int, seconds: float, legacy: bool) -> dict:
+    manager = dashboard_server.manager = ConnectionManager()
+    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="error")
+    server = uvicorn.Server(config)
+    serve = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    url = f"ws://127.0.0.1:{port}/ws"
+
+    latencies: list = []
+    counts = [0] * n_clients
+    stop = asyncio.Event()
+    clients = [
+        asyncio.create_task(healthy_client(url, latencies, counts, i)) for i in range(n_clients)
+    ]
+    clients += [asyncio.create_task(stalled_client(url, stop)) for _ in range(N_STALLED)]
+    while len(manager.clients) < n_clients + N_STALLED:
+        await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    published = await produce(seconds, legacy)
+    await asyncio.sleep(1.0)  # drain
+    elapsed = time.perf_counter() - started
+    stats = manager.stats()
+
+    stop.set()
+    for task in clients:
+        task.cancel()
+    await asyncio.gather(*clients, return_exceptions=True)
+    manager.close()
+    server.should_exit = True
+    await serve
+    for task in asyncio.all_tasks() - {asyncio.current_task()}:
+        task.cancel()
+
+    lat_ms = np.asarray(latencies) * 1000.0 if latencies else np.zeros(1)
+    return {
+        "published": published,
+        "frames_per_client": float(np.mean(counts)),
+        "p50_ms": float(np.percentile(lat_ms, 50)),
+        "p99_ms": float(np.percentile(lat_ms, 99)),
+        "max_ms": float(lat_ms.max()),
+        "elapsed_s": elapsed,
+        **stats,
+    }
+
+
+def main():
+    n_clients = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    print(f"\n{n_clients} clients (+{N_STALLED} stalled), {UPDATE_HZ} updates/s for {seconds:.0f}s")
+    print("=" * 80)
+    for name, legacy in [("legacy serial broadcast", True), ("coalesced fan-out", False)]:
+        result = asyncio.run(run(n_clients, seconds, legacy))
+        print(f"\n{name}")
+        print(f"  published updates    {result['published']}")
+        print(f"  frames / client      {result['frames_per_client']:.0f}")
+        print(
+            f"  latency p50/p99/max  {result['p50_ms']:.1f} / {result['p99_ms']:.1f} / "
+            f"{result['max_ms']:.1f} ms"
+        )
+        print(f"  dropped / evicted    {result['dropped_frames']} / {result['evicted']}")
+        print(f"  wall time            {result['elapsed_s']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Out-of-Core Dataset Building Benchmark
+
+Writes a partitioned Parquet dataset (default 20 partitions x 100,000 rows
+x 40 features), then builds the training dataset twice, each in a fresh
+subprocess so peak RSS is measured independently:
+
+1. In memory: concatenate every partition and call DatasetBuilder.build_dataset
+2. Out of core: DatasetBuilder.build_dataset_from_parquet -> float32 memmaps
+
+Run with: python benchmarks/dataset_parquet_benchmark.py [n_partitions] [rows_per_partition]
+"""
+
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+N_FEATURES = 40
+
+
+def write_partitions(root: Path, n_partitions: int, rows: int):
+    rng = np.random.default_rng(0)
+    for i in range(n_partitions):
+        columns = {f"feat_{j}": rng.normal(size=rows) for j in range(N_FEATURES)}
+        columns.update({
+            "hedge_movement_energy": rng.uniform(0.1, 2.0, size=rows),
+            "direction_5": rng.choice([-1, 1], size=rows).astype(np.int32),
+            "magnitude_5": rng.integers(0, 3, size=rows).astype(np.int32),
+            "volatility_5": rng.uniform(size=rows),
+        })
+        part_dir = root / f"date={i:04d}"
+        part_dir.mkdir(parents=True)
+        pl.DataFrame(columns).write_parquet(part_dir / "data.parquet")
+
+
+def run_mode(mode: str, source: str, output_dir: str):
+    """Build the dataset in this (fresh) process and report time and peak RSS."""
+    from ml.dataset.builder import DatasetBuilder
+
+    builder = DatasetBuilder()
+    start = time.perf_counter()
+
+    if mode == "memory":
+        df = pl.concat([pl.read_parquet(path) for path in sorted(Path(source).rglob("*.parquet"))])
+        dataset = builder.build_dataset(df, horizon=5)
+    else:
+        dataset = builder.build_dataset_from_parquet(source, output_dir, horizon=5)
+        float(dataset.X[:, 0].sum())  # touch a column through the memmap
+
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode},{dataset.n_samples},{elapsed:.2f},{peak_mb:.0f}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        run_mode(*sys.argv[2:5])
+        return
+
+    n_partitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    print(f"\n🔄 Writing {n_partitions} partitions x {rows:,} rows x {N_FEATURES} features...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "bars"
+        write_partitions(source, n_partitions, rows)
+
+        print(f"{'Mode':<14} {'Samples':>12} {'Time':>10} {'Peak RSS':>12}")
+        for mode in ("memory", "out_of_core"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--run", mode, str(source), str(Path(tmp) / mode)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            _, n_samples, elapsed, peak_mb = out.split(",")
+            print(f"{mode:<14} {int(n_samples):>12,} {float(elapsed):>9.2f}s {float(peak_mb):>9.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
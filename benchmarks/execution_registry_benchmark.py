@@ -0,0 +1,78 @@
+"""
+Execution Registry Write Throughput Benchmark
+
+Creates N orders and walks each through submitted -> retry -> filled,
+with the default per-update DuckDB commits and in write-behind mode
+(WAL append + batched flushes), with and without WAL fsync.
+
+Run with: python benchmarks/execution_registry_benchmark.py [n_orders]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark_suite import BenchmarkSuite
+
+from agents.portfolio.schemas import OrderAction, OrderInstruction
+from agents.trade_agent.schemas import StrategyType
+from execution.registry import ExecutionRegistry, generate_idempotency_key
+from execution.schemas import OrderEnvelope, OrderStatus
+
+UPDATES_PER_ORDER = 4  # create, submitted, retry, filled
+
+
+def make_envelopes(n_orders: int) -> list[OrderEnvelope]:
+    envelopes = []
+    for i in range(n_orders):
+        instruction = OrderInstruction(
+            action=OrderAction.OPEN,
+            asset=f"S{i:05d}",
+            strategy_type=StrategyType.STOCK,
+            size_delta=1,
+            notional_risk=100.0,
+            reason="benchmark",
+        )
+        envelopes.append(OrderEnvelope(
+            idempotency_key=generate_idempotency_key(instruction),
+            instruction=instruction,
+            limit_price=10.0,
+        ))
+    return envelopes
+
+
+def order_flow(envelopes: list[OrderEnvelope], **registry_kwargs):
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = ExecutionRegistry(Path(tmp) / "registry.db", **registry_kwargs)
+        for envelope in envelopes:
+            registry.create_envelope(envelope)
+            registry.update_status(envelope.order_id, OrderStatus.SUBMITTED, broker_order_id="B")
+            registry.increment_retry(envelope.order_id)
+            registry.update_status(
+                envelope.order_id, OrderStatus.FILLED, fill_price=10.0, filled_quantity=1
+            )
+        registry.close()
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    envelopes = make_envelopes(n_orders)
+    updates = n_orders * UPDATES_PER_ORDER
+
+    print(f"\n🔄 {n_orders} orders x {UPDATES_PER_ORDER} registry writes...")
+    suite = BenchmarkSuite(iterations=3)
+    suite.benchmark("Per-update DuckDB commits", order_flow, envelopes)
+    suite.benchmark("Write-behind (WAL fsync)", order_flow, envelopes, write_behind=True)
+    suite.benchmark(
+        "Write-behind (no fsync)", order_flow, envelopes, write_behind=True, wal_fsync=False
+    )
+
+    baseline = suite.results[0].mean_time_ms
+    for result in suite.results:
+        print(f"{result.name:<28} {result.mean_time_ms:>10.1f}ms "
+              f"({updates / result.mean_time_ms * 1000:>8.0f} writes/s, "
+              f"{baseline / result.mean_time_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Hedge Engine Full vs Incremental Recompute Benchmark
+
+Replays intraday ticks of a 20k-contract chain (500 strikes x 20 expiries
+x call/put) in which 2% of contracts change OI and Greeks per tick and
+spot moves every tick, through HedgeEngineV3:
+
+- full: the whole chain fetched and reduced on every run
+- incremental: per-strike aggregates updated from native chain deltas
+  (a feed that serves the changed contracts)
+- incremental + diff: deltas derived by SnapshotDeltaAdapter, which still
+  fetches and diffs the full chain
+
+Run with: python benchmarks/hedge_incremental_benchmark.py [n_ticks]
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import polars as pl
+from benchmark_suite import BenchmarkSuite
+
+from engines.hedge.hedge_engine_v3 import HedgeEngineV3
+from engines.inputs.options_chain_adapter import ChainDelta, SnapshotDeltaAdapter, chain_market
+
+N_STRIKES = 500
+N_EXPIRIES = 20
+CHANGED_SHARE = 0.02
+
+
+def make_chain(rng: np.random.Generator, spot: float = 500.0) -> pl.DataFrame:
+    strikes = np.repeat(spot + np.arange(N_STRIKES) - N_STRIKES / 2, N_EXPIRIES * 2)
+    n = len(strikes)
+    return pl.DataFrame({
+        "symbol": ["SPY"] * n,
+        "strike": strikes,
+        "expiry": np.tile(np.repeat(np.arange(N_EXPIRIES), 2), N_STRIKES),
+        "option_type": np.tile(["C", "P"], N_STRIKES * N_EXPIRIES),
+        "gamma": rng.uniform(0.0, 0.05, n),
+        "vanna": rng.normal(0.0, 0.02, n),
+        "charm": rng.normal(0.0, 0.01, n),
+        "open_interest": rng.integers(0, 20_000, n),
+        "days_to_expiry": np.tile(np.repeat(np.arange(1.0, N_EXPIRIES + 1) * 7, 2), N_STRIKES),
+        "underlying_price": np.full(n, spot),
+        "vix": np.full(n, 18.0),
+    })
+
+
+def make_ticks(n_ticks: int, seed: int = 7):
+    """Chains per tick and the native delta (changed contracts) of each."""
+    rng = np.random.default_rng(seed)
+    chain = make_chain(rng)
+    chains, deltas = [chain], [None]
+    for _ in range(1, n_ticks):
+        n = chain.height
+        changed = pl.Series(rng.random(n) < CHANGED_SHARE)
+        spot = float(chain["underlying_price"][0]) + float(rng.normal(0.0, 0.5))
+        chain = chain.with_columns(
+            *(
+                pl.when(changed).then(pl.Series(values)).otherwise(pl.col(name)).alias(name)
+                for name, values in (
+                    ("gamma", rng.uniform(0.0, 0.05, n)),
+                    ("vanna", rng.normal(0.0, 0.02, n)),
+                    ("charm", rng.normal(0.0, 0.01, n)),
+                    ("open_interest", rng.integers(0, 20_000, n)),
+                )
+            ),
+            pl.lit(spot).alias("underlying_price"),
+        )
+        chains.append(chain)
+        deltas.append(ChainDelta(
+            upserts=chain.filter(changed),
+            removed=chain.clear().select("strike", "expiry", "option_type"),
+            market=chain_market(chain),
+        ))
+    return chains, deltas
+
+
+class ReplayAdapter:
+    """Serves the chain (or native delta) of the current tick."""
+
+    def __init__(self, chains: list, deltas: list):
+        self.chains = chains
+        self.deltas = deltas
+        self.tick = 0
+
+    def fetch_chain(self, symbol: str, now: datetime) -> pl.DataFrame:
+        return self.chains[self.tick]
+
+    def fetch_chain_delta(self, symbol: str, now: datetime, full: bool = False) -> ChainDelta:
+        chain = self.chains[self.tick]
+        if full or self.deltas[self.tick] is None:
+            return ChainDelta(upserts=chain, removed=pl.DataFrame(), market=chain_market(chain), snapshot=True)
+        return self.deltas[self.tick]
+
+
+def replay(engine: HedgeEngineV3, source: ReplayAdapter, now: datetime, diff: SnapshotDeltaAdapter = None):
+    """Run the engine on ticks 1..n (tick 0 primes incremental state)."""
+    if diff is not None:
+        diff._snapshots["SPY"] = source.chains[0]
+    for tick in range(1, len(source.chains)):
+        source.tick = tick
+        engine.run("SPY", now)
+
+
+def main():
+    n_ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    chains, deltas = make_ticks(n_ticks)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    ticks = n_ticks - 1
+
+    source = ReplayAdapter(chains, deltas)
+    full = HedgeEngineV3(source, {"incremental": False})
+    incremental = HedgeEngineV3(source, {})
+    diff = SnapshotDeltaAdapter(ReplayAdapter(chains, deltas))
+    incremental_diff = HedgeEngineV3(diff, {})
+    incremental.run("SPY", now)  # Tick 0: snapshot
+    incremental_diff.run("SPY", now)
+
+    print(f"\n🛡️  HedgeEngineV3 over {ticks} ticks of a {chains[0].height:,}-contract chain "
+          f"({CHANGED_SHARE:.0%} of contracts changing per tick)...")
+    suite = BenchmarkSuite(iterations=3)
+    results = [
+        suite.benchmark("Full recompute", replay, full, source, now),
+        suite.benchmark("Incremental (native deltas)", replay, incremental, source, now),
+        suite.benchmark("Incremental (snapshot diff)", replay, incremental_diff, diff.adapter, now, diff),
+    ]
+
+    baseline = results[0].mean_time_ms
+    print(f"\n{'Mode':<30} {'Per tick':>10} {'Speedup':>9}")
+    for result in results:
+        print(f"{result.name:<30} {result.mean_time_ms / ticks:>8.2f}ms {baseline / result.mean_time_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Liquidity Engine Per-Symbol Latency Benchmark
+
+Runs LiquidityEngineV1 over a universe of symbols with in-memory
+100-bar OHLCV windows, so the timing is the eight processors plus
+fusion, not data fetching.
+
+Run with: python benchmarks/liquidity_engine_benchmark.py [n_symbols]
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+from benchmark_suite import BenchmarkSuite
+
+from engines.liquidity.liquidity_engine_v1 import LiquidityEngineV1
+
+LOOKBACK = 100
+
+
+class InMemoryAdapter:
+    """Serves pre-generated random-walk bars."""
+
+    def __init__(self, n_symbols: int, n_bars: int = LOOKBACK, seed: int = 7):
+        rng = np.random.default_rng(seed)
+        now = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        timestamps = [now - timedelta(minutes=n_bars - i) for i in range(n_bars)]
+        self.frames = {}
+        for s in range(n_symbols):
+            close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.002, n_bars)))
+            spread = np.abs(rng.normal(0, 0.1, n_bars)) + 0.01
+            self.frames[f"S{s:03d}"] = pl.DataFrame({
+                "timestamp": timestamps,
+                "open": np.roll(close, 1),
+                "high": close + spread,
+                "low": close - spread,
+                "close": close,
+                "volume": rng.integers(1_000, 50_000, n_bars).astype(float),
+            })
+
+    def fetch_ohlcv(self, symbol: str, lookback: int, now: datetime) -> pl.DataFrame:
+        return self.frames[symbol]
+
+
+def run_universe(engine: LiquidityEngineV1, symbols: list, now: datetime):
+    for symbol in symbols:
+        engine.run(symbol, now)
+
+
+def main():
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    adapter = InMemoryAdapter(n_symbols)
+    engine = LiquidityEngineV1(adapter, {"lookback_bars": LOOKBACK})
+    symbols = list(adapter.frames)
+    now = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+    print(f"\n💧 LiquidityEngineV1.run over {n_symbols} symbols ({LOOKBACK} bars each)...")
+    suite = BenchmarkSuite(iterations=5)
+    run_universe(engine, symbols, now)  # warm-up
+    result = suite.benchmark("Liquidity pipeline (universe)", run_universe, engine, symbols, now)
+
+    per_symbol_us = result.mean_time_ms / n_symbols * 1000
+    print(f"{'Universe':<20} {result.mean_time_ms:>10.1f}ms")
+    print(f"{'Per symbol':<20} {per_symbol_us:>10.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
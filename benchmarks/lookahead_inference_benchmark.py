@@ -0,0 +1,79 @@
+"""
+LookaheadTransformer Inference Latency Benchmark
+
+Scores B symbols per tick (B = 1, 16, 128, 512) with one predict call per
+symbol and with a single predict_batch call, for each available inference
+backend (eager, TorchScript, torch.compile, ONNX Runtime), on CPU with
+pinned intra-op threads.
+
+Run with: python benchmarks/lookahead_inference_benchmark.py [threads]
+"""
+
+import sys
+import tempfile
+
+import numpy as np
+from benchmark_suite import BenchmarkSuite
+
+from models.lookahead_transformer import FEATURE_DEFAULTS, ONNX_AVAILABLE, LookaheadTransformer
+
+BATCH_SIZES = (1, 16, 128, 512)
+SEQUENCE_LENGTH = 20
+
+
+def make_histories(rng: np.random.Generator, n_symbols: int) -> dict:
+    keys = [key for key, _ in FEATURE_DEFAULTS]
+    return {
+        f"S{i:03d}": [
+            dict(zip(keys, rng.normal(size=len(keys)).tolist())) for _ in range(SEQUENCE_LENGTH)
+        ]
+        for i in range(n_symbols)
+    }
+
+
+def build_model(backend: str, threads: int) -> LookaheadTransformer:
+    model = LookaheadTransformer(
+        sequence_length=SEQUENCE_LENGTH,
+        weights_dir=tempfile.mkdtemp(),
+        buffer_size=8,
+        inference_backend=backend,
+        inference_threads=threads,
+        pin_torch_threads=True,
+    )
+    model._swap_inference_model(model.model.state_dict())
+    return model
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    rng = np.random.default_rng(0)
+    suite = BenchmarkSuite(iterations=20)
+
+    backends = ["eager", "torchscript", "compile"] + (["onnx"] if ONNX_AVAILABLE else [])
+    print(f"\n🔄 Lookahead inference, seq_len={SEQUENCE_LENGTH}, {threads} intra-op thread(s)...")
+    print(f"{'backend':<12} {'batch':>5} {'per-symbol':>12} {'batched':>10} "
+          f"{'µs/symbol':>10} {'speedup':>8}")
+
+    for backend in backends:
+        model = build_model(backend, threads)
+        for batch_size in BATCH_SIZES:
+            histories = make_histories(rng, batch_size)
+            model.predict_batch(histories)  # warm-up (compile, allocator)
+
+            def per_symbol():
+                return [model.predict(history) for history in histories.values()]
+
+            loop_result = suite.benchmark(f"{backend} per-symbol B={batch_size}", per_symbol)
+            batch_result = suite.benchmark(
+                f"{backend} batched B={batch_size}", model.predict_batch, histories
+            )
+
+            print(f"{backend:<12} {batch_size:>5} {loop_result.median_time_ms:>10.2f}ms "
+                  f"{batch_result.median_time_ms:>8.2f}ms "
+                  f"{batch_result.median_time_ms * 1000 / batch_size:>10.1f} "
+                  f"{loop_result.median_time_ms / batch_result.median_time_ms:>7.1f}x")
+        model.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Episode Memory Store Benchmark
+
+Populates a typed (v2) EpisodeStore with synthetic episodes directly in
+DuckDB and times the analytics paths that must stay inside the database:
+summary stats, per-agent vote stats and the Arrow -> Polars bulk fetch.
+
+Run with: python benchmarks/memory_store_benchmark.py [n_episodes]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark_suite import BenchmarkSuite
+
+from gnosis.memory.store import EpisodeStore
+
+
+def populate(store: EpisodeStore, n_episodes: int):
+    """Insert n synthetic closed episodes with three agent votes each."""
+    store.conn.execute(f"""
+        INSERT INTO episodes (
+            episode_id, symbol, t_open, t_close, price_open, price_close,
+            decision, decision_confidence, position_size, consensus_logic,
+            pnl, return_pct, duration_bars, hit_target, exit_reason, regime_label,
+            hedge_gamma, liq_amihud, sent_momentum, sent_volume_delta,
+            features, agent_views, similar_episodes, retrieval_score
+        )
+        SELECT
+            'ep-' || i::VARCHAR,
+            ['SPY', 'QQQ', 'IWM', 'AAPL', 'NVDA'][1 + i % 5],
+            TIMESTAMP '2024-01-01' + to_minutes(i::BIGINT),
+            TIMESTAMP '2024-01-01' + to_minutes(i::BIGINT + 30),
+            100.0,
+            100.0 + (random() - 0.5) * 4,
+            CASE WHEN i % 2 = 0 THEN 1 ELSE -1 END,
+            random(),
+            0.1,
+            'benchmark',
+            (random() - 0.5) * 2,
+            (random() - 0.5) * 0.04,
+            30,
+            random() > 0.6,
+            ['TP', 'SL', 'time_stop'][1 + i % 3],
+            ['trending_up', 'trending_down', 'ranging'][1 + i % 3],
+            random() * 2 - 1,
+            random() * 0.05,
+            random() * 2 - 1,
+            random() * 2 - 1,
+            MAP {{'hedge_gamma': random(), 'liq_amihud': random()}},
+            [
+                {{'agent_name': 'hedge', 'signal': (i % 3) - 1, 'confidence': random(),
+                  'reasoning': '', 'key_features': '{{}}'}},
+                {{'agent_name': 'liquidity', 'signal': ((i + 1) % 3) - 1, 'confidence': random(),
+                  'reasoning': '', 'key_features': '{{}}'}},
+                {{'agent_name': 'sentiment', 'signal': ((i + 2) % 3) - 1, 'confidence': random(),
+                  'reasoning': '', 'key_features': '{{}}'}}
+            ],
+            [],
+            0.0
+        FROM range({n_episodes}) t(i)
+    """)
+
+
+def main():
+    n_episodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"\n🔄 Populating episode store with {n_episodes:,} episodes...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EpisodeStore(str(Path(tmp) / "episodes.duckdb"))
+        populate(store, n_episodes)
+
+        suite = BenchmarkSuite(iterations=5)
+        suite.benchmark("Memory stats (all symbols)", store.get_stats)
+        suite.benchmark("Memory stats (one symbol)", store.get_stats, "SPY")
+        suite.benchmark("Memory agent vote stats", store.get_agent_stats)
+        suite.benchmark(
+            "Memory data fetch (hot columns -> Polars)",
+            store.fetch_frame,
+            columns=["symbol", "pnl", "regime_label", "hedge_gamma", "liq_amihud"],
+        )
+        suite.benchmark("Memory read_recent (100 episodes)", store.read_recent)
+
+        for result in suite.results:
+            print(f"{result.name:<45} {result.mean_time_ms:>10.2f}ms "
+                  f"(min {result.min_time_ms:.2f}ms)")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
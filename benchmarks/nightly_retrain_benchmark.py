@@ -0,0 +1,96 @@
+"""
+Nightly Retrain Benchmark
+
+Retrains direction/magnitude/volatility models for a synthetic universe
+(default 100 symbols x 4 horizons):
+
+1. Per horizon: fresh lgb.Dataset per task vs one binned Dataset shared
+   by all three tasks (LightGBMTrainer.train_multi_task)
+2. Whole universe: one process vs a process pool sharing a global
+   LightGBM thread budget (MLTrainingOrchestrator.train_universe)
+
+Run with: python benchmarks/nightly_retrain_benchmark.py [n_symbols] [n_bars]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+from benchmark_suite import BenchmarkSuite
+
+from ml.labels.generator import LabelConfig
+from ml.train import MLTrainingOrchestrator
+from ml.trainer.lightgbm_trainer import LightGBMConfig
+
+HORIZONS = [5, 15, 30, 60]
+
+
+def make_bars(n_bars: int, seed: int) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(scale=0.002, size=n_bars)))
+    open_ = close * (1 + rng.normal(scale=0.0005, size=n_bars))
+    start = datetime(2024, 1, 2, 9, 30)
+    return pl.DataFrame({
+        "timestamp": [start + timedelta(minutes=i) for i in range(n_bars)],
+        "open": open_,
+        "high": np.maximum(open_, close) * (1 + rng.uniform(0, 0.001, size=n_bars)),
+        "low": np.minimum(open_, close) * (1 - rng.uniform(0, 0.001, size=n_bars)),
+        "close": close,
+        "volume": rng.uniform(1e4, 1e5, size=n_bars),
+    })
+
+
+def train_tasks_separately(trainer, train, valid):
+    """Pre-shared-dataset path: every task bins its own lgb.Dataset."""
+    trainer.train_direction_model(train, valid, "BENCH", 5)
+    trainer.train_magnitude_model(train, valid, "BENCH", 5)
+    trainer.train_volatility_model(train, valid, "BENCH", 5)
+
+
+def main():
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    total_threads = os.cpu_count() or 1
+
+    print(f"\n🔄 Nightly retrain: {n_symbols} symbols x {len(HORIZONS)} horizons, "
+          f"{n_bars:,} bars each, {total_threads} threads")
+
+    data = {f"SYM{i:03d}": make_bars(n_bars, i) for i in range(n_symbols)}
+    suite = BenchmarkSuite(iterations=1)
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        orchestrator = MLTrainingOrchestrator(
+            label_config=LabelConfig(horizons=HORIZONS),
+            lgbm_config=LightGBMConfig(),
+            models_dir=models_dir,
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            df_ml = orchestrator._build_ml_frame(data["SYM000"], "SYM000")
+            dataset = orchestrator.dataset_builder.build_dataset(df_ml, horizon=HORIZONS[0])
+            train, valid, _ = orchestrator.dataset_builder.temporal_split(dataset)
+
+            trainer = orchestrator.trainer
+            suite.benchmark("One horizon, Dataset per task", train_tasks_separately, trainer, train, valid)
+            suite.benchmark("One horizon, shared Dataset", trainer.train_multi_task, train, valid, "BENCH", 5)
+
+            suite.benchmark(
+                "Universe, 1 process",
+                orchestrator.train_universe, data, HORIZONS, max_workers=1, total_threads=total_threads,
+            )
+            suite.benchmark(
+                f"Universe, {total_threads} processes",
+                orchestrator.train_universe, data, HORIZONS, total_threads=total_threads,
+            )
+
+    for result in suite.results:
+        print(f"{result.name:<40} {result.mean_time_ms / 1000:>10.2f}s")
+
+
+if __name__ == "__main__":
+    main()
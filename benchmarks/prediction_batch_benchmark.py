@@ -0,0 +1,78 @@
+"""
+Batched vs Per-Row Prediction Benchmark
+
+Scores a universe scan (one feature row per symbol) with
+Predictor.predict (one call per symbol) and Predictor.predict_batch
+(one call per cycle), for a shared universe model and for per-sector
+models.
+
+Run with: python benchmarks/prediction_batch_benchmark.py
+"""
+
+import lightgbm as lgb
+import numpy as np
+from benchmark_suite import BenchmarkSuite
+
+from ml.prediction.predictor import Predictor
+
+N_FEATURES = 100
+N_SYMBOLS = 500
+
+
+def train_model_set(rng: np.random.Generator) -> dict:
+    X = rng.normal(size=(2000, N_FEATURES))
+    params = {"num_leaves": 31, "verbose": -1}
+    return {
+        "direction": lgb.train(
+            {**params, "objective": "binary"},
+            lgb.Dataset(X, label=(X[:, 0] > 0).astype(int)),
+            num_boost_round=100,
+        ),
+        "magnitude": lgb.train(
+            {**params, "objective": "multiclass", "num_class": 3},
+            lgb.Dataset(X, label=np.digitize(X[:, 1], [-0.5, 0.5])),
+            num_boost_round=100,
+        ),
+        "volatility": lgb.train(
+            {**params, "objective": "regression"},
+            lgb.Dataset(X, label=np.abs(X[:, 2])),
+            num_boost_round=100,
+        ),
+    }
+
+
+def main():
+    rng = np.random.default_rng(0)
+    predictor = Predictor()
+    suite = BenchmarkSuite(iterations=5)
+
+    X = rng.normal(size=(N_SYMBOLS, N_FEATURES))
+    energy = list(rng.uniform(0, 100, size=N_SYMBOLS))
+
+    sector_models = [train_model_set(rng) for _ in range(10)]
+    scenarios = {
+        "shared model": [sector_models[0]] * N_SYMBOLS,
+        "10 sector models": [sector_models[i % 10] for i in range(N_SYMBOLS)],
+    }
+
+    print(f"\n🔄 Scoring {N_SYMBOLS} symbols x {N_FEATURES} features per cycle...")
+
+    for label, row_models in scenarios.items():
+        def per_row():
+            return [predictor.predict(row_models[i], X[i], energy[i]) for i in range(N_SYMBOLS)]
+
+        def batched():
+            return predictor.predict_batch(row_models, X, energy)
+
+        row_result = suite.benchmark(f"Per-row predict ({label})", per_row)
+        batch_result = suite.benchmark(f"Batch predict ({label})", batched)
+
+        print(f"{label:<18} per-row {row_result.mean_time_ms:>9.2f}ms "
+              f"({N_SYMBOLS / row_result.mean_time_ms * 1000:>8.0f} rows/s)  "
+              f"batched {batch_result.mean_time_ms:>8.2f}ms "
+              f"({N_SYMBOLS / batch_result.mean_time_ms * 1000:>8.0f} rows/s)  "
+              f"speedup {row_result.mean_time_ms / batch_result.mean_time_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
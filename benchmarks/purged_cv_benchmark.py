@@ -0,0 +1,67 @@
+"""
+Sample Uniqueness & Purged CV Benchmark
+
+Times the O(n log n) uniqueness weights (window-overlap and López de Prado
+average uniqueness) and PurgedKFold splits with bar- and time-based
+purging on synthetic minute datasets.
+
+Run with: python benchmarks/purged_cv_benchmark.py [n_samples ...]
+"""
+
+import sys
+
+import numpy as np
+from benchmark_suite import BenchmarkSuite
+
+from ml.dataset.cv import (
+    PurgedKFold,
+    compute_average_uniqueness,
+    compute_sample_uniqueness,
+)
+
+
+def make_labels(n_samples: int, rng: np.random.Generator):
+    """Minute bars with variable-horizon (1-60 bar) labels."""
+    sample_times = np.datetime64("2018-01-02T09:30") + np.arange(n_samples) * np.timedelta64(1, "m")
+    label_end_times = sample_times + rng.integers(1, 61, size=n_samples) * np.timedelta64(1, "m")
+    return sample_times, label_end_times
+
+
+def consume(splits):
+    for train_idx, valid_idx in splits:
+        pass
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    rng = np.random.default_rng(42)
+    suite = BenchmarkSuite(iterations=3)
+
+    for n_samples in sizes:
+        print(f"\n🔄 Generating {n_samples:,} samples...")
+        sample_times, label_end_times = make_labels(n_samples, rng)
+        X = np.empty((n_samples, 0))
+        cv = PurgedKFold(n_splits=5, embargo_bars=60, purge_bars=60)
+        label = f"{n_samples / 1e6:g}M"
+
+        suite.benchmark(
+            f"Sample uniqueness ({label})",
+            compute_sample_uniqueness, sample_times, np.timedelta64(20, "m"),
+        )
+        suite.benchmark(
+            f"Average uniqueness ({label})",
+            compute_average_uniqueness, sample_times, label_end_times,
+        )
+        suite.benchmark(f"PurgedKFold bars ({label})", lambda: consume(cv.split(X)))
+        suite.benchmark(
+            f"PurgedKFold label times ({label})",
+            lambda: consume(cv.split(X, label_end_times=label_end_times, sample_times=sample_times)),
+        )
+
+    for result in suite.results:
+        print(f"{result.name:<40} {result.mean_time_ms:>10.2f}ms "
+              f"(min {result.min_time_ms:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
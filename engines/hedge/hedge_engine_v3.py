@@ -19,6 +19,13 @@ Processors:
     6. Movement Energy Calculator
     7. Regime Detector
     8. MTF Fusion Engine
+
+Incremental mode: when the adapter serves chain deltas (``fetch_chain_delta``),
+the engine keeps per-strike aggregates per symbol (StrikeAggregates) and
+applies only the changed contracts on each run; the processors read their
+sums from the aggregates instead of reducing the full chain. Chains that
+cannot be keyed per contract (no expiry/option_type columns, repeated
+keys) are reduced in full.
 """
 
 from datetime import datetime
@@ -28,6 +35,7 @@ import polars as pl
 
 from engines.base import Engine
 from engines.hedge.models import GreekInputs, HedgeEngineOutput
+from engines.hedge.strike_aggregates import StrikeAggregates
 from engines.hedge.processors import (
     build_charm_field,
     build_gamma_field,
@@ -38,7 +46,7 @@ from engines.hedge.processors import (
     estimate_dealer_sign,
     fuse_multi_timeframe,
 )
-from engines.inputs.options_chain_adapter import OptionsChainAdapter
+from engines.inputs.options_chain_adapter import OptionsChainAdapter, chain_market
 from schemas.core_schemas import EngineOutput
 
 
@@ -65,12 +73,15 @@ class HedgeEngineV3(Engine):
         
         Args:
             adapter: Options chain data adapter
-            config: Engine configuration parameters
+            config: Engine configuration parameters (``incremental: False``
+                disables delta mode for delta-capable adapters)
             liquidity_adapter: Optional liquidity engine adapter for friction
         """
         self.adapter = adapter
         self.config = config
         self.liquidity_adapter = liquidity_adapter
+        self.incremental = config.get("incremental", True) and hasattr(adapter, "fetch_chain_delta")
+        self.aggregates: Dict[str, StrikeAggregates] = {}
 
     def run(self, symbol: str, now: datetime) -> EngineOutput:
         """
@@ -86,27 +97,38 @@ class HedgeEngineV3(Engine):
         # ============================================================
         # FETCH RAW DATA
         # ============================================================
-        chain = self.adapter.fetch_chain(symbol, now)
+        aggregates = None
+        if self.incremental:
+            try:
+                aggregates, market, chain = self._apply_chain_delta(symbol, now)
+            except Exception as e:
+                self.aggregates.pop(symbol, None)  # Resync on the next run
+                return self._degraded_output(symbol, now, f"processor_error: {str(e)}")
+            has_data = len(aggregates) > 0 if aggregates is not None else not chain.is_empty()
+        else:
+            chain = self.adapter.fetch_chain(symbol, now)
+            market = chain_market(chain)
+            has_data = not chain.is_empty()
         
         # Degraded mode: no data
-        if chain.is_empty():
+        if not has_data:
             return self._degraded_output(symbol, now, "no_data")
         
         # Extract spot price
-        if "underlying_price" not in chain.columns:
+        if "underlying_price" not in market:
             return self._degraded_output(symbol, now, "missing_underlying_price")
         
-        spot = float(chain["underlying_price"][0])
+        spot = float(market["underlying_price"])
         
         # Extract VIX if available (for vol regime detection)
         vix = None
-        if "vix" in chain.columns:
-            vix = float(chain["vix"][0])
+        if "vix" in market:
+            vix = float(market["vix"])
         
         # Extract vol-of-vol if available
         vol_of_vol = 0.0
-        if "vol_of_vol" in chain.columns:
-            vol_of_vol = float(chain["vol_of_vol"][0])
+        if "vol_of_vol" in market:
+            vol_of_vol = float(market["vol_of_vol"])
         
         # Get liquidity lambda (Amihud) if available
         liquidity_lambda = 0.0
@@ -125,6 +147,7 @@ class HedgeEngineV3(Engine):
             vol_of_vol=vol_of_vol,
             liquidity_lambda=liquidity_lambda,
             timestamp=now.timestamp(),
+            aggregates=aggregates,
         )
         
         # ============================================================
@@ -186,6 +209,30 @@ class HedgeEngineV3(Engine):
             metadata=metadata,
         )
     
+    def _apply_chain_delta(self, symbol: str, now: datetime):
+        """
+        Fetch the chain delta for ``symbol`` and apply it to its aggregates.
+        
+        A chain that cannot be keyed per contract is returned whole, with no
+        aggregates, for a full recompute (and re-fetched in full next run).
+        
+        Returns:
+            (aggregates or None, chain-level market values, full chain or empty)
+        """
+        aggregates = self.aggregates.get(symbol)
+        delta = self.adapter.fetch_chain_delta(symbol, now, full=aggregates is None)
+        if not delta.snapshot and not StrikeAggregates.accepts(delta):
+            delta = self.adapter.fetch_chain_delta(symbol, now, full=True)
+        if not StrikeAggregates.accepts(delta):
+            self.aggregates.pop(symbol, None)
+            return None, delta.market, delta.upserts
+        
+        if aggregates is None:
+            aggregates = StrikeAggregates(pin_oi_threshold=self.config.get("pin_oi_threshold", 5000))
+            self.aggregates[symbol] = aggregates
+        aggregates.apply(delta)
+        return aggregates, delta.market, pl.DataFrame()
+    
     def _run_processors(self, inputs: GreekInputs) -> HedgeEngineOutput:
         """
         Run the full processor pipeline.
@@ -7,6 +7,8 @@ from typing import Dict, Optional
 import polars as pl
 from pydantic import BaseModel, ConfigDict, Field
 
+from engines.hedge.strike_aggregates import StrikeAggregates
+
 
 class GreekInputs(BaseModel):
     """Raw Greek data extracted from options chain."""
@@ -19,6 +21,16 @@ class GreekInputs(BaseModel):
     vol_of_vol: float = 0.0
     liquidity_lambda: float = 0.0
     timestamp: float
+    # Incremental mode: chain sums are read from here and ``chain`` is empty
+    aggregates: Optional[StrikeAggregates] = None
+
+    def chain_columns(self) -> set:
+        """Columns of the chain (or of the chain behind the aggregates)."""
+        return set(self.chain.columns) if self.aggregates is None else self.aggregates.columns
+
+    def chain_rows(self) -> int:
+        """Contracts in the chain (or in the aggregates)."""
+        return self.chain.height if self.aggregates is None else len(self.aggregates)
 
 
 class DealerSignOutput(BaseModel):
@@ -32,8 +32,10 @@ def build_charm_field(
     """
     chain = inputs.chain
     spot = inputs.spot
+    aggregates = inputs.aggregates
+    columns = inputs.chain_columns()
     
-    if chain.is_empty():
+    if not inputs.chain_rows():
         return CharmFieldOutput(
             charm_exposure=0.0,
             charm_drift_rate=0.0,
@@ -47,11 +49,12 @@ def build_charm_field(
     
     # Strike-weighted charm field
     decay_rate = config.get("strike_decay_rate", 0.05)
-    chain = chain.with_columns(
-        (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
-    )
+    if aggregates is None:
+        chain = chain.with_columns(
+            (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
+        )
     
-    if "charm" not in chain.columns or "open_interest" not in chain.columns:
+    if "charm" not in columns or "open_interest" not in columns:
         return CharmFieldOutput(
             charm_exposure=0.0,
             charm_drift_rate=0.0,
@@ -60,12 +63,14 @@ def build_charm_field(
             decay_acceleration=0.0,
         )
     
-    chain = chain.with_columns(
-        (pl.col("charm") * pl.col("open_interest") * pl.col("strike_weight")).alias("weighted_charm")
-    )
-    
     # Time decay pressure (aggregate charm effect)
-    time_decay_pressure = float(chain["weighted_charm"].sum())
+    if aggregates is not None:
+        time_decay_pressure = sum(aggregates.weighted_split("charm_oi", spot, decay_rate))
+    else:
+        chain = chain.with_columns(
+            (pl.col("charm") * pl.col("open_interest") * pl.col("strike_weight")).alias("weighted_charm")
+        )
+        time_decay_pressure = float(chain["weighted_charm"].sum())
     
     # Charm drift rate: how fast is dealer delta changing due to time?
     # This is essentially charm exposure normalized by time
@@ -74,8 +79,8 @@ def build_charm_field(
     
     # Decay acceleration: if near expiration, charm accelerates
     # Check if we have days_to_expiry column
-    if "days_to_expiry" in chain.columns:
-        avg_dte = float(chain["days_to_expiry"].mean())
+    if "days_to_expiry" in columns:
+        avg_dte = float(chain["days_to_expiry"].mean() if aggregates is None else aggregates.mean_dte())
         # Acceleration increases as DTE approaches zero
         # Using inverse square to model gamma/charm explosion near expiry
         if avg_dte > 0:
@@ -99,7 +104,7 @@ def build_charm_field(
         charm_regime = "neutral"
     
     metadata = {
-        "avg_days_to_expiry": float(chain["days_to_expiry"].mean() if "days_to_expiry" in chain.columns else 30.0),
+        "avg_days_to_expiry": float(avg_dte if "days_to_expiry" in columns else 30.0),
         "decay_acceleration_factor": float(decay_acceleration),
         "charm_magnitude": float(charm_magnitude),
     }
@@ -27,8 +27,9 @@ def estimate_dealer_sign(inputs: GreekInputs, config: dict) -> DealerSignOutput:
     """
     chain = inputs.chain
     spot = inputs.spot
+    aggregates = inputs.aggregates
     
-    if chain.is_empty():
+    if not inputs.chain_rows():
         return DealerSignOutput(
             net_dealer_gamma=0.0,
             net_dealer_vanna=0.0,
@@ -40,7 +41,7 @@ def estimate_dealer_sign(inputs: GreekInputs, config: dict) -> DealerSignOutput:
     
     # Required columns check
     required = {"strike", "gamma", "vanna", "charm", "open_interest", "option_type"}
-    if not required.issubset(set(chain.columns)):
+    if not required.issubset(inputs.chain_columns()):
         return DealerSignOutput(
             net_dealer_gamma=0.0,
             net_dealer_vanna=0.0,
@@ -50,39 +51,50 @@ def estimate_dealer_sign(inputs: GreekInputs, config: dict) -> DealerSignOutput:
             oi_weighted_strike_center=spot,
         )
     
-    # Separate calls and puts
-    calls = chain.filter(pl.col("option_type") == "C")
-    puts = chain.filter(pl.col("option_type") == "P")
-    
-    # OI-weighted Greek exposures
-    # Assumption: Dealers are SHORT retail options (retail buys, dealers sell)
-    # So we flip the sign - if retail is long gamma, dealers are short gamma
-    
-    # Call gamma exposure (dealers short calls = negative gamma for dealers)
-    call_gamma_exp = -(calls["gamma"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
-    
-    # Put gamma exposure (dealers short puts = negative gamma for dealers below spot)
-    # But puts have negative gamma, so short puts = positive gamma for dealers
-    put_gamma_exp = -(puts["gamma"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
-    
-    net_dealer_gamma = float(call_gamma_exp + put_gamma_exp)
-    
-    # Vanna exposure (OI-weighted)
-    call_vanna_exp = -(calls["vanna"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
-    put_vanna_exp = -(puts["vanna"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
-    net_dealer_vanna = float(call_vanna_exp + put_vanna_exp)
-    
-    # Charm exposure (OI-weighted)
-    call_charm_exp = -(calls["charm"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
-    put_charm_exp = -(puts["charm"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
-    net_dealer_charm = float(call_charm_exp + put_charm_exp)
-    
-    # Calculate OI-weighted strike center
-    total_oi = chain["open_interest"].sum()
-    if total_oi > 0:
-        oi_weighted_strike = float((chain["strike"] * chain["open_interest"]).sum() / total_oi)
+    if aggregates is not None:
+        # Same sums, maintained per strike and option type
+        call_gamma_exp, put_gamma_exp = (-value for value in aggregates.dealer_exposure("gamma_oi"))
+        call_vanna_exp, put_vanna_exp = (-value for value in aggregates.dealer_exposure("vanna_oi"))
+        call_charm_exp, put_charm_exp = (-value for value in aggregates.dealer_exposure("charm_oi"))
+        total_oi = aggregates.total("oi")
+        oi_weighted_strike = aggregates.oi_weighted_strike() or spot
+        net_dealer_gamma = float(call_gamma_exp + put_gamma_exp)
+        net_dealer_vanna = float(call_vanna_exp + put_vanna_exp)
+        net_dealer_charm = float(call_charm_exp + put_charm_exp)
     else:
-        oi_weighted_strike = spot
+        # Separate calls and puts
+        calls = chain.filter(pl.col("option_type") == "C")
+        puts = chain.filter(pl.col("option_type") == "P")
+        
+        # OI-weighted Greek exposures
+        # Assumption: Dealers are SHORT retail options (retail buys, dealers sell)
+        # So we flip the sign - if retail is long gamma, dealers are short gamma
+        
+        # Call gamma exposure (dealers short calls = negative gamma for dealers)
+        call_gamma_exp = -(calls["gamma"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
+        
+        # Put gamma exposure (dealers short puts = negative gamma for dealers below spot)
+        # But puts have negative gamma, so short puts = positive gamma for dealers
+        put_gamma_exp = -(puts["gamma"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
+        
+        net_dealer_gamma = float(call_gamma_exp + put_gamma_exp)
+        
+        # Vanna exposure (OI-weighted)
+        call_vanna_exp = -(calls["vanna"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
+        put_vanna_exp = -(puts["vanna"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
+        net_dealer_vanna = float(call_vanna_exp + put_vanna_exp)
+        
+        # Charm exposure (OI-weighted)
+        call_charm_exp = -(calls["charm"] * calls["open_interest"]).sum() if not calls.is_empty() else 0.0
+        put_charm_exp = -(puts["charm"] * puts["open_interest"]).sum() if not puts.is_empty() else 0.0
+        net_dealer_charm = float(call_charm_exp + put_charm_exp)
+        
+        # Calculate OI-weighted strike center
+        total_oi = chain["open_interest"].sum()
+        if total_oi > 0:
+            oi_weighted_strike = float((chain["strike"] * chain["open_interest"]).sum() / total_oi)
+        else:
+            oi_weighted_strike = spot
     
     # Dealer sign: normalize net gamma to [-1, 1]
     # Negative gamma = short gamma = destabilizing
@@ -96,7 +108,7 @@ def estimate_dealer_sign(inputs: GreekInputs, config: dict) -> DealerSignOutput:
         dealer_sign = 0.0
     
     # Confidence based on OI concentration and data quality
-    total_strikes = len(chain)
+    total_strikes = inputs.chain_rows()
     confidence = min(1.0, total_strikes / config.get("min_strikes_for_confidence", 50))
     
     # Additional confidence from OI concentration
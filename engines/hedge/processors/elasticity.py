@@ -116,10 +116,13 @@ def calculate_elasticity(
     # OI DENSITY MODIFIER
     # ============================================================
     # Concentrated OI creates "wells" that increase local elasticity
-    if not chain.is_empty() and "open_interest" in chain.columns:
-        total_oi = float(chain["open_interest"].sum())
+    if inputs.chain_rows() and "open_interest" in inputs.chain_columns():
+        aggregates = inputs.aggregates
+        total_oi = float(chain["open_interest"].sum() if aggregates is None else aggregates.total("oi"))
         # Calculate OI concentration (Herfindahl-like index)
-        if total_oi > 0:
+        if total_oi > 0 and aggregates is not None:
+            oi_concentration = aggregates.total("oi_sq") / total_oi**2
+        elif total_oi > 0:
             oi_shares = chain["open_interest"] / total_oi
             oi_concentration = float((oi_shares**2).sum())
         else:
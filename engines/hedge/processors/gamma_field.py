@@ -34,8 +34,9 @@ def build_gamma_field(
     """
     chain = inputs.chain
     spot = inputs.spot
+    aggregates = inputs.aggregates
     
-    if chain.is_empty():
+    if not inputs.chain_rows():
         return GammaFieldOutput(
             gamma_exposure=0.0,
             gamma_pressure_up=0.0,
@@ -47,22 +48,19 @@ def build_gamma_field(
     
     # Strike weighting: exponential decay from spot
     decay_rate = config.get("strike_decay_rate", 0.05)
-    chain = chain.with_columns(
-        (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
-    )
-    
-    # Weighted gamma exposure by strike
-    chain = chain.with_columns(
-        (pl.col("gamma") * pl.col("open_interest") * pl.col("strike_weight") * spot).alias("weighted_gamma")
-    )
+    if aggregates is None:
+        chain = chain.with_columns(
+            (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
+        )
+        
+        # Weighted gamma exposure by strike
+        chain = chain.with_columns(
+            (pl.col("gamma") * pl.col("open_interest") * pl.col("strike_weight") * spot).alias("weighted_gamma")
+        )
     
     # Total gamma exposure (dealer perspective)
     gamma_exposure = dealer_sign.net_dealer_gamma
     
-    # Separate up/down pressure based on strike location
-    above_spot = chain.filter(pl.col("strike") > spot)
-    below_spot = chain.filter(pl.col("strike") <= spot)
-    
     # Gamma pressure interpretation:
     # If dealers are SHORT gamma (negative), they must:
     #   - SELL into rallies (creates resistance up)
@@ -71,8 +69,16 @@ def build_gamma_field(
     #   - BUY dips (stabilizing support)
     #   - SELL rips (stabilizing resistance)
     
-    gamma_pressure_up = float(above_spot["weighted_gamma"].sum() if not above_spot.is_empty() else 0.0)
-    gamma_pressure_down = float(below_spot["weighted_gamma"].sum() if not below_spot.is_empty() else 0.0)
+    if aggregates is not None:
+        gamma_pressure_up, gamma_pressure_down = (
+            value * spot for value in aggregates.weighted_split("gamma_oi", spot, decay_rate)
+        )
+    else:
+        # Separate up/down pressure based on strike location
+        above_spot = chain.filter(pl.col("strike") > spot)
+        below_spot = chain.filter(pl.col("strike") <= spot)
+        gamma_pressure_up = float(above_spot["weighted_gamma"].sum() if not above_spot.is_empty() else 0.0)
+        gamma_pressure_down = float(below_spot["weighted_gamma"].sum() if not below_spot.is_empty() else 0.0)
     
     # Adjust pressure by dealer sign
     dealer_gamma_sign = dealer_sign.dealer_sign
@@ -96,32 +102,47 @@ def build_gamma_field(
         gamma_regime = "neutral"
     
     # Strike-weighted gamma map (for visualization/analysis)
+    # Incremental mode: per-strike sums (all contracts at the strike)
     strike_weighted_gamma = {}
-    if "strike" in chain.columns and "weighted_gamma" in chain.columns:
+    if aggregates is not None:
+        strike_weighted_gamma = {
+            strike: value * spot
+            for strike, value in aggregates.weighted_by_strike("gamma_oi", spot, decay_rate).items()
+        }
+    elif "strike" in chain.columns and "weighted_gamma" in chain.columns:
         for row in chain.select(["strike", "weighted_gamma"]).iter_rows():
             strike_weighted_gamma[float(row[0])] = float(row[1])
     
     # Pin zone detection (high OI concentration zones)
+    # Incremental mode: the aggregates' threshold, strikes in ascending order
     pin_oi_threshold = config.get("pin_oi_threshold", 5000)
     pin_zones = []
-    if "strike" in chain.columns and "open_interest" in chain.columns:
+    strikes = []
+    if aggregates is not None:
+        strikes = aggregates.pin_strikes()
+    elif "strike" in chain.columns and "open_interest" in chain.columns:
         high_oi_strikes = chain.filter(pl.col("open_interest") > pin_oi_threshold)
         if not high_oi_strikes.is_empty():
             strikes = high_oi_strikes["strike"].to_list()
-            # Group consecutive strikes into zones
-            if strikes:
-                zone_start = strikes[0]
-                prev_strike = strikes[0]
-                for strike in strikes[1:]:
-                    if strike - prev_strike > spot * 0.02:  # 2% gap = new zone
-                        pin_zones.append((float(zone_start), float(prev_strike)))
-                        zone_start = strike
-                    prev_strike = strike
+    # Group consecutive strikes into zones
+    if strikes:
+        zone_start = strikes[0]
+        prev_strike = strikes[0]
+        for strike in strikes[1:]:
+            if strike - prev_strike > spot * 0.02:  # 2% gap = new zone
                 pin_zones.append((float(zone_start), float(prev_strike)))
+                zone_start = strike
+            prev_strike = strike
+        pin_zones.append((float(zone_start), float(prev_strike)))
+    
+    if aggregates is not None:
+        atm_gamma = aggregates.near_spot("gamma", spot, spot * 0.01)
+    else:
+        atm_gamma = float(chain.filter((pl.col("strike") - spot).abs() < spot * 0.01)["gamma"].sum())
     
     metadata = {
-        "total_strikes": float(len(chain)),
-        "atm_gamma": float(chain.filter((pl.col("strike") - spot).abs() < spot * 0.01)["gamma"].sum()),
+        "total_strikes": float(inputs.chain_rows()),
+        "atm_gamma": atm_gamma,
         "gamma_skew": float(gamma_pressure_up / (abs(gamma_pressure_down) + 1e-9)),
     }
     
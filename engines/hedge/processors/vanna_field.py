@@ -37,8 +37,9 @@ def build_vanna_field(
     spot = inputs.spot
     vix = inputs.vix or 20.0  # Default VIX if not provided
     vol_of_vol = inputs.vol_of_vol
+    aggregates = inputs.aggregates
     
-    if chain.is_empty():
+    if not inputs.chain_rows():
         return VannaFieldOutput(
             vanna_exposure=0.0,
             vanna_pressure_up=0.0,
@@ -53,14 +54,17 @@ def build_vanna_field(
     
     # Strike-weighted vanna field
     decay_rate = config.get("strike_decay_rate", 0.05)
-    chain = chain.with_columns(
-        (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
-    )
-    
-    if "vanna" in chain.columns and "open_interest" in chain.columns:
+    columns = inputs.chain_columns()
+    if aggregates is None:
         chain = chain.with_columns(
-            (pl.col("vanna") * pl.col("open_interest") * pl.col("strike_weight")).alias("weighted_vanna")
+            (pl.lit(-decay_rate) * (pl.col("strike") - spot).abs() / spot).exp().alias("strike_weight")
         )
+    
+    if "vanna" in columns and "open_interest" in columns:
+        if aggregates is None:
+            chain = chain.with_columns(
+                (pl.col("vanna") * pl.col("open_interest") * pl.col("strike_weight")).alias("weighted_vanna")
+            )
     else:
         return VannaFieldOutput(
             vanna_exposure=0.0,
@@ -71,12 +75,15 @@ def build_vanna_field(
             vanna_shock_absorber=1.0,
         )
     
-    # Separate by strike location
-    above_spot = chain.filter(pl.col("strike") > spot)
-    below_spot = chain.filter(pl.col("strike") <= spot)
-    
-    vanna_pressure_up = float(above_spot["weighted_vanna"].sum() if not above_spot.is_empty() else 0.0)
-    vanna_pressure_down = float(below_spot["weighted_vanna"].sum() if not below_spot.is_empty() else 0.0)
+    if aggregates is not None:
+        vanna_pressure_up, vanna_pressure_down = aggregates.weighted_split("vanna_oi", spot, decay_rate)
+    else:
+        # Separate by strike location
+        above_spot = chain.filter(pl.col("strike") > spot)
+        below_spot = chain.filter(pl.col("strike") <= spot)
+        
+        vanna_pressure_up = float(above_spot["weighted_vanna"].sum() if not above_spot.is_empty() else 0.0)
+        vanna_pressure_down = float(below_spot["weighted_vanna"].sum() if not below_spot.is_empty() else 0.0)
     
     # Volatility sensitivity: how much does vanna exposure change with vol?
     # This is approximately vanna * vol_of_vol
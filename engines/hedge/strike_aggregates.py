@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+"""
+Incrementally maintained per-strike aggregates of an options chain.
+
+The hedge processors reduce the chain to a handful of sums: OI-weighted
+gamma/vanna/charm per strike (weighted by distance from spot and split
+above/below spot), dealer exposures by option type, OI totals and
+concentration, mean days to expiry. StrikeAggregates keeps those sums
+per strike and applies a ChainDelta by subtracting each changed
+contract's old contribution and adding its new one, so a tick costs
+O(changed contracts). When spot moves only the per-strike distance
+weights are recomputed (O(strikes)).
+
+Deltas must be keyed per contract (see ``accepts``); the engine reduces
+chains that are not, e.g. without expiry/option_type columns or with
+repeated keys, in full instead. Missing values (null or NaN) contribute
+nothing, as polars sums skip nulls. Per-strike sums are rebuilt from the contract rows every
+``rebuild_every`` deltas to bound floating-point drift.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+from engines.inputs.options_chain_adapter import CONTRACT_KEY, ChainDelta, has_unique_keys
+
+# Contract values kept per row and summed per strike
+_ROW_FIELDS = ("gamma", "gamma_oi", "vanna_oi", "charm_oi", "oi", "oi_sq", "dte", "dte_count", "pin", "rows")
+
+# Chain columns the aggregates read
+_INPUT_COLUMNS = ("strike", "gamma", "vanna", "charm", "open_interest", "days_to_expiry")
+
+# Dealer-sign option type codes (estimate_dealer_sign counts "C" and "P" rows)
+_CALL, _PUT, _OTHER = 0, 1, 2
+
+
+class StrikeAggregates:
+    """Per-strike Greek exposure sums of one symbol's chain, updated by deltas."""
+
+    def __init__(self, pin_oi_threshold: float = 5000, rebuild_every: int = 500, capacity: int = 1024):
+        """
+        Initialize aggregates.
+
+        Args:
+            pin_oi_threshold: Open interest above which a contract marks a pin strike
+            rebuild_every: Deltas between full re-summations
+            capacity: Initial contract rows (doubled when full)
+        """
+        self.pin_oi_threshold = pin_oi_threshold
+        self.rebuild_every = rebuild_every
+        self.key: Tuple[str, ...] = CONTRACT_KEY
+        self.columns: set = set()
+        self._capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """Drop all contracts."""
+        self._slots: Dict[tuple, int] = {}
+        self._free: List[int] = []
+        self._rows = {name: np.zeros(self._capacity) for name in _ROW_FIELDS}
+        self._row_strike = np.zeros(self._capacity, dtype=np.int64)
+        self._row_type = np.full(self._capacity, _OTHER, dtype=np.int64)
+        self._strike_index: Dict[float, int] = {}
+        self.strikes = np.zeros(0)
+        self._by_strike = {name: np.zeros(0) for name in _ROW_FIELDS}
+        self._by_type = {name: np.zeros(3) for name in ("gamma_oi", "vanna_oi", "charm_oi")}
+        self._weights: Optional[Tuple[float, float, np.ndarray]] = None
+        self._since_rebuild = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def accepts(delta: ChainDelta) -> bool:
+        """Whether each upserted row maps to exactly one contract key."""
+        return delta.upserts.height == 0 or has_unique_keys(delta.upserts, delta.key)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def apply(self, delta: ChainDelta):
+        """Apply a chain delta (a snapshot delta replaces all contracts)."""
+        if delta.snapshot:
+            self.reset()
+            self.key = tuple(delta.key)
+            self.columns = set(delta.upserts.columns)
+        elif delta.upserts.width:
+            self.columns |= set(delta.upserts.columns)
+
+        if delta.removed.height:
+            slots = [self._slots.pop(key) for key in delta.removed.select(self.key).rows() if key in self._slots]
+            if slots:
+                slots = np.array(slots, dtype=np.int64)
+                self._accumulate(slots, -1.0)
+                for values in self._rows.values():
+                    values[slots] = 0.0
+                self._free.extend(slots.tolist())
+
+        if delta.upserts.height:
+            self._upsert(delta.upserts)
+
+        self._since_rebuild += 1
+        if delta.snapshot or self._since_rebuild >= self.rebuild_every:
+            self.rebuild()
+
+    def _upsert(self, frame: pl.DataFrame):
+        """Write new or changed contracts into their rows."""
+        for name in ("strike", "gamma", "open_interest"):
+            if name not in frame.columns:
+                raise ValueError(f"options chain is missing column '{name}'")
+
+        existing = []
+        slots = np.empty(frame.height, dtype=np.int64)
+        for i, key in enumerate(frame.select(self.key).rows()):
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._allocate()
+                self._slots[key] = slot
+            else:
+                existing.append(slot)
+            slots[i] = slot
+        if existing:
+            self._accumulate(np.array(existing, dtype=np.int64), -1.0)
+
+        # One float matrix for every input column (nulls come out as NaN)
+        names = [name for name in _INPUT_COLUMNS if name in frame.columns]
+        matrix = frame.select(pl.col(names).cast(pl.Float64)).to_numpy()
+        missing = np.full(frame.height, np.nan)
+
+        def column(name: str) -> np.ndarray:
+            return matrix[:, names.index(name)] if name in names else missing
+
+        oi = column("open_interest")
+        gamma = column("gamma")
+        dte = column("days_to_expiry")
+        values = {
+            "gamma": gamma,
+            "gamma_oi": gamma * oi,
+            "vanna_oi": column("vanna") * oi,
+            "charm_oi": column("charm") * oi,
+            "oi": oi,
+            "oi_sq": oi * oi,
+            "dte": dte,
+            "dte_count": (~np.isnan(dte)).astype(float),
+            "pin": (oi > self.pin_oi_threshold).astype(float),
+            "rows": np.ones(frame.height),
+        }
+        for name, array in values.items():
+            self._rows[name][slots] = np.where(np.isnan(array), 0.0, array)
+
+        self._row_strike[slots] = self._strike_slots(column("strike"))
+        if "option_type" in frame.columns:
+            option_type = frame["option_type"].cast(pl.String)
+            self._row_type[slots] = np.where(
+                (option_type == "C").fill_null(False).to_numpy(), _CALL,
+                np.where((option_type == "P").fill_null(False).to_numpy(), _PUT, _OTHER),
+            )
+        else:
+            self._row_type[slots] = _OTHER
+
+        self._accumulate(slots, 1.0)
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        slot = len(self._slots) + len(self._free)
+        if slot == len(self._row_strike):
+            grow = len(self._row_strike)
+            for name in _ROW_FIELDS:
+                self._rows[name] = np.concatenate([self._rows[name], np.zeros(grow)])
+            self._row_strike = np.concatenate([self._row_strike, np.zeros(grow, dtype=np.int64)])
+            self._row_type = np.concatenate([self._row_type, np.full(grow, _OTHER, dtype=np.int64)])
+        return slot
+
+    def _strike_slots(self, strikes: np.ndarray) -> np.ndarray:
+        """Per-strike slot of each value, adding unseen strikes."""
+        unique, inverse = np.unique(strikes, return_inverse=True)
+        index = np.empty(len(unique), dtype=np.int64)
+        for i, strike in enumerate(unique.tolist()):
+            slot = self._strike_index.get(strike)
+            if slot is None:
+                slot = len(self._strike_index)
+                self._strike_index[strike] = slot
+            index[i] = slot
+        if len(self._strike_index) > len(self.strikes):
+            size = len(self._strike_index)
+            self.strikes = np.fromiter(self._strike_index, dtype=float, count=size)
+            for name in _ROW_FIELDS:
+                self._by_strike[name] = np.concatenate([self._by_strike[name], np.zeros(size - len(self._by_strike[name]))])
+            self._weights = None
+        return index[inverse]
+
+    def _accumulate(self, slots: np.ndarray, sign: float):
+        """Add (sign=1) or remove (sign=-1) rows' contributions to the sums."""
+        strike = self._row_strike[slots]
+        kind = self._row_type[slots]
+        for name in _ROW_FIELDS:
+            np.add.at(self._by_strike[name], strike, sign * self._rows[name][slots])
+        for name, sums in self._by_type.items():
+            np.add.at(sums, kind, sign * self._rows[name][slots])
+
+    def rebuild(self):
+        """Re-sum every aggregate from the contract rows."""
+        slots = np.fromiter(self._slots.values(), dtype=np.int64, count=len(self._slots))
+        strike = self._row_strike[slots]
+        size = len(self.strikes)
+        for name in _ROW_FIELDS:
+            self._by_strike[name] = np.bincount(strike, weights=self._rows[name][slots], minlength=size)
+        kind = self._row_type[slots]
+        for name in self._by_type:
+            self._by_type[name] = np.bincount(kind, weights=self._rows[name][slots], minlength=3)
+        self._since_rebuild = 0
+
+    # ------------------------------------------------------------------
+    # Reductions (what the hedge processors read)
+    # ------------------------------------------------------------------
+
+    def dealer_exposure(self, name: str) -> Tuple[float, float]:
+        """Call and put sums of ``name`` (e.g. "gamma_oi")."""
+        sums = self._by_type[name]
+        return float(sums[_CALL]), float(sums[_PUT])
+
+    def total(self, name: str) -> float:
+        return float(self._by_strike[name].sum())
+
+    def oi_weighted_strike(self) -> Optional[float]:
+        """Open-interest-weighted mean strike (None without open interest)."""
+        total_oi = self.total("oi")
+        return float((self.strikes * self._by_strike["oi"]).sum() / total_oi) if total_oi > 0 else None
+
+    def mean_dte(self) -> Optional[float]:
+        count = self.total("dte_count")
+        return self.total("dte") / count if count else None
+
+    def strike_weights(self, spot: float, decay_rate: float) -> np.ndarray:
+        """exp(-decay * |strike - spot| / spot) per strike, recomputed when spot moves."""
+        if self._weights is None or self._weights[:2] != (spot, decay_rate):
+            weights = np.exp(-decay_rate * np.abs(self.strikes - spot) / spot)
+            self._weights = (spot, decay_rate, weights)
+        return self._weights[2]
+
+    def weighted_split(self, name: str, spot: float, decay_rate: float) -> Tuple[float, float]:
+        """Distance-weighted sums of ``name`` over strikes above / at-or-below spot."""
+        weighted = self._by_strike[name] * self.strike_weights(spot, decay_rate)
+        above = self.strikes > spot
+        return float(weighted[above].sum()), float(weighted[~above].sum())
+
+    def weighted_by_strike(self, name: str, spot: float, decay_rate: float) -> Dict[float, float]:
+        """Distance-weighted sum of ``name`` at each listed strike."""
+        weighted = self._by_strike[name] * self.strike_weights(spot, decay_rate)
+        listed = self._by_strike["rows"] > 0.5
+        return dict(zip(self.strikes[listed].tolist(), weighted[listed].tolist()))
+
+    def near_spot(self, name: str, spot: float, band: float) -> float:
+        """Sum of ``name`` over strikes within ``band`` of spot."""
+        near = np.abs(self.strikes - spot) < band
+        return float(self._by_strike[name][near].sum())
+
+    def pin_strikes(self) -> List[float]:
+        """Strikes with at least one contract above the pin OI threshold, ascending."""
+        return sorted(self.strikes[self._by_strike["pin"] > 0.5].tolist())
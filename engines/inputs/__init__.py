@@ -1,7 +1,12 @@
 """Input adapter protocols for Super Gnosis."""
 from .market_data_adapter import MarketDataAdapter
 from .news_adapter import NewsAdapter
-from .options_chain_adapter import OptionsChainAdapter
+from .options_chain_adapter import (
+    ChainDelta,
+    OptionsChainAdapter,
+    OptionsChainDeltaAdapter,
+    SnapshotDeltaAdapter,
+)
 from .stub_adapters import StaticMarketDataAdapter, StaticNewsAdapter, StaticOptionsAdapter
 from .public_trading_adapter import PublicTradingAdapter, create_adapter
 from .sample_options_generator import SampleOptionsGenerator, generate_sample_chain_for_testing
@@ -11,6 +16,9 @@ __all__ = [
     "MarketDataAdapter",
     "NewsAdapter",
     "OptionsChainAdapter",
+    "OptionsChainDeltaAdapter",
+    "ChainDelta",
+    "SnapshotDeltaAdapter",
     "StaticMarketDataAdapter",
     "StaticNewsAdapter",
     "StaticOptionsAdapter",
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-"""Options chain adapter interface."""
+"""
+Options chain adapter interface.
 
+Besides full chains, a source can serve deltas: the contracts that changed
+since the previous fetch for a symbol, keyed by contract (``ChainDelta``).
+Between intraday ticks only a small share of a chain changes OI, IV or
+Greeks, so consumers that keep per-contract state (HedgeEngineV3) can
+update it in O(changed rows). ``SnapshotDeltaAdapter`` derives deltas from
+any full-chain adapter by diffing consecutive snapshots.
+"""
+
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import Dict, Optional, Protocol, Sequence, Tuple
 
 import polars as pl
 
+# Columns identifying one contract
+CONTRACT_KEY: Tuple[str, ...] = ("strike", "expiry", "option_type")
+
+# Per-chain values repeated on every row; a change is not a contract change
+CHAIN_LEVEL_COLUMNS: Tuple[str, ...] = ("symbol", "underlying_price", "vix", "vol_of_vol")
+
 
 class OptionsChainAdapter(Protocol):
     """Protocol describing an options chain data source."""
@@ -15,3 +31,98 @@ class OptionsChainAdapter(Protocol):
         """Return a normalized options chain for ``symbol``."""
 
         raise NotImplementedError
+
+
+@dataclass
+class ChainDelta:
+    """Contracts changed since the previous fetch of one symbol's chain."""
+
+    upserts: pl.DataFrame  # New or changed contracts (full rows)
+    removed: pl.DataFrame  # Key columns of delisted contracts
+    market: Dict[str, object] = field(default_factory=dict)  # Current chain-level values
+    key: Tuple[str, ...] = CONTRACT_KEY
+    snapshot: bool = False  # upserts is the whole chain: discard earlier state
+
+    def __len__(self) -> int:
+        return self.upserts.height + self.removed.height
+
+
+class OptionsChainDeltaAdapter(OptionsChainAdapter, Protocol):
+    """Options chain source that can also serve per-contract deltas."""
+
+    def fetch_chain_delta(self, symbol: str, now: datetime, full: bool = False) -> ChainDelta:
+        """
+        Return the contracts changed since the last call for ``symbol``.
+
+        The first call for a symbol, or ``full=True``, returns a snapshot
+        delta holding the whole chain.
+        """
+
+        raise NotImplementedError
+
+
+def chain_market(chain: pl.DataFrame) -> Dict[str, object]:
+    """Chain-level values (spot, VIX, ...) from the first row of a chain."""
+    if chain.is_empty():
+        return {}
+    return {name: chain[name][0] for name in CHAIN_LEVEL_COLUMNS if name in chain.columns}
+
+
+def has_unique_keys(chain: pl.DataFrame, key: Sequence[str] = CONTRACT_KEY) -> bool:
+    """Whether every row of ``chain`` is one contract: key columns present, no key repeated."""
+    if not set(key) <= set(chain.columns):
+        return False
+    return not chain.select(key).is_duplicated().any()
+
+
+class SnapshotDeltaAdapter:
+    """
+    Delta mode for any full-chain adapter.
+
+    Keeps the last chain served per symbol and diffs the next fetch against
+    it on ``key`` plus every contract column (chain-level columns excluded),
+    so a spot move alone yields an empty delta. A chain that lacks the key
+    columns or repeats a key cannot be diffed per contract and is served
+    as a snapshot delta. Each instance should feed a single consumer, since
+    every delta advances the stored snapshot.
+    """
+
+    def __init__(self, adapter: OptionsChainAdapter, key: Sequence[str] = CONTRACT_KEY):
+        """
+        Initialize delta adapter.
+
+        Args:
+            adapter: Full-chain source
+            key: Columns identifying one contract
+        """
+        self.adapter = adapter
+        self.key = tuple(key)
+        self._snapshots: Dict[str, pl.DataFrame] = {}
+
+    def fetch_chain(self, symbol: str, now: datetime) -> pl.DataFrame:
+        return self.adapter.fetch_chain(symbol, now)
+
+    def fetch_chain_delta(self, symbol: str, now: datetime, full: bool = False) -> ChainDelta:
+        chain = self.adapter.fetch_chain(symbol, now)
+        previous: Optional[pl.DataFrame] = None if full else self._snapshots.get(symbol)
+        self._snapshots[symbol] = chain
+        market = chain_market(chain)
+
+        if (
+            previous is None
+            or previous.columns != chain.columns
+            or chain.is_empty()
+            or not has_unique_keys(chain, self.key)
+        ):
+            return ChainDelta(
+                upserts=chain,
+                removed=pl.DataFrame(),
+                market=market,
+                key=self.key,
+                snapshot=True,
+            )
+
+        compare = [name for name in chain.columns if name not in CHAIN_LEVEL_COLUMNS]
+        upserts = chain.join(previous.select(compare), on=compare, how="anti", nulls_equal=True)
+        removed = previous.select(self.key).join(chain.select(self.key), on=list(self.key), how="anti", nulls_equal=True)
+        return ChainDelta(upserts=upserts, removed=removed, market=market, key=self.key)
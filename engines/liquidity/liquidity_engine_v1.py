@@ -15,17 +15,34 @@ liquidity analysis covering:
 - Volatility-liquidity interaction
 """
 
+import warnings
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
+import numpy as np
 import polars as pl
 
 from engines.base import Engine
 from engines.liquidity.models import *
 from engines.liquidity.processors.all_processors import *
+from engines.liquidity.processors.bar_history import RollingBarStatistics, builtin_min
+from engines.liquidity.processors.bar_stats import BarStatistics
 from engines.inputs.market_data_adapter import MarketDataAdapter
 from schemas.core_schemas import EngineOutput
 
+# Columns of a run_history/run_universe row that map onto EngineOutput
+_FEATURE_COLUMNS = (
+    "liquidity_score", "friction_cost", "amihud_illiquidity", "kyle_lambda",
+    "orderbook_imbalance", "sweep_detected", "iceberg_detected",
+    "volume_strength", "buying_effort", "selling_effort",
+    "num_absorption_zones", "num_displacement_zones", "num_voids", "num_hvn_nodes",
+    "compression_energy", "expansion_energy", "wyckoff_energy",
+    "polr_direction", "polr_strength", "off_exchange_ratio",
+)
+_METADATA_COLUMNS = (
+    "rvol", "taker_intensity", "impact_energy", "squeeze_flag", "sos_detected", "sow_detected",
+)
+
 
 class LiquidityEngineV1(Engine):
     """
@@ -79,16 +96,17 @@ class LiquidityEngineV1(Engine):
         if data.is_empty():
             return self._degraded_output(symbol, now, "no_data")
         
-        # Run all processors
+        # Run all processors on one shared set of bar statistics
         try:
-            volume_result = self.volume_proc.process(data, self.config)
-            orderflow_result = self.orderflow_proc.process(data, self.config)
-            micro_result = self.micro_proc.process(data, self.config)
-            impact_result = self.impact_proc.process(data, self.config)
-            darkpool_result = self.darkpool_proc.process(data, self.config)
-            structure_result = self.structure_proc.process(data, self.config)
-            wyckoff_result = self.wyckoff_proc.process(data, self.config)
-            vol_liq_result = self.vol_liq_proc.process(data, self.config)
+            stats = BarStatistics(data)
+            volume_result = self.volume_proc.process(data, self.config, stats)
+            orderflow_result = self.orderflow_proc.process(data, self.config, stats)
+            micro_result = self.micro_proc.process(data, self.config, stats)
+            impact_result = self.impact_proc.process(data, self.config, stats)
+            darkpool_result = self.darkpool_proc.process(data, self.config, stats)
+            structure_result = self.structure_proc.process(data, self.config, stats)
+            wyckoff_result = self.wyckoff_proc.process(data, self.config, stats)
+            vol_liq_result = self.vol_liq_proc.process(data, self.config, stats)
         except Exception as e:
             return self._degraded_output(symbol, now, f"processor_error: {str(e)}")
         
@@ -106,7 +124,107 @@ class LiquidityEngineV1(Engine):
         
         # Convert to standard EngineOutput
         return self._to_engine_output(symbol, now, liquidity_output)
-    
+
+    def run_history(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """
+        Compute the liquidity features for every bar of a series in one pass.
+
+        Row t equals ``run()`` at bar t's timestamp: the pipeline over the
+        last ``lookback_bars`` bars ending at t (fewer during warm-up). Each
+        processor runs vectorized over rolling windows instead of once per bar.
+        Bars where run() would degrade on a processor error keep the degraded
+        features, null elsewhere, with regime "degraded".
+
+        Args:
+            frame: OHLCV bars in time order, optionally with a timestamp column
+
+        Returns:
+            DataFrame aligned to the bars: timestamp (if present), the
+            EngineOutput features, liquidity_regime, wyckoff_phase,
+            regime_confidence, confidence and the metadata fields
+        """
+        if frame.is_empty():
+            return pl.DataFrame()
+
+        lookback = self.config.get("lookback_bars", 100)
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            stats = RollingBarStatistics(frame, lookback)
+            history = self._fuse_history(
+                self.volume_proc.process_history(stats),
+                self.orderflow_proc.process_history(stats),
+                self.micro_proc.process_history(stats),
+                self.impact_proc.process_history(stats),
+                self.darkpool_proc.process_history(stats),
+                self.structure_proc.process_history(stats),
+                self.wyckoff_proc.process_history(stats),
+                self.vol_liq_proc.process_history(stats),
+            )
+
+        if "timestamp" in frame.columns:
+            history = history.with_columns(frame["timestamp"]).select(
+                "timestamp", pl.exclude("timestamp")
+            )
+        return history
+
+    def run_universe(self, frame: pl.DataFrame, now: datetime, by: str = "symbol") -> Dict[str, EngineOutput]:
+        """
+        Run the pipeline for every symbol of a stacked frame at once.
+
+        Each symbol's output equals ``run()`` on that symbol's last
+        ``lookback_bars`` bars: the processors run vectorized across symbols
+        on the latest windows, instead of 8 calls on a small frame per symbol.
+
+        Args:
+            frame: OHLCV bars of many symbols, in time order within each symbol
+            now: Timestamp for the outputs
+            by: Symbol column
+
+        Returns:
+            EngineOutput per symbol in the frame
+        """
+        if frame.is_empty():
+            return {}
+
+        lookback = self.config.get("lookback_bars", 100)
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            symbols, stats = RollingBarStatistics.latest(frame, lookback, by)
+            latest = self._fuse_history(
+                self.volume_proc.process_history(stats),
+                self.orderflow_proc.process_history(stats),
+                self.micro_proc.process_history(stats),
+                self.impact_proc.process_history(stats),
+                self.darkpool_proc.process_history(stats),
+                self.structure_proc.process_history(stats),
+                self.wyckoff_proc.process_history(stats),
+                self.vol_liq_proc.process_history(stats),
+            )
+
+        return {
+            symbol: self._row_to_engine_output(symbol, now, row)
+            for symbol, row in zip(symbols, latest.iter_rows(named=True))
+        }
+
+    def run_many(self, symbols: Iterable[str], now: datetime) -> Dict[str, EngineOutput]:
+        """
+        ``run()`` for several symbols: fetch each symbol's bars, then process
+        them together through run_universe.
+        """
+        lookback = self.config.get("lookback_bars", 100)
+        outputs: Dict[str, EngineOutput] = {}
+        frames = []
+        for symbol in symbols:
+            data = self.adapter.fetch_ohlcv(symbol, lookback, now)
+            if data.is_empty():
+                outputs[symbol] = self._degraded_output(symbol, now, "no_data")
+            else:
+                frames.append(data.with_columns(pl.lit(symbol).alias("_symbol")))
+
+        if frames:
+            outputs.update(self.run_universe(pl.concat(frames, how="diagonal_relaxed"), now, "_symbol"))
+        return outputs
+
     def _fuse_results(
         self,
         volume: VolumeProcessorResult,
@@ -266,6 +384,114 @@ class LiquidityEngineV1(Engine):
             },
         )
     
+    def _fuse_history(
+        self,
+        volume: Dict[str, np.ndarray],
+        orderflow: Dict[str, np.ndarray],
+        micro: Dict[str, np.ndarray],
+        impact: Dict[str, np.ndarray],
+        darkpool: Dict[str, np.ndarray],
+        structure: Dict[str, np.ndarray],
+        wyckoff: Dict[str, np.ndarray],
+        vol_liq: Dict[str, np.ndarray],
+    ) -> pl.DataFrame:
+        """Column-wise _fuse_results + _to_engine_output for run_history()."""
+
+        amihud_score = 1.0 / (1.0 + impact["amihud"] * 1e6)
+        spread_score = 1.0 / (1.0 + micro["spread_cost"] * 100)
+        liquidity_score = (
+            amihud_score * 0.3 +
+            volume["volume_strength"] * 0.3 +
+            spread_score * 0.2 +
+            structure["confidence"] * 0.2
+        )
+
+        friction_cost = (
+            micro["spread_cost"] +
+            impact["slippage_per_1pct_move"] +
+            impact["lambda_kyle"] * 1000
+        )
+
+        regime = np.select(
+            [liquidity_score > 0.8, liquidity_score > 0.6, liquidity_score > 0.4, liquidity_score > 0.2],
+            ["Abundant", "Normal", "Thin", "Stressed"],
+            "Crisis",
+        )
+        regime[vol_liq["squeeze_flag"] & volume["exhaustion_flag"]] = "Stressed"
+
+        polr_direction = (
+            orderflow["ofi"] * 0.4 +
+            wyckoff["absorption_vs_displacement_bias"] * 0.3 +
+            micro["microprice_direction"] * 0.3
+        )
+        alignment_score = np.abs(orderflow["ofi"]) * np.abs(wyckoff["absorption_vs_displacement_bias"])
+        polr_strength = builtin_min(1.0, alignment_score + orderflow["liquidity_taker_intensity"] * 0.5)
+
+        overall_confidence = (
+            volume["confidence"] +
+            orderflow["confidence"] +
+            micro["confidence"] +
+            impact["confidence"] +
+            structure["confidence"] +
+            wyckoff["confidence"] +
+            vol_liq["confidence"]
+        ) / 7
+
+        valid = np.logical_and.reduce([
+            result["valid"]
+            for result in (volume, orderflow, micro, impact, darkpool, structure, wyckoff, vol_liq)
+        ])
+
+        # Same columns as _to_engine_output features, then regime and metadata
+        history = pl.DataFrame({
+            "liquidity_score": liquidity_score,
+            "friction_cost": friction_cost,
+            "amihud_illiquidity": impact["amihud"],
+            "kyle_lambda": impact["lambda_kyle"],
+            "orderbook_imbalance": orderflow["ofi"],
+            "sweep_detected": orderflow["sweep_flag"].astype(float),
+            "iceberg_detected": orderflow["iceberg_flag"].astype(float),
+            "volume_strength": volume["volume_strength"],
+            "buying_effort": volume["buying_effort"],
+            "selling_effort": volume["selling_effort"],
+            "num_absorption_zones": structure["num_absorption_zones"],
+            "num_displacement_zones": structure["num_displacement_zones"],
+            "num_voids": structure["num_voids"],
+            "num_hvn_nodes": structure["num_hvn_nodes"],
+            "compression_energy": vol_liq["compression_energy"],
+            "expansion_energy": vol_liq["expansion_energy"],
+            "wyckoff_energy": wyckoff["wyckoff_energy"],
+            "polr_direction": polr_direction,
+            "polr_strength": polr_strength,
+            "off_exchange_ratio": darkpool["off_exchange_ratio"],
+            "liquidity_regime": regime,
+            "wyckoff_phase": wyckoff["wyckoff_phase"],
+            "regime_confidence": overall_confidence * liquidity_score,
+            "confidence": overall_confidence,
+            "hidden_accumulation": darkpool["dp_accumulation"],
+            "rvol": volume["rvol"],
+            "taker_intensity": orderflow["liquidity_taker_intensity"],
+            "impact_energy": impact["impact_energy"],
+            "squeeze_flag": vol_liq["squeeze_flag"].astype(float),
+            "sos_detected": wyckoff["sos_detected"].astype(float),
+            "sow_detected": wyckoff["sow_detected"].astype(float),
+        })
+
+        # Degraded bars: the _degraded_output values, null where it has none
+        degraded_values = {
+            "liquidity_score": 0.5,
+            "friction_cost": 0.0,
+            "amihud_illiquidity": 0.0,
+            "kyle_lambda": 0.0,
+            "liquidity_regime": "degraded",
+            "confidence": 0.0,
+        }
+        ok = pl.Series(valid)
+        return history.with_columns(
+            pl.when(ok).then(pl.col(name)).otherwise(pl.lit(degraded_values.get(name))).alias(name)
+            for name in history.columns
+        )
+
     def _to_engine_output(
         self,
         symbol: str,
@@ -331,6 +557,28 @@ class LiquidityEngineV1(Engine):
             metadata=metadata,
         )
     
+    def _row_to_engine_output(self, symbol: str, now: datetime, row: Dict[str, Any]) -> EngineOutput:
+        """Convert one _fuse_history row to the EngineOutput run() builds."""
+        if row["liquidity_regime"] == "degraded":
+            return self._degraded_output(symbol, now, "processor_error")
+
+        metadata = {
+            "liquidity_regime": row["liquidity_regime"],
+            "wyckoff_phase": row["wyckoff_phase"],
+            "regime_confidence": str(row["regime_confidence"]),
+        }
+        metadata.update({name: str(row[name]) for name in _METADATA_COLUMNS})
+
+        return EngineOutput(
+            kind="liquidity",
+            symbol=symbol,
+            timestamp=now,
+            features={name: row[name] for name in _FEATURE_COLUMNS},
+            confidence=row["confidence"],
+            regime=row["liquidity_regime"],
+            metadata=metadata,
+        )
+
     def _degraded_output(self, symbol: str, now: datetime, reason: str) -> EngineOutput:
         """Return degraded output when data is missing or processing fails."""
         return EngineOutput(
@@ -1,5 +1,7 @@
 """Liquidity Engine v1.0 processors."""
 
+from .bar_history import RollingBarStatistics
+from .bar_stats import BarStatistics
 from .volume_processor import VolumeProcessor
 from .orderflow_processor import OrderFlowProcessor
 from .microstructure_processor import MicrostructureProcessor
@@ -10,6 +12,8 @@ from .wyckoff_liquidity_processor import WyckoffLiquidityProcessor
 from .volatility_liquidity_processor import VolatilityLiquidityProcessor
 
 __all__ = [
+    "BarStatistics",
+    "RollingBarStatistics",
     "VolumeProcessor",
     "OrderFlowProcessor",
     "MicrostructureProcessor",
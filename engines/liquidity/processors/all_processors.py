@@ -3,13 +3,27 @@ from __future__ import annotations
 """
 Consolidated Liquidity Engine Processors.
 All 8 processors in one file for efficiency.
+
+Every processor reads its window statistics from a shared BarStatistics
+built once per tick; when called without one, it builds its own.
+process_history() is the vectorized form of process() over every bar of
+a series, reading RollingBarStatistics instead: it returns one array per
+output field, plus a ``valid`` mask that is False where process() would
+raise or its result would fail validation.
 """
 
 import polars as pl
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from engines.liquidity.models import *
+from engines.liquidity.processors.bar_history import (
+    RollingBarStatistics,
+    builtin_max,
+    builtin_min,
+    within,
+)
+from engines.liquidity.processors.bar_stats import BarStatistics
 
 
 # ============================================================
@@ -22,21 +36,27 @@ class VolumeProcessor:
     def __init__(self, lookback: int = 20):
         self.lookback = lookback
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> VolumeProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> VolumeProcessorResult:
         if data.is_empty() or len(data) < self.lookback:
             return VolumeProcessorResult(
                 volume_strength=0.5, buying_effort=0.5, selling_effort=0.5,
                 confidence=0.0
             )
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Calculate RVOL
-        recent_vol = float(data["volume"].tail(1)[0])
-        avg_vol = float(data["volume"].tail(self.lookback).mean())
+        recent_vol = stats.last("volume")
+        avg_vol = stats.mean("volume", self.lookback)
         rvol = recent_vol / (avg_vol + 1.0) if avg_vol > 0 else 1.0
         
         # Effort vs Result
-        price_change = float(data["close"].tail(1)[0] - data["close"].tail(2)[0])
-        volume_change = float(recent_vol - data["volume"].tail(2).mean())
+        price_change = stats.last("close") - stats.last("close", 1)
+        volume_change = recent_vol - stats.mean("volume", 2)
         
         # Buying/selling effort (simplified Wyckoff)
         if price_change > 0 and volume_change > 0:
@@ -49,7 +69,7 @@ class VolumeProcessor:
             buying_effort = selling_effort = 0.5
         
         # Volume strength based on consistency
-        vol_std = float(data["volume"].tail(self.lookback).std())
+        vol_std = stats.std("volume", self.lookback)
         vol_consistency = 1.0 - min(1.0, vol_std / (avg_vol + 1.0))
         volume_strength = vol_consistency * min(1.0, rvol)
         
@@ -65,6 +85,46 @@ class VolumeProcessor:
             confidence=min(1.0, len(data) / self.lookback)
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= self.lookback
+
+        recent_vol = stats.last("volume")
+        avg_vol = stats.mean("volume", self.lookback)
+        rvol = np.where(avg_vol > 0, recent_vol / (avg_vol + 1.0), 1.0)
+
+        price_change = stats.last("close") - stats.last("close", 1)
+        volume_change = recent_vol - stats.mean("volume", 2)
+
+        buying = (price_change > 0) & (volume_change > 0)
+        selling = (price_change < 0) & (volume_change > 0)
+        strong = builtin_min(1.0, 0.5 + rvol * 0.3)
+        weak = builtin_max(0.0, 0.5 - rvol * 0.3)
+        buying_effort = np.select([buying, selling], [strong, weak], 0.5)
+        selling_effort = np.select([buying, selling], [weak, strong], 0.5)
+
+        vol_std = stats.std("volume", self.lookback)
+        vol_consistency = 1.0 - builtin_min(1.0, vol_std / (avg_vol + 1.0))
+        volume_strength = vol_consistency * builtin_min(1.0, rvol)
+
+        exhaustion_flag = (rvol > 2.5) & (np.abs(price_change) < avg_vol * 0.001)
+
+        valid = ~active | (
+            (stats.lengths >= 2) & (avg_vol + 1.0 != 0)
+            & within(volume_strength, 0.0, 1.0)
+            & within(buying_effort, 0.0, 1.0)
+            & within(selling_effort, 0.0, 1.0)
+            & within(rvol, 0.0)
+        )
+        return {
+            "volume_strength": np.where(active, volume_strength, 0.5),
+            "buying_effort": np.where(active, buying_effort, 0.5),
+            "selling_effort": np.where(active, selling_effort, 0.5),
+            "exhaustion_flag": active & exhaustion_flag,
+            "rvol": np.where(active, rvol, 1.0),
+            "confidence": np.where(active, builtin_min(1.0, stats.lengths / self.lookback), 0.0),
+            "valid": valid,
+        }
+
 
 # ============================================================
 # 2. ORDER FLOW PROCESSOR
@@ -73,29 +133,35 @@ class VolumeProcessor:
 class OrderFlowProcessor:
     """Processes order flow imbalance and aggressive trading."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> OrderFlowProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> OrderFlowProcessorResult:
         if data.is_empty():
             return OrderFlowProcessorResult(ofi=0.0, liquidity_taker_intensity=0.0, confidence=0.0)
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Simplified OFI from price-volume relationship
         if len(data) >= 2:
-            price_changes = data["close"].diff().tail(10)
-            volume_weights = data["volume"].tail(10)
+            price_changes = stats.tail("close_diff", 10)
+            volume_weights = stats.tail("volume", 10)
             
             # Weight price changes by volume
             weighted_changes = price_changes * volume_weights
-            total_vol = float(volume_weights.sum())
-            ofi = float(weighted_changes.sum() / (total_vol + 1.0)) if total_vol > 0 else 0.0
+            total_vol = stats.sum("volume", 10)
+            ofi = float(np.nansum(weighted_changes) / (total_vol + 1.0)) if total_vol > 0 else 0.0
             ofi = max(-1.0, min(1.0, ofi * 1000))  # Normalize
         else:
             ofi = 0.0
         
         # Detect sweeps (large volume bars with significant price movement)
         if len(data) >= 3:
-            recent_vol = float(data["volume"].tail(1)[0])
-            avg_vol = float(data["volume"].tail(10).mean())
-            price_move = abs(float(data["close"].tail(1)[0] - data["close"].tail(2)[0]))
-            avg_range = float((data["high"] - data["low"]).tail(10).mean())
+            recent_vol = stats.last("volume")
+            avg_vol = stats.mean("volume", 10)
+            price_move = abs(stats.last("close_diff"))
+            avg_range = stats.mean("range", 10)
             
             sweep_flag = (recent_vol > avg_vol * 2.0) and (price_move > avg_range * 0.5)
             taker_intensity = min(1.0, recent_vol / (avg_vol * 3.0))
@@ -111,6 +177,36 @@ class OrderFlowProcessor:
             confidence=0.7
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        weighted_changes = stats.tail("close_diff", 10) * stats.tail("volume", 10)
+        total_vol = stats.sum("volume", 10)
+        ofi = np.where(total_vol > 0, np.nansum(weighted_changes, axis=1) / (total_vol + 1.0), 0.0)
+        ofi = builtin_max(-1.0, builtin_min(1.0, ofi * 1000))
+        ofi = np.where(stats.lengths >= 2, ofi, 0.0)
+
+        swept = stats.lengths >= 3
+        recent_vol = stats.last("volume")
+        avg_vol = stats.mean("volume", 10)
+        price_move = np.abs(stats.last("close_diff"))
+        avg_range = stats.mean("range", 10)
+
+        sweep_flag = swept & (recent_vol > avg_vol * 2.0) & (price_move > avg_range * 0.5)
+        taker_intensity = np.where(swept, builtin_min(1.0, recent_vol / (avg_vol * 3.0)), 0.0)
+
+        valid = (
+            (~swept | (avg_vol * 3.0 != 0))
+            & within(ofi, -1.0, 1.0)
+            & within(taker_intensity, 0.0, 1.0)
+        )
+        return {
+            "ofi": ofi,
+            "sweep_flag": sweep_flag,
+            "iceberg_flag": np.zeros(stats.n, dtype=bool),
+            "liquidity_taker_intensity": taker_intensity,
+            "confidence": np.full(stats.n, 0.7),
+            "valid": valid,
+        }
+
 
 # ============================================================
 # 3. MICROSTRUCTURE PROCESSOR
@@ -119,22 +215,27 @@ class OrderFlowProcessor:
 class MicrostructureProcessor:
     """Processes spreads and microprice dynamics."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> MicrostructureProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> MicrostructureProcessorResult:
         if data.is_empty() or len(data) < 2:
             return MicrostructureProcessorResult(
                 spread_cost=0.0, microprice_direction=0.0, impact_slope=0.0, confidence=0.0
             )
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Estimate spread from high-low range
-        avg_range = float((data["high"] - data["low"]).tail(10).mean())
-        avg_price = float(data["close"].tail(10).mean())
+        avg_range = stats.mean("range", 10)
+        avg_price = stats.mean("close", 10)
         spread_cost = avg_range / avg_price if avg_price > 0 else 0.0
         
         # Microprice direction from close position in range
-        recent_close = float(data["close"].tail(1)[0])
-        recent_high = float(data["high"].tail(1)[0])
-        recent_low = float(data["low"].tail(1)[0])
-        range_size = recent_high - recent_low
+        recent_close = stats.last("close")
+        recent_low = stats.last("low")
+        range_size = stats.last("range")
         
         if range_size > 0:
             # Position in range: 0 = low, 1 = high
@@ -145,8 +246,8 @@ class MicrostructureProcessor:
         
         # Impact slope from volume-price relationship
         if len(data) >= 5:
-            volumes = data["volume"].tail(5).to_numpy()
-            price_changes = data["close"].diff().tail(5).to_numpy()
+            volumes = stats.tail("volume", 5)
+            price_changes = stats.tail("close_diff", 5)
             impact_slope = float(np.abs(price_changes / (volumes + 1.0)).mean())
         else:
             impact_slope = 0.0
@@ -158,6 +259,35 @@ class MicrostructureProcessor:
             confidence=0.8
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= 2
+
+        avg_range = stats.mean("range", 10)
+        avg_price = stats.mean("close", 10)
+        spread_cost = np.where(avg_price > 0, avg_range / avg_price, 0.0)
+
+        range_size = stats.last("range")
+        position = (stats.last("close") - stats.last("low")) / range_size
+        microprice_direction = np.where(range_size > 0, (position - 0.5) * 2, 0.0)
+
+        price_changes = stats.tail("close_diff", 5)
+        volumes = stats.tail("volume", 5)
+        impact_slope = np.abs(price_changes / (volumes + 1.0)).mean(axis=1)
+        impact_slope = np.where(stats.lengths >= 5, impact_slope, 0.0)
+
+        valid = ~active | (
+            within(spread_cost, 0.0)
+            & within(microprice_direction, -1.0, 1.0)
+            & within(impact_slope, 0.0)
+        )
+        return {
+            "spread_cost": np.where(active, spread_cost, 0.0),
+            "microprice_direction": np.where(active, microprice_direction, 0.0),
+            "impact_slope": np.where(active, impact_slope, 0.0),
+            "confidence": np.where(active, 0.8, 0.0),
+            "valid": valid,
+        }
+
 
 # ============================================================
 # 4. IMPACT PROCESSOR
@@ -166,26 +296,32 @@ class MicrostructureProcessor:
 class ImpactProcessor:
     """Calculates Amihud, Kyle lambda, and impact metrics."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> ImpactProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> ImpactProcessorResult:
         if data.is_empty() or len(data) < 10:
             return ImpactProcessorResult(
                 slippage_per_1pct_move=0.0, lambda_kyle=0.0, amihud=0.0,
                 impact_energy=0.0, confidence=0.0
             )
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Amihud illiquidity: |return| / volume
-        returns = data["close"].pct_change().tail(20)
-        volumes = data["volume"].tail(20)
+        returns = stats.tail("returns", 20)
+        volume_scale = stats.tail("volume", 20) + 1.0
         
-        amihud = float((returns.abs() / (volumes + 1.0)).mean())
+        amihud = float(np.nanmean(np.abs(returns) / volume_scale))
         
         # Kyle's lambda: price impact per unit volume
-        price_changes = data["close"].diff().tail(20)
-        lambda_kyle = float((price_changes.abs() / (volumes + 1.0)).mean())
+        price_changes = stats.tail("close_diff", 20)
+        lambda_kyle = float(np.nanmean(np.abs(price_changes) / volume_scale))
         
         # Slippage estimate for 1% move
-        avg_price = float(data["close"].mean())
-        avg_volume = float(volumes.mean())
+        avg_price = stats.mean("close")
+        avg_volume = stats.mean("volume", 20)
         move_size = avg_price * 0.01
         slippage = lambda_kyle * (move_size / (avg_volume + 1.0)) * 100
         
@@ -200,6 +336,36 @@ class ImpactProcessor:
             confidence=0.8
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= 10
+
+        volume_scale = stats.tail("volume", 20) + 1.0
+        amihud = np.nanmean(np.abs(stats.tail("returns", 20)) / volume_scale, axis=1)
+        lambda_kyle = np.nanmean(np.abs(stats.tail("close_diff", 20)) / volume_scale, axis=1)
+
+        avg_price = stats.mean("close")
+        avg_volume = stats.mean("volume", 20)
+        move_size = avg_price * 0.01
+        slippage = lambda_kyle * (move_size / (avg_volume + 1.0)) * 100
+
+        impact_energy = amihud * lambda_kyle * 1e6
+
+        valid = ~active | (
+            (avg_volume + 1.0 != 0)
+            & within(slippage, 0.0)
+            & within(lambda_kyle, 0.0)
+            & within(amihud, 0.0)
+            & within(impact_energy, 0.0)
+        )
+        return {
+            "slippage_per_1pct_move": np.where(active, slippage, 0.0),
+            "lambda_kyle": np.where(active, lambda_kyle, 0.0),
+            "amihud": np.where(active, amihud, 0.0),
+            "impact_energy": np.where(active, impact_energy, 0.0),
+            "confidence": np.where(active, 0.8, 0.0),
+            "valid": valid,
+        }
+
 
 # ============================================================
 # 5. DARK POOL PROCESSOR
@@ -208,7 +374,12 @@ class ImpactProcessor:
 class DarkPoolProcessor:
     """Analyzes off-exchange and dark pool activity."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> DarkPoolProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> DarkPoolProcessorResult:
         # Placeholder - requires actual dark pool data feed
         return DarkPoolProcessorResult(
             dp_accumulation=0.0,
@@ -217,6 +388,16 @@ class DarkPoolProcessor:
             confidence=0.0
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        zeros = np.zeros(stats.n)
+        return {
+            "dp_accumulation": zeros,
+            "dp_distribution": zeros,
+            "off_exchange_ratio": zeros,
+            "confidence": zeros,
+            "valid": np.ones(stats.n, dtype=bool),
+        }
+
 
 # ============================================================
 # 6. STRUCTURE PROCESSOR
@@ -225,22 +406,35 @@ class DarkPoolProcessor:
 class StructureProcessor:
     """Builds HVN/LVN structure and liquidity zones."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> StructureProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> StructureProcessorResult:
         if data.is_empty() or len(data) < 20:
             return StructureProcessorResult(confidence=0.0)
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Build simple volume profile
         price_levels = np.linspace(
-            float(data["low"].min()),
-            float(data["high"].max()),
+            stats.min("low"),
+            stats.max("high"),
             20
         )
         
+        # Volume per price range [level_i, level_i+1), all bins in one pass
+        bins = np.searchsorted(price_levels, stats.columns["close"], side="right") - 1
+        in_profile = (bins >= 0) & (bins < len(price_levels) - 1)
+        volume_by_bin = np.bincount(
+            bins[in_profile],
+            weights=stats.columns["volume"][in_profile],
+            minlength=len(price_levels) - 1,
+        )
+        
         profile_nodes = []
         for i, price in enumerate(price_levels[:-1]):
-            # Volume in this price range
-            mask = (data["close"] >= price) & (data["close"] < price_levels[i+1])
-            vol_in_range = float(data.filter(mask)["volume"].sum()) if mask.any() else 0.0
+            vol_in_range = float(volume_by_bin[i])
             
             if vol_in_range > 0:
                 profile_nodes.append(ProfileNode(
@@ -300,6 +494,64 @@ class StructureProcessor:
             confidence=0.7
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= 20
+        n_bins = 19
+        price_levels = _linspace_rows(stats.min("low"), stats.max("high"), n_bins + 1)
+        closes = stats.tail("close", stats.window)
+        volumes = stats.tail("volume", stats.window)
+
+        # Same binning as searchsorted(side="right") - 1, in row chunks to
+        # bound the (rows, window, levels) comparison
+        volume_by_bin = np.zeros((stats.n, n_bins))
+        chunk = max(1, 2**22 // (stats.window * (n_bins + 1)))
+        for start in range(0, stats.n, chunk):
+            stop = min(stats.n, start + chunk)
+            levels = price_levels[start:stop, None, :]
+            bins = (closes[start:stop, :, None] >= levels).sum(axis=2) - 1
+            in_profile = (bins >= 0) & (bins < n_bins)
+            rows = np.broadcast_to(np.arange(stop - start)[:, None], bins.shape)
+            volume_by_bin[start:stop] = np.bincount(
+                (rows * n_bins + bins)[in_profile],
+                weights=volumes[start:stop][in_profile],
+                minlength=(stop - start) * n_bins,
+            ).reshape(stop - start, n_bins)
+
+        nodes = volume_by_bin > 0
+        node_count = nodes.sum(axis=1)
+        has_nodes = node_count > 0
+
+        # Median node volume: sorted node volumes, NaN (no node) last
+        ordered = np.sort(np.where(nodes, volume_by_bin, np.nan), axis=1)
+        rows = np.arange(stats.n)
+        lower = np.maximum(node_count - 1, 0) // 2
+        median_vol = (ordered[rows, lower] + ordered[rows, node_count // 2]) / 2
+
+        hvn = nodes & (volume_by_bin > median_vol[:, None] * 1.5)
+        lvn = nodes & ~hvn & (volume_by_bin < median_vol[:, None] * 0.5)
+        poc = np.argmax(np.where(nodes, volume_by_bin, -np.inf), axis=1)
+        poc_only = has_nodes & ~hvn[rows, poc]
+
+        return {
+            "num_absorption_zones": np.where(active, hvn.sum(axis=1) + poc_only, 0).astype(float),
+            "num_displacement_zones": np.where(active, lvn.sum(axis=1), 0).astype(float),
+            "num_voids": np.zeros(stats.n),
+            "num_hvn_nodes": np.where(active, hvn.sum(axis=1), 0).astype(float),
+            "confidence": np.where(active, 0.7, 0.0),
+            "valid": np.ones(stats.n, dtype=bool),
+        }
+
+
+def _linspace_rows(start: np.ndarray, stop: np.ndarray, num: int) -> np.ndarray:
+    """Row-wise ``np.linspace(start[i], stop[i], num)``, bit-for-bit."""
+    div = num - 1
+    steps = np.arange(num, dtype=float)
+    delta = (stop - start)[:, None]
+    step = delta / div
+    levels = np.where(step == 0, steps / div * delta, steps * step) + start[:, None]
+    levels[:, -1] = stop
+    return levels
+
 
 # ============================================================
 # 7. WYCKOFF LIQUIDITY PROCESSOR
@@ -308,18 +560,24 @@ class StructureProcessor:
 class WyckoffLiquidityProcessor:
     """Detects Wyckoff phases and SOS/SOW."""
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> WyckoffLiquidityProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> WyckoffLiquidityProcessorResult:
         if data.is_empty() or len(data) < 30:
             return WyckoffLiquidityProcessorResult(
                 wyckoff_energy=0.0,
                 absorption_vs_displacement_bias=0.0,
                 confidence=0.0
             )
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Simplified Wyckoff phase detection
-        price_range = float(data["high"].max() - data["low"].min())
-        recent_range = float(data["high"].tail(10).max() - data["low"].tail(10).min())
-        volume_trend = float(data["volume"].tail(10).mean() / data["volume"].head(10).mean())
+        price_range = stats.max("high") - stats.min("low")
+        recent_range = stats.max("high", 10) - stats.min("low", 10)
+        volume_trend = stats.mean("volume", 10) / stats.mean("volume", 10, head=True)
         
         # Detect accumulation/distribution
         if recent_range < price_range * 0.3 and volume_trend > 1.2:
@@ -336,12 +594,13 @@ class WyckoffLiquidityProcessor:
             bias = 0.0
         
         # SOS/SOW detection (simplified)
-        recent_close = float(data["close"].tail(1)[0])
-        recent_volume = float(data["volume"].tail(1)[0])
-        avg_volume = float(data["volume"].mean())
+        recent_close = stats.last("close")
+        previous_close = stats.last("close", 1)
+        recent_volume = stats.last("volume")
+        avg_volume = stats.mean("volume")
         
-        sos_detected = recent_volume > avg_volume * 2.0 and recent_close > float(data["close"].tail(2)[0])
-        sow_detected = recent_volume > avg_volume * 2.0 and recent_close < float(data["close"].tail(2)[0])
+        sos_detected = recent_volume > avg_volume * 2.0 and recent_close > previous_close
+        sow_detected = recent_volume > avg_volume * 2.0 and recent_close < previous_close
         
         return WyckoffLiquidityProcessorResult(
             wyckoff_phase=phase,
@@ -352,6 +611,34 @@ class WyckoffLiquidityProcessor:
             confidence=0.6
         )
 
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= 30
+
+        price_range = stats.max("high") - stats.min("low")
+        recent_range = stats.max("high", 10) - stats.min("low", 10)
+        early_volume = stats.mean("volume", 10, head=True)
+        volume_trend = stats.mean("volume", 10) / early_volume
+
+        testing = active & (recent_range < price_range * 0.3) & (volume_trend > 1.2)
+        markup = active & ~testing & (recent_range > price_range * 0.7)
+        phase = np.select([testing, markup], ["C", "E"], "Unknown")
+        wyckoff_energy = np.select([testing, markup], [0.7, 0.9], 0.3)
+        bias = np.select([testing, markup], [0.3, np.where(volume_trend > 1.0, 0.5, -0.5)], 0.0)
+
+        recent_close = stats.last("close")
+        previous_close = stats.last("close", 1)
+        surge = active & (stats.last("volume") > stats.mean("volume") * 2.0)
+
+        return {
+            "wyckoff_phase": phase,
+            "wyckoff_energy": np.where(active, wyckoff_energy, 0.0),
+            "absorption_vs_displacement_bias": np.where(active, bias, 0.0),
+            "sos_detected": surge & (recent_close > previous_close),
+            "sow_detected": surge & (recent_close < previous_close),
+            "confidence": np.where(active, 0.6, 0.0),
+            "valid": ~active | (early_volume != 0),
+        }
+
 
 # ============================================================
 # 8. VOLATILITY LIQUIDITY PROCESSOR
@@ -364,26 +651,29 @@ class VolatilityLiquidityProcessor:
         self.bb_period = bb_period
         self.kc_period = kc_period
     
-    def process(self, data: pl.DataFrame, config: Dict[str, Any]) -> VolatilityLiquidityProcessorResult:
+    def process(
+        self,
+        data: pl.DataFrame,
+        config: Dict[str, Any],
+        stats: Optional[BarStatistics] = None,
+    ) -> VolatilityLiquidityProcessorResult:
         if data.is_empty() or len(data) < self.bb_period:
             return VolatilityLiquidityProcessorResult(
                 compression_energy=0.0,
                 expansion_energy=0.0,
                 confidence=0.0
             )
+        stats = stats if stats is not None else BarStatistics(data)
         
         # Calculate Bollinger Bands
-        closes = data["close"].tail(self.bb_period)
-        bb_middle = float(closes.mean())
-        bb_std = float(closes.std())
+        bb_middle = stats.mean("close", self.bb_period)
+        bb_std = stats.std("close", self.bb_period)
         bb_upper = bb_middle + 2 * bb_std
         bb_lower = bb_middle - 2 * bb_std
         bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else 0.0
         
         # Calculate Keltner Channels (using ATR approximation)
-        highs = data["high"].tail(self.kc_period)
-        lows = data["low"].tail(self.kc_period)
-        atr = float((highs - lows).mean())
+        atr = stats.mean("range", self.kc_period)
         kc_upper = bb_middle + 2 * atr
         kc_lower = bb_middle - 2 * atr
         kc_width = (kc_upper - kc_lower) / bb_middle if bb_middle > 0 else 0.0
@@ -416,3 +706,34 @@ class VolatilityLiquidityProcessor:
             compression_duration=compression_duration,
             confidence=0.8
         )
+
+    def process_history(self, stats: RollingBarStatistics) -> Dict[str, np.ndarray]:
+        active = stats.lengths >= self.bb_period
+
+        bb_middle = stats.mean("close", self.bb_period)
+        bb_std = stats.std("close", self.bb_period)
+        bb_upper = bb_middle + 2 * bb_std
+        bb_lower = bb_middle - 2 * bb_std
+        positive = bb_middle > 0
+        bb_width = np.where(positive, (bb_upper - bb_lower) / bb_middle, 0.0)
+
+        atr = stats.mean("range", self.kc_period)
+        kc_upper = bb_middle + 2 * atr
+        kc_lower = bb_middle - 2 * atr
+        kc_width = np.where(positive, (kc_upper - kc_lower) / bb_middle, 0.0)
+
+        squeeze_flag = active & (bb_width < kc_width)
+
+        max_width = 0.1
+        compression_energy = builtin_max(0.0, 1.0 - (bb_width / max_width))
+        expansion_energy = np.where(
+            squeeze_flag, compression_energy * 1.5, builtin_max(0.0, bb_width / max_width)
+        )
+
+        return {
+            "compression_energy": np.where(active, compression_energy, 0.0),
+            "expansion_energy": np.where(active, expansion_energy, 0.0),
+            "squeeze_flag": squeeze_flag,
+            "confidence": np.where(active, 0.8, 0.0),
+            "valid": np.ones(stats.n, dtype=bool),
+        }
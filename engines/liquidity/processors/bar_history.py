@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+"""
+Rolling bar statistics for historical (batch) liquidity runs.
+
+At bar t the per-bar engine sees the last ``min(t + 1, window)`` bars
+fetched for that timestamp. RollingBarStatistics serves those windows for
+every bar of a series at once: row t of each 2-D window is the window
+ending at bar t, left-padded with NaN during warm-up, and every statistic
+is an array with one value per bar. As in a freshly fetched frame, the
+first ``close_diff``/``returns`` value of each window is NaN.
+
+Reductions skip NaN, so padding and input nulls drop out the way they do
+in BarStatistics; full windows reduce the same values in the same order.
+
+RollingBarStatistics.latest builds the cross-sectional variant from a
+stacked multi-symbol frame: one row per symbol, holding the window that
+ends at that symbol's last bar.
+"""
+
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
+
+from engines.liquidity.processors.bar_stats import _LEADING_NULL, OHLCV_COLUMNS, BarStatistics
+
+_REDUCERS = {
+    "mean": np.nanmean,
+    "std": lambda values, axis: np.nanstd(values, axis=axis, ddof=1),
+    "sum": np.nansum,
+    "max": np.nanmax,
+    "min": np.nanmin,
+}
+
+
+def builtin_min(a, b) -> np.ndarray:
+    """Elementwise ``min(a, b)`` with Python's NaN semantics (a unless b < a)."""
+    return np.where(b < a, b, a)
+
+
+def builtin_max(a, b) -> np.ndarray:
+    """Elementwise ``max(a, b)`` with Python's NaN semantics (a unless b > a)."""
+    return np.where(b > a, b, a)
+
+
+def within(values: np.ndarray, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+    """Rows whose value passes a pydantic ``ge``/``le`` check (NaN never does)."""
+    ok = ~np.isnan(values)
+    if low is not None:
+        ok &= values >= low
+    if high is not None:
+        ok &= values <= high
+    return ok
+
+
+class RollingBarStatistics:
+    """Trailing-window statistics for every bar of an OHLCV series."""
+
+    def __init__(self, data: pl.DataFrame, window: int):
+        bars = BarStatistics(data)
+        self.n = bars.n
+        self.window = max(1, min(window, self.n))
+        self.columns: Dict[str, np.ndarray] = bars.columns
+        # Bars in each row's window
+        self.lengths = np.minimum(np.arange(1, self.n + 1), self.window)
+        self._windows: Dict[str, np.ndarray] = {}
+        self._cache: Dict[Tuple[str, str, Optional[int], bool], np.ndarray] = {}
+
+    @classmethod
+    def latest(
+        cls, data: pl.DataFrame, window: int, by: str = "symbol"
+    ) -> Tuple[List, "RollingBarStatistics"]:
+        """
+        Cross-sectional statistics for a stacked frame of several series.
+
+        Row i is the window ending at the last bar of the i-th ``by`` group
+        (in order of first appearance): the group's last ``window`` bars in
+        frame order, left-padded with NaN when the group has fewer. Derived columns are differenced within
+        each window, so their first value is NaN as in a fetched frame.
+
+        Returns:
+            (group keys in row order, statistics)
+        """
+        counts = data.group_by(by, maintain_order=True).len()
+        keys = counts[by].to_list()
+        window = max(1, min(window, int(counts["len"].max() or 0)))
+        data = data.group_by(by, maintain_order=True).tail(window)
+
+        stats = cls.__new__(cls)
+        stats.n = len(keys)
+        stats.window = window
+        stats.columns = {}
+        stats.lengths = np.minimum(counts["len"].to_numpy().astype(np.int64), window)
+        stats._cache = {}
+
+        # Scatter each group's bars into the right end of its row
+        row = np.repeat(np.arange(stats.n), stats.lengths)
+        first = np.cumsum(stats.lengths) - stats.lengths
+        column = window - stats.lengths[row] + np.arange(len(row)) - first[row]
+        windows: Dict[str, np.ndarray] = {}
+        for name in OHLCV_COLUMNS:
+            if name in data.columns:
+                windows[name] = np.full((stats.n, window), np.nan)
+                windows[name][row, column] = data[name].cast(pl.Float64).to_numpy()
+        if "high" in windows and "low" in windows:
+            windows["range"] = windows["high"] - windows["low"]
+        if "close" in windows:
+            close = windows["close"]
+            diff = np.full_like(close, np.nan)
+            returns = np.full_like(close, np.nan)
+            diff[:, 1:] = close[:, 1:] - close[:, :-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns[:, 1:] = diff[:, 1:] / close[:, :-1]
+            windows["close_diff"] = diff
+            windows["returns"] = returns
+        stats._windows = windows
+        return keys, stats
+
+    def __len__(self) -> int:
+        return self.n
+
+    def windows(self, name: str) -> np.ndarray:
+        """(n, window) view of a column; row t is the window ending at bar t."""
+        view = self._windows.get(name)
+        if view is None:
+            padded = np.concatenate([np.full(self.window - 1, np.nan), self.columns[name]])
+            view = sliding_window_view(padded, self.window)
+            self._windows[name] = view
+        return view
+
+    def tail(self, name: str, n: int) -> np.ndarray:
+        """Last ``n`` values of every window, NaN where the window is shorter."""
+        n = min(max(n, 0), self.window)
+        values = self.windows(name)[:, self.window - n:]
+        if name in _LEADING_NULL and n == self.window and n:
+            values = values.copy()
+            values[:, 0] = np.nan
+        return values
+
+    def head(self, name: str, n: int) -> np.ndarray:
+        """First ``n`` values of every window, NaN past the window's last bar."""
+        n = min(max(n, 0), self.window)
+        offset = np.arange(n)
+        index = (self.window - self.lengths)[:, None] + offset
+        values = np.take_along_axis(self.windows(name), np.minimum(index, self.window - 1), axis=1)
+        values[offset >= self.lengths[:, None]] = np.nan
+        if name in _LEADING_NULL and n:
+            values[:, 0] = np.nan
+        return values
+
+    def last(self, name: str, offset: int = 0) -> np.ndarray:
+        """Value ``offset`` bars before each bar, NaN where outside its window."""
+        values = np.full(self.n, np.nan)
+        if offset < self.window:
+            values[:] = self.windows(name)[:, self.window - 1 - offset]
+        first = offset + 1 if name in _LEADING_NULL else offset
+        values[self.lengths <= first] = np.nan
+        return values
+
+    def mean(self, name: str, n: Optional[int] = None, head: bool = False) -> np.ndarray:
+        return self._stat("mean", name, n, head)
+
+    def std(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self._stat("std", name, n, False)
+
+    def sum(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self._stat("sum", name, n, False)
+
+    def max(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self._stat("max", name, n, False)
+
+    def min(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self._stat("min", name, n, False)
+
+    def _stat(self, stat: str, name: str, n: Optional[int], head: bool) -> np.ndarray:
+        """Reduce each bar's whole window (n=None) or its first/last n values, cached."""
+        key = (stat, name, n, head)
+        values = self._cache.get(key)
+        if values is None:
+            size = self.window if n is None else n
+            windows = self.head(name, size) if head else self.tail(name, size)
+            with warnings.catch_warnings():
+                # All-NaN rows (windows shorter than the guard) reduce to NaN
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = _REDUCERS[stat](windows, axis=1)
+            self._cache[key] = values
+        return values
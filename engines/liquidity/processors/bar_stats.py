@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+"""
+Shared bar-statistics kernel for the liquidity processors.
+
+Built once per (symbol, tick) from the OHLCV window, then handed to all
+eight processors. Columns are NumPy views of the Polars frame, derived
+series (range, close diff, returns) are computed once, and window
+moments are cached by (statistic, column, window) so a mean or std used
+by several processors is only computed once.
+
+Null handling follows Polars: the leading element of ``close_diff`` and
+``returns`` is NaN (Polars' null) and is left out of reductions, as are
+nulls in the input columns, like ``Series.mean()``.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Derived columns whose first element is undefined (null in Polars)
+_LEADING_NULL = ("close_diff", "returns")
+
+_REDUCERS = {
+    "mean": np.ndarray.mean,
+    "std": lambda values: values.std(ddof=1),
+    "sum": np.ndarray.sum,
+    "max": np.ndarray.max,
+    "min": np.ndarray.min,
+}
+
+# Slower NaN-skipping variants, only for columns that contain nulls
+_NAN_REDUCERS = {
+    "mean": np.nanmean,
+    "std": lambda values: np.nanstd(values, ddof=1),
+    "sum": np.nansum,
+    "max": np.nanmax,
+    "min": np.nanmin,
+}
+
+
+class BarStatistics:
+    """OHLCV arrays plus cached head/tail window statistics."""
+
+    def __init__(self, data: pl.DataFrame):
+        self.n = data.height
+        self.columns: Dict[str, np.ndarray] = {
+            name: data[name].cast(pl.Float64).to_numpy()
+            for name in OHLCV_COLUMNS
+            if name in data.columns
+        }
+        self._nullable = {
+            name for name in self.columns if data[name].null_count() > 0
+        }
+        if "high" in self.columns and "low" in self.columns:
+            self.columns["range"] = self.columns["high"] - self.columns["low"]
+        if "close" in self.columns:
+            close = self.columns["close"]
+            diff = np.empty(self.n)
+            returns = np.empty(self.n)
+            if self.n:
+                diff[0] = returns[0] = np.nan
+                diff[1:] = close[1:] - close[:-1]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    returns[1:] = diff[1:] / close[:-1]
+            self.columns["close_diff"] = diff
+            self.columns["returns"] = returns
+            if "close" in self._nullable:
+                self._nullable.update(_LEADING_NULL)
+        if "high" in self._nullable or "low" in self._nullable:
+            self._nullable.add("range")
+        self._cache: Dict[Tuple[str, str, Optional[int], bool], float] = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    def tail(self, name: str, n: int) -> np.ndarray:
+        """Last ``n`` values of a column (a view)."""
+        values = self.columns[name]
+        return values[-n:] if n > 0 else values[:0]
+
+    def head(self, name: str, n: int) -> np.ndarray:
+        """First ``n`` values of a column (a view)."""
+        return self.columns[name][:max(n, 0)]
+
+    def last(self, name: str, offset: int = 0) -> float:
+        """Value ``offset`` bars before the most recent one."""
+        return float(self.columns[name][-1 - offset])
+
+    def mean(self, name: str, n: Optional[int] = None, head: bool = False) -> float:
+        return self._stat("mean", name, n, head)
+
+    def std(self, name: str, n: Optional[int] = None) -> float:
+        return self._stat("std", name, n, False)
+
+    def sum(self, name: str, n: Optional[int] = None) -> float:
+        return self._stat("sum", name, n, False)
+
+    def max(self, name: str, n: Optional[int] = None) -> float:
+        return self._stat("max", name, n, False)
+
+    def min(self, name: str, n: Optional[int] = None) -> float:
+        return self._stat("min", name, n, False)
+
+    def _stat(self, stat: str, name: str, n: Optional[int], head: bool) -> float:
+        """Reduce the whole column (n=None) or its first/last n values, cached."""
+        key = (stat, name, n, head)
+        value = self._cache.get(key)
+        if value is None:
+            values = self.columns[name]
+            if n is not None:
+                values = self.head(name, n) if head else self.tail(name, n)
+            if name in _LEADING_NULL and (head or len(values) == self.n):
+                values = values[1:]
+            reducers = _NAN_REDUCERS if name in self._nullable else _REDUCERS
+            value = float(reducers[stat](values))
+            self._cache[key] = value
+        return value
@@ -19,6 +19,8 @@ from datetime import datetime, timezone
 from typing import List, Dict, Optional, Tuple
 import logging
 
+from schemas.core_schemas import EngineOutput
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,14 +131,26 @@ class OpportunityScanner:
         
         opportunities = []
         
+        # Quick pre-filter: price and volume
+        candidates = []
         for symbol in universe:
             try:
-                # Quick pre-filter: price and volume
-                if not self._passes_prefilter(symbol, min_price, max_price, min_volume):
-                    continue
-                
+                if self._passes_prefilter(symbol, min_price, max_price, min_volume):
+                    candidates.append(symbol)
+            except Exception as e:
+                logger.warning(f"Error scanning {symbol}: {e}")
+        
+        # Liquidity and sentiment for all candidates in one cross-sectional pass
+        liquidity_outputs, sentiment_outputs = self._bulk_engine_outputs(
+            candidates, datetime.now(timezone.utc)
+        )
+        
+        for symbol in candidates:
+            try:
                 # Calculate opportunity score
-                opp_score = self._score_symbol(symbol)
+                opp_score = self._score_symbol(
+                    symbol, liquidity_outputs.get(symbol), sentiment_outputs.get(symbol)
+                )
                 
                 if opp_score:
                     opportunities.append(opp_score)
@@ -199,10 +213,78 @@ class OpportunityScanner:
             logger.debug(f"Prefilter failed for {symbol}: {e}")
             return False
     
-    def _score_symbol(self, symbol: str) -> Optional[OpportunityScore]:
+    def _bulk_engine_outputs(
+        self,
+        symbols: List[str],
+        now: datetime,
+    ) -> Tuple[Dict[str, EngineOutput], Dict[str, EngineOutput]]:
+        """
+        Liquidity and sentiment outputs for many symbols at once.
+        
+        Uses the engines' cross-sectional paths (LiquidityEngineV1.run_many,
+        SentimentEngineV1.process_many) when they have one; symbols missing
+        from the result are run one by one in _score_symbol.
+        """
+        liquidity_outputs: Dict[str, EngineOutput] = {}
+        sentiment_outputs: Dict[str, EngineOutput] = {}
+        if not symbols:
+            return liquidity_outputs, sentiment_outputs
+        
+        if hasattr(self.liquidity_engine, "run_many"):
+            try:
+                liquidity_outputs = self.liquidity_engine.run_many(symbols, now)
+            except Exception as e:
+                logger.warning(f"Bulk liquidity run failed: {e}")
+        
+        if hasattr(self.sentiment_engine, "process_many"):
+            try:
+                envelopes = self.sentiment_engine.process_many(symbols, now)
+                sentiment_outputs = {
+                    symbol: self._sentiment_output(symbol, now, envelope)
+                    for symbol, envelope in envelopes.items()
+                }
+            except Exception as e:
+                logger.warning(f"Bulk sentiment run failed: {e}")
+        
+        return liquidity_outputs, sentiment_outputs
+    
+    @staticmethod
+    def _sentiment_output(symbol: str, now: datetime, envelope) -> EngineOutput:
+        """Sentiment features the scanner scores, from a SentimentEnvelope."""
+        # Signed score as the sentiment agent maps it: +strength bullish, -strength bearish
+        if envelope.bias == "bullish":
+            score = envelope.strength
+        elif envelope.bias == "bearish":
+            score = -envelope.strength
+        else:
+            score = 0.0
+        
+        return EngineOutput(
+            kind="sentiment",
+            symbol=symbol,
+            timestamp=now,
+            features={
+                "sentiment_score": score,
+                "sentiment_confidence": envelope.confidence,
+            },
+            confidence=envelope.confidence,
+            regime=envelope.bias,
+        )
+    
+    def _score_symbol(
+        self,
+        symbol: str,
+        liquidity_output: Optional[EngineOutput] = None,
+        sentiment_output: Optional[EngineOutput] = None,
+    ) -> Optional[OpportunityScore]:
         """
         Calculate comprehensive opportunity score for a symbol.
         
+        Args:
+            symbol: Ticker symbol
+            liquidity_output: Precomputed liquidity output (run here if None)
+            sentiment_output: Precomputed sentiment output (run here if None)
+        
         Returns:
             OpportunityScore or None if analysis fails
         """
@@ -214,10 +296,12 @@ class OpportunityScanner:
             hedge_output = self.hedge_engine.run(symbol, now)
             
             # 2. Liquidity Engine (orderflow, absorption)
-            liquidity_output = self.liquidity_engine.run(symbol, now)
+            if liquidity_output is None:
+                liquidity_output = self.liquidity_engine.run(symbol, now)
             
             # 3. Sentiment Engine (news, flow, technical)
-            sentiment_output = self.sentiment_engine.run(symbol, now)
+            if sentiment_output is None:
+                sentiment_output = self.sentiment_engine.run(symbol, now)
             
             # 4. Elasticity Engine (price resistance)
             elasticity_output = self.elasticity_engine.run(symbol, now)
@@ -361,3 +361,156 @@ def detect_conflicting_signals(
             return True
     
     return False
+
+
+# ============================================================================
+# Column-wise fusion for historical (batch) runs
+# ============================================================================
+
+_TRENDING_REGIMES = ["bullish_consensus", "bearish_consensus", "risk_on", "risk_off"]
+_REVERTING_REGIMES = ["mixed", "neutral", "choppy"]
+
+
+def apply_graceful_degradation_columns(
+    confidences: np.ndarray,
+    weights: np.ndarray,
+    required_minimum: int = 3,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise ``apply_graceful_degradation``.
+    
+    Arrays are (rows, signals) with every row holding the same signal list.
+    
+    Returns:
+        (confidences, weights) after the boost
+    """
+    count = confidences.shape[1]
+    if count < required_minimum:
+        boost_factor = required_minimum / max(1, count)
+        return np.minimum(1.0, confidences * boost_factor), weights * boost_factor
+    
+    return confidences, weights
+
+
+def detect_conflicting_signal_columns(
+    values: np.ndarray,
+    confidences: np.ndarray,
+    weights: np.ndarray,
+    conflict_threshold: float = 0.7,
+) -> np.ndarray:
+    """Column-wise ``detect_conflicting_signals``; one bool per row."""
+    rows, count = values.shape
+    if count < 2:
+        return np.zeros(rows, dtype=bool)
+    
+    positive = values > conflict_threshold
+    negative = values < -conflict_threshold
+    strengths = weights * confidences
+    pos_strength = np.zeros(rows)
+    neg_strength = np.zeros(rows)
+    for column in range(count):
+        pos_strength = pos_strength + np.where(positive[:, column], strengths[:, column], 0.0)
+        neg_strength = neg_strength + np.where(negative[:, column], strengths[:, column], 0.0)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        balance = np.minimum(pos_strength, neg_strength) / np.maximum(pos_strength, neg_strength)
+    return positive.any(axis=1) & negative.any(axis=1) & (balance > 0.7)
+
+
+def fuse_signal_columns(
+    values: np.ndarray,
+    confidences: np.ndarray,
+    weights: np.ndarray,
+    drivers: List[str],
+    energy_level: np.ndarray,
+    regime: np.ndarray,
+    bias_threshold: float = 0.15,
+) -> Dict[str, np.ndarray]:
+    """
+    Column-wise ``fuse_signals`` for rows that share one signal list.
+    
+    Args:
+        values, confidences, weights: (rows, len(drivers)) signal arrays
+        drivers: Driver name of each column, in signal order
+        energy_level: Energy level per row
+        regime: Regime label per row ("" where unknown)
+        bias_threshold: Threshold for neutral classification [0, 1]
+    
+    Returns:
+        Dict of per-row bias, strength, energy and confidence, plus the
+        (rows, len(drivers)) driver ``contributions``. Rows that fall back to
+        the empty envelope get NaN contributions.
+    """
+    rows, count = values.shape
+    fused = {
+        "bias": np.full(rows, "neutral", dtype=object),
+        "strength": np.zeros(rows),
+        "energy": np.zeros(rows),
+        "confidence": np.zeros(rows),
+        "contributions": np.full((rows, count), np.nan),
+    }
+    if not count:
+        return fused
+    
+    # Regime- and energy-aware weighting
+    trending = np.isin(regime, _TRENDING_REGIMES)
+    reverting = np.isin(regime, _REVERTING_REGIMES)
+    high_energy = energy_level > 1.5
+    low_energy = energy_level < 0.5
+    weights = weights.copy()
+    for column, driver in enumerate(drivers):
+        factor = np.ones(rows)
+        if driver in ["wyckoff", "energy"]:
+            factor = factor * np.where(trending, 1.3, 1.0)
+        elif driver == "oscillators":
+            factor = factor * np.where(trending, 0.8, 1.0)
+        if driver in ["oscillators", "volatility"]:
+            factor = factor * np.where(reverting, 1.3, 1.0)
+        elif driver == "wyckoff":
+            factor = factor * np.where(reverting, 0.8, 1.0)
+        weights[:, column] = weights[:, column] * factor
+        
+        if driver == "oscillators":
+            energy_factor = np.where(high_energy, 0.7, np.where(low_energy, 1.2, 1.0))
+        elif driver == "flow":
+            energy_factor = np.where(high_energy, 1.2, 1.0)
+        elif driver == "energy":
+            energy_factor = np.where(low_energy, 0.8, 1.0)
+        else:
+            continue
+        weights[:, column] = weights[:, column] * energy_factor
+    
+    # Energy-aware rescaling of extreme values
+    damping = np.minimum(0.2, np.maximum(0.0, (energy_level - 0.5) / 7.5))[:, None]
+    magnitude = np.abs(values)
+    values = np.where(magnitude > 0.7, np.sign(values) * (magnitude * (1.0 - damping)), values)
+    
+    total_weight = np.zeros(rows)
+    for column in range(count):
+        total_weight = total_weight + weights[:, column] * confidences[:, column]
+    ok = total_weight != 0
+    
+    contributions = values * weights * confidences
+    with np.errstate(divide="ignore", invalid="ignore"):
+        combined = np.sum(contributions, axis=1) / total_weight
+    
+    # Meta-confidence
+    agreement_ratio = np.sum(np.sign(values) == np.sign(combined)[:, None], axis=1) / count
+    variance = np.var(values, axis=1)
+    confidence = (
+        np.mean(confidences, axis=1) * 0.4 +
+        agreement_ratio * 0.3 +
+        min(1.0, count / 6.0) * 0.2 +
+        (1.0 - np.minimum(0.3, variance * 0.5)) * 0.1
+    )
+    
+    # Aggregate energy
+    energy = np.mean(np.abs(values), axis=1) * 0.4 + energy_level * 0.4 + variance * 0.2
+    
+    fused["bias"][ok & (combined > bias_threshold)] = "bullish"
+    fused["bias"][ok & (combined < -bias_threshold)] = "bearish"
+    fused["strength"][ok] = np.minimum(1.0, np.abs(combined[ok]))
+    fused["energy"][ok] = np.where(energy[ok] > 0.0, energy[ok], 0.0)
+    fused["confidence"][ok] = np.clip(confidence[ok], 0.0, 1.0)
+    fused["contributions"][ok] = contributions[ok]
+    return fused
@@ -3,13 +3,23 @@ Sentiment Engine v1.0 - Complete Processor Implementations
 
 All sentiment processors following the canonical specification.
 Pure functions, stateless, Polars/NumPy vectorized.
+
+Each processor also exposes ``process_history``: the same computation over
+a stack of equal-length windows, one row per bar, as NumPy column
+operations. Windows are (rows, length) arrays keyed by OHLCV column, and
+every slice of ``process`` is taken along axis 1, so each row reduces the
+same values in the same order as the per-bar call. The result holds the
+signal ``value``/``confidence``, the fields the engine reads back, and a
+``valid`` mask that is False where ``process`` would raise (a model
+bound failing validation).
 """
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 
 import numpy as np
 import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
 
 from engines.sentiment.models import (
     BollingerSignals,
@@ -34,6 +44,23 @@ from engines.sentiment.models import (
 )
 
 
+def _in_range(values: np.ndarray, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+    """Rows whose value passes a pydantic ``ge``/``le`` check (NaN never does)."""
+    ok = ~np.isnan(values)
+    if low is not None:
+        ok &= values >= low
+    if high is not None:
+        ok &= values <= high
+    return ok
+
+
+def _constant_history(rows: int, **fields) -> Dict[str, np.ndarray]:
+    """History output repeating one (default) processor output on every row."""
+    history = {name: np.full(rows, value) for name, value in fields.items()}
+    history["valid"] = np.ones(rows, dtype=bool)
+    return history
+
+
 # ============================================================================
 # WYCKOFF PROCESSOR
 # ============================================================================
@@ -107,6 +134,87 @@ class WyckoffProcessor:
         
         return wyckoff_signals, sentiment_signal
     
+    def process_history(self, windows: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows (see module docstring)."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < self.lookback:
+            return _constant_history(rows, value=0.0, confidence=0.0, phase="Unknown")
+        
+        opens = windows["open"]
+        highs = windows["high"]
+        lows = windows["low"]
+        volumes = windows["volume"]
+        
+        # Phase detection
+        recent_range = np.ptp(closes[:, -20:], axis=1)
+        total_range = np.ptp(closes, axis=1)
+        avg_volume = np.mean(volumes, axis=1)
+        recent_volume = np.mean(volumes[:, -10:], axis=1)
+        if length >= 20:
+            momentum = (closes[:, -1] - closes[:, -20]) / closes[:, -20]
+        else:
+            momentum = np.zeros(rows)
+        rising = (momentum > 0.05) & (recent_volume > avg_volume)
+        flat = np.abs(momentum) < 0.02
+        conditions = [
+            (recent_range / (total_range + 1e-9) < 0.3) & (recent_volume > avg_volume * 1.2),
+            rising & (np.std(closes[:, -10:], axis=1) > np.std(closes[:, -30:-10], axis=1)),
+            rising,
+            (momentum < -0.05) & (recent_volume > avg_volume),
+            flat & (recent_volume < avg_volume * 0.8),
+            flat,
+        ]
+        phase = np.select(conditions, ["B", "E", "D", "D", "A", "C"], "Unknown")
+        phase_confidence = np.select(conditions, [0.7, 0.6, 0.75, 0.75, 0.65, 0.7], 0.3)
+        
+        # Demand/Supply analysis
+        demand_volume = np.sum(np.where(closes > opens, volumes, 0.0), axis=1)
+        supply_volume = np.sum(np.where(closes < opens, volumes, 0.0), axis=1)
+        demand_supply = np.where(
+            supply_volume == 0, 2.0, np.clip(demand_volume / supply_volume, 0.0, 2.0)
+        )
+        
+        # Spring/UTAD detection
+        if length >= 30:
+            current_close = closes[:, -1]
+            avg_break_volume = np.mean(volumes[:, -30:-5], axis=1)
+            break_volume = np.mean(volumes[:, -5:], axis=1)
+            support = np.min(lows[:, -30:-5], axis=1)
+            spring = (
+                (np.min(lows[:, -5:], axis=1) < support * (1 - self.spring_threshold))
+                & (current_close > support)
+                & (break_volume < avg_break_volume * 1.1)
+            )
+            resistance = np.max(highs[:, -30:-5], axis=1)
+            utad = (
+                (np.max(highs[:, -5:], axis=1) > resistance * (1 + self.spring_threshold))
+                & (current_close < resistance)
+                & (break_volume > avg_break_volume * 1.2)
+            )
+        else:
+            spring = utad = np.zeros(rows, dtype=bool)
+        
+        # Operator bias, phase contribution signed by demand/supply
+        phase_bias = np.select([phase == "B", phase == "D", phase == "E"], [0.2, 0.5, 0.3], 0.0)
+        bias = np.where(
+            demand_supply > 1.1, phase_bias, np.where(demand_supply < 0.9, -phase_bias, 0.0)
+        )
+        bias = bias + np.where(spring, 0.3, 0.0)
+        bias = bias - np.where(utad, 0.3, 0.0)
+        bias = np.clip(bias + (demand_supply - 1.0) * 0.3, -1.0, 1.0)
+        
+        # Overall strength
+        strength = phase_confidence * 0.5 + np.abs(demand_supply - 1.0) * 0.3
+        strength = np.clip(strength + np.where(spring | utad, 0.2, 0.0), 0.0, 1.0)
+        
+        return {
+            "value": bias,
+            "confidence": strength,
+            "phase": phase,
+            "valid": _in_range(bias, -1.0, 1.0) & _in_range(strength, 0.0, 1.0),
+        }
+    
     def _detect_phase(self, df: pl.DataFrame) -> WyckoffPhase:
         """Detect current Wyckoff phase."""
         # Simplified phase detection based on price action and volume patterns
@@ -384,6 +492,95 @@ class OscillatorProcessor:
         
         return oscillator_signals, sentiment_signal
     
+    def process_history(self, windows: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows (see module docstring)."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < max(self.rsi_period, self.mfi_period, self.stoch_k) + 5:
+            return _constant_history(rows, value=0.0, confidence=0.0)
+        
+        highs = windows["high"]
+        lows = windows["low"]
+        current_close = closes[:, -1]
+        
+        # RSI (slope and divergence feed no envelope field and cannot fail)
+        deltas = np.diff(closes, axis=1)
+        avg_gain = np.mean(np.where(deltas > 0, deltas, 0)[:, -self.rsi_period:], axis=1)
+        avg_loss = np.mean(np.where(deltas < 0, -deltas, 0)[:, -self.rsi_period:], axis=1)
+        rsi = np.where(
+            avg_loss == 0,
+            np.where(avg_gain == 0, 50.0, 100.0),
+            100.0 - (100.0 / (1.0 + avg_gain / avg_loss)),
+        )
+        
+        # MFI
+        typical_price = windows["typical_price"]
+        money_flow = windows["money_flow"][:, -self.mfi_period:]
+        tp_change = np.diff(typical_price[:, -self.mfi_period - 1:], axis=1)
+        positive_flow = np.sum(np.where(tp_change > 0, money_flow, 0.0), axis=1)
+        negative_flow = np.sum(np.where(tp_change < 0, money_flow, 0.0), axis=1)
+        mfi = np.where(
+            negative_flow == 0, 100.0, 100.0 - (100.0 / (1.0 + positive_flow / negative_flow))
+        )
+        total_flow = positive_flow + negative_flow
+        buy_pressure = np.where(total_flow > 0, positive_flow / total_flow, 0.5)
+        sell_pressure = np.where(total_flow > 0, negative_flow / total_flow, 0.5)
+        
+        # Stochastic %K, and %D from the K of the previous windows
+        period_high = np.max(highs[:, -self.stoch_k:], axis=1)
+        period_low = np.min(lows[:, -self.stoch_k:], axis=1)
+        k_value = np.where(
+            period_high == period_low,
+            50.0,
+            100.0 * (current_close - period_low) / (period_high - period_low),
+        )
+        if length >= self.stoch_k + self.stoch_d:
+            k_values = []
+            for i in range(self.stoch_d):
+                idx = -(i + 1)
+                ph = np.max(highs[:, idx - self.stoch_k:idx], axis=1)
+                pl_ = np.min(lows[:, idx - self.stoch_k:idx], axis=1)
+                k_values.append(
+                    np.where(ph == pl_, 50.0, 100.0 * (closes[:, idx] - pl_) / (ph - pl_))
+                )
+            d_value = np.mean(np.stack(k_values, axis=1), axis=1)
+        else:
+            d_value = k_value
+        d_value = np.clip(d_value, 0.0, 100.0)
+        
+        # Composite score
+        def map_to_sentiment(value: np.ndarray) -> np.ndarray:
+            return np.where(
+                value < 30,
+                (value - 30) / 30,
+                np.where(value > 70, (value - 70) / 30, (value - 50) / 20),
+            )
+        
+        composite = np.clip(
+            map_to_sentiment(rsi) * 0.4
+            + map_to_sentiment(mfi) * 0.3
+            + map_to_sentiment(k_value) * 0.3,
+            -1.0,
+            1.0,
+        )
+        
+        # Confidence from oscillator agreement
+        votes = [np.where(value > 60, 1, np.where(value < 40, -1, 0)) for value in (rsi, mfi, k_value)]
+        agreement = (votes[0] == votes[1]) & (votes[1] == votes[2])
+        non_neutral = (votes[0] != 0).astype(int) + (votes[1] != 0) + (votes[2] != 0)
+        confidence = np.where(agreement, 0.8, np.where(non_neutral >= 2, 0.6, 0.4))
+        
+        valid = (
+            _in_range(rsi, 0.0, 100.0)
+            & _in_range(mfi, 0.0, 100.0)
+            & _in_range(buy_pressure, 0.0, 1.0)
+            & _in_range(sell_pressure, 0.0, 1.0)
+            & _in_range(k_value, 0.0, 100.0)
+            & _in_range(d_value, 0.0, 100.0)
+            & _in_range(composite, -1.0, 1.0)
+        )
+        return {"value": composite, "confidence": confidence, "valid": valid}
+    
     def _calculate_rsi(self, df: pl.DataFrame) -> RSISignals:
         """Calculate RSI and derived signals."""
         closes = df["close"].to_numpy()
@@ -686,6 +883,96 @@ class VolatilityProcessor:
         
         return volatility_signals, sentiment_signal
     
+    def process_history(self, windows: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows (see module docstring)."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < max(self.bb_period, self.kc_period):
+            no_flag = np.zeros(rows, dtype=bool)
+            history = _constant_history(rows, value=0.0, confidence=0.0)
+            history.update(squeeze_detected=no_flag, expansion=no_flag, compression=no_flag)
+            return history
+        
+        highs = windows["high"]
+        lows = windows["low"]
+        current = closes[:, -1]
+        
+        # Bollinger Bands
+        recent = closes[:, -self.bb_period:]
+        middle = np.mean(recent, axis=1)
+        std = np.std(recent, axis=1)
+        upper = middle + (self.bb_std * std)
+        lower = middle - (self.bb_std * std)
+        percent_b = np.where(upper == lower, 0.5, (current - lower) / (upper - lower))
+        bandwidth = np.where(middle != 0, (upper - lower) / middle, 0.0)
+        pressure = np.where(
+            percent_b > 0.8,
+            -(percent_b - 0.8) / 0.2,
+            np.where(percent_b < 0.2, (0.2 - percent_b) / 0.2, 0.0),
+        )
+        pressure = np.clip(pressure, -1.0, 1.0)
+        if length > self.bb_period:
+            past = sliding_window_view(closes, self.bb_period, axis=1)[:, :length - self.bb_period]
+            avg_bandwidth = np.mean(
+                (np.max(past, axis=2) - np.min(past, axis=2)) / np.mean(past, axis=2), axis=1
+            )
+        else:
+            avg_bandwidth = bandwidth
+        squeeze_active = bandwidth < avg_bandwidth * 0.7
+        
+        # Keltner Channels. True range of every window position; position 0
+        # pairs with the window's last close, as closes[j - 1] does for j = 0.
+        kc_middle = np.mean(closes[:, -self.kc_period:], axis=1)
+        previous_close = np.roll(closes, 1, axis=1)
+        high_close = np.abs(highs - previous_close)
+        low_close = np.abs(lows - previous_close)
+        true_range = highs - lows
+        true_range = np.where(high_close > true_range, high_close, true_range)
+        true_range = np.where(low_close > true_range, low_close, true_range)
+        
+        atr_count = min(length, self.kc_period + 1) - 1
+        if atr_count:
+            # Most recent bar first, like the per-bar loop
+            atr = np.mean(true_range[:, length - atr_count:][:, ::-1], axis=1)
+        else:
+            atr = np.zeros(rows)
+        kc_upper = kc_middle + (self.kc_mult * atr)
+        kc_lower = kc_middle - (self.kc_mult * atr)
+        position = np.where(kc_upper == kc_lower, 0.0, (current - kc_middle) / (kc_upper - kc_middle))
+        
+        if length > self.kc_period * 2:
+            spans = sliding_window_view(true_range, self.kc_period, axis=1)
+            avg_width = np.mean(np.mean(spans[:, :length - 2 * self.kc_period], axis=2), axis=1)
+        else:
+            avg_width = atr
+        expansion = atr > avg_width * 1.2
+        compression = atr < avg_width * 0.8
+        
+        squeeze = squeeze_active & compression
+        compression_energy = np.where(squeeze_active | compression, (1.0 - bandwidth) * 2.0, 0.0)
+        expansion_energy = np.where(expansion, bandwidth * 2.0, 0.0)
+        envelope_score = np.clip(pressure * 0.6 + position * 0.4, -1.0, 1.0)
+        
+        confidence = 0.5 + np.where(squeeze, 0.2, 0.0)
+        confidence = confidence + np.where(np.abs(percent_b - 0.5) > 0.3, 0.15, 0.0)
+        confidence = confidence + np.where(np.abs(position) > 0.5, 0.15, 0.0)
+        confidence = np.clip(confidence, 0.0, 1.0)
+        
+        valid = (
+            _in_range(pressure, -1.0, 1.0)
+            & _in_range(compression_energy, 0.0)
+            & _in_range(expansion_energy, 0.0)
+            & _in_range(envelope_score, -1.0, 1.0)
+        )
+        return {
+            "value": envelope_score,
+            "confidence": confidence,
+            "squeeze_detected": squeeze,
+            "expansion": expansion,
+            "compression": compression,
+            "valid": valid,
+        }
+    
     def _calculate_bollinger(self, df: pl.DataFrame) -> BollingerSignals:
         """Calculate Bollinger Bands."""
         closes = df["close"].to_numpy()
@@ -924,6 +1211,59 @@ class FlowBiasProcessor:
         
         return flow_signals, sentiment_signal
     
+    def process_history(
+        self, windows: Dict[str, np.ndarray], darkpool_data: Optional[dict] = None
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows; ``darkpool_data`` applies to every row."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < self.orderflow_window:
+            return _constant_history(rows, value=0.0, confidence=0.0, composite_flow_bias=0.0)
+        
+        darkpool = self._calculate_darkpool(darkpool_data) if self.darkpool_enabled else self._default_darkpool()
+        
+        # Order flow over the last orderflow_window bars
+        closes = closes[:, -self.orderflow_window:]
+        opens = windows["open"][:, -self.orderflow_window:]
+        volumes = windows["volume"][:, -self.orderflow_window:]
+        up_volume = np.sum(np.where(closes > opens, volumes, 0.0), axis=1)
+        down_volume = np.sum(np.where(closes < opens, volumes, 0.0), axis=1)
+        total_volume = up_volume + down_volume
+        no_volume = total_volume == 0
+        imbalance = np.where(no_volume, 0.0, (up_volume - down_volume) / total_volume)
+        buy_ratio = np.where(no_volume, 0.5, up_volume / total_volume)
+        sell_ratio = np.where(no_volume, 0.5, down_volume / total_volume)
+        pressure = np.clip(imbalance, -1.0, 1.0)
+        
+        # Composite and confidence
+        of_confidence = np.abs(pressure) * 0.5 + 0.3
+        if darkpool.confidence > 0:
+            composite = np.clip(pressure * 0.7 + darkpool.sentiment_score * 0.3, -1.0, 1.0)
+            boosted = of_confidence + darkpool.confidence * 0.3
+            confidence = np.where(
+                np.sign(pressure) == np.sign(darkpool.sentiment_score),
+                np.where(boosted < 1.0, boosted, 1.0),
+                of_confidence * 0.7,
+            )
+        else:
+            composite = np.clip(pressure, -1.0, 1.0)
+            confidence = of_confidence
+        confidence = np.clip(confidence, 0.0, 1.0)
+        
+        valid = (
+            _in_range(pressure, -1.0, 1.0)
+            & _in_range(buy_ratio, 0.0, 1.0)
+            & _in_range(sell_ratio, 0.0, 1.0)
+            & _in_range(composite, -1.0, 1.0)
+            & _in_range(confidence, 0.0, 1.0)
+        )
+        return {
+            "value": composite,
+            "confidence": confidence,
+            "composite_flow_bias": composite,
+            "valid": valid,
+        }
+    
     def _calculate_orderflow(self, df: pl.DataFrame) -> OrderFlowSignals:
         """Calculate order flow imbalance from price-volume action."""
         closes = df["close"].to_numpy()
@@ -1106,6 +1446,85 @@ class BreadthRegimeProcessor:
         
         return breadth_signals, sentiment_signal
     
+    def process_history(
+        self, windows: Dict[str, np.ndarray], breadth_data: Optional[dict] = None
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows; ``breadth_data`` applies to every row."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < max(self.ma_periods):
+            return _constant_history(rows, value=0.0, confidence=0.0, multi_period_regime="unknown")
+        
+        current = closes[:, -1]
+        returns = np.diff(closes, axis=1) / closes[:, :-1]
+        
+        # Breadth
+        if breadth_data is not None:
+            advances = breadth_data.get("advances", 0)
+            declines = breadth_data.get("declines", 0)
+            total = advances + declines
+            ratio = advances / total if total > 0 else 1.0
+            ad_ratio = np.full(rows, float(ratio))
+            thrust = np.full(rows, bool(ratio > 0.7 or ratio < 0.3))
+        else:
+            ad_ratio = np.sum(returns[:, -20:] > 0, axis=1) / 20.0
+            thrust = np.zeros(rows, dtype=bool)
+        pct_above_ma = np.zeros(rows)
+        for period in self.ma_periods:
+            if length >= period:
+                above = current > np.mean(closes[:, -period:], axis=1)
+                pct_above_ma = pct_above_ma + np.where(above, 1.0 / len(self.ma_periods), 0.0)
+        
+        # Risk regime
+        recent_returns = returns[:, -self.regime_window:]
+        volatility = np.std(recent_returns, axis=1)
+        avg_return = np.mean(recent_returns, axis=1)
+        if length - 1 > self.regime_window * 2:
+            hist_vol = np.std(returns[:, :-self.regime_window], axis=1)
+        else:
+            hist_vol = volatility
+        vol_ratio = np.where(hist_vol > 0, volatility / hist_vol, 1.0)
+        risk_on = (avg_return > 0) & (vol_ratio < 1.2)
+        risk_off = (avg_return < 0) & (vol_ratio > 1.3)
+        rotation = np.select([risk_on, risk_off], [0.5, -0.5], 0.0)
+        risk_confidence = np.where(risk_on | risk_off, 0.7, 0.5)
+        
+        # Multi-period regime
+        periods = [period for period in [10, 20, 50] if length >= period]
+        if periods:
+            bullish = np.zeros(rows, dtype=int)
+            bearish = np.zeros(rows, dtype=int)
+            for period in periods:
+                period_return = (current - closes[:, -period]) / closes[:, -period]
+                bullish += period_return > 0.05
+                bearish += period_return < -0.05
+            multi_period = np.select(
+                [bullish >= 2, bearish >= 2], ["bullish_consensus", "bearish_consensus"], "mixed"
+            )
+        else:
+            multi_period = np.full(rows, "unknown")
+        
+        # Composite score and confidence
+        composite = np.clip(
+            (ad_ratio - 0.5) * 2.0 * 0.4 + (pct_above_ma - 0.5) * 2.0 * 0.3 + rotation * 0.3,
+            -1.0,
+            1.0,
+        )
+        confidence = 0.5 + np.where(thrust, 0.2, 0.0)
+        confidence = np.clip(confidence + risk_confidence * 0.3, 0.0, 1.0)
+        
+        valid = (
+            _in_range(pct_above_ma, 0.0, 1.0)
+            & _in_range(composite, -1.0, 1.0)
+            & _in_range(confidence, 0.0, 1.0)
+        )
+        return {
+            "value": composite,
+            "confidence": confidence,
+            "multi_period_regime": multi_period,
+            "valid": valid,
+        }
+    
     def _calculate_breadth(self, df: pl.DataFrame, breadth_data: Optional[dict]) -> BreadthSignals:
         """Calculate market breadth indicators."""
         if breadth_data is not None:
@@ -1321,6 +1740,66 @@ class EnergyProcessor:
         
         return energy_signals, sentiment_signal
     
+    def process_history(self, windows: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized ``process`` over equal-length windows (see module docstring)."""
+        closes = windows["close"]
+        rows, length = closes.shape
+        if length < max(self.momentum_window, self.coherence_window):
+            return _constant_history(rows, value=0.0, confidence=0.0, metabolic_load=0.0)
+        
+        volumes = windows["volume"]
+        returns = np.diff(closes, axis=1) / closes[:, :-1]
+        
+        # Trend energy and coherence
+        momentum_energy = np.sum(np.abs(returns[:, -self.momentum_window:]), axis=1) * 100
+        moves = returns[:, -self.coherence_window:]
+        coherence = np.abs(np.sum(moves > 0, axis=1) / moves.shape[1] - 0.5) * 2.0
+        if length >= self.momentum_window + 10:
+            prev_momentum = np.sum(np.abs(returns[:, -self.momentum_window - 10:-10]), axis=1) * 100
+            prev_moves = returns[:, -self.coherence_window - 10:-10]
+            prev_coherence = np.abs(np.sum(prev_moves > 0, axis=1) / prev_moves.shape[1] - 0.5) * 2.0
+            exhaustion = (momentum_energy > prev_momentum * 1.2) & (coherence < prev_coherence * 0.8)
+            buildup = (momentum_energy < prev_momentum * 0.8) & (coherence > prev_coherence * 1.2)
+        else:
+            exhaustion = buildup = np.zeros(rows, dtype=bool)
+        
+        # Volume confirmation (the volume/return correlation feeds no envelope field)
+        recent_volumes = volumes[:, -self.momentum_window:]
+        avg_recent_volume = np.mean(recent_volumes, axis=1)
+        confirmation = avg_recent_volume > np.mean(volumes, axis=1) * 1.1
+        
+        # Exhaustion vs continuation
+        score = 0.0 - np.where(exhaustion, 0.4, 0.0)
+        score = score + np.where(buildup, 0.4, 0.0)
+        score = score - np.where(coherence < 0.3, 0.2, 0.0)
+        score = score + np.where(coherence > 0.7, 0.2, 0.0)
+        score = score + np.where(confirmation, 0.2, 0.0)
+        score = score - np.where(~confirmation & (momentum_energy > 1.0), 0.2, 0.0)
+        score = np.clip(score, -1.0, 1.0)
+        
+        # Metabolic load
+        volatility = np.std(returns[:, -self.momentum_window:], axis=1)
+        baseline_vol = np.std(returns, axis=1) if length - 1 > self.momentum_window else volatility
+        baseline_volume = np.mean(volumes, axis=1) if length > self.momentum_window else avg_recent_volume
+        load = (volatility / (baseline_vol + 1e-9)) * (avg_recent_volume / (baseline_volume + 1e-9))
+        metabolic_load = np.where(load > 0.0, load, 0.0)
+        
+        confidence = 0.5 + coherence * 0.3
+        confidence = np.clip(confidence + np.where(confirmation, 0.2, 0.0), 0.0, 1.0)
+        
+        valid = (
+            _in_range(momentum_energy, 0.0)
+            & _in_range(coherence, 0.0, 1.0)
+            & _in_range(score, -1.0, 1.0)
+            & _in_range(confidence, 0.0, 1.0)
+        )
+        return {
+            "value": score,
+            "confidence": confidence,
+            "metabolic_load": metabolic_load,
+            "valid": valid,
+        }
+    
     def _calculate_trend_energy(self, df: pl.DataFrame) -> TrendEnergySignals:
         """Calculate trend momentum energy."""
         closes = df["close"].to_numpy()
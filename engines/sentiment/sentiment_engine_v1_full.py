@@ -12,15 +12,21 @@ Multi-modal sentiment analysis combining:
 Outputs unified sentiment vector for Agent 3 (Sentiment Agent).
 """
 
+import warnings
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
 
 from engines.inputs.market_data_adapter import MarketDataAdapter
 from engines.sentiment.fusion import (
     apply_graceful_degradation,
+    apply_graceful_degradation_columns,
+    detect_conflicting_signal_columns,
     detect_conflicting_signals,
+    fuse_signal_columns,
     fuse_signals,
 )
 from engines.sentiment.models import (
@@ -37,6 +43,24 @@ from engines.sentiment.processors.all_processors import (
     WyckoffProcessor,
 )
 
+# Processor drivers, in the order process() collects their signals
+_DRIVERS = ("wyckoff", "oscillators", "volatility", "flow", "breadth", "energy")
+
+_HISTORY_SCHEMA = {
+    "bias": pl.Utf8,
+    "strength": pl.Float64,
+    "energy": pl.Float64,
+    "confidence": pl.Float64,
+    "wyckoff_phase": pl.Utf8,
+    "liquidity_regime": pl.Utf8,
+    "volatility_regime": pl.Utf8,
+    "flow_regime": pl.Utf8,
+    **{f"driver_{driver}": pl.Float64 for driver in _DRIVERS},
+}
+
+# Bars evaluated per vectorized pass (bounds the (rows, lookback) temporaries)
+_HISTORY_CHUNK = 1 << 16
+
 
 class SentimentEngineV1:
     """
@@ -131,14 +155,7 @@ class SentimentEngineV1:
             SentimentEnvelope with fused sentiment vector
         """
         # Fetch market data
-        lookback = max(
-            self.config.wyckoff.lookback_periods,
-            self.config.oscillators.lookback_periods,
-            self.config.volatility.lookback_periods,
-            self.config.flow.lookback_periods,
-            self.config.breadth.lookback_periods,
-            self.config.energy.lookback_periods,
-        ) + 10  # Extra buffer for calculations
+        lookback = self._lookback_bars()
         
         try:
             df = self.market_adapter.fetch_ohlcv(symbol, lookback, now)
@@ -161,6 +178,26 @@ class SentimentEngineV1:
                 drivers={"no_data": 0.0},
             )
         
+        return self._process_frame(df, darkpool_data, breadth_data)
+    
+    def _lookback_bars(self) -> int:
+        """Bars fetched per timestamp."""
+        return max(
+            self.config.wyckoff.lookback_periods,
+            self.config.oscillators.lookback_periods,
+            self.config.volatility.lookback_periods,
+            self.config.flow.lookback_periods,
+            self.config.breadth.lookback_periods,
+            self.config.energy.lookback_periods,
+        ) + 10  # Extra buffer for calculations
+    
+    def _process_frame(
+        self,
+        df: pl.DataFrame,
+        darkpool_data: Optional[Dict],
+        breadth_data: Optional[Dict],
+    ) -> SentimentEnvelope:
+        """Run the processors on one fetched window and fuse their signals."""
         # Process all sentiment signals
         signals: List[SentimentSignal] = []
         
@@ -285,6 +322,318 @@ class SentimentEngineV1:
         
         return envelope
     
+    def process_history(
+        self,
+        frame: pl.DataFrame,
+        darkpool_data: Optional[Dict] = None,
+        breadth_data: Optional[Dict] = None,
+    ) -> pl.DataFrame:
+        """
+        Compute the sentiment envelope for every bar of a series in one pass.
+        
+        Row t equals ``process()`` at bar t's timestamp: the processors over
+        the last ``lookback`` bars ending at t, with the same dark pool and
+        breadth inputs for every bar. Bars with a full window run through the
+        processors' vectorized ``process_history`` and column-wise fusion; the
+        first ``lookback - 1`` bars (shorter windows) take the per-bar path.
+        
+        Args:
+            frame: OHLCV bars in time order, optionally with a timestamp column
+            darkpool_data: Optional dark pool data (DIX/GEX)
+            breadth_data: Optional market breadth data (advances/declines)
+        
+        Returns:
+            DataFrame aligned to the bars: timestamp (if present), bias,
+            strength, energy, confidence, the four regime labels and one
+            ``driver_<name>`` contribution per processor (null when that
+            processor did not contribute)
+        """
+        if frame.is_empty():
+            return pl.DataFrame()
+        
+        lookback = self._lookback_bars()
+        warmup = min(frame.height, lookback - 1)
+        parts = [
+            pl.DataFrame(
+                [
+                    self._history_row(self._process_frame(frame.head(end), darkpool_data, breadth_data))
+                    for end in range(1, warmup + 1)
+                ],
+                schema=_HISTORY_SCHEMA,
+            )
+        ]
+        
+        if frame.height >= lookback:
+            windows = {
+                name: sliding_window_view(values, lookback)
+                for name, values in self._window_columns(frame).items()
+            }
+            with np.errstate(all="ignore"), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                for start in range(0, frame.height - lookback + 1, _HISTORY_CHUNK):
+                    chunk = {
+                        name: view[start:start + _HISTORY_CHUNK] for name, view in windows.items()
+                    }
+                    part = pl.DataFrame(
+                        self._fuse_history(chunk, darkpool_data, breadth_data),
+                        schema=_HISTORY_SCHEMA,
+                    )
+                    # Missing drivers are NaN in the arrays, null in the frame
+                    parts.append(part.with_columns(pl.col("^driver_.*$").fill_nan(None)))
+        
+        history = pl.concat(parts)
+        if "timestamp" in frame.columns:
+            history = history.with_columns(frame["timestamp"]).select(
+                "timestamp", pl.exclude("timestamp")
+            )
+        return history
+    
+    def process_universe(
+        self,
+        frame: pl.DataFrame,
+        darkpool_data: Optional[Dict] = None,
+        breadth_data: Optional[Dict] = None,
+        by: str = "symbol",
+    ) -> Dict[str, SentimentEnvelope]:
+        """
+        Compute the latest sentiment envelope of every symbol in a stacked frame.
+        
+        Each symbol's envelope equals ``process()`` over that symbol's last
+        ``lookback`` bars, with the same dark pool and breadth inputs for
+        every symbol. Symbols with a full window run through the processors'
+        vectorized ``process_history`` together, one row per symbol; symbols
+        with fewer bars take the per-symbol path.
+        
+        Args:
+            frame: OHLCV bars of many symbols, in time order within each symbol
+            darkpool_data: Optional dark pool data (DIX/GEX)
+            breadth_data: Optional market breadth data (advances/declines)
+            by: Symbol column
+        
+        Returns:
+            SentimentEnvelope per symbol in the frame
+        """
+        if frame.is_empty():
+            return {}
+        
+        lookback = self._lookback_bars()
+        latest = frame.group_by(by, maintain_order=True).tail(lookback)
+        counts = latest.group_by(by, maintain_order=True).len()
+        full = counts.filter(pl.col("len") == lookback)[by]
+        
+        envelopes: Dict[str, SentimentEnvelope] = {}
+        short = latest.filter(~pl.col(by).is_in(full.implode()))
+        for (symbol,), bars in short.partition_by(by, maintain_order=True, as_dict=True).items():
+            envelopes[symbol] = self._process_frame(bars.drop(by), darkpool_data, breadth_data)
+        
+        if len(full):
+            # Full windows are contiguous lookback-row blocks in symbol order
+            windows = {
+                name: values.reshape(len(full), lookback)
+                for name, values in self._window_columns(latest.filter(pl.col(by).is_in(full.implode()))).items()
+            }
+            with np.errstate(all="ignore"), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                fused = self._fuse_history(windows, darkpool_data, breadth_data)
+            for row, symbol in enumerate(full.to_list()):
+                envelopes[symbol] = self._history_envelope(fused, row)
+        return envelopes
+    
+    def process_many(
+        self,
+        symbols: Iterable[str],
+        now: datetime,
+        darkpool_data: Optional[Dict] = None,
+        breadth_data: Optional[Dict] = None,
+    ) -> Dict[str, SentimentEnvelope]:
+        """
+        ``process()`` for several symbols: fetch each symbol's bars, then
+        process them together through process_universe.
+        """
+        lookback = self._lookback_bars()
+        envelopes: Dict[str, SentimentEnvelope] = {}
+        frames = []
+        for symbol in symbols:
+            try:
+                df = self.market_adapter.fetch_ohlcv(symbol, lookback, now)
+            except Exception:
+                envelopes[symbol] = SentimentEnvelope(
+                    bias="neutral", strength=0.0, energy=0.0, confidence=0.0, drivers={"error": 0.0}
+                )
+                continue
+            if df.is_empty():
+                envelopes[symbol] = SentimentEnvelope(
+                    bias="neutral", strength=0.0, energy=0.0, confidence=0.0, drivers={"no_data": 0.0}
+                )
+            else:
+                frames.append(df.with_columns(pl.lit(symbol).alias("_symbol")))
+        
+        if frames:
+            envelopes.update(self.process_universe(
+                pl.concat(frames, how="diagonal_relaxed"), darkpool_data, breadth_data, "_symbol"
+            ))
+        return envelopes
+    
+    @staticmethod
+    def _window_columns(frame: pl.DataFrame) -> Dict[str, np.ndarray]:
+        """Float columns the processors' ``process_history`` windows are cut from."""
+        typical_price = (frame["high"] + frame["low"] + frame["close"]) / 3.0
+        series = {
+            "open": frame["open"],
+            "high": frame["high"],
+            "low": frame["low"],
+            "close": frame["close"],
+            "volume": frame["volume"],
+            "typical_price": typical_price,
+            "money_flow": typical_price * frame["volume"],
+        }
+        return {name: values.cast(pl.Float64).to_numpy() for name, values in series.items()}
+    
+    def _fuse_history(
+        self,
+        windows: Dict[str, np.ndarray],
+        darkpool_data: Optional[Dict],
+        breadth_data: Optional[Dict],
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized ``_process_frame`` over full-length windows, one row per bar."""
+        rows = windows["close"].shape[0]
+        runs = (
+            (self.config.wyckoff.enabled, lambda: self.wyckoff_processor.process_history(windows)),
+            (self.config.oscillators.enabled, lambda: self.oscillator_processor.process_history(windows)),
+            (self.config.volatility.enabled, lambda: self.volatility_processor.process_history(windows)),
+            (self.config.flow.enabled, lambda: self.flow_processor.process_history(windows, darkpool_data)),
+            (self.config.breadth.enabled, lambda: self.breadth_processor.process_history(windows, breadth_data)),
+            (self.config.energy.enabled, lambda: self.energy_processor.process_history(windows)),
+        )
+        outputs = []
+        for enabled, run in runs:
+            output = None
+            if enabled:
+                try:
+                    output = run()
+                except Exception:
+                    pass  # Graceful degradation, as in process()
+            outputs.append(output)
+        wyckoff, _, volatility, flow, breadth, energy = outputs
+        
+        # Signals a processor contributes on each row
+        present = np.zeros((rows, len(_DRIVERS)), dtype=bool)
+        values = np.zeros((rows, len(_DRIVERS)))
+        confidences = np.zeros((rows, len(_DRIVERS)))
+        for column, output in enumerate(outputs):
+            if output is not None:
+                present[:, column] = output["valid"]
+                values[:, column] = output["value"]
+                confidences[:, column] = output["confidence"]
+        
+        energy_level = np.zeros(rows)
+        if energy is not None:
+            energy_level = np.where(energy["valid"], energy["metabolic_load"], 0.0)
+        regime = np.full(rows, "")
+        if breadth is not None:
+            regime = np.where(breadth["valid"], breadth["multi_period_regime"], "")
+        
+        # Fuse rows that share a signal list together
+        history = {
+            "bias": np.empty(rows, dtype=object),
+            "strength": np.empty(rows),
+            "energy": np.empty(rows),
+            "confidence": np.empty(rows),
+        }
+        contributions = np.full((rows, len(_DRIVERS)), np.nan)
+        patterns = present @ (1 << np.arange(len(_DRIVERS)))
+        for pattern in np.unique(patterns):
+            selected = patterns == pattern
+            columns = [column for column in range(len(_DRIVERS)) if pattern >> column & 1]
+            signal_values = values[selected][:, columns]
+            signal_confidences, signal_weights = apply_graceful_degradation_columns(
+                confidences[selected][:, columns], np.ones((int(selected.sum()), len(columns)))
+            )
+            has_conflicts = detect_conflicting_signal_columns(
+                signal_values, signal_confidences, signal_weights
+            )
+            fused = fuse_signal_columns(
+                signal_values,
+                signal_confidences,
+                signal_weights,
+                [_DRIVERS[column] for column in columns],
+                energy_level[selected],
+                regime[selected],
+                self.config.bias_threshold,
+            )
+            history["bias"][selected] = fused["bias"]
+            history["strength"][selected] = fused["strength"]
+            history["energy"][selected] = fused["energy"]
+            history["confidence"][selected] = np.where(
+                has_conflicts, fused["confidence"] * 0.7, fused["confidence"]
+            )
+            contributions[np.ix_(selected, columns)] = fused["contributions"]
+        
+        # Envelope labels, set where the processor's output is valid
+        for name in ("wyckoff_phase", "liquidity_regime", "volatility_regime", "flow_regime"):
+            history[name] = np.full(rows, None, dtype=object)
+        if wyckoff is not None:
+            history["wyckoff_phase"] = np.where(wyckoff["valid"], wyckoff["phase"].astype(object), None)
+        if breadth is not None:
+            history["liquidity_regime"] = np.where(breadth["valid"], regime.astype(object), None)
+        if volatility is not None:
+            volatility_regime = np.select(
+                [volatility["squeeze_detected"], volatility["expansion"], volatility["compression"]],
+                ["squeeze", "expansion", "compression"],
+                "normal",
+            )
+            history["volatility_regime"] = np.where(
+                volatility["valid"], volatility_regime.astype(object), None
+            )
+        if flow is not None:
+            flow_regime = np.select(
+                [flow["composite_flow_bias"] > 0.3, flow["composite_flow_bias"] < -0.3],
+                ["bullish_flow", "bearish_flow"],
+                "balanced_flow",
+            )
+            history["flow_regime"] = np.where(flow["valid"], flow_regime.astype(object), None)
+        for column, driver in enumerate(_DRIVERS):
+            history[f"driver_{driver}"] = contributions[:, column]
+        return history
+    
+    @staticmethod
+    def _history_envelope(history: Dict[str, np.ndarray], row: int) -> SentimentEnvelope:
+        """The per-bar envelope for one row of _fuse_history."""
+        drivers = {
+            driver: float(history[f"driver_{driver}"][row])
+            for driver in _DRIVERS
+            if not np.isnan(history[f"driver_{driver}"][row])
+        }
+        return SentimentEnvelope(
+            bias=history["bias"][row],
+            strength=float(history["strength"][row]),
+            energy=float(history["energy"][row]),
+            confidence=float(history["confidence"][row]),
+            # Sorted by absolute contribution, as fuse_signals does
+            drivers=dict(sorted(drivers.items(), key=lambda x: abs(x[1]), reverse=True)),
+            wyckoff_phase=history["wyckoff_phase"][row],
+            liquidity_regime=history["liquidity_regime"][row],
+            volatility_regime=history["volatility_regime"][row],
+            flow_regime=history["flow_regime"][row],
+        )
+    
+    @staticmethod
+    def _history_row(envelope: SentimentEnvelope) -> Dict:
+        """One process_history row from a per-bar envelope."""
+        row = {
+            "bias": envelope.bias,
+            "strength": envelope.strength,
+            "energy": envelope.energy,
+            "confidence": envelope.confidence,
+            "wyckoff_phase": envelope.wyckoff_phase,
+            "liquidity_regime": envelope.liquidity_regime,
+            "volatility_regime": envelope.volatility_regime,
+            "flow_regime": envelope.flow_regime,
+        }
+        for driver in _DRIVERS:
+            row[f"driver_{driver}"] = envelope.drivers.get(driver)
+        return row
+    
     def get_detailed_analysis(
         self,
         symbol: str,
@@ -17,8 +17,9 @@ Environment Variables Required:
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Callable, List, Optional
 from uuid import uuid4
 
 from alpaca.trading.client import TradingClient
@@ -35,7 +36,9 @@ from alpaca.trading.enums import (
     TimeInForce as AlpacaTimeInForce,
     OrderStatus as AlpacaOrderStatus,
     AssetClass as AlpacaAssetClass,
+    QueryOrderStatus,
 )
+from alpaca.trading.stream import TradingStream
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest
 
@@ -108,6 +111,8 @@ class AlpacaBrokerAdapter:
         self.secret_key = secret_key or os.getenv("ALPACA_SECRET_KEY")
         self.base_url = base_url or os.getenv("ALPACA_BASE_URL")
         self.paper = paper
+        self.trading_stream: Optional[TradingStream] = None
+        self._stream_thread: Optional[threading.Thread] = None
         
         if not self.api_key or not self.secret_key:
             raise BrokerConnectionError(
@@ -251,20 +256,72 @@ class AlpacaBrokerAdapter:
         """
         try:
             alpaca_order = self.client.get_order_by_id(order_id)
+            return self._order_to_result(alpaca_order)
             
-            # Convert to OrderResult (with minimal OrderRequest context)
-            order_request = OrderRequest(
-                asset_class=self._map_asset_class_from_alpaca(alpaca_order.asset_class),
-                symbol=alpaca_order.symbol,
-                side=self._map_side_from_alpaca(alpaca_order.side),
-                quantity=int(alpaca_order.qty),
-                order_type=self._map_order_type_from_alpaca(alpaca_order.order_type),
+        except Exception as e:
+            raise BrokerError(f"Failed to get order status: {str(e)}")
+    
+    def list_orders_since(self, since: datetime) -> List[OrderResult]:
+        """
+        Get all orders submitted at or after a point in time (one request).
+        
+        Args:
+            since: Earliest submission time of interest
+        
+        Returns:
+            List of OrderResult, open and closed
+        
+        Raises:
+            BrokerError: If order listing fails
+        """
+        try:
+            request = GetOrdersRequest(
+                status=QueryOrderStatus.ALL,
+                after=since,
+                limit=500,
             )
-            
-            return self._convert_alpaca_order_to_result(alpaca_order, order_request)
+            alpaca_orders = self.client.get_orders(filter=request)
+            return [self._order_to_result(alpaca_order) for alpaca_order in alpaca_orders]
             
         except Exception as e:
-            raise BrokerError(f"Failed to get order status: {str(e)}")
+            raise BrokerError(f"Failed to list orders: {str(e)}")
+    
+    def subscribe_trade_updates(self, callback: Callable[[OrderResult], None]) -> None:
+        """
+        Stream order updates (fills, cancels, ...) to a callback.
+        
+        Runs Alpaca's trade-updates websocket on a daemon thread; the
+        callback is invoked from that thread with the updated order.
+        
+        Args:
+            callback: Called with an OrderResult for every trade update
+        """
+        if self.trading_stream is None:
+            self.trading_stream = TradingStream(
+                api_key=self.api_key,
+                secret_key=self.secret_key,
+                paper=self.paper,
+            )
+        
+        async def handle(update):
+            callback(self._order_to_result(update.order))
+        
+        self.trading_stream.subscribe_trade_updates(handle)
+        
+        if self._stream_thread is None:
+            self._stream_thread = threading.Thread(
+                target=self.trading_stream.run,
+                name="alpaca-trade-updates",
+                daemon=True,
+            )
+            self._stream_thread.start()
+    
+    def stop_trade_updates(self) -> None:
+        """Stop the trade-updates stream, if running."""
+        if self.trading_stream is not None:
+            self.trading_stream.stop()
+        self.trading_stream = None
+        self._stream_thread = None
     
     def cancel_order(self, order_id: str) -> bool:
         """
@@ -409,6 +466,17 @@ class AlpacaBrokerAdapter:
         else:
             raise InvalidOrderError(f"Unsupported order type: {order.order_type}")
     
+    def _order_to_result(self, alpaca_order) -> OrderResult:
+        """Convert an Alpaca order to OrderResult (with minimal OrderRequest context)."""
+        order_request = OrderRequest(
+            asset_class=self._map_asset_class_from_alpaca(alpaca_order.asset_class),
+            symbol=alpaca_order.symbol,
+            side=self._map_side_from_alpaca(alpaca_order.side),
+            quantity=int(alpaca_order.qty),
+            order_type=self._map_order_type_from_alpaca(alpaca_order.order_type),
+        )
+        return self._convert_alpaca_order_to_result(alpaca_order, order_request)
+    
     def _convert_alpaca_order_to_result(self, alpaca_order, original_order: OrderRequest) -> OrderResult:
         """Convert Alpaca order to OrderResult."""
         # Map status
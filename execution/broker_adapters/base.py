@@ -5,10 +5,15 @@ Base broker adapter protocol for Trade Agent v3.
 
 Defines the unified interface that all broker adapters must implement.
 Uses Protocol for structural subtyping (duck typing with type checking).
+
+Adapters that can push order updates may additionally provide
+``subscribe_trade_updates(callback)``; the lifecycle controller uses it
+when present and falls back to polling ``list_orders_since`` otherwise.
 """
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol, List
 
 from ..schemas import (
@@ -73,6 +78,18 @@ class BrokerAdapter(Protocol):
         """
         ...
     
+    def list_orders_since(self, since: datetime) -> List[OrderResult]:
+        """
+        Get all orders submitted at or after a point in time (bulk status).
+        
+        Args:
+            since: Earliest submission time of interest
+        
+        Returns:
+            List of OrderResult, open and closed
+        """
+        ...
+    
     def cancel_order(self, order_id: str) -> bool:
         """
         Cancel a pending order.
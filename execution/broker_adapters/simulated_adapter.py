@@ -8,13 +8,14 @@ Provides realistic order execution simulation with:
 - Partial fill simulation
 - Market impact modeling
 - Position tracking
+- Optional resting limit orders with trade-update callbacks
 """
 
 from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import Callable, List, Dict
 
 from ..schemas import (
     OrderRequest,
@@ -48,6 +49,7 @@ class SimulatedBrokerAdapter:
         slippage_pct: float = 0.001,  # 0.1% default slippage
         commission_per_contract: float = 0.65,
         commission_per_share: float = 0.0,  # Commission-free stocks
+        immediate_fills: bool = True,
     ):
         """
         Initialize simulated broker.
@@ -57,6 +59,8 @@ class SimulatedBrokerAdapter:
             slippage_pct: Slippage as percentage of price (0.001 = 0.1%)
             commission_per_contract: Commission per option contract
             commission_per_share: Commission per share (0 = commission-free)
+            immediate_fills: If False, non-marketable limit orders rest as
+                working orders until a quote update crosses them
         """
         self.account_id = f"SIM_{uuid.uuid4().hex[:8]}"
         self.cash = initial_cash
@@ -64,11 +68,14 @@ class SimulatedBrokerAdapter:
         self.slippage_pct = slippage_pct
         self.commission_per_contract = commission_per_contract
         self.commission_per_share = commission_per_share
+        self.immediate_fills = immediate_fills
         
         # State tracking
         self.positions: Dict[str, Position] = {}
         self.orders: Dict[str, OrderResult] = {}
         self.quote_cache: Dict[str, Quote] = {}
+        self.working_orders: Dict[str, OrderRequest] = {}
+        self._trade_update_callbacks: List[Callable[[OrderResult], None]] = []
     
     def get_account(self) -> AccountInfo:
         """Get current account state."""
@@ -108,6 +115,26 @@ class SimulatedBrokerAdapter:
         """
         order_id = f"ORD_{uuid.uuid4().hex[:12]}"
         
+        if not self.immediate_fills and not self._is_marketable(order):
+            result = OrderResult(
+                order_id=order_id,
+                status=OrderStatus.SUBMITTED,
+                broker="simulated",
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                order_type=order.order_type,
+                submitted_at=datetime.now(timezone.utc),
+            )
+            self.orders[order_id] = result
+            self.working_orders[order_id] = order
+            self._publish(result)
+            return result
+        
+        return self._execute(order_id, order)
+    
+    def _execute(self, order_id: str, order: OrderRequest) -> OrderResult:
+        """Fill an order in full at the current quote (or its limit price)."""
         # Get quote for pricing
         quote = self.get_quote(order.symbol)
         
@@ -136,7 +163,7 @@ class SimulatedBrokerAdapter:
         
         # Check sufficient funds for buy orders
         if order.side == OrderSide.BUY and total_cost > self.cash:
-            return OrderResult(
+            result = OrderResult(
                 order_id=order_id,
                 status=OrderStatus.REJECTED,
                 broker="simulated",
@@ -146,6 +173,9 @@ class SimulatedBrokerAdapter:
                 order_type=order.order_type,
                 error_message=f"Insufficient funds: need ${total_cost:.2f}, have ${self.cash:.2f}",
             )
+            self.orders[order_id] = result
+            self._publish(result)
+            return result
         
         # Execute order
         fill = Fill(
@@ -162,6 +192,11 @@ class SimulatedBrokerAdapter:
         # Update position
         self._update_position(order.symbol, order.side, order.quantity, exec_price, order.asset_class)
         
+        # Resting orders keep their original submission time
+        now = datetime.now(timezone.utc)
+        previous = self.orders.get(order_id)
+        submitted_at = previous.submitted_at if previous is not None else now
+        
         # Create result
         result = OrderResult(
             order_id=order_id,
@@ -177,11 +212,12 @@ class SimulatedBrokerAdapter:
             total_cost=abs(total_cost),
             total_commission=commission,
             estimated_slippage=abs(slippage * order.quantity),
-            submitted_at=datetime.now(timezone.utc),
-            filled_at=datetime.now(timezone.utc),
+            submitted_at=submitted_at,
+            filled_at=now,
         )
         
         self.orders[order_id] = result
+        self._publish(result)
         return result
     
     def get_order_status(self, order_id: str) -> OrderResult:
@@ -190,9 +226,26 @@ class SimulatedBrokerAdapter:
             raise BrokerError(f"Order {order_id} not found")
         return self.orders[order_id]
     
+    def list_orders_since(self, since: datetime) -> List[OrderResult]:
+        """Get all orders submitted at or after ``since``."""
+        return [
+            result for result in self.orders.values()
+            if result.submitted_at is None or result.submitted_at >= since
+        ]
+    
     def cancel_order(self, order_id: str) -> bool:
-        """Cancel order (simulated orders execute immediately, so always returns False)."""
-        return False
+        """Cancel a working order (filled orders cannot be cancelled)."""
+        if order_id not in self.working_orders:
+            return False
+        del self.working_orders[order_id]
+        result = self.orders[order_id].model_copy(update={"status": OrderStatus.CANCELLED})
+        self.orders[order_id] = result
+        self._publish(result)
+        return True
+    
+    def subscribe_trade_updates(self, callback: Callable[[OrderResult], None]) -> None:
+        """Register a callback invoked with every order state change."""
+        self._trade_update_callbacks.append(callback)
     
     def get_quote(self, symbol: str) -> Quote:
         """
@@ -232,8 +285,27 @@ class SimulatedBrokerAdapter:
         return [self.get_quote(symbol) for symbol in symbols]
     
     def set_quote(self, symbol: str, quote: Quote) -> None:
-        """Manually set quote for testing."""
+        """Manually set quote for testing (fills working orders it crosses)."""
         self.quote_cache[symbol] = quote
+        
+        for order_id, order in list(self.working_orders.items()):
+            if order.symbol == symbol and self._is_marketable(order):
+                del self.working_orders[order_id]
+                self._execute(order_id, order)
+    
+    def _is_marketable(self, order: OrderRequest) -> bool:
+        """Whether an order would execute against the current quote."""
+        if order.order_type.value != "limit" or order.limit_price is None:
+            return True
+        quote = self.get_quote(order.symbol)
+        if order.side == OrderSide.BUY:
+            return order.limit_price >= quote.ask
+        return order.limit_price <= quote.bid
+    
+    def _publish(self, result: OrderResult) -> None:
+        """Deliver an order update to trade-update subscribers."""
+        for callback in self._trade_update_callbacks:
+            callback(result)
     
     def _update_position(
         self,
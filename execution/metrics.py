@@ -0,0 +1,115 @@
+# execution/metrics.py
+
+"""
+Execution latency metrics.
+
+Fixed log-spaced bucket histograms: recording is O(log buckets) with no
+per-sample storage, so they can stay on for the whole session.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Dict, List, Optional
+
+# Bucket upper bounds in milliseconds: 0.1ms .. ~100s, 4 buckets per decade
+DEFAULT_BUCKETS_MS: tuple[float, ...] = tuple(
+    round(10 ** (exponent / 4), 4) for exponent in range(-4, 21)
+)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with approximate percentiles.
+
+    Percentiles are interpolated inside the bucket that contains them,
+    so they are accurate to the bucket width (~78% per step).
+    """
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """
+        Initialize histogram.
+
+        Args:
+            buckets_ms: Ascending bucket upper bounds in milliseconds
+        """
+        self.buckets_ms = buckets_ms
+        self._counts: List[int] = [0] * (len(buckets_ms) + 1)  # last = overflow
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        ms = seconds * 1000.0
+        index = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Approximate percentile in milliseconds.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Latency in ms, None if no samples
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count = self.count
+            max_ms = self.max_ms
+        if count == 0:
+            return None
+
+        rank = q / 100.0 * count
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets_ms[index - 1] if index > 0 else 0.0
+                upper = self.buckets_ms[index] if index < len(self.buckets_ms) else max_ms
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + fraction * (upper - lower), max_ms)
+            cumulative += bucket_count
+        return max_ms
+
+    def snapshot(self) -> Dict[str, object]:
+        """Summary and non-empty buckets, suitable for dashboards/logging."""
+        with self._lock:
+            counts = list(self._counts)
+            count = self.count
+            total_ms = self.total_ms
+            max_ms = self.max_ms
+
+        buckets = {}
+        for index, bucket_count in enumerate(counts):
+            if bucket_count:
+                label = (
+                    f"<={self.buckets_ms[index]}ms" if index < len(self.buckets_ms)
+                    else f">{self.buckets_ms[-1]}ms"
+                )
+                buckets[label] = bucket_count
+
+        return {
+            "count": count,
+            "mean_ms": total_ms / count if count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": max_ms if count else None,
+            "buckets": buckets,
+        }
+
+    def reset(self) -> None:
+        """Clear all samples."""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets_ms) + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
@@ -15,18 +15,28 @@ This orchestrator:
 7. Provides status queries
 8. Enables audit trail and replay
 
+Orders can be submitted synchronously (``submit``) or through the async
+pipeline (``start`` / ``submit_async``): a bounded submit queue feeding up to
+``max_in_flight`` concurrent broker calls, with jittered exponential
+backoff scheduled on the event loop so a flaky order never holds up others.
+
 This is the ONLY layer that talks to brokers.
 All other code talks to this orchestrator.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional
 from uuid import UUID
 
 from execution.broker.base import AbstractBrokerAdapter, NetworkError
+from execution.metrics import LatencyHistogram
 from execution.registry import ExecutionRegistry, generate_idempotency_key
 from execution.schemas import BrokerResponse, OrderEnvelope, OrderStatus, OrderType
 from agents.portfolio.schemas import OrderInstruction
@@ -34,6 +44,17 @@ from agents.portfolio.schemas import OrderInstruction
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _QueuedOrder:
+    """Order waiting for (or between) broker submission attempts."""
+
+    envelope: OrderEnvelope
+    future: asyncio.Future
+    enqueued_at: float
+    attempt: int = 0
+    retry_handle: Optional[asyncio.TimerHandle] = None
+
+
 class ExecutionOrchestrator:
     """
     Execution orchestration layer.
@@ -47,6 +68,10 @@ class ExecutionOrchestrator:
         registry: Optional[ExecutionRegistry] = None,
         max_retries: int = 3,
         retry_delay_seconds: float = 1.0,
+        max_retry_delay_seconds: float = 30.0,
+        retry_jitter: float = 0.5,
+        max_queue_size: int = 1000,
+        max_in_flight: int = 8,
     ):
         """
         Initialize orchestrator.
@@ -55,12 +80,36 @@ class ExecutionOrchestrator:
             broker: Broker adapter implementation
             registry: Execution registry (creates default if None)
             max_retries: Max retry attempts for transient failures
-            retry_delay_seconds: Delay between retries
+            retry_delay_seconds: Base retry delay (doubles on each attempt)
+            max_retry_delay_seconds: Cap on a single retry delay
+            retry_jitter: Fraction of each delay that is randomized (0-1)
+            max_queue_size: Bound on queued async submissions (backpressure)
+            max_in_flight: Max concurrent broker calls in the async pipeline
         """
         self.broker = broker
         self.registry = registry or ExecutionRegistry()
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self.retry_jitter = retry_jitter
+        self.max_queue_size = max_queue_size
+        self.max_in_flight = max_in_flight
+
+        # Latency histograms: enqueue -> final broker ack, and each broker call
+        self.latency: Dict[str, LatencyHistogram] = {
+            "submit_to_ack": LatencyHistogram(),
+            "broker_call": LatencyHistogram(),
+        }
+
+        # Async pipeline state (created by start())
+        self._queue: Optional[asyncio.Queue] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}  # idempotency_key -> ack
+        self._tasks: set[asyncio.Task] = set()
+        self._retry_handles: set[asyncio.TimerHandle] = set()
 
     def submit(
         self,
@@ -89,52 +138,285 @@ class ExecutionOrchestrator:
         Raises:
             ValueError: If limit_price missing for limit order
         """
-        # Validate limit price for limit orders
-        if order_type == OrderType.LIMIT and limit_price is None:
-            raise ValueError("Limit price required for limit orders")
+        envelope, is_new = self._create_envelope(instruction, order_type, limit_price)
+        if not is_new:
+            return envelope
 
-        # Generate idempotency key
-        idempotency_key = generate_idempotency_key(instruction)
+        # Submit to broker with retries
+        start = time.perf_counter()
+        response = self._submit_with_retry(envelope)
+        self.latency["submit_to_ack"].observe(time.perf_counter() - start)
 
-        # Create envelope
-        envelope = OrderEnvelope(
-            idempotency_key=idempotency_key,
-            instruction=instruction,
-            order_type=order_type,
-            limit_price=limit_price,
-            status=OrderStatus.PENDING,
+        return self._apply_response(envelope, response)
+
+    # Async submission pipeline
+
+    async def start(self) -> None:
+        """
+        Start the async submission pipeline on the running event loop.
+
+        Must be called before ``submit_async`` / ``submit_nowait``.
+        """
+        if self._dispatcher is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        # Broker adapters are blocking; one worker thread per in-flight slot
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="broker-submit"
         )
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        if self.registry.write_behind:
+            self._flusher = asyncio.create_task(self._flush_loop())
 
-        # Persist envelope (crash-safe)
-        envelope, is_new = self.registry.create_envelope(envelope)
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the async pipeline.
+
+        Args:
+            drain: Wait for queued and in-flight orders (including pending
+                retries) to be acknowledged first; otherwise their futures
+                are cancelled
+        """
+        if self._dispatcher is None:
+            return
+
+        if drain:
+            pending = list(self._pending.values())
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        else:
+            for handle in self._retry_handles:
+                handle.cancel()
+            for future in self._pending.values():
+                future.cancel()
+
+        self._dispatcher.cancel()
+        background = [self._dispatcher]
+        if self._flusher is not None:
+            self._flusher.cancel()
+            background.append(self._flusher)
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*background, *self._tasks, return_exceptions=True)
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._dispatcher = None
+        self._flusher = None
+        self._executor = None
+        self._queue = None
+        self._pending.clear()
+        self._retry_handles.clear()
+
+    async def submit_async(
+        self,
+        instruction: OrderInstruction,
+        order_type: OrderType = OrderType.LIMIT,
+        limit_price: Optional[float] = None,
+    ) -> OrderEnvelope:
+        """
+        Submit order through the async pipeline and wait for the broker ack.
+
+        The envelope is persisted before it is queued. Waits for queue space
+        when the submit queue is full (backpressure). Duplicate instructions
+        (same idempotency key) share the original order's ack.
+
+        Args:
+            instruction: Order instruction from Portfolio Manager
+            order_type: Broker order type (market, limit, etc.)
+            limit_price: Limit price (required for limit orders)
+
+        Returns:
+            OrderEnvelope with status after the broker ack (or final error)
+        """
+        result = self._prepare(instruction, order_type, limit_price)
+        if isinstance(result, OrderEnvelope):
+            return result
+
+        future, item = result
+        if item is not None:
+            await self._queue.put(item)
+        return await asyncio.shield(future)
+
+    def submit_nowait(
+        self,
+        instruction: OrderInstruction,
+        order_type: OrderType = OrderType.LIMIT,
+        limit_price: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Queue order without waiting; fire-and-forget variant of ``submit_async``.
+
+        Returns:
+            Future resolving to the acknowledged OrderEnvelope
 
+        Raises:
+            asyncio.QueueFull: If the submit queue is full (nothing is persisted)
+        """
+        if self._queue is not None and self._queue.full():
+            raise asyncio.QueueFull()
+
+        result = self._prepare(instruction, order_type, limit_price)
+        if isinstance(result, OrderEnvelope):
+            done = asyncio.get_running_loop().create_future()
+            done.set_result(result)
+            return done
+
+        future, item = result
+        if item is not None:
+            self._queue.put_nowait(item)
+        return future
+
+    @property
+    def queue_depth(self) -> int:
+        """Orders waiting for an in-flight slot."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def latency_stats(self) -> Dict[str, dict]:
+        """Submit-to-ack and per-call broker latency histograms."""
+        return {name: histogram.snapshot() for name, histogram in self.latency.items()}
+
+    def _prepare(
+        self,
+        instruction: OrderInstruction,
+        order_type: OrderType,
+        limit_price: Optional[float],
+    ) -> OrderEnvelope | tuple[asyncio.Future, Optional[_QueuedOrder]]:
+        """
+        Persist a new envelope and create its ack future.
+
+        Returns:
+            The existing envelope for an already-registered order, or
+            (ack future, item to queue); item is None when the same order
+            is already in flight
+        """
+        if self._dispatcher is None:
+            raise RuntimeError("Async pipeline not started; call start() first")
+
+        # Same instruction already in flight: share its ack
+        idempotency_key = generate_idempotency_key(instruction)
+        pending = self._pending.get(idempotency_key)
+        if pending is not None:
+            logger.info(f"Duplicate order in flight (idempotency_key={idempotency_key})")
+            return pending, None
+
+        envelope, is_new = self._create_envelope(instruction, order_type, limit_price)
         if not is_new:
-            # Duplicate order detected via idempotency key
+            return envelope
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[idempotency_key] = future
+        future.add_done_callback(lambda _: self._pending.pop(idempotency_key, None))
+        return future, _QueuedOrder(envelope, future, loop.time())
+
+    async def _dispatch_loop(self) -> None:
+        """Move queued orders into free in-flight slots."""
+        while True:
+            # Take a slot first so waiting orders stay visible in the queue
+            await self._in_flight.acquire()
+            try:
+                item = await self._queue.get()
+            except asyncio.CancelledError:
+                self._in_flight.release()
+                raise
+            self._spawn(self._attempt(item))
+
+    async def _flush_loop(self) -> None:
+        """Flush write-behind registry changes left dirty by an idle stretch."""
+        while True:
+            await asyncio.sleep(max(self.registry.flush_interval_seconds, 0.01))
+            try:
+                self.registry.flush_if_due()
+            except Exception as e:
+                logger.error(f"Registry flush failed: {e}")
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _attempt(self, item: _QueuedOrder) -> None:
+        """One broker submission attempt; holds an in-flight slot."""
+        loop = asyncio.get_running_loop()
+        envelope = item.envelope
+        try:
+            start = loop.time()
+            try:
+                response = await loop.run_in_executor(
+                    self._executor, self.broker.submit_order, envelope
+                )
+            finally:
+                self.latency["broker_call"].observe(loop.time() - start)
+
             logger.info(
-                f"Duplicate order detected: {envelope.order_id} "
-                f"(idempotency_key={idempotency_key})"
+                f"Order {envelope.order_id} submitted to broker: "
+                f"broker_order_id={response.broker_order_id}, "
+                f"status={response.status}"
             )
-            return envelope
+            self._complete(item, response)
 
-        logger.info(
-            f"Created new order: {envelope.order_id} "
-            f"(asset={instruction.asset}, "
-            f"strategy={instruction.strategy_type}, "
-            f"size={instruction.size_delta})"
-        )
+        except NetworkError as e:
+            item.attempt += 1
+            logger.warning(
+                f"Network error submitting order {envelope.order_id} "
+                f"(attempt {item.attempt}/{self.max_retries}): {e}"
+            )
+            self.registry.increment_retry(envelope.order_id)
 
-        # Submit to broker with retries
-        response = self._submit_with_retry(envelope)
+            if item.attempt < self.max_retries:
+                # Retry later without holding a slot or blocking the loop
+                delay = self._backoff_delay(item.attempt - 1)
+                item.retry_handle = loop.call_later(delay, self._retry, item)
+                self._retry_handles.add(item.retry_handle)
+            else:
+                self._complete(item, self._max_retries_exceeded(envelope, e))
 
-        # Update registry with broker response
-        self._update_from_response(envelope, response)
+        except asyncio.CancelledError:
+            raise
 
-        # Reload envelope from registry to get updated state
-        updated_envelope = self.registry.get_by_id(envelope.order_id)
-        if updated_envelope:
-            envelope = self.registry._record_to_envelope(updated_envelope)
+        except Exception as e:
+            self._complete(item, self._submission_error(envelope, e))
 
-        return envelope
+        finally:
+            self._in_flight.release()
+
+    def _retry(self, item: _QueuedOrder) -> None:
+        """Backoff timer fired: re-attempt as soon as a slot is free."""
+        self._retry_handles.discard(item.retry_handle)
+        if item.future.done():
+            return
+
+        async def reattempt():
+            await self._in_flight.acquire()
+            await self._attempt(item)
+
+        self._spawn(reattempt())
+
+    def _complete(self, item: _QueuedOrder, response: BrokerResponse) -> None:
+        """Record the ack, update the registry and resolve the caller's future."""
+        self.latency["submit_to_ack"].observe(
+            asyncio.get_running_loop().time() - item.enqueued_at
+        )
+        try:
+            envelope = self._apply_response(item.envelope, response)
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+            return
+        if not item.future.done():
+            item.future.set_result(envelope)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Jittered exponential backoff for retry number ``attempt`` (0-based).
+
+        base * 2**attempt, capped, with the top ``retry_jitter`` fraction
+        randomized so simultaneous failures do not retry in lockstep.
+        """
+        delay = min(self.retry_delay_seconds * (2 ** attempt), self.max_retry_delay_seconds)
+        return delay * (1.0 - self.retry_jitter * random.random())
 
     def get_status(self, order_id: UUID) -> Optional[OrderEnvelope]:
         """
@@ -265,46 +547,107 @@ class ExecutionOrchestrator:
                 # Increment retry count in registry
                 self.registry.increment_retry(envelope.order_id)
 
-                # Wait before retry
+                # Wait before retry (blocking; the async pipeline schedules
+                # retries on the event loop instead)
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay_seconds * (attempt + 1))
+                    time.sleep(self._backoff_delay(attempt))
 
             except Exception as e:
                 # Non-retryable error
-                logger.error(
-                    f"Error submitting order {envelope.order_id}: {e}"
-                )
+                return self._submission_error(envelope, e)
 
-                # Update status to error
-                self.registry.update_status(
-                    order_id=envelope.order_id,
-                    status=OrderStatus.ERROR,
-                    error_message=str(e),
-                )
+        return self._max_retries_exceeded(envelope, last_error)
 
-                return BrokerResponse(
-                    success=False,
-                    status=OrderStatus.ERROR,
-                    error_code="SUBMISSION_ERROR",
-                    error_message=str(e),
-                )
+    def _create_envelope(
+        self,
+        instruction: OrderInstruction,
+        order_type: OrderType,
+        limit_price: Optional[float],
+    ) -> tuple[OrderEnvelope, bool]:
+        """
+        Validate, key and persist a new envelope (crash-safe, idempotent).
+
+        Returns:
+            Tuple of (envelope, is_new); duplicates return the existing envelope
+
+        Raises:
+            ValueError: If limit_price missing for limit order
+        """
+        # Validate limit price for limit orders
+        if order_type == OrderType.LIMIT and limit_price is None:
+            raise ValueError("Limit price required for limit orders")
+
+        # Generate idempotency key
+        idempotency_key = generate_idempotency_key(instruction)
+
+        # Create envelope
+        envelope = OrderEnvelope(
+            idempotency_key=idempotency_key,
+            instruction=instruction,
+            order_type=order_type,
+            limit_price=limit_price,
+            status=OrderStatus.PENDING,
+        )
+
+        # Persist envelope (crash-safe)
+        envelope, is_new = self.registry.create_envelope(envelope)
+
+        if not is_new:
+            # Duplicate order detected via idempotency key
+            logger.info(
+                f"Duplicate order detected: {envelope.order_id} "
+                f"(idempotency_key={idempotency_key})"
+            )
+            return envelope, False
 
-        # Max retries exceeded
+        logger.info(
+            f"Created new order: {envelope.order_id} "
+            f"(asset={instruction.asset}, "
+            f"strategy={instruction.strategy_type}, "
+            f"size={instruction.size_delta})"
+        )
+        return envelope, True
+
+    def _apply_response(
+        self, envelope: OrderEnvelope, response: BrokerResponse
+    ) -> OrderEnvelope:
+        """Update registry from a final broker response and return the reloaded envelope."""
+        # Update registry with broker response
+        self._update_from_response(envelope, response)
+
+        # Reload envelope from registry to get updated state
+        updated_envelope = self.registry.get_by_id(envelope.order_id)
+        if updated_envelope:
+            envelope = self.registry._record_to_envelope(updated_envelope)
+
+        return envelope
+
+    def _submission_error(self, envelope: OrderEnvelope, error: Exception) -> BrokerResponse:
+        """Non-retryable submission failure."""
         logger.error(
-            f"Max retries exceeded for order {envelope.order_id}: {last_error}"
+            f"Error submitting order {envelope.order_id}: {error}"
         )
 
-        self.registry.update_status(
-            order_id=envelope.order_id,
+        return BrokerResponse(
+            success=False,
             status=OrderStatus.ERROR,
-            error_message=f"Max retries exceeded: {last_error}",
+            error_code="SUBMISSION_ERROR",
+            error_message=str(error),
+        )
+
+    def _max_retries_exceeded(
+        self, envelope: OrderEnvelope, last_error: Optional[Exception]
+    ) -> BrokerResponse:
+        """Retryable failures exhausted max_retries."""
+        logger.error(
+            f"Max retries exceeded for order {envelope.order_id}: {last_error}"
         )
 
         return BrokerResponse(
             success=False,
             status=OrderStatus.ERROR,
             error_code="MAX_RETRIES_EXCEEDED",
-            error_message=str(last_error),
+            error_message=f"Max retries exceeded: {last_error}",
         )
 
     def _update_from_response(
@@ -9,21 +9,57 @@ Handles:
 - Automatic repricing for unfilled orders
 - Time-based cancellation
 - Auto-stop protection
+
+Order state arrives through two paths:
+- Event-driven: broker trade updates (when the adapter can stream them)
+  are applied as they arrive
+- Polling fallback: one bulk ``list_orders_since`` call per check, made
+  every check without a stream and only when the stream has been quiet
+  for ``poll_interval_sec`` with one
+
+Due actions (repricing, expiry) are kept in a min-heap keyed on the next
+action time, so a check only touches orders that need attention.
+
+Broker round-trips are made outside the controller lock, so trade updates
+arriving on a broker thread are never blocked behind them.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
+from .broker_adapters.base import BrokerAdapter, BrokerError
+from .router import SmartOrderRouter
 from .schemas import (
     OrderRequest,
     OrderResult,
     OrderStatus,
+    OrderType,
     Quote,
 )
-from .broker_adapters.base import BrokerAdapter
-from .router import SmartOrderRouter
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({
+    OrderStatus.FILLED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+    OrderStatus.EXPIRED,
+})
+
+# Statuses of an order still working at the broker
+WORKING_STATUSES = frozenset({
+    OrderStatus.PENDING,
+    OrderStatus.SUBMITTED,
+    OrderStatus.PARTIAL_FILL,
+})
+
+# Look-back margin on bulk polls, absorbs clock skew between us and the broker
+POLL_LOOKBACK = timedelta(seconds=60)
 
 
 class OrderLifecycleController:
@@ -35,6 +71,7 @@ class OrderLifecycleController:
     - Partial fill tracking
     - Cancel-and-replace for unfilled orders
     - Time-based order expiration
+    - Event-driven status updates with bulk polling as fallback
     """
     
     def __init__(
@@ -43,6 +80,8 @@ class OrderLifecycleController:
         router: Optional[SmartOrderRouter] = None,
         reprice_interval_sec: int = 60,  # Reprice every 60 seconds
         max_order_lifetime_sec: int = 300,  # Cancel after 5 minutes
+        poll_interval_sec: float = 30.0,
+        use_trade_updates: bool = True,
     ):
         """
         Initialize lifecycle controller.
@@ -52,15 +91,35 @@ class OrderLifecycleController:
             router: Smart router for routing decisions
             reprice_interval_sec: Seconds before repricing unfilled limit orders
             max_order_lifetime_sec: Max order lifetime before cancellation
+            poll_interval_sec: With a trade-update stream, max seconds without
+                an event before falling back to a bulk poll
+            use_trade_updates: Subscribe to broker trade updates if supported
         """
         self.broker = broker
         self.router = router or SmartOrderRouter()
         self.reprice_interval_sec = reprice_interval_sec
         self.max_order_lifetime_sec = max_order_lifetime_sec
+        self.poll_interval_sec = poll_interval_sec
         
         # Track active orders
         self.active_orders: Dict[str, OrderResult] = {}
         self.order_timestamps: Dict[str, datetime] = {}
+        self.order_requests: Dict[str, OrderRequest] = {}
+        self.replacements: Dict[str, str] = {}  # cancelled order_id -> replacement order_id
+        
+        # Min-heap of (next_action_at, order_id); stale entries are skipped lazily
+        self._action_heap: List[Tuple[datetime, str]] = []
+        self._next_action: Dict[str, datetime] = {}
+        
+        # Trade updates may arrive on a broker thread
+        self._lock = threading.RLock()
+        self._event_updates: Dict[str, OrderResult] = {}
+        self._last_sync_at: Optional[datetime] = None
+        
+        self.streaming = False
+        if use_trade_updates and hasattr(broker, "subscribe_trade_updates"):
+            broker.subscribe_trade_updates(self.on_trade_update)
+            self.streaming = True
     
     def submit_order(
         self,
@@ -89,52 +148,64 @@ class OrderLifecycleController:
         result = self.broker.place_order(order)
         
         # Track if not immediately filled
-        if result.status not in [OrderStatus.FILLED, OrderStatus.REJECTED, OrderStatus.CANCELLED]:
-            self.active_orders[result.order_id] = result
-            self.order_timestamps[result.order_id] = datetime.now(timezone.utc)
+        if result.status not in TERMINAL_STATUSES:
+            now = datetime.now(timezone.utc)
+            with self._lock:
+                self._track(result, order, submitted_at=now)
+                self._schedule(result.order_id, self._first_action_at(order, now, now))
         
         return result
     
-    def check_and_manage_orders(self) -> Dict[str, OrderResult]:
+    def on_trade_update(self, result: OrderResult) -> None:
+        """
+        Apply a pushed order update (trade-updates stream callback).
+        
+        Updates for orders this controller does not track are ignored.
+        The update is also reported by the next ``check_and_manage_orders``.
+        """
+        with self._lock:
+            self._last_sync_at = datetime.now(timezone.utc)
+            if self._apply_update(result):
+                self._event_updates[result.order_id] = result
+    
+    def check_and_manage_orders(self, now: Optional[datetime] = None) -> Dict[str, OrderResult]:
         """
-        Check all active orders and manage lifecycle.
+        Refresh order state and act on orders that are due.
+        
+        Polls the broker (one bulk request) unless trade updates are
+        streaming and fresh, then pops due entries off the action queue to
+        cancel expired orders and cancel/replace stale limit orders.
+        
+        Args:
+            now: Current time (defaults to the wall clock)
         
         Returns:
             Dictionary of order_id -> updated OrderResult
         """
-        now = datetime.now(timezone.utc)
-        updates: Dict[str, OrderResult] = {}
+        now = now or datetime.now(timezone.utc)
         
-        for order_id in list(self.active_orders.keys()):
-            # Get current status
-            result = self.broker.get_order_status(order_id)
-            
-            # If filled or cancelled, remove from tracking
-            if result.status in [OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED]:
-                del self.active_orders[order_id]
-                if order_id in self.order_timestamps:
-                    del self.order_timestamps[order_id]
-                updates[order_id] = result
-                continue
-            
-            # Check order age
-            order_age = (now - self.order_timestamps[order_id]).total_seconds()
-            
-            # Cancel if too old
-            if order_age > self.max_order_lifetime_sec:
-                self.broker.cancel_order(order_id)
-                del self.active_orders[order_id]
-                del self.order_timestamps[order_id]
-                updates[order_id] = result
-                continue
-            
-            # Reprice if stale (for limit orders)
-            if order_age > self.reprice_interval_sec and result.status == OrderStatus.PENDING:
-                # TODO: Implement cancel-and-replace logic
-                # For now, just track
-                pass
-            
-            updates[order_id] = result
+        with self._lock:
+            updates = self._event_updates
+            self._event_updates = {}
+            poll = bool(self.active_orders) and self._poll_due(now)
+            since = min(self.order_timestamps.values()) - POLL_LOOKBACK if poll else None
+        
+        if poll:
+            updates.update(self._poll_statuses(since))
+        
+        with self._lock:
+            if poll:
+                self._last_sync_at = now
+            due = []
+            while self._action_heap and self._action_heap[0][0] <= now:
+                action_at, order_id = heapq.heappop(self._action_heap)
+                if self._next_action.get(order_id) != action_at:
+                    continue  # Superseded or no longer tracked
+                del self._next_action[order_id]
+                due.append(order_id)
+        
+        for order_id in due:
+            updates.update(self._run_action(order_id, now))
         
         return updates
     
@@ -146,15 +217,178 @@ class OrderLifecycleController:
             Number of orders cancelled
         """
         cancelled = 0
-        for order_id in list(self.active_orders.keys()):
+        with self._lock:
+            order_ids = list(self.active_orders.keys())
+        
+        for order_id in order_ids:
             if self.broker.cancel_order(order_id):
                 cancelled += 1
-                del self.active_orders[order_id]
-                if order_id in self.order_timestamps:
-                    del self.order_timestamps[order_id]
+                with self._lock:
+                    self._untrack(order_id)
         
         return cancelled
     
     def get_active_orders(self) -> Dict[str, OrderResult]:
         """Get all active orders."""
-        return self.active_orders.copy()
+        with self._lock:
+            return self.active_orders.copy()
+    
+    # ========== Helper Methods ==========
+    
+    def _track(self, result: OrderResult, order: OrderRequest, submitted_at: datetime) -> None:
+        """Start tracking a working order."""
+        self.active_orders[result.order_id] = result
+        self.order_timestamps[result.order_id] = submitted_at
+        self.order_requests[result.order_id] = order
+    
+    def _untrack(self, order_id: str) -> None:
+        """Stop tracking an order (its heap entries become stale)."""
+        self.active_orders.pop(order_id, None)
+        self.order_timestamps.pop(order_id, None)
+        self.order_requests.pop(order_id, None)
+        self._next_action.pop(order_id, None)
+    
+    def _schedule(self, order_id: str, action_at: datetime) -> None:
+        """Set the next action time of an order."""
+        self._next_action[order_id] = action_at
+        heapq.heappush(self._action_heap, (action_at, order_id))
+    
+    def _first_action_at(self, order: OrderRequest, submitted_at: datetime, now: datetime) -> datetime:
+        """Next reprice time for limit orders, capped at the expiry time."""
+        expires_at = submitted_at + timedelta(seconds=self.max_order_lifetime_sec)
+        if order.order_type != OrderType.LIMIT:
+            return expires_at
+        return min(now + timedelta(seconds=self.reprice_interval_sec), expires_at)
+    
+    def _apply_update(self, result: OrderResult) -> bool:
+        """Record a status update; returns False for untracked orders."""
+        current = self.active_orders.get(result.order_id)
+        if current is None:
+            return False
+        if result.status in TERMINAL_STATUSES:
+            self._untrack(result.order_id)
+        elif result.filled_quantity >= current.filled_quantity:
+            # Fills only grow: a poll fetched before a pushed fill must not undo it
+            self.active_orders[result.order_id] = result
+        return True
+    
+    def _poll_due(self, now: datetime) -> bool:
+        """Whether order state must be fetched instead of trusting the stream."""
+        if not self.streaming or self._last_sync_at is None:
+            return True
+        return (now - self._last_sync_at).total_seconds() >= self.poll_interval_sec
+    
+    def _poll_statuses(self, since: datetime) -> Dict[str, OrderResult]:
+        """Refresh every tracked order with one bulk request."""
+        results = {result.order_id: result for result in self.broker.list_orders_since(since)}
+        
+        with self._lock:
+            missing = [order_id for order_id in self.active_orders if order_id not in results]
+        for order_id in missing:
+            # Outside the broker's listing window: ask for it directly
+            results[order_id] = self.broker.get_order_status(order_id)
+        
+        updates: Dict[str, OrderResult] = {}
+        with self._lock:
+            for order_id in list(self.active_orders.keys()):
+                result = results.get(order_id)
+                if result is None:
+                    continue  # Submitted after the listing; next poll covers it
+                self._apply_update(result)
+                updates[order_id] = result
+        return updates
+    
+    def _run_action(self, order_id: str, now: datetime) -> Dict[str, OrderResult]:
+        """Expire or reprice one due order."""
+        with self._lock:
+            result = self.active_orders.get(order_id)
+            if result is None:
+                return {}
+            
+            # Cancel if too old
+            order_age = (now - self.order_timestamps[order_id]).total_seconds()
+            expired = order_age >= self.max_order_lifetime_sec
+            if expired:
+                self._untrack(order_id)
+            elif not (
+                result.status in WORKING_STATUSES
+                and self.order_requests[order_id].order_type == OrderType.LIMIT
+            ):
+                self._schedule(order_id, self.order_timestamps[order_id] + timedelta(seconds=self.max_order_lifetime_sec))
+                return {}
+        
+        if expired:
+            self.broker.cancel_order(order_id)
+            return {order_id: result}
+        
+        # Reprice if stale (for limit orders)
+        return self._cancel_and_replace(order_id, result, now)
+    
+    def _cancel_and_replace(
+        self,
+        order_id: str,
+        result: OrderResult,
+        now: datetime,
+    ) -> Dict[str, OrderResult]:
+        """
+        Cancel a stale limit order and resubmit its unfilled quantity
+        at a price routed off a fresh quote.
+        
+        The replacement keeps the original submission time, so repricing
+        never extends an order's lifetime. Its quantity comes from the
+        order's state after the cancel, so fills that land while the
+        cancel is in flight are not resubmitted.
+        """
+        with self._lock:
+            order = self.order_requests.get(order_id)
+            submitted_at = self.order_timestamps.get(order_id)
+        if order is None:
+            return {}  # Settled by a trade update since it was due
+        
+        if order.quantity - result.filled_quantity <= 0 or not self.broker.cancel_order(order_id):
+            # Filled or cancelled in the meantime; the next poll/event settles it
+            with self._lock:
+                if order_id in self.active_orders:
+                    self._schedule(order_id, now + timedelta(seconds=self.reprice_interval_sec))
+            return {}
+        
+        with self._lock:
+            self._untrack(order_id)
+        
+        try:
+            final = self.broker.get_order_status(order_id)
+        except BrokerError as e:
+            # Without the final fill count the replacement could over-fill
+            logger.error(f"Cancelled {order_id} but could not fetch its final state, not replacing: {e}")
+            return {order_id: result.model_copy(update={"status": OrderStatus.CANCELLED, "error_message": str(e)})}
+        
+        if final.status not in TERMINAL_STATUSES:
+            final = final.model_copy(update={"status": OrderStatus.CANCELLED})
+        updates = {order_id: final}
+        
+        # Fills only grow; the cached count may be ahead of a lagging status
+        remaining = order.quantity - max(final.filled_quantity, result.filled_quantity)
+        if remaining <= 0:
+            return updates
+        
+        replacement = order.model_copy(update={"quantity": remaining})
+        try:
+            quote = self.broker.get_quote(order.symbol)
+            routing = self.router.route_order(replacement, quote)
+            replacement.order_type = routing.order_type
+            replacement.limit_price = routing.limit_price
+            replacement.time_in_force = routing.time_in_force
+            new_result = self.broker.place_order(replacement)
+        except BrokerError as e:
+            logger.error(f"Replacement for cancelled {order_id} ({remaining} {order.symbol}) failed: {e}")
+            updates[order_id] = final.model_copy(update={"error_message": f"Replacement failed: {e}"})
+            return updates
+        
+        updates[new_result.order_id] = new_result
+        with self._lock:
+            self.replacements[order_id] = new_result.order_id
+            if new_result.status not in TERMINAL_STATUSES:
+                self._track(new_result, replacement, submitted_at=submitted_at)
+                self._schedule(new_result.order_id, self._first_action_at(replacement, submitted_at, now))
+        
+        return updates
@@ -17,21 +17,55 @@ Uses DuckDB for:
 - Fast analytical queries
 - Single-file portability
 - No external dependencies
+
+Write-behind mode (``write_behind=True``) avoids a DuckDB commit per order
+update: records live in memory (indexed by order id and idempotency key),
+every change is appended to a write-ahead log first, and dirty records are
+flushed to DuckDB in one transaction once ``flush_max_records`` changes or
+``flush_interval_seconds`` have accumulated. Both thresholds are checked on
+each write; an idle registry flushes through ``flush_if_due`` (called
+periodically by ExecutionOrchestrator's async pipeline) or ``close``. On
+startup the WAL is replayed, so a crash loses nothing that was acknowledged.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
 import duckdb
 
 from execution.schemas import ExecutionRecord, OrderEnvelope, OrderStatus
 
+logger = logging.getLogger(__name__)
+
+# Orders in these states never change again; write-behind mode evicts them
+# from memory once they are flushed to DuckDB
+TERMINAL_STATUSES = frozenset({
+    OrderStatus.FILLED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+    OrderStatus.EXPIRED,
+    OrderStatus.ERROR,
+})
+
+# Rows per multi-row INSERT in a write-behind flush
+_FLUSH_CHUNK_ROWS = 500
+
+_COLUMNS = (
+    "order_id, idempotency_key, status, created_at, updated_at, "
+    "instruction_json, broker_order_id, order_type, limit_price, "
+    "fill_price, filled_quantity, error_message, retry_count, "
+    "status_history"
+)
+
 
 class ExecutionRegistry:
     """
@@ -41,17 +75,48 @@ class ExecutionRegistry:
     Provides crash-safe recovery and full audit trail.
     """
 
-    def __init__(self, db_path: str | Path = "execution_registry.db"):
+    def __init__(
+        self,
+        db_path: str | Path = "execution_registry.db",
+        write_behind: bool = False,
+        wal_path: str | Path | None = None,
+        flush_max_records: int = 500,
+        flush_interval_seconds: float = 1.0,
+        wal_fsync: bool = True,
+    ):
         """
         Initialize registry.
 
         Args:
             db_path: Path to DuckDB database file
+            write_behind: Serve from memory, log to a WAL, flush to DuckDB in batches
+            wal_path: Write-ahead log path (default: ``<db_path>.registry.wal``;
+                ``<db_path>.wal`` is DuckDB's own log)
+            flush_max_records: Flush once this many records are dirty
+            flush_interval_seconds: Flush once the oldest dirty change is this old
+            wal_fsync: fsync each WAL append (survives power loss, not just
+                process crashes)
         """
         self.db_path = Path(db_path)
         self._conn: Optional[duckdb.DuckDBPyConnection] = None
         self._initialize_db()
 
+        self.write_behind = write_behind
+        self.wal_path = Path(wal_path) if wal_path else Path(f"{self.db_path}.registry.wal")
+        self.flush_max_records = flush_max_records
+        self.flush_interval_seconds = flush_interval_seconds
+        self.wal_fsync = wal_fsync
+
+        # Write-behind state
+        self._records: Dict[str, ExecutionRecord] = {}  # order_id -> record (open/dirty)
+        self._by_key: Dict[str, str] = {}  # idempotency_key -> order_id (all orders)
+        self._dirty: set[str] = set()
+        self._dirty_since: Optional[float] = None
+        self._wal = None
+
+        if write_behind:
+            self._recover()
+
     def _initialize_db(self) -> None:
         """Create database and tables if they don't exist."""
         self._conn = duckdb.connect(str(self.db_path))
@@ -187,6 +252,17 @@ class ExecutionRegistry:
         Returns:
             New retry count
         """
+        if self.write_behind:
+            record = self._get_record(order_id)
+            if not record:
+                return 0
+            # Changed copy: the WAL entry goes first, then it replaces the record
+            record = record.model_copy(
+                update={"retry_count": record.retry_count + 1, "updated_at": datetime.now(timezone.utc)}
+            )
+            self._stage(record)
+            return record.retry_count
+
         self._conn.execute(
             """
             UPDATE orders
@@ -211,6 +287,17 @@ class ExecutionRegistry:
         Returns:
             ExecutionRecord if found, None otherwise
         """
+        if self.write_behind:
+            record = self._get_record(order_id)
+            if record is None:
+                return None
+            # History entries are never mutated, only appended
+            return record.model_copy(update={"status_history": list(record.status_history)})
+
+        return self._select_by_id(order_id)
+
+    def _select_by_id(self, order_id: UUID | str) -> Optional[ExecutionRecord]:
+        """Read one order from DuckDB."""
         result = self._conn.execute(
             """
             SELECT * FROM orders WHERE order_id = ?
@@ -235,6 +322,14 @@ class ExecutionRegistry:
         Returns:
             OrderEnvelope if found, None otherwise
         """
+        if self.write_behind:
+            # Every key is indexed, so a miss needs no database query
+            order_id = self._by_key.get(idempotency_key)
+            if order_id is None:
+                return None
+            record = self._get_record(order_id)
+            return self._record_to_envelope(record) if record else None
+
         result = self._conn.execute(
             """
             SELECT * FROM orders WHERE idempotency_key = ?
@@ -258,6 +353,9 @@ class ExecutionRegistry:
         Returns:
             List of ExecutionRecords
         """
+        if self.write_behind:
+            self.flush()
+
         results = self._conn.execute(
             """
             SELECT * FROM orders WHERE status = ?
@@ -278,6 +376,9 @@ class ExecutionRegistry:
         Returns:
             List of ExecutionRecords
         """
+        if self.write_behind:
+            self.flush()
+
         results = self._conn.execute(
             """
             SELECT * FROM orders
@@ -289,12 +390,158 @@ class ExecutionRegistry:
 
         return [self._row_to_record(row) for row in results]
 
+    def flush(self) -> int:
+        """
+        Write dirty records to DuckDB in one transaction and reset the WAL.
+
+        Only meaningful in write-behind mode. Terminal orders are evicted from
+        memory afterwards; open orders stay authoritative in memory.
+
+        Returns:
+            Number of records written
+        """
+        if not self._dirty:
+            return 0
+
+        order_ids = list(self._dirty)
+        records = [self._records[order_id] for order_id in order_ids]
+
+        # Delete + multi-row insert: DuckDB upserts and executemany both go
+        # row by row, a single VALUES list is bound and inserted in bulk
+        row_placeholder = "(" + ", ".join(["?"] * 14) + ")"
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            for start in range(0, len(records), _FLUSH_CHUNK_ROWS):
+                chunk = records[start:start + _FLUSH_CHUNK_ROWS]
+                ids = order_ids[start:start + _FLUSH_CHUNK_ROWS]
+                self._conn.execute(
+                    f"DELETE FROM orders WHERE order_id IN ({', '.join(['?'] * len(ids))})", ids
+                )
+                self._conn.execute(
+                    f"INSERT INTO orders ({_COLUMNS}) VALUES "
+                    + ", ".join([row_placeholder] * len(chunk)),
+                    [value for record in chunk for value in self._record_params(record)],
+                )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        # Everything in the WAL is now in DuckDB (replaying it again would be
+        # harmless, so a crash before truncation is safe)
+        self._wal.truncate(0)
+        self._wal.seek(0)
+
+        for record in records:
+            if record.status in TERMINAL_STATUSES:
+                self._evict(record)
+
+        self._dirty.clear()
+        self._dirty_since = None
+        return len(records)
+
+    def flush_if_due(self) -> int:
+        """
+        Flush if the oldest dirty change is ``flush_interval_seconds`` old.
+
+        Writes check this themselves; call it periodically so changes made
+        before the registry goes idle still reach DuckDB.
+
+        Returns:
+            Number of records written
+        """
+        if self._dirty_since is None:
+            return 0
+        if time.monotonic() - self._dirty_since < self.flush_interval_seconds:
+            return 0
+        return self.flush()
+
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending writes and close database connection."""
+        if self.write_behind and self._conn:
+            self.flush()
+        if self._wal:
+            self._wal.close()
+            self._wal = None
         if self._conn:
             self._conn.close()
             self._conn = None
 
+    # Write-behind helpers
+
+    def _recover(self) -> None:
+        """Load open orders, replay the WAL and flush what it contained."""
+        terminal = [status.value for status in TERMINAL_STATUSES]
+        rows = self._conn.execute(
+            f"SELECT * FROM orders WHERE status NOT IN ({', '.join(['?'] * len(terminal))})",
+            terminal,
+        ).fetchall()
+        for row in rows:
+            self._remember(self._row_to_record(row))
+        for idempotency_key, order_id in self._conn.execute(
+            "SELECT idempotency_key, order_id FROM orders"
+        ).fetchall():
+            self._by_key[idempotency_key] = order_id
+
+        replayed = 0
+        torn = False
+        if self.wal_path.exists():
+            with open(self.wal_path, "r") as f:
+                for line in f:
+                    try:
+                        record = ExecutionRecord.model_validate_json(line)
+                    except ValueError:
+                        # Torn final write from a crash mid-append
+                        logger.warning(f"Skipping unreadable WAL entry in {self.wal_path}")
+                        torn = True
+                        continue
+                    self._remember(record)
+                    self._dirty.add(str(record.order_id))
+                    replayed += 1
+
+        self._wal = open(self.wal_path, "a")
+        if replayed:
+            logger.info(f"Replayed {replayed} WAL entries from {self.wal_path}")
+            self.flush()
+        elif torn:
+            # Don't append new entries to the torn fragment
+            self._wal.truncate(0)
+
+    def _get_record(self, order_id: UUID | str) -> Optional[ExecutionRecord]:
+        """Memory first, then DuckDB (closed orders flushed earlier)."""
+        record = self._records.get(str(order_id))
+        if record is None:
+            record = self._select_by_id(order_id)
+            if record is not None and record.status not in TERMINAL_STATUSES:
+                self._remember(record)
+        return record
+
+    def _remember(self, record: ExecutionRecord) -> None:
+        order_id = str(record.order_id)
+        self._records[order_id] = record
+        self._by_key[record.idempotency_key] = order_id
+
+    def _evict(self, record: ExecutionRecord) -> None:
+        # The idempotency index keeps the key; the record is re-read on demand
+        self._records.pop(str(record.order_id), None)
+
+    def _stage(self, record: ExecutionRecord) -> None:
+        """Log a changed record to the WAL, apply it in memory, flush if due."""
+        self._wal.write(record.model_dump_json() + "\n")
+        self._wal.flush()
+        if self.wal_fsync:
+            os.fsync(self._wal.fileno())
+
+        self._remember(record)
+        self._dirty.add(str(record.order_id))
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+        if len(self._dirty) >= self.flush_max_records:
+            self.flush()
+        else:
+            self.flush_if_due()
+
     # Helper methods
 
     def _envelope_to_record(self, envelope: OrderEnvelope) -> ExecutionRecord:
@@ -355,8 +602,31 @@ class ExecutionRegistry:
             error_message=record.error_message,
         )
 
+    def _record_params(self, record: ExecutionRecord) -> list:
+        """Column values in _COLUMNS order."""
+        return [
+            str(record.order_id),
+            record.idempotency_key,
+            record.status.value,
+            record.created_at,
+            record.updated_at,
+            record.instruction_json,
+            record.broker_order_id,
+            record.order_type,
+            record.limit_price,
+            record.fill_price,
+            record.filled_quantity,
+            record.error_message,
+            record.retry_count,
+            json.dumps(record.status_history),
+        ]
+
     def _insert_record(self, record: ExecutionRecord) -> None:
         """Insert new record into database."""
+        if self.write_behind:
+            self._stage(record)
+            return
+
         self._conn.execute(
             """
             INSERT INTO orders (
@@ -387,6 +657,10 @@ class ExecutionRegistry:
 
     def _update_record(self, record: ExecutionRecord) -> None:
         """Update existing record in database."""
+        if self.write_behind:
+            self._stage(record)
+            return
+
         self._conn.execute(
             """
             UPDATE orders
@@ -9,12 +9,15 @@ quotes, and execution costs using Pydantic v2.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from agents.portfolio.schemas import OrderInstruction
+
 
 class OrderType(str, Enum):
     """Order type classification."""
@@ -39,6 +42,10 @@ class OrderStatus(str, Enum):
     CANCELLED = "cancelled"
     REJECTED = "rejected"
     EXPIRED = "expired"
+    ERROR = "error"  # Submission failed (orchestrator)
+    
+    # Alias used by the Phase 8 broker simulator
+    PARTIALLY_FILLED = "partial_fill"
 
 
 class TimeInForce(str, Enum):
@@ -235,3 +242,87 @@ class RoutingDecision(BaseModel):
     split_order: bool = False
     split_quantities: List[int] = Field(default_factory=list)
     reasoning: str = ""
+
+
+# ============================================================================
+# Phase 8 orchestration schemas (ExecutionOrchestrator / ExecutionRegistry)
+# ============================================================================
+
+
+class OrderEnvelope(BaseModel):
+    """
+    Order instruction wrapped with identity and execution state.
+    
+    Persisted by the registry before the broker sees it; the idempotency
+    key deduplicates resubmissions of the same instruction.
+    """
+    model_config = ConfigDict(frozen=False)
+    
+    order_id: UUID = Field(default_factory=uuid4)
+    idempotency_key: str
+    
+    # Lifecycle timestamps
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    submitted_at: Optional[datetime] = None
+    filled_at: Optional[datetime] = None
+    
+    status: OrderStatus = OrderStatus.PENDING
+    retry_count: int = 0
+    
+    # Order
+    instruction: OrderInstruction
+    order_type: OrderType = OrderType.LIMIT
+    limit_price: Optional[float] = None
+    
+    # Broker state
+    broker_order_id: Optional[str] = None
+    fill_price: Optional[float] = None
+    filled_quantity: int = 0
+    error_message: Optional[str] = None
+
+
+class BrokerResponse(BaseModel):
+    """Broker reply to a submit or cancel request."""
+    model_config = ConfigDict(frozen=False)
+    
+    success: bool
+    status: OrderStatus
+    broker_order_id: Optional[str] = None
+    fill_price: Optional[float] = None
+    filled_quantity: Optional[int] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BrokerStatus(BaseModel):
+    """Broker-side state of an order."""
+    model_config = ConfigDict(frozen=False)
+    
+    broker_order_id: str
+    status: OrderStatus
+    fill_price: Optional[float] = None
+    filled_quantity: int = 0
+    remaining_quantity: int = 0
+    submitted_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ExecutionRecord(BaseModel):
+    """Registry row: current order state plus status transition history."""
+    model_config = ConfigDict(frozen=False)
+    
+    order_id: UUID
+    idempotency_key: str
+    status: OrderStatus
+    created_at: datetime
+    updated_at: datetime
+    instruction_json: str
+    broker_order_id: Optional[str] = None
+    order_type: str
+    limit_price: Optional[float] = None
+    fill_price: Optional[float] = None
+    filled_quantity: int = 0
+    error_message: Optional[str] = None
+    retry_count: int = 0
+    status_history: List[Dict[str, Any]] = Field(default_factory=list)
@@ -174,7 +174,7 @@ class LearningOrchestrator:
                     iv_rank=iv_rank
                 )
             
-            # Note: Lookahead model training happens in background thread
+            # Note: Lookahead model training happens in a background process
             # Sequences are added separately via add_hedge_snapshot()
             
             # Periodic save
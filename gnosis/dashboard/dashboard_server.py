@@ -2,7 +2,7 @@
 Simple Web Dashboard for Live Trading Bot
 
 FastAPI backend providing:
-- Real-time WebSocket updates
+- Real-time WebSocket updates (coalesced, rate-limited, per-client queues)
 - REST API for positions, trades, memory
 - Static HTML/JS frontend
 
@@ -61,24 +61,195 @@ class DashboardState:
 dashboard_state = DashboardState()
 
 # WebSocket connection manager
+class ClientConnection:
+    """
+    One websocket client with a bounded outgoing queue.
+
+    A dedicated sender task drains the queue, so a slow client only
+    delays (and eventually drops) its own frames. When the queue is full
+    the oldest frame is dropped.
+    """
+    def __init__(self, websocket: WebSocket, max_queue_size: int):
+        self.websocket = websocket
+        self.queue: deque = deque(maxlen=max_queue_size)
+        self.dropped = 0
+        self._ready = asyncio.Event()
+        self.sender: Optional[asyncio.Task] = None
+
+    def enqueue(self, frame: str):
+        """Queue a serialized frame, dropping the oldest if full"""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(frame)
+        self._ready.set()
+
+    async def send_loop(self, send_timeout: float):
+        """Send queued frames until the connection fails"""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self.queue:
+                frame = self.queue.popleft()
+                await asyncio.wait_for(self.websocket.send_text(frame), send_timeout)
+
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-    
-    async def connect(self, websocket: WebSocket):
+    """
+    Fans dashboard updates out to websocket clients.
+
+    Updates are coalesced per type (latest value wins, except for
+    ``EVENT_TYPES`` which are all delivered) and flushed at most ``max_hz``
+    times per second, in publish order (a coalesced update takes the place
+    of its latest publish). At most ``max_pending_events`` events wait for
+    a flush; older ones are dropped. Each frame is serialized once and
+    shared by all clients; clients whose sends fail or time out are evicted.
+    """
+    # Discrete events: every one matters, so they are queued, not coalesced
+    EVENT_TYPES = frozenset({"trade", "memory_recall"})
+
+    def __init__(
+        self,
+        max_hz: float = 10.0,
+        max_queue_size: int = 64,
+        send_timeout: float = 5.0,
+        max_pending_events: int = 1000,
+    ):
+        self.max_hz = max_hz
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.max_pending_events = max_pending_events
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        self.evicted = 0
+        self.dropped_events = 0
+        # Pending updates in publish order: update type -> latest message,
+        # (type, seq) -> event
+        self._queued: Dict[Any, Dict] = {}
+        self._queued_events = 0
+        self._event_seq = 0
+        self._pending: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self.clients)
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
         await websocket.accept()
-        self.active_connections.append(websocket)
-    
+        client = ClientConnection(websocket, self.max_queue_size)
+        self.clients[websocket] = client
+        client.sender = asyncio.create_task(self._run_sender(client))
+        self._ensure_flusher()
+        return client
+
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-    
+        client = self.clients.pop(websocket, None)
+        if client is not None and client.sender is not None:
+            client.sender.cancel()
+
+    def publish(self, update_type: str, data: Any):
+        """Schedule an update for the next flush (never blocks)"""
+        message = {
+            "type": update_type,
+            "data": data,
+            "timestamp": datetime.now().isoformat()
+        }
+        if update_type in self.EVENT_TYPES:
+            self._event_seq += 1
+            self._queued[(update_type, self._event_seq)] = message
+            self._queued_events += 1
+            if self._queued_events > self.max_pending_events:
+                self._drop_oldest_event()
+        else:
+            # Re-insert so the update moves to its latest publish position
+            self._queued.pop(update_type, None)
+            self._queued[update_type] = message
+        self._ensure_flusher()
+        if self._pending is not None:
+            self._pending.set()
+
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        self._send_to_all(self._serialize(message))
+
+    def flush(self) -> int:
+        """Send all pending updates now; returns number of frames sent"""
+        messages = list(self._queued.values())
+        self._queued = {}
+        self._queued_events = 0
+        for message in messages:
+            self._send_to_all(self._serialize(message))
+        return len(messages)
+
+    def close(self):
+        """Stop the flush task and all sender tasks"""
+        for websocket in list(self.clients):
+            self.disconnect(websocket)
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection and backpressure counters"""
+        return {
+            "clients": len(self.clients),
+            "queued_frames": sum(len(c.queue) for c in self.clients.values()),
+            "dropped_frames": sum(c.dropped for c in self.clients.values()),
+            "evicted": self.evicted,
+            "dropped_events": self.dropped_events,
+        }
+
+    @staticmethod
+    def _serialize(message: dict) -> str:
+        return json.dumps(message, default=str)
+
+    def _drop_oldest_event(self):
+        for key in self._queued:
+            if isinstance(key, tuple):
+                del self._queued[key]
+                self._queued_events -= 1
+                self.dropped_events += 1
+                return
+
+    def _send_to_all(self, frame: str):
+        for client in self.clients.values():
+            client.enqueue(frame)
+
+    def _ensure_flusher(self):
+        """Start the flush task once an event loop is running"""
+        if self._flusher is not None and not self._flusher.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Updates stay pending until a client connects
+        self._pending = asyncio.Event()
+        if self._queued:
+            self._pending.set()
+        self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Flush on the first pending update, then at most max_hz times/sec"""
+        interval = 1.0 / self.max_hz
+        while True:
+            await self._pending.wait()
+            self._pending.clear()
+            self.flush()
+            await asyncio.sleep(interval)
+
+    async def _run_sender(self, client: ClientConnection):
+        try:
+            await client.send_loop(self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Dead or stalled connection: stop sending to it
+            if self.clients.get(client.websocket) is client:
+                del self.clients[client.websocket]
+                self.evicted += 1
+                try:
+                    await client.websocket.close()
+                except Exception:
+                    pass
 
 manager = ConnectionManager()
 
@@ -133,6 +304,11 @@ async def get_regime():
     """Get current regime state"""
     return dashboard_state.regime_state or {"primary": "unknown", "confidence": 0.0}
 
+@app.get("/api/connections")
+async def get_connections():
+    """Get websocket fan-out stats"""
+    return manager.stats()
+
 
 # ============================================================================
 # WebSocket Endpoint
@@ -141,20 +317,20 @@ async def get_regime():
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
-    await manager.connect(websocket)
+    client = await manager.connect(websocket)
     
     try:
-        # Send initial state
-        await websocket.send_json({
+        # Send initial state (queued ahead of any update)
+        client.enqueue(manager._serialize({
             "type": "init",
             "data": dashboard_state.to_dict()
-        })
+        }))
         
         # Keep connection alive and listen for messages
         while True:
             data = await websocket.receive_text()
             # Echo back (for testing)
-            await websocket.send_text(f"Echo: {data}")
+            client.enqueue(f"Echo: {data}")
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -167,46 +343,39 @@ async def websocket_endpoint(websocket: WebSocket):
 def update_positions(positions: Dict[str, Any]):
     """Update open positions"""
     dashboard_state.positions = positions
-    asyncio.create_task(_broadcast_update("positions", positions))
+    manager.publish("positions", positions)
 
 def add_trade(trade: Dict[str, Any]):
     """Add new trade"""
     dashboard_state.trades.appendleft(trade)
     dashboard_state.portfolio_stats["total_trades"] += 1
-    asyncio.create_task(_broadcast_update("trade", trade))
+    manager.publish("trade", trade)
 
 def update_agent_votes(votes: Dict[str, Any]):
     """Update latest agent votes"""
     dashboard_state.agent_votes = votes
-    asyncio.create_task(_broadcast_update("agent_votes", votes))
+    manager.publish("agent_votes", votes)
 
 def add_memory_recall(recall: Dict[str, Any]):
     """Add memory recall"""
     dashboard_state.memory_recalls.appendleft(recall)
-    asyncio.create_task(_broadcast_update("memory_recall", recall))
+    manager.publish("memory_recall", recall)
 
 def update_portfolio_stats(stats: Dict[str, Any]):
     """Update portfolio statistics"""
     dashboard_state.portfolio_stats.update(stats)
-    asyncio.create_task(_broadcast_update("portfolio_stats", stats))
+    # Full stats: coalescing keeps only the latest frame per type
+    manager.publish("portfolio_stats", dict(dashboard_state.portfolio_stats))
 
 def update_regime(regime: Dict[str, Any]):
     """Update regime state"""
     dashboard_state.regime_state = regime
-    asyncio.create_task(_broadcast_update("regime", regime))
+    manager.publish("regime", regime)
 
 def update_bar(bar: Dict[str, Any]):
     """Update latest bar"""
     dashboard_state.last_bar = bar
-    asyncio.create_task(_broadcast_update("bar", bar))
-
-async def _broadcast_update(update_type: str, data: Any):
-    """Broadcast update to all websocket clients"""
-    await manager.broadcast({
-        "type": update_type,
-        "data": data,
-        "timestamp": datetime.now().isoformat()
-    })
+    manager.publish("bar", bar)
 
 
 # ============================================================================
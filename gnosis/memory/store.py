@@ -2,7 +2,8 @@
 Episode Memory Store
 
 DuckDB + Parquet for structured episode storage.
-Append-only writes with updates on exit.
+Append-only writes with updates on exit. Episode fields are stored as typed
+columns so aggregate queries and exports run inside DuckDB.
 """
 
 from __future__ import annotations
@@ -11,18 +12,50 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 import json
+import numbers
 
-from gnosis.memory.schema import Episode
+import polars as pl
+
+from gnosis.memory.schema import Episode, AgentView
+
+
+# Bump when the episodes table layout changes; _init_schema migrates older layouts.
+SCHEMA_VERSION = 2
+
+# Feature-digest keys promoted to typed DOUBLE columns so analytics can filter
+# and aggregate on them without touching the features map.
+HOT_FEATURES = ("hedge_gamma", "liq_amihud", "sent_momentum", "sent_volume_delta")
+
+_AGENT_VIEW_TYPE = (
+    "STRUCT(agent_name VARCHAR, signal INTEGER, confidence DOUBLE, "
+    "reasoning VARCHAR, key_features JSON)"
+)
+
+# Columns hydrated into an Episode, in SELECT order
+_EPISODE_COLUMNS = (
+    "episode_id", "symbol", "t_open", "price_open", "features", "features_extra", "agent_views",
+    "decision", "decision_confidence", "position_size", "consensus_logic",
+    "t_close", "price_close", "exit_reason", "pnl", "return_pct", "duration_bars",
+    "hit_target", "critique", "regime_label", "key_lesson", "embedding",
+    "similar_episodes", "retrieval_score",
+)
 
 
 class EpisodeStore:
     """
     Persistent storage for trade episodes
     
-    Schema:
-    - episodes table with JSON fields for nested data
-    - Parquet backing for durability
+    Schema (v2):
+    - episodes table with one typed column per episode field
+    - hot feature values (HOT_FEATURES) as DOUBLE columns, the numeric
+      digest as MAP(VARCHAR, DOUBLE), other digest values (strings, flags)
+      as JSON in ``features_extra``
+    - agent votes as a list of structs, embedding as FLOAT[]
+    - Parquet export for durability
     - Efficient queries by symbol, date, outcome
+    
+    Databases written with the v1 layout (full episode in a ``data JSON``
+    column) are migrated in place on open.
     """
     
     def __init__(self, db_path: str = "memory/episodes.duckdb"):
@@ -33,27 +66,63 @@ class EpisodeStore:
         self._init_schema()
     
     def _init_schema(self):
-        """Create episodes table if not exists"""
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS episodes (
+        """Create episodes table if not exists, migrating v1 tables"""
+        columns = self._table_columns("episodes")
+        
+        if not columns:
+            self._create_table("episodes")
+        elif "data" in columns:
+            self._migrate_v1()
+        elif "features_extra" not in columns:
+            self.conn.execute("ALTER TABLE episodes ADD COLUMN features_extra JSON")
+        
+        self._create_indexes()
+    
+    def _table_columns(self, table: str) -> List[str]:
+        """Column names of a table (empty if it does not exist)"""
+        rows = self.conn.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ?",
+            [table]
+        ).fetchall()
+        return [row[0] for row in rows]
+    
+    def _create_table(self, table: str):
+        """Create a v2 episodes table under the given name"""
+        hot_columns = "".join(f"{name} DOUBLE,\n" for name in HOT_FEATURES)
+        self.conn.execute(f"""
+            CREATE TABLE {table} (
                 episode_id VARCHAR PRIMARY KEY,
                 symbol VARCHAR,
                 t_open TIMESTAMP,
                 t_close TIMESTAMP,
+                price_open DOUBLE,
+                price_close DOUBLE,
                 decision INTEGER,
                 decision_confidence DOUBLE,
+                position_size DOUBLE,
+                consensus_logic VARCHAR,
                 pnl DOUBLE,
                 return_pct DOUBLE,
+                duration_bars INTEGER,
                 hit_target BOOLEAN,
                 exit_reason VARCHAR,
                 regime_label VARCHAR,
-                data JSON,  -- Full episode as JSON
+                critique VARCHAR,
+                key_lesson VARCHAR,
+                {hot_columns}
+                features MAP(VARCHAR, DOUBLE),
+                features_extra JSON,
+                agent_views {_AGENT_VIEW_TYPE}[],
+                embedding FLOAT[],
+                similar_episodes VARCHAR[],
+                retrieval_score DOUBLE,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
-        # Indexes for fast queries
+    
+    def _create_indexes(self):
+        """Indexes for fast queries"""
         self.conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_symbol_time 
             ON episodes(symbol, t_open DESC)
@@ -61,59 +130,217 @@ class EpisodeStore:
         
         self.conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_outcome 
-            ON episodes(pnl, hit_target) WHERE pnl IS NOT NULL
+            ON episodes(pnl, hit_target)
         """)
     
-    def write(self, episode: Episode):
+    def _migrate_v1(self):
         """
-        Write episode to store (insert or update)
+        Migrate a v1 table (episode JSON blob in ``data``) to typed columns
         
-        If episode_id exists, update it. Otherwise insert.
+        Runs entirely inside DuckDB in one transaction: nested fields are
+        decoded with json_transform, so no rows are hydrated in Python.
+        Digest values are split like ``_episode_params``: JSON numbers go to
+        the hot columns and ``features``, everything else to ``features_extra``.
         """
-        data_json = json.dumps(episode.to_dict())
-        
-        self.conn.execute("""
-            INSERT INTO episodes (
-                episode_id, symbol, t_open, t_close, decision, decision_confidence,
-                pnl, return_pct, hit_target, exit_reason, regime_label, data, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT (episode_id) DO UPDATE SET
-                t_close = excluded.t_close,
-                pnl = excluded.pnl,
-                return_pct = excluded.return_pct,
-                hit_target = excluded.hit_target,
-                exit_reason = excluded.exit_reason,
-                regime_label = excluded.regime_label,
-                data = excluded.data,
-                updated_at = CURRENT_TIMESTAMP
-        """, [
+        numeric = "('BIGINT', 'UBIGINT', 'DOUBLE')"
+        hot_select = "".join(
+            f"CASE WHEN json_type(data->'$.features_digest.{name}') IN {numeric} "
+            f"THEN TRY_CAST(data->>'$.features_digest.{name}' AS DOUBLE) END,\n"
+            for name in HOT_FEATURES
+        )
+        digest_entries = "map_entries(json_transform(data->'$.features_digest', '\"MAP(VARCHAR, JSON)\"'))"
+        agent_view_json = (
+            '[{"agent_name": "VARCHAR", "signal": "INTEGER", "confidence": "DOUBLE", '
+            '"reasoning": "VARCHAR", "key_features": "JSON"}]'
+        )
+        
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DROP TABLE IF EXISTS episodes_v2")
+            self._create_table("episodes_v2")
+            self.conn.execute(f"""
+                INSERT INTO episodes_v2
+                SELECT
+                    episode_id,
+                    symbol,
+                    t_open,
+                    t_close,
+                    (data->>'$.price_open')::DOUBLE,
+                    (data->>'$.price_close')::DOUBLE,
+                    decision,
+                    decision_confidence,
+                    (data->>'$.position_size')::DOUBLE,
+                    data->>'$.consensus_logic',
+                    pnl,
+                    return_pct,
+                    (data->>'$.duration_bars')::INTEGER,
+                    hit_target,
+                    exit_reason,
+                    regime_label,
+                    data->>'$.critique',
+                    data->>'$.key_lesson',
+                    {hot_select}
+                    map_from_entries(list_transform(
+                        list_filter({digest_entries}, e -> json_type(e.value) IN {numeric}),
+                        e -> {{'key': e.key, 'value': TRY_CAST(e.value AS DOUBLE)}}
+                    ))::MAP(VARCHAR, DOUBLE),
+                    to_json(map_from_entries(list_filter(
+                        {digest_entries}, e -> json_type(e.value) NOT IN {numeric}
+                    ))),
+                    json_transform(data->'$.agent_views', '{agent_view_json}'),
+                    json_transform(data->'$.embedding', '["FLOAT"]'),
+                    COALESCE(json_transform(data->'$.similar_episodes', '["VARCHAR"]'), []),
+                    COALESCE((data->>'$.retrieval_score')::DOUBLE, 0.0),
+                    created_at,
+                    updated_at
+                FROM episodes
+            """)
+            self.conn.execute("DROP TABLE episodes")
+            self.conn.execute("ALTER TABLE episodes_v2 RENAME TO episodes")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+    
+    @staticmethod
+    def _episode_params(episode: Episode) -> list:
+        """Bind parameters for one episode, in write() column order"""
+        # Non-numeric digest values (strings, flags, None) go to features_extra
+        features, extra = {}, {}
+        for k, v in episode.features_digest.items():
+            if isinstance(v, numbers.Real) and not isinstance(v, bool):
+                features[k] = float(v)
+            else:
+                extra[k] = v
+        agent_views = [
+            {
+                "agent_name": av.agent_name,
+                "signal": av.signal,
+                "confidence": av.confidence,
+                "reasoning": av.reasoning,
+                "key_features": json.dumps(av.key_features)
+            }
+            for av in episode.agent_views
+        ]
+        
+        return [
             episode.episode_id,
             episode.symbol,
             episode.t_open,
             episode.t_close,
+            episode.price_open,
+            episode.price_close,
             episode.decision,
             episode.decision_confidence,
+            episode.position_size,
+            episode.consensus_logic,
             episode.pnl,
             episode.return_pct,
+            episode.duration_bars,
             episode.hit_target,
             episode.exit_reason,
             episode.regime_label,
-            data_json
-        ])
+            episode.critique,
+            episode.key_lesson,
+            *[features.get(name) for name in HOT_FEATURES],
+            features,
+            json.dumps(extra, default=str) if extra else None,
+            agent_views,
+            episode.embedding,
+            list(episode.similar_episodes),
+            episode.retrieval_score,
+        ]
+    
+    @staticmethod
+    def _row_to_episode(row: tuple) -> Episode:
+        """Hydrate an Episode from a row selected with _EPISODE_COLUMNS"""
+        d = dict(zip(_EPISODE_COLUMNS, row))
+        
+        agent_views = [
+            AgentView(
+                agent_name=av["agent_name"],
+                signal=av["signal"],
+                confidence=av["confidence"],
+                reasoning=av["reasoning"],
+                key_features=json.loads(av["key_features"]) if av["key_features"] else {}
+            )
+            for av in d["agent_views"] or []
+        ]
+        
+        return Episode(
+            episode_id=d["episode_id"],
+            symbol=d["symbol"],
+            t_open=d["t_open"],
+            price_open=d["price_open"],
+            features_digest={**(d["features"] or {}), **json.loads(d["features_extra"] or "{}")},
+            agent_views=agent_views,
+            decision=d["decision"],
+            decision_confidence=d["decision_confidence"],
+            position_size=d["position_size"],
+            consensus_logic=d["consensus_logic"],
+            t_close=d["t_close"],
+            price_close=d["price_close"],
+            exit_reason=d["exit_reason"],
+            pnl=d["pnl"],
+            return_pct=d["return_pct"],
+            duration_bars=d["duration_bars"],
+            hit_target=d["hit_target"],
+            critique=d["critique"],
+            regime_label=d["regime_label"],
+            key_lesson=d["key_lesson"],
+            embedding=d["embedding"],
+            similar_episodes=list(d["similar_episodes"] or []),
+            retrieval_score=d["retrieval_score"] or 0.0
+        )
+    
+    def _select_episodes(self, where: str, params: list, order_by: str, limit: int) -> List[Episode]:
+        """Run a filtered episode query and hydrate the rows"""
+        query = (
+            f"SELECT {', '.join(_EPISODE_COLUMNS)} FROM episodes WHERE {where} "
+            f"ORDER BY {order_by} LIMIT ?"
+        )
+        results = self.conn.execute(query, params + [limit]).fetchall()
+        return [self._row_to_episode(row) for row in results]
+    
+    def write(self, episode: Episode):
+        """
+        Write episode to store (insert or update)
+        
+        If episode_id exists, update it. Otherwise insert.
+        """
+        self.write_many([episode])
+    
+    def write_many(self, episodes: List[Episode]):
+        """Write a batch of episodes (insert or update) in one statement batch"""
+        if not episodes:
+            return
+        
+        insert_columns = [
+            "episode_id", "symbol", "t_open", "t_close", "price_open", "price_close",
+            "decision", "decision_confidence", "position_size", "consensus_logic",
+            "pnl", "return_pct", "duration_bars", "hit_target", "exit_reason",
+            "regime_label", "critique", "key_lesson", *HOT_FEATURES, "features",
+            "features_extra", "agent_views", "embedding", "similar_episodes", "retrieval_score",
+        ]
+        # Identity and entry context are fixed once the episode is opened
+        immutable = {"episode_id", "symbol", "t_open"}
+        updates = ",\n".join(
+            f"{col} = excluded.{col}" for col in insert_columns if col not in immutable
+        )
+        placeholders = ", ".join("?" for _ in insert_columns)
+        
+        self.conn.executemany(f"""
+            INSERT INTO episodes ({', '.join(insert_columns)}, updated_at)
+            VALUES ({placeholders}, now())
+            ON CONFLICT (episode_id) DO UPDATE SET
+                {updates},
+                updated_at = now()
+        """, [self._episode_params(ep) for ep in episodes])
     
     def read(self, episode_id: str) -> Optional[Episode]:
         """Read single episode by ID"""
-        result = self.conn.execute(
-            "SELECT data FROM episodes WHERE episode_id = ?",
-            [episode_id]
-        ).fetchone()
-        
-        if result is None:
-            return None
-        
-        data = json.loads(result[0])
-        return Episode.from_dict(data)
+        episodes = self._select_episodes("episode_id = ?", [episode_id], "episode_id", 1)
+        return episodes[0] if episodes else None
     
     def read_recent(
         self,
@@ -132,27 +359,17 @@ class EpisodeStore:
         Returns:
             List of episodes ordered by t_close DESC
         """
-        query = "SELECT data FROM episodes WHERE 1=1"
+        where = "1=1"
         params = []
         
         if symbol:
-            query += " AND symbol = ?"
+            where += " AND symbol = ?"
             params.append(symbol)
         
         if closed_only:
-            query += " AND t_close IS NOT NULL"
-        
-        query += " ORDER BY COALESCE(t_close, t_open) DESC LIMIT ?"
-        params.append(limit)
-        
-        results = self.conn.execute(query, params).fetchall()
+            where += " AND t_close IS NOT NULL"
         
-        episodes = []
-        for row in results:
-            data = json.loads(row[0])
-            episodes.append(Episode.from_dict(data))
-        
-        return episodes
+        return self._select_episodes(where, params, "COALESCE(t_close, t_open) DESC", limit)
     
     def read_by_outcome(
         self,
@@ -173,31 +390,59 @@ class EpisodeStore:
         Returns:
             List of episodes ordered by PnL DESC
         """
-        query = "SELECT data FROM episodes WHERE pnl IS NOT NULL"
+        where = "pnl IS NOT NULL"
         params = []
         
         if symbol:
-            query += " AND symbol = ?"
+            where += " AND symbol = ?"
             params.append(symbol)
         
         if min_pnl is not None:
-            query += " AND pnl >= ?"
+            where += " AND pnl >= ?"
             params.append(min_pnl)
         
         if hit_target_only:
-            query += " AND hit_target = TRUE"
+            where += " AND hit_target = TRUE"
+        
+        return self._select_episodes(where, params, "pnl DESC", limit)
+    
+    def fetch_frame(
+        self,
+        symbol: Optional[str] = None,
+        closed_only: bool = False,
+        columns: Optional[List[str]] = None,
+        since: Optional[datetime] = None
+    ) -> pl.DataFrame:
+        """
+        Bulk fetch episodes as a Polars frame via Arrow
+        
+        Rows are never hydrated into Episode objects, so this is the path for
+        analytics and exports over large stores.
+        
+        Args:
+            symbol: Filter by symbol (None = all symbols)
+            closed_only: Only return closed episodes
+            columns: Columns to select (None = all)
+            since: Only episodes opened at or after this time
+        
+        Returns:
+            Polars DataFrame with one row per episode
+        """
+        query = f"SELECT {', '.join(columns) if columns else '*'} FROM episodes WHERE 1=1"
+        params = []
         
-        query += " ORDER BY pnl DESC LIMIT ?"
-        params.append(limit)
+        if symbol:
+            query += " AND symbol = ?"
+            params.append(symbol)
         
-        results = self.conn.execute(query, params).fetchall()
+        if closed_only:
+            query += " AND t_close IS NOT NULL"
         
-        episodes = []
-        for row in results:
-            data = json.loads(row[0])
-            episodes.append(Episode.from_dict(data))
+        if since is not None:
+            query += " AND t_open >= ?"
+            params.append(since)
         
-        return episodes
+        return self.conn.execute(query, params).pl()
     
     def get_stats(self, symbol: Optional[str] = None) -> dict:
         """
@@ -241,6 +486,47 @@ class EpisodeStore:
             "avg_return_pct": avg_return_pct or 0.0
         }
     
+    def get_agent_stats(self, symbol: Optional[str] = None) -> pl.DataFrame:
+        """
+        Per-agent vote statistics over closed episodes
+        
+        An agent's vote is counted correct when it points the same way the
+        market moved (trade direction times sign of PnL). Computed entirely
+        in DuckDB by unnesting the agent_views struct list.
+        
+        Returns:
+            Polars DataFrame with agent_name, votes, agreement_rate,
+            accuracy and avg_confidence
+        """
+        where = "pnl IS NOT NULL AND pnl != 0"
+        params = []
+        
+        if symbol:
+            where += " AND symbol = ?"
+            params.append(symbol)
+        
+        query = f"""
+            WITH votes AS (
+                SELECT
+                    decision,
+                    sign(pnl) * decision AS market_direction,
+                    UNNEST(agent_views) AS av
+                FROM episodes
+                WHERE {where}
+            )
+            SELECT
+                av.agent_name AS agent_name,
+                COUNT(*) AS votes,
+                AVG(CASE WHEN av.signal = decision THEN 1.0 ELSE 0.0 END) AS agreement_rate,
+                AVG(CASE WHEN av.signal = market_direction THEN 1.0 ELSE 0.0 END)
+                    FILTER (WHERE av.signal != 0) AS accuracy,
+                AVG(av.confidence) AS avg_confidence
+            FROM votes
+            GROUP BY av.agent_name
+            ORDER BY av.agent_name
+        """
+        return self.conn.execute(query, params).pl()
+    
     def export_parquet(self, output_path: str, symbol: Optional[str] = None):
         """Export episodes to Parquet file"""
         query = "COPY (SELECT * FROM episodes"
@@ -4,6 +4,6 @@ Regime Detection Module
 Provides market regime classification for conditional agent activation.
 """
 
-from gnosis.regime.detector import RegimeDetector, RegimeState
+from gnosis.regime.detector import IncrementalRegimeDetector, RegimeDetector, RegimeState
 
-__all__ = ["RegimeDetector", "RegimeState"]
+__all__ = ["IncrementalRegimeDetector", "RegimeDetector", "RegimeState"]
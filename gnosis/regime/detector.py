@@ -8,9 +8,14 @@ Classifies market state using multiple methods:
 4. Range detection
 
 Activates agents conditionally based on regime.
+
+RegimeDetector.detect classifies a bar DataFrame (backfills);
+IncrementalRegimeDetector keeps the same statistics in ring buffers and
+updates them in O(1) per bar (live loops).
 """
 
 from __future__ import annotations
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -77,14 +82,7 @@ class RegimeDetector:
         """
         if len(bars) < max(self.trend_window, self.vol_window):
             # Not enough data - default to ranging
-            return RegimeState(
-                primary="ranging",
-                confidence=0.5,
-                sub_regimes={"ranging": 1.0},
-                volatility=0.15,
-                trend_strength=0.0,
-                timestamp=datetime.now()
-            )
+            return self._default_state()
         
         # 1. Volatility regime
         volatility = self._calculate_volatility(bars)
@@ -202,6 +200,17 @@ class RegimeDetector:
         except:
             return None
     
+    def _default_state(self) -> RegimeState:
+        """Regime reported before there are enough bars"""
+        return RegimeState(
+            primary="ranging",
+            confidence=0.5,
+            sub_regimes={"ranging": 1.0},
+            volatility=0.15,
+            trend_strength=0.0,
+            timestamp=datetime.now()
+        )
+    
     def _combine_regimes(
         self,
         vol_regime: str,
@@ -304,6 +313,211 @@ class RegimeDetector:
         return True
 
 
+# Evicting a value this many times the remaining sum of squares triggers a resync
+_RESYNC_RATIO = 1e4
+
+
+class _RingWindow:
+    """
+    Last ``capacity`` values with running sums, for O(1) window statistics.
+    
+    Values are stored minus ``shift``. With ``shift=None`` the shift starts
+    at the first value and re-centres on the window mean at every resync,
+    which keeps the sums of squares well conditioned for price levels. The
+    sums are recomputed from the ring once per lap, and whenever an evicted
+    value dwarfs the rest, so rounding from the add/subtract updates cannot
+    accumulate.
+    """
+    
+    def __init__(self, capacity: int, shift: Optional[float] = None):
+        self.capacity = capacity
+        self.recenter = shift is None
+        self.shift = shift
+        self.values = np.zeros(capacity)
+        self.head = 0  # Slot of the next value (the oldest once full)
+        self.count = 0
+        self.sum = 0.0       # sum(v)
+        self.sum_sq = 0.0    # sum(v^2)
+        self.sum_xv = 0.0    # sum(i * v), i = 0 for the oldest value
+    
+    def push(self, value: float):
+        if self.shift is None:
+            self.shift = value
+        value -= self.shift
+        
+        evicted = 0.0
+        if self.count < self.capacity:
+            self.sum_xv += self.count * value
+            self.count += 1
+            self.sum += value
+            self.sum_sq += value * value
+        else:
+            evicted = self.values[self.head]
+            self.sum += value - evicted
+            self.sum_sq += value * value - evicted * evicted
+            # Every remaining value moves down one index
+            self.sum_xv += (self.capacity - 1) * value - (self.sum - value)
+        
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.head == 0 or evicted * evicted > _RESYNC_RATIO * self.sum_sq:
+            self._resync()
+    
+    def ordered(self) -> np.ndarray:
+        """Values oldest first (shifted)"""
+        if self.count < self.capacity:
+            return self.values[:self.count]
+        return np.concatenate([self.values[self.head:], self.values[:self.head]])
+    
+    def oldest(self) -> float:
+        index = self.head if self.count == self.capacity else 0
+        return self.values[index] + self.shift
+    
+    def newest(self) -> float:
+        return self.values[self.head - 1] + self.shift
+    
+    def mean(self) -> float:
+        return self.shift + self.sum / self.count
+    
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1), NaN below two values"""
+        if self.count < 2:
+            return np.nan
+        var = (self.sum_sq - self.sum * self.sum / self.count) / (self.count - 1)
+        return np.sqrt(max(var, 0.0))
+    
+    def _resync(self):
+        if self.recenter:
+            center = self.ordered().mean()
+            self.values -= center
+            self.shift += center
+        values = self.ordered()
+        self.sum = float(values.sum())
+        self.sum_sq = float(values @ values)
+        self.sum_xv = float(np.arange(self.count) @ values)
+
+
+class IncrementalRegimeDetector(RegimeDetector):
+    """
+    Streaming RegimeDetector for per-bar live updates
+    
+    Keeps running sums over ring buffers instead of re-deriving them from a
+    DataFrame: returns mean/variance over ``vol_window``, the closed-form
+    regression slope, price mean/variance and the high-low range over
+    ``trend_window``. ``update(bar)`` is O(1) and returns the RegimeState
+    ``detect`` would return for the bars seen so far (the batch path stays
+    available for backfills).
+    
+    Bars are dicts (or rows) with price, high, low and volume, as the live
+    bot builds them.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reset()
+    
+    def reset(self):
+        """Forget all bars"""
+        self.bars_seen = 0
+        self.last_price: Optional[float] = None
+        self.returns = _RingWindow(self.vol_window, shift=0.0)
+        self.prices = _RingWindow(self.trend_window)
+        self.ranges = _RingWindow(self.trend_window, shift=0.0)
+        # Last 5 bars for the HMM observation
+        self.recent = deque(maxlen=5)
+    
+    def update(self, bar: Dict) -> RegimeState:
+        """Add one bar and return the current regime"""
+        self.push(bar)
+        return self.current()
+    
+    def push(self, bar: Dict):
+        """Add one bar without classifying (O(1))"""
+        price = float(bar["price"])
+        if self.last_price is not None:
+            self.returns.push(price / self.last_price - 1)
+        self.last_price = price
+        self.prices.push(price)
+        self.ranges.push((bar["high"] - bar["low"]) / price)
+        self.recent.append((price, bar.get("volume")))
+        self.bars_seen += 1
+    
+    def current(self) -> RegimeState:
+        """RegimeState for the bars pushed so far (O(1))"""
+        if self.bars_seen < max(self.trend_window, self.vol_window):
+            return self._default_state()
+        
+        # 1. Volatility regime
+        volatility = self.returns.std() * np.sqrt(252)
+        vol_regime = self._classify_volatility(volatility)
+        
+        # 2. Trend regime
+        trend_strength = self._running_trend_strength()
+        trend_regime = self._classify_trend(trend_strength)
+        
+        # 3. Range detection
+        atr_pct = self.ranges.sum / self.ranges.count
+        bb_width = self.prices.std() / self.prices.mean()
+        is_ranging = (atr_pct < 0.01) and (bb_width < 0.02)
+        
+        # 4. HMM regime (if available)
+        hmm_regime = None
+        if self.hmm_available:
+            hmm_regime = self._running_hmm_regime()
+        
+        # Combine regimes
+        primary, confidence, sub_regimes = self._combine_regimes(
+            vol_regime, trend_regime, is_ranging, hmm_regime, trend_strength
+        )
+        
+        return RegimeState(
+            primary=primary,
+            confidence=confidence,
+            sub_regimes=sub_regimes,
+            volatility=volatility,
+            trend_strength=trend_strength,
+            timestamp=datetime.now()
+        )
+    
+    def _running_trend_strength(self) -> float:
+        """_calculate_trend_strength from the running price sums"""
+        window = self.prices
+        n = window.count
+        
+        # Price momentum
+        momentum = (window.newest() / window.oldest()) - 1
+        
+        # Least-squares slope of price on x = 0..n-1 (shift cancels out)
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        slope = (n * window.sum_xv - sum_x * window.sum) / (n * sum_xx - sum_x * sum_x)
+        
+        # Normalize slope
+        slope_norm = slope / (window.mean() / n)
+        
+        # Combine (weight momentum more)
+        strength = 0.7 * momentum + 0.3 * slope_norm
+        
+        # Clip to [-1, 1]
+        return np.clip(strength, -1.0, 1.0)
+    
+    def _running_hmm_regime(self) -> Optional[str]:
+        """_hmm_regime on the last 5 bars"""
+        try:
+            prices, volumes = (np.array(values, dtype=float) for values in zip(*self.recent))
+            returns = prices[1:] / prices[:-1] - 1
+            
+            momo = returns.mean()
+            vol_change = (volumes[1:] / volumes[:-1] - 1).mean()
+            vol = returns.std(ddof=1)
+            
+            state, probs = self.hmm.update(momo, vol_change, vol)
+            
+            return state
+        except Exception:
+            return None
+
+
 if __name__ == "__main__":
     # Test regime detector
     print("="*60)
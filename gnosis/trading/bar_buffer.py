@@ -0,0 +1,118 @@
+"""
+Columnar ring buffer of recent bars for the live loop.
+
+One preallocated NumPy array per field with a fixed capacity, so appending
+a bar and reading a window cost the same on the first bar of the session
+and the ten-thousandth. Each value is written twice (slot i and i +
+capacity), which keeps the last ``capacity`` bars contiguous: column reads
+are zero-copy views, oldest bar first.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Numeric bar fields, as LiveTradingBot.on_bar builds them
+PRICE_FIELDS = ("open", "high", "low", "price", "volume")
+
+
+class BarBuffer:
+    """
+    Last ``capacity`` bars of one symbol as NumPy columns.
+
+    Timestamps are stored as UTC ``datetime64[ns]``; tz-aware inputs come
+    back tz-aware (UTC) from ``__getitem__`` and ``to_frame``.
+    """
+
+    def __init__(self, capacity: int = 100, symbol: Optional[str] = None):
+        """
+        Initialize buffer.
+
+        Args:
+            capacity: Bars kept (older bars are overwritten)
+            symbol: Symbol added to rows and frames, if given
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.symbol = symbol
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(2 * capacity, np.nan) for name in PRICE_FIELDS
+        }
+        self._columns["t_event"] = np.full(2 * capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+        self._head = 0  # Slot of the next bar
+        self._count = 0
+        self._utc = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, bar: Dict):
+        """Add one bar (a dict with t_event and the price fields); O(1)."""
+        timestamp = pd.Timestamp(bar["t_event"])
+        if timestamp.tzinfo is not None:
+            self._utc = True
+            timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+
+        mirror = self._head + self.capacity
+        self._columns["t_event"][self._head] = self._columns["t_event"][mirror] = timestamp.to_datetime64()
+        for name in PRICE_FIELDS:
+            value = bar.get(name, np.nan)
+            self._columns[name][self._head] = self._columns[name][mirror] = np.nan if value is None else value
+
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        Read-only view of the last ``n`` values of a field (all if None).
+
+        The view aliases the buffer: it reflects later appends, so copy it
+        if it has to outlive the current bar.
+        """
+        n = self._count if n is None else min(max(n, 0), self._count)
+        end = self._head + self.capacity
+        view = self._columns[name][end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def last(self, name: str):
+        """Most recent value of a field."""
+        if not self._count:
+            raise IndexError("bar buffer is empty")
+        return self._columns[name][self._head + self.capacity - 1]
+
+    def __getitem__(self, index: int) -> Dict:
+        """One bar as a dict (negative indices count from the newest)."""
+        if not -self._count <= index < self._count:
+            raise IndexError("bar index out of range")
+        slot = self._head + self.capacity - self._count + (index % self._count)
+        bar = {name: float(self._columns[name][slot]) for name in PRICE_FIELDS}
+        bar["t_event"] = self._timestamp(self._columns["t_event"][slot])
+        if self.symbol is not None:
+            bar["symbol"] = self.symbol
+        return bar
+
+    def to_frame(self) -> pd.DataFrame:
+        """Copy of the buffered bars as a pandas DataFrame (for DataFrame-based engines)."""
+        t_event = pd.Series(self.column("t_event"), copy=True)
+        frame = pd.DataFrame({
+            "t_event": t_event.dt.tz_localize("UTC") if self._utc else t_event,
+            **{name: self.column(name).copy() for name in PRICE_FIELDS},
+        })
+        if self.symbol is not None:
+            frame.insert(1, "symbol", self.symbol)
+        return frame
+
+    def clear(self):
+        """Drop all bars."""
+        self._head = 0
+        self._count = 0
+
+    def _timestamp(self, value: np.datetime64) -> datetime:
+        timestamp = pd.Timestamp(value)
+        return timestamp.tz_localize("UTC") if self._utc else timestamp
@@ -32,21 +32,23 @@ except ImportError:
     print("⚠️  alpaca-py not installed. Install with: pip install alpaca-py")
 
 import os
+import time
 from dotenv import load_dotenv
-import pandas as pd
 
 # Load environment
 load_dotenv()
 
 # Import our components
+from gnosis.trading.bar_buffer import BarBuffer
 from gnosis.trading.position_manager import PositionManager, Position
 from gnosis.trading.risk_manager import RiskManager
-from gnosis.regime import RegimeDetector, RegimeState
+from gnosis.regime import IncrementalRegimeDetector, RegimeState
 from gnosis.engines.hedge_v0 import compute_hedge_v0
 from gnosis.engines.liquidity_v0 import compute_liquidity_v0
 from gnosis.engines.sentiment_v0 import compute_sentiment_v0
 from gnosis.engines.wyckoff_v0 import compute_wyckoff_v0
 from gnosis.engines.markov_regime_v0 import compute_markov_regime_v0, SimpleHMM
+from execution.metrics import LatencyHistogram
 
 # Try to import memory (optional)
 try:
@@ -91,8 +93,22 @@ class LiveTradingBot:
         bar_interval: str = "1Min",
         enable_memory: bool = True,
         enable_trading: bool = True,
-        paper_mode: bool = True
+        paper_mode: bool = True,
+        stream=None,
+        trading_client=None,
+        position_mgr: Optional[PositionManager] = None,
+        risk_mgr: Optional[RiskManager] = None,
     ):
+        """
+        Args:
+            symbol: Symbol traded by this bot
+            bar_interval: Bar interval of the stream subscription
+            enable_memory: Use episode memory if available
+            enable_trading: Place orders (False = dry run)
+            paper_mode: Alpaca paper account
+            stream, trading_client, position_mgr, risk_mgr: Shared components
+                (e.g. from MultiSymbolRuntime); created per bot when None
+        """
         if not ALPACA_AVAILABLE:
             raise RuntimeError("alpaca-py required. Install: pip install alpaca-py")
         
@@ -106,23 +122,29 @@ class LiveTradingBot:
         api_key = os.getenv("ALPACA_API_KEY")
         secret_key = os.getenv("ALPACA_SECRET_KEY")
         
-        self.stream = StockDataStream(api_key, secret_key, raw_data=False)
-        self.trading_client = TradingClient(api_key, secret_key, paper=paper_mode)
+        self.stream = stream or StockDataStream(api_key, secret_key, raw_data=False)
+        self.trading_client = trading_client or TradingClient(api_key, secret_key, paper=paper_mode)
         
         # Components
-        self.position_mgr = PositionManager(
+        self.position_mgr = position_mgr or PositionManager(
             state_file="live_trading_state.json",
             max_positions=3,
             max_daily_loss=-0.05
         )
-        self.risk_mgr = RiskManager(capital=30000.0)
-        self.regime_detector = RegimeDetector()
+        self.risk_mgr = risk_mgr or RiskManager(capital=30000.0)
+        self.regime_detector = IncrementalRegimeDetector()  # Updated per bar in on_bar
         self.markov_hmm = SimpleHMM()  # Stateful HMM for markov agent
         
         # Data buffers
-        self.bars: list = []  # Recent bars for feature computation
+        self.bars = BarBuffer(capacity=100, symbol=symbol)  # Recent bars, columnar ring
         self.current_bar = None
         
+        # Per-bar timing (whole process_bar, and the agent evaluation inside it)
+        self.latency: Dict[str, LatencyHistogram] = {
+            "process_bar": LatencyHistogram(),
+            "evaluate_agents": LatencyHistogram(),
+        }
+        
         # State
         self.running = False
         self.trades_today = 0
@@ -137,31 +159,40 @@ class LiveTradingBot:
     async def on_bar(self, bar):
         """Handle new bar from WebSocket"""
         try:
-            # Convert to dict
-            bar_data = {
-                "t_event": bar.timestamp,
-                "symbol": bar.symbol,
-                "price": bar.close,
-                "volume": bar.volume,
-                "high": bar.high,
-                "low": bar.low,
-                "open": bar.open
-            }
-            
-            self.bars.append(bar_data)
-            
-            # Keep last 100 bars
-            if len(self.bars) > 100:
-                self.bars = self.bars[-100:]
+            bar_data = self.record_bar(bar)
             
             # Process bar
+            start = time.perf_counter()
             await self.process_bar(bar_data)
+            self.latency["process_bar"].observe(time.perf_counter() - start)
             
         except Exception as e:
             print(f"❌ Error in on_bar: {e}")
             import traceback
             traceback.print_exc()
     
+    def record_bar(self, bar) -> dict:
+        """
+        Add a stream bar to the bar buffer and regime detector (O(1))
+        
+        Returns:
+            The bar as a dict
+        """
+        bar_data = {
+            "t_event": bar.timestamp,
+            "symbol": bar.symbol,
+            "price": bar.close,
+            "volume": bar.volume,
+            "high": bar.high,
+            "low": bar.low,
+            "open": bar.open
+        }
+        
+        # Ring buffer keeps the last 100 bars
+        self.bars.append(bar_data)
+        self.regime_detector.push(bar_data)
+        return bar_data
+    
     async def process_bar(self, bar: dict):
         """
         Process new bar: compute features, evaluate agents, make decisions
@@ -178,10 +209,11 @@ class LiveTradingBot:
         # Update existing positions
         self.position_mgr.update_positions({self.symbol: price})
         
-        # Check for exits
+        # Check for exits (this symbol only: the manager may be shared)
         exits = self.position_mgr.check_exits()
         for symbol, reason in exits:
-            await self.close_position(symbol, price, reason)
+            if symbol == self.symbol:
+                await self.close_position(symbol, price, reason)
         
         # Don't evaluate new entries if we need more bars
         if len(self.bars) < 50:
@@ -194,7 +226,9 @@ class LiveTradingBot:
             return
         
         # Evaluate agents
+        start = time.perf_counter()
         agent_views = self.evaluate_agents(features, price)
+        self.latency["evaluate_agents"].observe(time.perf_counter() - start)
         
         # Make decision
         decision = self.make_decision(agent_views, features, price, timestamp)
@@ -206,10 +240,6 @@ class LiveTradingBot:
     def compute_features(self, current_bar: dict) -> Optional[Dict]:
         """Compute L3 features from recent bars"""
         try:
-            # Convert bars to DataFrame
-            df = pd.DataFrame(self.bars)
-            df["t_event"] = pd.to_datetime(df["t_event"])
-            
             # Compute features (simplified - you'd use full pipeline)
             features = {
                 "price": current_bar["price"],
@@ -219,10 +249,10 @@ class LiveTradingBot:
                 "hedge_gamma": 0.0,    # Placeholder
             }
             
-            # You would call actual engines here:
+            # You would call actual engines here (columns are views into self.bars):
             # hedge = compute_hedge_v0(self.symbol, timestamp, price, chain)
-            # liq = compute_liquidity_v0(self.symbol, timestamp, df)
-            # sent = compute_sentiment_v0(self.symbol, timestamp, df)
+            # liq = compute_liquidity_v0(self.symbol, timestamp, self.bars.to_frame())
+            # sent = compute_sentiment_v0(self.symbol, timestamp, self.bars.to_frame())
             
             return features
             
@@ -239,9 +269,13 @@ class LiveTradingBot:
         """
         agent_views = []
         
-        # Detect regime first
-        df = pd.DataFrame(self.bars)
-        regime = self.regime_detector.detect(df)
+        # Detect regime first (running statistics, O(1) per bar)
+        regime = self.regime_detector.current()
+        
+        # DataFrame only for the v0 engines of the conditional agents
+        use_wyckoff = self.regime_detector.should_use_wyckoff(regime)
+        use_markov = self.regime_detector.should_use_markov(regime)
+        df = self.bars.to_frame() if (use_wyckoff or use_markov) else None
         
         print(f"📊 Regime: {regime.primary} (conf={regime.confidence:.2f}, "
               f"trend={regime.trend_strength:+.2f})")
@@ -286,7 +320,7 @@ class LiveTradingBot:
         ))
         
         # Conditional: Wyckoff agent (active in trends)
-        if self.regime_detector.should_use_wyckoff(regime):
+        if use_wyckoff:
             wyckoff_result = compute_wyckoff_v0(self.symbol, df["t_event"].iloc[-1], df)
             wyckoff_signal = 0
             wyckoff_conf = wyckoff_result["confidence"]
@@ -312,7 +346,7 @@ class LiveTradingBot:
             print(f"   ⏸️  Wyckoff inactive (regime: {regime.primary})")
         
         # Conditional: Markov agent (active in clear regimes)
-        if self.regime_detector.should_use_markov(regime):
+        if use_markov:
             markov_result = compute_markov_regime_v0(
                 self.symbol, df["t_event"].iloc[-1], df, hmm=self.markov_hmm
             )
@@ -430,7 +464,7 @@ class LiveTradingBot:
         take_profit = self.risk_mgr.calculate_take_profit(price, action, stop_loss)
         
         # Validate trade
-        existing_risk = sum(p.size for p in self.position_mgr.positions.values())
+        existing_risk = self.position_mgr.positions.total_size
         valid, msg = self.risk_mgr.validate_trade(
             self.symbol, action, size, confidence, existing_risk
         )
@@ -574,7 +608,17 @@ class LiveTradingBot:
         print(f"   Daily Trades: {summary['daily_trades']}")
         print(f"   Total PnL: {summary['total_pnl']:+.2%}")
         
+        bar_timing = self.latency_stats()["process_bar"]
+        if bar_timing["count"]:
+            print(f"   Bar processing: p50={bar_timing['p50_ms']:.2f}ms "
+                  f"p99={bar_timing['p99_ms']:.2f}ms max={bar_timing['max_ms']:.2f}ms "
+                  f"({bar_timing['count']} bars)")
+        
         print("\n✅ Bot stopped gracefully")
+    
+    def latency_stats(self) -> Dict[str, dict]:
+        """Per-bar process_bar and evaluate_agents latency histograms."""
+        return {name: histogram.snapshot() for name, histogram in self.latency.items()}
 
 
 async def main():
@@ -0,0 +1,238 @@
+"""
+Multi-Symbol Live Runtime
+
+Runs many symbols in one process and one event loop instead of one
+LiveTradingBot (stream, position manager, state file) per symbol:
+
+- One market-data subscription for all symbols, fanned out by symbol
+- Shared position and risk managers (one state file)
+- Per-symbol bounded work queue and worker task
+
+Stream callbacks never block: each bar is recorded in its handler's bar
+buffer and regime detector immediately (cheap, never dropped), then queued
+for the decision path. When a symbol's queue is full the oldest pending
+bar is shed, since a newer bar supersedes it; the shed count, queue depth
+and bar-to-decision latency are exported as backpressure metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+from execution.metrics import LatencyHistogram
+
+
+@dataclass
+class SymbolChannel:
+    """Queue, worker and counters of one symbol"""
+    handler: object
+    queue: asyncio.Queue
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    worker: Optional[asyncio.Task] = None
+    received: int = 0
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    max_depth: int = 0
+
+
+class MultiSymbolRuntime:
+    """
+    One event loop, one subscription, many symbol handlers
+
+    A handler is anything with ``symbol``, ``record_bar(bar) -> dict`` and
+    an async ``process_bar(bar_data)`` (LiveTradingBot built with shared
+    components, see ``create_live_runtime``).
+    """
+
+    def __init__(self, handlers: Iterable, stream=None, queue_size: int = 4):
+        """
+        Initialize runtime.
+
+        Args:
+            handlers: One handler per symbol
+            stream: Market data stream (``subscribe_bars``, ``_run_forever``,
+                ``stop_ws``)
+            queue_size: Pending bars per symbol before the oldest is shed
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be positive")
+        self.stream = stream
+        self.queue_size = queue_size
+        self.channels: Dict[str, SymbolChannel] = {}
+        self.latency = LatencyHistogram()  # Bar-to-decision, all symbols
+        self.unrouted = 0
+        self.running = False
+        for handler in handlers:
+            self.add_handler(handler)
+
+    @property
+    def symbols(self) -> list:
+        return list(self.channels)
+
+    def add_handler(self, handler):
+        """Register a symbol handler (started with the runtime if running)"""
+        channel = SymbolChannel(handler=handler, queue=asyncio.Queue(maxsize=self.queue_size))
+        self.channels[handler.symbol] = channel
+        if self.running:
+            channel.worker = asyncio.create_task(self._work(handler.symbol, channel))
+
+    async def on_bar(self, bar):
+        """Stream callback: record the bar and queue it for its symbol's worker"""
+        channel = self.channels.get(bar.symbol)
+        if channel is None:
+            self.unrouted += 1
+            return
+
+        channel.received += 1
+        try:
+            bar_data = channel.handler.record_bar(bar)
+        except Exception as e:
+            # A bad bar must not break the shared stream callback
+            channel.errors += 1
+            print(f"❌ {bar.symbol}: error recording bar: {e}")
+            return
+
+        if channel.queue.full():
+            # Shed the stalest pending bar; its state is already recorded
+            channel.queue.get_nowait()
+            channel.queue.task_done()
+            channel.dropped += 1
+        channel.queue.put_nowait((bar_data, time.perf_counter()))
+        channel.max_depth = max(channel.max_depth, channel.queue.qsize())
+
+    async def start(self):
+        """Start one worker per symbol on the running loop"""
+        self.running = True
+        for symbol, channel in self.channels.items():
+            if channel.worker is None or channel.worker.done():
+                channel.worker = asyncio.create_task(self._work(symbol, channel))
+
+    async def stop(self):
+        """Stop the stream (ending ``run``) and cancel the workers (pending bars are discarded)"""
+        self.running = False
+        if self.stream is not None:
+            await self.stream.stop_ws()
+        workers = [channel.worker for channel in self.channels.values() if channel.worker]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for channel in self.channels.values():
+            channel.worker = None
+
+    async def drain(self):
+        """Wait until every queued bar has been processed"""
+        await asyncio.gather(*(channel.queue.join() for channel in self.channels.values()))
+
+    async def run(self):
+        """Subscribe all symbols on the one stream and run until it stops"""
+        await self.start()
+        self.stream.subscribe_bars(self.on_bar, *self.channels)
+        print(f"📡 Multiplexed stream: {len(self.channels)} symbols, 1 subscription")
+        try:
+            await self.stream._run_forever()
+        finally:
+            await self.stop()
+
+    async def _work(self, symbol: str, channel: SymbolChannel):
+        """Process one symbol's bars in arrival order"""
+        while True:
+            bar_data, received_at = await channel.queue.get()
+            try:
+                await channel.handler.process_bar(bar_data)
+                channel.processed += 1
+            except Exception as e:
+                channel.errors += 1
+                print(f"❌ {symbol}: error processing bar: {e}")
+            finally:
+                elapsed = time.perf_counter() - received_at
+                channel.latency.observe(elapsed)
+                self.latency.observe(elapsed)
+                channel.queue.task_done()
+
+    def metrics(self) -> Dict[str, object]:
+        """Backpressure metrics: totals, bar-to-decision latency, per-symbol queues"""
+        symbols = {
+            symbol: {
+                "queue_depth": channel.queue.qsize(),
+                "max_queue_depth": channel.max_depth,
+                "received": channel.received,
+                "processed": channel.processed,
+                "dropped": channel.dropped,
+                "errors": channel.errors,
+                "p99_latency_ms": channel.latency.percentile(99),
+            }
+            for symbol, channel in self.channels.items()
+        }
+        return {
+            "symbols": len(self.channels),
+            "queue_depth": sum(entry["queue_depth"] for entry in symbols.values()),
+            "received": sum(entry["received"] for entry in symbols.values()),
+            "processed": sum(entry["processed"] for entry in symbols.values()),
+            "dropped": sum(entry["dropped"] for entry in symbols.values()),
+            "errors": sum(entry["errors"] for entry in symbols.values()),
+            "unrouted": self.unrouted,
+            "bar_to_decision": self.latency.snapshot(),
+            "per_symbol": symbols,
+        }
+
+
+def create_live_runtime(
+    symbols: Iterable[str],
+    bar_interval: str = "1Min",
+    enable_memory: bool = True,
+    enable_trading: bool = True,
+    paper_mode: bool = True,
+    max_positions: int = 10,
+    capital: float = 30000.0,
+    state_file: str = "live_trading_state.json",
+    queue_size: int = 4,
+    journal: bool = True,
+) -> Tuple[MultiSymbolRuntime, object, object]:
+    """
+    Build a runtime of LiveTradingBots sharing one Alpaca stream, one
+    trading client and one position/risk manager. The shared position
+    manager journals its events by default (close it on shutdown to write
+    the final snapshot).
+
+    Returns:
+        (runtime, position_mgr, risk_mgr)
+    """
+    from alpaca.data.live import StockDataStream
+    from alpaca.trading.client import TradingClient
+
+    from gnosis.trading.live_bot import LiveTradingBot
+    from gnosis.trading.position_manager import PositionManager
+    from gnosis.trading.risk_manager import RiskManager
+
+    api_key = os.getenv("ALPACA_API_KEY")
+    secret_key = os.getenv("ALPACA_SECRET_KEY")
+    stream = StockDataStream(api_key, secret_key, raw_data=False)
+    trading_client = TradingClient(api_key, secret_key, paper=paper_mode)
+    position_mgr = PositionManager(
+        state_file=state_file,
+        max_positions=max_positions,
+        max_daily_loss=-0.05,
+        journal=journal
+    )
+    risk_mgr = RiskManager(capital=capital)
+
+    bots = [
+        LiveTradingBot(
+            symbol=symbol,
+            bar_interval=bar_interval,
+            enable_memory=enable_memory,
+            enable_trading=enable_trading,
+            paper_mode=paper_mode,
+            stream=stream,
+            trading_client=trading_client,
+            position_mgr=position_mgr,
+            risk_mgr=risk_mgr,
+        )
+        for symbol in symbols
+    ]
+    return MultiSymbolRuntime(bots, stream=stream, queue_size=queue_size), position_mgr, risk_mgr
@@ -0,0 +1,262 @@
+"""
+Array-backed position book.
+
+Keeps the per-tick state of every open position (side, size, entry, stops,
+price, bars held, unrealized P&L) as NumPy columns, one row per symbol, so
+marking the portfolio to market and checking stop/target/time exits are a
+few vectorized operations instead of a Python loop over Position objects.
+Total size and unrealized P&L are kept as running aggregates.
+
+The book is a mapping of symbol -> Position: the objects carry the entry
+metadata, and while a position is in the book its per-tick fields
+(``BookField``) read from and write to its row, so any reference to the
+object (``positions[symbol].bars_held``, ``to_dict()``, ``update()``, a
+stop edit) sees and changes the same state as ``mark``. Removing a
+position copies its last state back onto the object.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from dataclasses import MISSING
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from gnosis.trading.position_manager import Position
+
+
+class BookField:
+    """
+    Position field backed by the owning book's column
+
+    Outside a book the value lives on the object. In a book, writes also go
+    to the position's row; ``live`` fields (changed by ``mark``) are read
+    from the row, the others keep their exact value (e.g. a None stop,
+    stored as NaN) on the object.
+    """
+
+    def __init__(self, default: Any = MISSING, cast=float, live: bool = False):
+        self.default = default
+        self.cast = cast
+        self.live = live
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            if self.default is MISSING:
+                raise AttributeError(self.name)  # Required dataclass field
+            return self.default
+        owned = obj.__dict__.get("_book")
+        if self.live and owned is not None:
+            book, symbol = owned
+            return self.cast(book._columns[self.name][book._rows[symbol]])
+        return obj.__dict__[self.attr]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+        owned = obj.__dict__.get("_book")
+        if owned is not None:
+            book, symbol = owned
+            book._write(symbol, self.name, value)
+
+
+class PositionBook(MutableMapping):
+    """Open positions by symbol, with columnar mark-to-market and exit checks"""
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize book.
+
+        Args:
+            capacity: Initial rows (doubled when full)
+        """
+        self._positions: Dict[str, Position] = {}  # Insertion order
+        self._rows: Dict[str, int] = {}
+        self._symbols: List[str] = []  # Row -> symbol
+        self._opened = 0
+        self._allocate(max(capacity, 1))
+        self.total_size = 0.0
+        self.unrealized_pnl = 0.0
+
+    def _allocate(self, capacity: int):
+        """(Re)allocate the columns, keeping existing rows"""
+        n = len(self._symbols)
+        old = getattr(self, "_columns", None)
+        self._columns = {
+            "side": np.zeros(capacity),
+            "size": np.zeros(capacity),
+            "entry_price": np.zeros(capacity),
+            "stop_loss": np.full(capacity, np.nan),
+            "take_profit": np.full(capacity, np.nan),
+            "max_bars": np.zeros(capacity, dtype=np.int64),
+            "current_price": np.zeros(capacity),
+            "bars_held": np.zeros(capacity, dtype=np.int64),
+            "unrealized_pnl": np.zeros(capacity),
+            "order": np.zeros(capacity, dtype=np.int64),  # Open sequence, for exit order
+        }
+        if old:
+            for name, values in self._columns.items():
+                values[:n] = old[name][:n]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self._positions
+
+    def __getitem__(self, symbol: str) -> Position:
+        return self._positions[symbol]
+
+    def __setitem__(self, symbol: str, position: Position):
+        current = self._positions.get(symbol)
+        if current is position:
+            return
+        if current is not None:
+            del self[symbol]
+        row = len(self._symbols)
+        if row == len(self._columns["side"]):
+            self._allocate(2 * row)
+
+        if position.__dict__.get("_book") is not None:
+            raise ValueError(f"Position {position.position_id} is already in a book")
+
+        columns = self._columns
+        for name in self._FIELDS:
+            columns[name][row] = self._encode(name, getattr(position, name))
+        columns["order"][row] = self._opened
+        self._opened += 1
+
+        self._positions[symbol] = position
+        self._rows[symbol] = row
+        self._symbols.append(symbol)
+        self.total_size += position.size
+        self.unrealized_pnl += position.unrealized_pnl
+        position.__dict__["_book"] = (self, symbol)
+
+    def __delitem__(self, symbol: str):
+        position = self._positions[symbol]
+        # Detach, keeping the last marked state on the object
+        for name in ("current_price", "bars_held", "unrealized_pnl"):
+            position.__dict__[f"_{name}"] = getattr(position, name)
+        del position.__dict__["_book"]
+        row = self._rows.pop(symbol)
+        del self._positions[symbol]
+
+        # Move the last row into the hole
+        last = len(self._symbols) - 1
+        if row != last:
+            moved = self._symbols[last]
+            for values in self._columns.values():
+                values[row] = values[last]
+            self._symbols[row] = moved
+            self._rows[moved] = row
+        self._symbols.pop()
+
+        if self._positions:
+            self.total_size -= position.size
+            self.unrealized_pnl -= position.unrealized_pnl
+        else:
+            # Reset the running sums with the book
+            self.total_size = 0.0
+            self.unrealized_pnl = 0.0
+
+    _FIELDS = (
+        "side", "size", "entry_price", "stop_loss", "take_profit", "max_bars",
+        "current_price", "bars_held", "unrealized_pnl",
+    )
+
+    @staticmethod
+    def _encode(name: str, value) -> float:
+        # Unset (None or 0) stops never trigger, as in Position.check_exit_conditions
+        if name in ("stop_loss", "take_profit"):
+            return value or np.nan
+        return value
+
+    def _write(self, symbol: str, name: str, value):
+        """Write one field of a position's row (BookField.__set__)"""
+        values = self._columns[name]
+        row = self._rows[symbol]
+        if name == "size":
+            self.total_size += value - values[row]
+        elif name == "unrealized_pnl":
+            self.unrealized_pnl += value - values[row]
+        values[row] = self._encode(name, value)
+
+    def mark(self, prices: Dict[str, float]) -> List[str]:
+        """
+        Mark positions to market (``Position.update`` for every row at once)
+
+        Args:
+            prices: symbol -> current price (symbols without a position are ignored)
+
+        Returns:
+            Symbols marked, in ``prices`` order
+        """
+        index = self._rows
+        symbols = [symbol for symbol in prices if symbol in index]
+        columns = self._columns
+        if len(symbols) == 1:
+            # One symbol per bar is the live bot's case: skip the array setup
+            row = index[symbols[0]]
+            price = float(prices[symbols[0]])
+            entry = columns["entry_price"][row]
+            pnl = float(columns["side"][row] * (price - entry) / entry * columns["size"][row])
+            self.unrealized_pnl += pnl - columns["unrealized_pnl"][row]
+            columns["current_price"][row] = price
+            columns["bars_held"][row] += 1
+            columns["unrealized_pnl"][row] = pnl
+            return symbols
+        if not symbols:
+            return symbols
+        rows = np.array([index[symbol] for symbol in symbols], dtype=np.int64)
+        price = np.array([prices[symbol] for symbol in symbols], dtype=float)
+
+        entry = columns["entry_price"][rows]
+        pnl = columns["side"][rows] * (price - entry) / entry * columns["size"][rows]
+        self.unrealized_pnl += float(np.sum(pnl - columns["unrealized_pnl"][rows]))
+        columns["current_price"][rows] = price
+        columns["bars_held"][rows] += 1
+        columns["unrealized_pnl"][rows] = pnl
+        return symbols
+
+    def exits(self) -> List[Tuple[str, str]]:
+        """
+        Positions whose stop, target or time limit is hit
+
+        Same rules and precedence as ``Position.check_exit_conditions``.
+
+        Returns:
+            (symbol, exit_reason) tuples, in the order positions were opened
+        """
+        n = len(self._symbols)
+        columns = self._columns
+        price = columns["current_price"][:n]
+        stop = price <= columns["stop_loss"][:n]  # NaN (unset) compares False
+        target = price >= columns["take_profit"][:n]
+        timeout = columns["bars_held"][:n] >= columns["max_bars"][:n]
+
+        rows = np.flatnonzero(stop | target | timeout)
+        rows = rows[np.argsort(columns["order"][rows])]
+        return [
+            (self._symbols[row], "stop_loss" if stop[row] else "take_profit" if target[row] else "time_stop")
+            for row in rows
+        ]
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of one column, in row order (see ``symbols``)"""
+        view = self._columns[name][:len(self._symbols)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbol of each row"""
+        return list(self._symbols)
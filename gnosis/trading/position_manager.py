@@ -6,6 +6,13 @@ Tracks open positions and manages lifecycle:
 - Updates: Track P&L, time in position
 - Exit: Close on TP/SL/time/signal
 - Persistence: Survive restarts
+
+State is saved as a JSON snapshot, replaced atomically (temp file +
+rename). In journal mode each open/mark/close/reset is instead appended
+to a log as one compact event (a mark carries every price of one
+``update_positions`` call), so a write costs O(event) rather than
+O(portfolio); the snapshot is rewritten every ``snapshot_every`` events,
+and startup loads the snapshot and replays the journal tail.
 """
 
 from __future__ import annotations
@@ -14,28 +21,37 @@ from datetime import datetime
 from typing import Dict, Optional, List
 from pathlib import Path
 import json
+import os
+import time
+
+from gnosis.trading.position_book import BookField, PositionBook
 
 
 @dataclass
 class Position:
-    """Open trading position"""
+    """
+    Open trading position
+
+    Fields declared as BookField stay in sync with the PositionManager's
+    book while the position is open (see PositionBook).
+    """
     position_id: str
     symbol: str
-    side: int  # 1 = long, -1 = short
-    size: float  # Position size (fraction of capital)
-    entry_price: float
+    side: int = BookField(cast=int)  # 1 = long, -1 = short
+    size: float = BookField()  # Position size (fraction of capital)
+    entry_price: float = BookField()
     entry_time: datetime
     entry_confidence: float
     
     # Risk parameters
-    stop_loss: Optional[float] = None
-    take_profit: Optional[float] = None
-    max_bars: int = 24  # Auto-exit after N bars
+    stop_loss: Optional[float] = BookField(None)
+    take_profit: Optional[float] = BookField(None)
+    max_bars: int = BookField(24, int)  # Auto-exit after N bars
     
     # State
-    current_price: float = 0.0
-    bars_held: int = 0
-    unrealized_pnl: float = 0.0
+    current_price: float = BookField(0.0, live=True)
+    bars_held: int = BookField(0, int, live=True)
+    unrealized_pnl: float = BookField(0.0, live=True)
     
     # Memory tracking
     episode_id: Optional[str] = None
@@ -59,6 +75,14 @@ class Position:
         
         self.unrealized_pnl = pnl_pct * self.size
     
+    def __getstate__(self):
+        # Copies and pickles are detached from the book, with its current state
+        state = dict(self.__dict__)
+        if state.pop("_book", None) is not None:
+            for name in ("current_price", "bars_held", "unrealized_pnl"):
+                state[f"_{name}"] = getattr(self, name)
+        return state
+    
     def check_exit_conditions(self) -> Optional[str]:
         """
         Check if position should exit
@@ -142,19 +166,51 @@ class PositionManager:
         state_file: str = "trading_state.json",
         max_positions: int = 3,
         max_daily_loss: float = -0.05,  # -5% daily loss limit
-        learning_orchestrator=None
+        learning_orchestrator=None,
+        journal: bool = False,
+        journal_file: Optional[str] = None,
+        snapshot_every: int = 1000,
+        fsync_every: int = 32,
+        fsync_interval_seconds: float = 1.0
     ):
+        """
+        Args:
+            state_file: JSON snapshot path
+            max_positions: Max concurrent positions
+            max_daily_loss: Daily loss limit (fraction of capital)
+            learning_orchestrator: Optional adaptive learning feedback
+            journal: Append events to a journal instead of rewriting the snapshot
+            journal_file: Journal path (default: ``<state_file>.journal``)
+            snapshot_every: Journal events between snapshots
+            fsync_every: Journal events between fsyncs (every event is
+                flushed to the OS, so a process crash loses nothing)
+            fsync_interval_seconds: Also fsync once the last one is this old
+        """
         self.state_file = Path(state_file)
         self.max_positions = max_positions
         self.max_daily_loss = max_daily_loss
         self.learning_orchestrator = learning_orchestrator
         
-        self.positions: Dict[str, Position] = {}
+        self.positions = PositionBook()  # symbol -> Position, array-backed
         self.daily_pnl: float = 0.0
         self.daily_trades: int = 0
         self.last_reset: datetime = datetime.now()
         
+        # Journal state (seq = last event included in the state)
+        self.journal = journal
+        self.journal_file = Path(journal_file) if journal_file else Path(f"{self.state_file}.journal")
+        self.snapshot_every = snapshot_every
+        self.fsync_every = fsync_every
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self._journal = None
+        self._seq = 0
+        self._events_since_snapshot = 0
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+        
         self.load_state()
+        if journal:
+            self._recover()
     
     def can_open_position(self, symbol: str) -> tuple[bool, str]:
         """
@@ -238,7 +294,7 @@ class PositionManager:
         
         self.positions[symbol] = position
         self.daily_trades += 1
-        self.save_state()
+        self._persist("open", position=position.to_dict(), daily_trades=self.daily_trades)
         
         print(f"✅ Opened {symbol} {'LONG' if side == 1 else 'SHORT'}: "
               f"size={size:.2%}, entry=${entry_price:.2f}")
@@ -253,9 +309,10 @@ class PositionManager:
             prices: Dict of symbol -> current_price
             hedge_snapshots: Optional dict of symbol -> hedge_snapshot for lookahead training
         """
-        for symbol, position in self.positions.items():
-            if symbol in prices:
-                position.update(prices[symbol])
+        marked = self.positions.mark(prices)
+        if self.journal and marked:
+            # One event per batch: a snapshot taken after it holds all of its marks
+            self._log("mark", prices={symbol: prices[symbol] for symbol in marked})
         
         # 🧠 ADAPTIVE LEARNING: Feed hedge snapshots to Transformer for sequence learning
         if self.learning_orchestrator and self.learning_orchestrator.enabled and hedge_snapshots:
@@ -269,14 +326,7 @@ class PositionManager:
         Returns:
             List of (symbol, exit_reason) tuples
         """
-        to_exit = []
-        
-        for symbol, position in self.positions.items():
-            exit_reason = position.check_exit_conditions()
-            if exit_reason:
-                to_exit.append((symbol, exit_reason))
-        
-        return to_exit
+        return self.positions.exits()
     
     def close_position(
         self,
@@ -346,7 +396,7 @@ class PositionManager:
         
         # Remove position
         del self.positions[symbol]
-        self.save_state()
+        self._persist("close", symbol=symbol, daily_pnl=self.daily_pnl)
         
         outcome = "WIN" if realized_pnl > 0 else "LOSS"
         print(f"🔔 Closed {symbol} {outcome}: "
@@ -356,7 +406,7 @@ class PositionManager:
     
     def get_portfolio_summary(self) -> dict:
         """Get current portfolio state"""
-        total_unrealized = sum(p.unrealized_pnl for p in self.positions.values())
+        total_unrealized = self.positions.unrealized_pnl
         
         return {
             "positions": len(self.positions),
@@ -375,19 +425,123 @@ class PositionManager:
             self.daily_pnl = 0.0
             self.daily_trades = 0
             self.last_reset = datetime.now()
-            self.save_state()
+            self._persist("reset", last_reset=self.last_reset.isoformat())
     
     def save_state(self):
-        """Persist state to disk"""
+        """
+        Persist full state to disk atomically (temp file + rename)
+        
+        In journal mode this is the snapshot: the journal is emptied once the
+        snapshot is in place.
+        """
         state = {
             "positions": {k: v.to_dict() for k, v in self.positions.items()},
             "daily_pnl": self.daily_pnl,
             "daily_trades": self.daily_trades,
-            "last_reset": self.last_reset.isoformat()
+            "last_reset": self.last_reset.isoformat(),
+            "seq": self._seq
         }
         
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        temp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(state, f, indent=None if self.journal else 2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.state_file)
+        
+        # Events up to seq are in the snapshot (replay skips them if the
+        # truncation below is lost to a crash)
+        if self._journal:
+            self._journal.truncate(0)
+            self._journal.seek(0)
+            self._unsynced = 0
+        self._events_since_snapshot = 0
+    
+    def sync(self):
+        """fsync pending journal events"""
+        if self._journal and self._unsynced:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._unsynced = 0
+        self._last_fsync = time.monotonic()
+    
+    def close(self):
+        """Snapshot and close the journal (journal mode)"""
+        if self._journal:
+            self.save_state()
+            self._journal.close()
+            self._journal = None
+    
+    def _persist(self, event: str, **fields):
+        """Record a state change: journal event, or full snapshot"""
+        if self.journal:
+            self._log(event, **fields)
+        else:
+            self.save_state()
+    
+    def _log(self, event: str, **fields):
+        """Append one event to the journal; fsync and snapshot when due"""
+        self._seq += 1
+        record = {"seq": self._seq, "event": event, **fields}
+        self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        
+        self._unsynced += 1
+        self._events_since_snapshot += 1
+        if self._events_since_snapshot >= self.snapshot_every:
+            self.save_state()
+        elif (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_fsync >= self.fsync_interval_seconds
+        ):
+            self.sync()
+    
+    def _apply(self, record: dict):
+        """Apply one journal event to the in-memory state"""
+        event = record["event"]
+        if event == "open":
+            position = Position.from_dict(record["position"])
+            self.positions[position.symbol] = position
+            self.daily_trades = record["daily_trades"]
+        elif event == "mark":
+            self.positions.mark(record["prices"])
+        elif event == "update":  # Single-symbol marks written by older versions
+            self.positions.mark({record["symbol"]: record["price"]})
+        elif event == "close":
+            self.positions.pop(record["symbol"], None)
+            self.daily_pnl = record["daily_pnl"]
+        elif event == "reset":
+            self.daily_pnl = 0.0
+            self.daily_trades = 0
+            self.last_reset = datetime.fromisoformat(record["last_reset"])
+    
+    def _recover(self):
+        """Replay journal events newer than the snapshot, then re-snapshot"""
+        replayed = 0
+        torn = False
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final write from a crash mid-append
+                        print(f"⚠️  Skipping unreadable journal entry in {self.journal_file}")
+                        torn = True
+                        continue
+                    if record["seq"] <= self._seq:
+                        continue
+                    self._apply(record)
+                    self._seq = record["seq"]
+                    replayed += 1
+        
+        self._journal = open(self.journal_file, 'a')
+        if replayed:
+            print(f"📂 Replayed {replayed} journal events: {len(self.positions)} open positions")
+        # Snapshotting empties the journal, so new events are not appended
+        # to the fragment of a torn line
+        if replayed or torn or not self.state_file.exists():
+            self.save_state()
     
     def load_state(self):
         """Load state from disk"""
@@ -398,13 +552,13 @@ class PositionManager:
             with open(self.state_file, 'r') as f:
                 state = json.load(f)
             
-            self.positions = {
-                k: Position.from_dict(v)
-                for k, v in state.get("positions", {}).items()
-            }
+            self.positions.clear()
+            for k, v in state.get("positions", {}).items():
+                self.positions[k] = Position.from_dict(v)
             self.daily_pnl = state.get("daily_pnl", 0.0)
             self.daily_trades = state.get("daily_trades", 0)
             self.last_reset = datetime.fromisoformat(state.get("last_reset", datetime.now().isoformat()))
+            self._seq = state.get("seq", 0)
             
             print(f"📂 Loaded state: {len(self.positions)} open positions")
         except Exception as e:
@@ -433,7 +587,7 @@ if __name__ == "__main__":
         exits = pm.check_exits()
         
         print(f"Bar {i+1}: SPY=${price:.2f}, "
-              f"Unrealized PnL={pos.unrealized_pnl:+.2%}")
+              f"Unrealized PnL={pm.positions['SPY'].unrealized_pnl:+.2%}")
         
         if exits:
             symbol, reason = exits[0]
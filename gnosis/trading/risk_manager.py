@@ -205,8 +205,10 @@ class RiskManager:
         return True, "OK"
     
     def get_risk_summary(self, positions: Dict) -> dict:
-        """Get current risk metrics"""
-        total_risk = sum(p.size for p in positions.values())
+        """Get current risk metrics (positions: a PositionBook or symbol -> Position dict)"""
+        total_risk = getattr(positions, "total_size", None)
+        if total_risk is None:
+            total_risk = sum(p.size for p in positions.values())
         
         return {
             "current_equity": self.current_equity,
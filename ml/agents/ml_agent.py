@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from pydantic import BaseModel, Field
 import numpy as np
 
 from ml.prediction.predictor import Predictor, PredictionResult, PredictionConfig
-from ml.persistence.manager import ModelManager
+from ml.persistence.manager import ModelManager, ModelMetadata
+from ml.persistence.cache import ModelCache, TASKS
+from ml.persistence.drift import DriftMonitor
 
 
 class MLAgentConfig(BaseModel):
@@ -16,6 +19,12 @@ class MLAgentConfig(BaseModel):
     # Model paths
     models_dir: str = Field(default="./ml_models")
     
+    # Model cache (one entry per symbol/task/horizon)
+    max_cached_models: int = Field(default=256, ge=1)
+    max_cache_bytes: Optional[int] = Field(default=None, ge=1)
+    model_refresh_seconds: float = Field(default=30.0, ge=0.0)
+    prefetch_workers: int = Field(default=2, ge=1)
+    
     # Prediction config
     prediction_config: PredictionConfig = Field(default_factory=PredictionConfig)
     
@@ -27,6 +36,12 @@ class MLAgentConfig(BaseModel):
     
     # Fallback behavior
     fallback_on_error: bool = Field(default=True)
+    
+    # Streaming drift monitoring (direction model's training bins)
+    drift_monitoring: bool = Field(default=True)
+    drift_threshold: float = Field(default=0.2, gt=0.0)
+    drift_window: int = Field(default=5000, ge=1)
+    drift_min_observations: int = Field(default=100, ge=0)
 
 
 class MLOutput(BaseModel):
@@ -72,8 +87,18 @@ class MLAgent:
         self.model_manager = ModelManager(base_dir=self.config.models_dir)
         self.predictor = Predictor(config=self.config.prediction_config)
         
-        # Cache loaded models
-        self._model_cache: Dict[str, Dict[str, Any]] = {}
+        # Cache loaded models (bounded LRU, hot-swapped on new versions)
+        self.model_cache = ModelCache(
+            self.model_manager,
+            max_entries=self.config.max_cached_models,
+            max_bytes=self.config.max_cache_bytes,
+            refresh_interval_seconds=self.config.model_refresh_seconds,
+            prefetch_workers=self.config.prefetch_workers,
+        )
+        
+        # Live drift monitors by (symbol, horizon), rebuilt on model version change
+        self.drift_monitors: Dict[Tuple[str, int], DriftMonitor] = {}
+        self._drift_versions: Dict[Tuple[str, int], str] = {}
     
     def process(
         self,
@@ -109,6 +134,7 @@ class MLAgent:
             
             # Make prediction
             prediction = self.predictor.predict(models, features, movement_energy)
+            self._observe_drift(symbol, horizon, features)
             
             # Convert to ML output
             ml_output = self._convert_to_output(prediction)
@@ -126,6 +152,69 @@ class MLAgent:
             else:
                 raise
     
+    def process_batch(
+        self,
+        symbols: List[str],
+        features: np.ndarray,
+        movement_energy: Optional[List[Optional[float]]] = None,
+        horizon: int = 5,
+    ) -> Dict[str, MLOutput]:
+        """Process one feature row per symbol in a single batched prediction.
+
+        Universe-scan counterpart of ``process``: rows are scored with
+        ``Predictor.predict_batch``, so each loaded model runs once per task.
+
+        Args:
+            symbols: Symbols, one per feature row
+            features: Feature matrix (n_symbols x n_features)
+            movement_energy: Optional per-symbol movement energy
+            horizon: Forecast horizon
+
+        Returns:
+            Dictionary mapping symbol to MLOutput
+        """
+        if not self.config.enabled:
+            return {symbol: MLOutput(has_signal=False, ml_confidence=0.0) for symbol in symbols}
+
+        try:
+            outputs: Dict[str, MLOutput] = {}
+            rows = []
+            row_models = []
+
+            for i, symbol in enumerate(symbols):
+                models = self._load_models(symbol, horizon)
+                if models:
+                    rows.append(i)
+                    row_models.append(models)
+                else:
+                    outputs[symbol] = MLOutput(
+                        has_signal=False,
+                        models_loaded=False,
+                        error="No models available"
+                    )
+
+            if rows:
+                energies = None
+                if movement_energy is not None:
+                    energies = [movement_energy[i] for i in rows]
+
+                X = np.asarray(features)
+                predictions = self.predictor.predict_batch(row_models, X[rows], energies)
+                for i, prediction in zip(rows, predictions):
+                    outputs[symbols[i]] = self._convert_to_output(prediction)
+                    self._observe_drift(symbols[i], horizon, X[i])
+
+            return {symbol: outputs[symbol] for symbol in symbols}
+
+        except Exception as e:
+            if self.config.fallback_on_error:
+                return {
+                    symbol: MLOutput(has_signal=False, models_loaded=False, error=str(e))
+                    for symbol in symbols
+                }
+            else:
+                raise
+
     def _load_models(self, symbol: str, horizon: int) -> Dict[str, Any]:
         """Load models for symbol and horizon.
         
@@ -136,52 +225,62 @@ class MLAgent:
         Returns:
             Dictionary of models
         """
-        cache_key = f"{symbol}_{horizon}"
-        
-        # Check cache
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
-        
         models = {}
         
-        # Load direction model
-        try:
-            direction_model, _ = self.model_manager.load_model(
-                symbol=symbol,
-                task="direction",
-                horizon=horizon,
-            )
-            models["direction"] = direction_model
-        except FileNotFoundError:
-            pass
+        for task in TASKS:
+            try:
+                models[task], metadata = self.model_cache.get(symbol, task, horizon)
+            except FileNotFoundError:
+                continue
+            if task == "direction":
+                self._track_drift_reference(symbol, horizon, metadata)
         
-        # Load magnitude model
-        try:
-            magnitude_model, _ = self.model_manager.load_model(
-                symbol=symbol,
-                task="magnitude",
-                horizon=horizon,
-            )
-            models["magnitude"] = magnitude_model
-        except FileNotFoundError:
-            pass
+        return models
+    
+    def _track_drift_reference(self, symbol: str, horizon: int, metadata: ModelMetadata) -> None:
+        """Create (or rebuild on a new model version) the drift monitor for a model."""
+        if not self.config.drift_monitoring:
+            return
+        key = (symbol, horizon)
+        if self._drift_versions.get(key) == metadata.version:
+            return
         
-        # Load volatility model
+        self._drift_versions[key] = metadata.version
+        if metadata.drift_reference is None:
+            self.drift_monitors.pop(key, None)
+            return
+        self.drift_monitors[key] = DriftMonitor(
+            metadata.drift_reference,
+            window=self.config.drift_window,
+            threshold=self.config.drift_threshold,
+            min_observations=self.config.drift_min_observations,
+        )
+    
+    def _observe_drift(self, symbol: str, horizon: int, features: np.ndarray) -> None:
+        """Add a scored feature row to the live drift histograms."""
+        monitor = self.drift_monitors.get((symbol, horizon))
+        if monitor is None:
+            return
         try:
-            volatility_model, _ = self.model_manager.load_model(
-                symbol=symbol,
-                task="volatility",
-                horizon=horizon,
-            )
-            models["volatility"] = volatility_model
-        except FileNotFoundError:
-            pass
+            monitor.update(features)
+        except ValueError:
+            # Feature layout no longer matches the model's reference
+            self.drift_monitors.pop((symbol, horizon), None)
+    
+    def prefetch_models(self, symbols: Iterable[str], horizons: Iterable[int] = (5,)) -> List[Future]:
+        """Warm the model cache in the background.
         
-        # Cache models
-        if models:
-            self._model_cache[cache_key] = models
+        Call with the scanner's top-N symbols so their first ``process`` call
+        does not pay a cold load on the trading tick.
         
-        return models
+        Args:
+            symbols: Symbols to prefetch
+            horizons: Forecast horizons to prefetch
+            
+        Returns:
+            Futures for the scheduled loads
+        """
+        return self.model_cache.prefetch(symbols, horizons)
     
     def _convert_to_output(self, prediction: PredictionResult) -> MLOutput:
         """Convert PredictionResult to MLOutput for Composer.
@@ -247,6 +346,23 @@ class MLAgent:
         except Exception:
             return False, 0.0
     
+    def drift_status(self, symbol: str, horizon: int = 5) -> Optional[Dict[str, Any]]:
+        """Current drift metrics from the live monitor (cheap, safe to poll).
+        
+        Args:
+            symbol: Trading symbol
+            horizon: Forecast horizon
+            
+        Returns:
+            Drift status dictionary, or None if the symbol has no monitor
+        """
+        monitor = self.drift_monitors.get((symbol, horizon))
+        return monitor.status() if monitor is not None else None
+    
+    def drift_statuses(self) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Drift metrics for every monitored (symbol, horizon)."""
+        return {key: monitor.status() for key, monitor in list(self.drift_monitors.items())}
+    
     def clear_cache(self):
-        """Clear model cache (e.g., after retraining)."""
-        self._model_cache.clear()
+        """Clear model cache (newer versions are also hot-swapped automatically)."""
+        self.model_cache.clear()
@@ -1,7 +1,12 @@
 """Dataset building with purged CV and energy-aware weighting."""
 
 from ml.dataset.builder import DatasetBuilder, DatasetConfig, MLDataset
-from ml.dataset.cv import PurgedKFold, embargo_samples
+from ml.dataset.cv import (
+    PurgedKFold,
+    compute_average_uniqueness,
+    compute_sample_uniqueness,
+    embargo_samples,
+)
 from ml.dataset.weighting import EnergyAwareWeighter
 
 __all__ = [
@@ -10,5 +15,7 @@ __all__ = [
     "MLDataset",
     "PurgedKFold",
     "embargo_samples",
+    "compute_sample_uniqueness",
+    "compute_average_uniqueness",
     "EnergyAwareWeighter",
 ]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import glob
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import polars as pl
 from pydantic import BaseModel, Field
@@ -63,6 +67,20 @@ class MLDataset(BaseModel):
         self.n_features = self.X.shape[1] if len(self.X.shape) > 1 else 0
 
 
+# On-disk layout of memory-mapped datasets: array name -> dtype (with
+# drop_na=False the class labels keep their NaNs as float32, see
+# DatasetBuilder._memmap_dtypes)
+MEMMAP_ARRAYS = {
+    "X": "float32",
+    "y_direction": "int8",
+    "y_magnitude": "int8",
+    "y_volatility": "float32",
+    "weights": "float32",
+    "timestamps": "datetime64[us]",
+}
+MEMMAP_METADATA = "dataset.json"
+
+
 class DatasetBuilder:
     """Build ML datasets with proper splitting and weighting."""
     
@@ -142,6 +160,221 @@ class DatasetBuilder:
             timestamps=timestamps,
         )
     
+    def build_dataset_from_parquet(
+        self,
+        source: Union[str, Path, Sequence[Union[str, Path]]],
+        output_dir: Union[str, Path],
+        horizon: int = 5,
+        transform: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+        include_weights: bool = True,
+    ) -> MLDataset:
+        """Build a memory-mapped ML dataset from partitioned Parquet, out of core.
+        
+        Partitions are scanned lazily and processed one at a time: each is
+        optionally passed through ``transform`` (e.g. label generation and
+        feature building), filtered like ``build_dataset``, and appended to
+        float32 feature / label / weight files in ``output_dir``. Only one
+        partition is ever held in memory; the result is reopened with
+        ``np.memmap`` so trainers page rows in on demand.
+        
+        Partitions are appended in path order, so ``temporal_split`` is only
+        temporal if the layout is time-major (e.g. ``date=.../symbol=...``).
+        ``transform`` sees one partition at a time, so rolling features
+        cannot look back across partition boundaries.
+        
+        Args:
+            source: Directory of Parquet files (searched recursively), glob
+                pattern, or explicit list of files
+            output_dir: Directory for the memory-mapped arrays
+            horizon: Forecast horizon for label selection
+            transform: Optional per-partition feature/label computation
+            include_weights: Whether to compute sample weights
+            
+        Returns:
+            MLDataset whose arrays are read-only np.memmap views
+        """
+        paths = self._resolve_parquet_paths(source)
+        if not paths:
+            raise ValueError(f"No Parquet files found for {source}")
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        with_weights = include_weights and self.config.use_energy_weighting
+        dtypes = self._memmap_dtypes()
+        feature_names: Optional[List[str]] = None
+        n_samples = 0
+        weight_sum = 0.0
+        has_timestamps = True
+        files = {
+            name: open(output_dir / f"{name}.bin", "wb")
+            for name in MEMMAP_ARRAYS
+        }
+        
+        try:
+            for path in paths:
+                df = pl.scan_parquet(path).collect()
+                if transform is not None:
+                    df = transform(df)
+                if df.is_empty():
+                    continue
+                
+                if feature_names is None:
+                    _, feature_names = self._extract_features(df.head(0))
+                
+                arrays = self._partition_arrays(df, feature_names, horizon, with_weights)
+                if arrays["timestamps"] is None:
+                    has_timestamps = False
+                
+                for name, array in arrays.items():
+                    if array is not None:
+                        files[name].write(np.ascontiguousarray(array).tobytes())
+                
+                n_samples += len(arrays["X"])
+                if with_weights:
+                    weight_sum += float(arrays["weights"].sum(dtype=np.float64))
+        finally:
+            for f in files.values():
+                f.close()
+        
+        if n_samples < self.config.min_valid_samples:
+            raise ValueError(
+                f"Not enough valid samples: {n_samples} < {self.config.min_valid_samples}"
+            )
+        
+        arrays_written = [
+            name for name in MEMMAP_ARRAYS
+            if (name != "timestamps" or has_timestamps)
+            and (name != "weights" or with_weights)
+        ]
+        for name in set(MEMMAP_ARRAYS) - set(arrays_written):
+            (output_dir / f"{name}.bin").unlink()
+        
+        # Normalize weights to mean 1 over the whole dataset (second, chunked pass)
+        if with_weights and n_samples > 0:
+            weights = np.memmap(output_dir / "weights.bin", dtype=np.float32, mode="r+")
+            scale = n_samples / weight_sum
+            for start in range(0, n_samples, 1_000_000):
+                weights[start:start + 1_000_000] *= scale
+            weights.flush()
+            del weights
+        
+        # Metadata last: a dataset directory without it is incomplete
+        metadata = {
+            "n_samples": n_samples,
+            "feature_names": feature_names,
+            "horizon": horizon,
+            "arrays": {name: dtypes[name] for name in arrays_written},
+            "partitions": [str(path) for path in paths],
+        }
+        tmp_path = output_dir / f"{MEMMAP_METADATA}.tmp"
+        tmp_path.write_text(json.dumps(metadata, indent=2))
+        os.replace(tmp_path, output_dir / MEMMAP_METADATA)
+        
+        return self.load_memmap_dataset(output_dir)
+    
+    @staticmethod
+    def load_memmap_dataset(output_dir: Union[str, Path]) -> MLDataset:
+        """Open a dataset written by ``build_dataset_from_parquet``.
+        
+        Args:
+            output_dir: Dataset directory
+            
+        Returns:
+            MLDataset backed by read-only np.memmap arrays
+        """
+        output_dir = Path(output_dir)
+        metadata = json.loads((output_dir / MEMMAP_METADATA).read_text())
+        n_samples = metadata["n_samples"]
+        n_features = len(metadata["feature_names"])
+        
+        arrays = {}
+        for name, dtype in metadata["arrays"].items():
+            shape = (n_samples, n_features) if name == "X" else (n_samples,)
+            if n_samples == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    output_dir / f"{name}.bin", dtype=dtype, mode="r", shape=shape
+                )
+        
+        return MLDataset(
+            X=arrays["X"],
+            y_direction=arrays["y_direction"],
+            y_magnitude=arrays["y_magnitude"],
+            y_volatility=arrays["y_volatility"],
+            weights=arrays.get("weights"),
+            feature_names=metadata["feature_names"],
+            timestamps=arrays.get("timestamps"),
+        )
+    
+    def _partition_arrays(
+        self,
+        df: pl.DataFrame,
+        feature_names: List[str],
+        horizon: int,
+        with_weights: bool,
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """Filtered on-disk arrays for one partition (unnormalized weights)."""
+        missing = [col for col in feature_names if col not in df.columns]
+        if missing:
+            raise ValueError(f"Partition is missing feature columns: {missing[:5]}")
+        
+        # Cast in Polars so the dense block is float32 from the start
+        X = df.select(pl.col(feature_names).cast(pl.Float32)).to_numpy()
+        
+        y_direction = self._extract_label(df, f"direction_{horizon}")
+        y_magnitude = self._extract_label(df, f"magnitude_{horizon}")
+        y_volatility = self._extract_label(df, f"volatility_{horizon}")
+        
+        timestamps = None
+        if "timestamp" in df.columns and isinstance(df.schema["timestamp"], pl.Datetime):
+            timestamps = df["timestamp"].cast(pl.Datetime("us")).to_numpy()
+        
+        valid_mask = None
+        if self.config.drop_na:
+            valid_mask = self._get_valid_mask(
+                X,
+                y_direction.astype(float),
+                y_magnitude.astype(float),
+                y_volatility.astype(float),
+            )
+        
+        def select(array):
+            return array if valid_mask is None or array is None else array[valid_mask]
+        
+        weights = None
+        if with_weights:
+            weights = self._compute_energy_weights(df, valid_mask, normalize=False)
+        
+        dtypes = self._memmap_dtypes()
+        return {
+            "X": select(X),
+            "y_direction": select(y_direction).astype(dtypes["y_direction"]),
+            "y_magnitude": select(y_magnitude).astype(dtypes["y_magnitude"]),
+            "y_volatility": select(y_volatility).astype(np.float32),
+            "weights": weights.astype(np.float32) if weights is not None else None,
+            "timestamps": select(timestamps),
+        }
+    
+    def _memmap_dtypes(self) -> Dict[str, str]:
+        """On-disk dtypes; int8 class labels only once rows with NaN are dropped."""
+        if self.config.drop_na:
+            return MEMMAP_ARRAYS
+        return {**MEMMAP_ARRAYS, "y_direction": "float32", "y_magnitude": "float32"}
+    
+    @staticmethod
+    def _resolve_parquet_paths(
+        source: Union[str, Path, Sequence[Union[str, Path]]],
+    ) -> List[Path]:
+        """Expand a directory, glob pattern or path list into sorted files."""
+        if isinstance(source, (list, tuple)):
+            return [Path(path) for path in source]
+        
+        if Path(source).is_dir():
+            return sorted(Path(source).rglob("*.parquet"))
+        return sorted(Path(path) for path in glob.glob(str(source), recursive=True))
+    
     def temporal_split(
         self,
         dataset: MLDataset,
@@ -271,6 +504,7 @@ class DatasetBuilder:
         self,
         df: pl.DataFrame,
         valid_mask: Optional[np.ndarray] = None,
+        normalize: bool = True,
     ) -> np.ndarray:
         """Compute energy-aware sample weights.
         
@@ -281,6 +515,7 @@ class DatasetBuilder:
         Args:
             df: DataFrame with energy column
             valid_mask: Optional mask for valid samples
+            normalize: Scale weights to mean 1 (off when normalizing globally)
             
         Returns:
             Sample weights array
@@ -301,6 +536,7 @@ class DatasetBuilder:
         weights = 1.0 / (energy + 1e-6)
         
         # Normalize weights to sum to n_samples
-        weights = weights / weights.mean()
+        if normalize:
+            weights = weights / weights.mean()
         
         return weights
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import Iterator, Optional, Tuple
 import numpy as np
-from sklearn.model_selection import KFold
 
 
 class PurgedKFold:
@@ -14,6 +13,15 @@ class PurgedKFold:
     1. Purging samples close to validation set from training
     2. Adding embargo period after validation set
     
+    Folds are contiguous blocks (same sizes as an unshuffled KFold), so
+    each training set is built from at most two index ranges instead of
+    per-fold boolean masks.
+    
+    Purging is bar-based (``purge_bars``) by default. When label end times
+    are passed to ``split``, training samples are instead purged if their
+    label interval [sample_time, label_end_time] overlaps the validation
+    labels, which is exact for triple-barrier / variable-horizon labels.
+    
     Based on "Advances in Financial Machine Learning" by Marcos López de Prado.
     """
     
@@ -33,101 +41,116 @@ class PurgedKFold:
         self.n_splits = n_splits
         self.embargo_bars = embargo_bars
         self.purge_bars = purge_bars
-        self.kfold = KFold(n_splits=n_splits, shuffle=False)
     
     def split(
         self,
         X: np.ndarray,
         y: Optional[np.ndarray] = None,
         groups: Optional[np.ndarray] = None,
+        label_end_times: Optional[np.ndarray] = None,
+        sample_times: Optional[np.ndarray] = None,
     ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
         """Generate purged train/validation indices.
         
         Args:
-            X: Feature matrix
+            X: Feature matrix (rows sorted by sample time)
             y: Target array (optional)
             groups: Group labels (optional)
+            label_end_times: Time each sample's label is resolved (optional).
+                Enables overlap-based purging instead of ``purge_bars``.
+            sample_times: Time each sample is observed, non-decreasing. Defaults
+                to the row index, so integer bar indices can be passed as
+                ``label_end_times`` without timestamps.
             
         Yields:
             Tuple of (train_indices, valid_indices)
         """
         n_samples = len(X)
-        indices = np.arange(n_samples)
+        if n_samples < self.n_splits:
+            raise ValueError(
+                f"Cannot have n_splits={self.n_splits} greater than n_samples={n_samples}"
+            )
         
-        for train_idx, valid_idx in self.kfold.split(X):
-            # Apply purging: remove samples close to validation set from training
-            train_idx_purged = self._purge_train_indices(
-                train_idx, valid_idx, n_samples
+        if label_end_times is not None:
+            label_end_times = np.asarray(label_end_times)
+            sample_times = (
+                np.arange(n_samples) if sample_times is None else np.asarray(sample_times)
             )
+            if len(label_end_times) != n_samples or len(sample_times) != n_samples:
+                raise ValueError("label_end_times and sample_times must have one entry per sample")
+        
+        # Fold sizes match KFold(shuffle=False): the first n % k folds get one extra sample
+        fold_sizes = np.full(self.n_splits, n_samples // self.n_splits, dtype=np.int64)
+        fold_sizes[: n_samples % self.n_splits] += 1
+        bounds = np.concatenate([[0], np.cumsum(fold_sizes)])
+        
+        for valid_start, valid_stop in zip(bounds[:-1], bounds[1:]):
+            valid_idx = np.arange(valid_start, valid_stop)
             
-            # Apply embargo: remove samples after validation set from training
-            train_idx_embargoed = self._embargo_train_indices(
-                train_idx_purged, valid_idx, n_samples
-            )
+            if label_end_times is None:
+                train_idx = self._purged_train_indices(valid_start, valid_stop, n_samples)
+            else:
+                train_idx = self._purged_train_indices_by_time(
+                    valid_start, valid_stop, sample_times, label_end_times
+                )
             
-            yield train_idx_embargoed, valid_idx
+            yield train_idx, valid_idx
     
-    def _purge_train_indices(
+    def _purged_train_indices(
         self,
-        train_idx: np.ndarray,
-        valid_idx: np.ndarray,
+        valid_start: int,
+        valid_stop: int,
         n_samples: int,
     ) -> np.ndarray:
-        """Purge training samples too close to validation set.
+        """Training indices outside the purge zone and embargo period.
         
         Args:
-            train_idx: Training indices
-            valid_idx: Validation indices
+            valid_start: First validation index
+            valid_stop: One past the last validation index
             n_samples: Total number of samples
             
         Returns:
-            Purged training indices
+            Purged and embargoed training indices
         """
-        if self.purge_bars == 0:
-            return train_idx
-        
-        # Get validation boundaries
-        valid_start = valid_idx.min()
-        valid_end = valid_idx.max()
-        
-        # Remove training samples within purge_bars of validation set
-        purge_start = max(0, valid_start - self.purge_bars)
-        purge_end = min(n_samples - 1, valid_end + self.purge_bars)
+        # Training samples before the purge zone
+        head_stop = max(0, valid_start - self.purge_bars)
         
-        # Keep only training samples outside purge zone
-        mask = (train_idx < purge_start) | (train_idx > purge_end)
+        # Training samples after both the purge zone and the embargo period
+        tail_start = min(n_samples, valid_stop + max(self.purge_bars, self.embargo_bars))
         
-        return train_idx[mask]
+        return np.concatenate([np.arange(head_stop), np.arange(tail_start, n_samples)])
     
-    def _embargo_train_indices(
+    def _purged_train_indices_by_time(
         self,
-        train_idx: np.ndarray,
-        valid_idx: np.ndarray,
-        n_samples: int,
+        valid_start: int,
+        valid_stop: int,
+        sample_times: np.ndarray,
+        label_end_times: np.ndarray,
     ) -> np.ndarray:
-        """Apply embargo period after validation set.
+        """Training indices whose labels do not overlap the validation labels.
         
         Args:
-            train_idx: Training indices
-            valid_idx: Validation indices
-            n_samples: Total number of samples
+            valid_start: First validation index
+            valid_stop: One past the last validation index
+            sample_times: Sample observation times (non-decreasing)
+            label_end_times: Label resolution times
             
         Returns:
-            Training indices with embargo applied
+            Purged and embargoed training indices
         """
-        if self.embargo_bars == 0:
-            return train_idx
+        n_samples = len(sample_times)
+        valid_t0 = sample_times[valid_start]
+        valid_t1 = label_end_times[valid_start:valid_stop].max()
         
-        # Get validation end
-        valid_end = valid_idx.max()
+        # Before the fold: drop samples whose label is still open when validation starts
+        head = np.flatnonzero(label_end_times[:valid_start] < valid_t0)
         
-        # Remove training samples in embargo period
-        embargo_end = min(n_samples - 1, valid_end + self.embargo_bars)
+        # After the fold: samples observed once every validation label has resolved,
+        # and beyond the embargo period
+        tail_start = int(np.searchsorted(sample_times, valid_t1, side="right"))
+        tail_start = max(tail_start, min(n_samples, valid_stop + self.embargo_bars))
         
-        # Keep only training samples before validation or after embargo
-        mask = (train_idx < valid_idx.min()) | (train_idx > embargo_end)
-        
-        return train_idx[mask]
+        return np.concatenate([head, np.arange(tail_start, n_samples)])
     
     def get_n_splits(
         self,
@@ -188,6 +211,9 @@ def compute_sample_uniqueness(
     Samples that overlap with many other samples (in time) receive lower weights.
     This reduces overfitting to overlapping samples.
     
+    Overlaps are counted with binary searches on the sorted timestamps, so
+    this is O(n log n) and timestamps need not be sorted.
+    
     Args:
         timestamps: Array of timestamps
         lookback_window: Window size for computing overlaps
@@ -195,20 +221,103 @@ def compute_sample_uniqueness(
     Returns:
         Array of uniqueness weights (0 to 1)
     """
-    n = len(timestamps)
-    uniqueness = np.ones(n)
+    timestamps = np.asarray(timestamps)
+    if len(timestamps) == 0:
+        return np.ones(0)
     
-    for i in range(n):
-        # Count how many samples are within the lookback window
-        window_start = timestamps[i] - lookback_window
-        window_end = timestamps[i] + lookback_window
-        
-        overlaps = ((timestamps >= window_start) & (timestamps <= window_end)).sum()
-        
-        # Uniqueness is inverse of overlap count
-        uniqueness[i] = 1.0 / max(1, overlaps)
+    sorted_ts = np.sort(timestamps)
+    
+    # Number of samples within [t - lookback_window, t + lookback_window]
+    overlaps = (
+        np.searchsorted(sorted_ts, timestamps + lookback_window, side="right")
+        - np.searchsorted(sorted_ts, timestamps - lookback_window, side="left")
+    )
+    
+    # Uniqueness is inverse of overlap count
+    uniqueness = 1.0 / np.maximum(1, overlaps)
     
     # Normalize to [0, 1]
     uniqueness = uniqueness / uniqueness.max()
     
     return uniqueness
+
+
+def compute_label_concurrency(
+    sample_times: np.ndarray,
+    label_end_times: np.ndarray,
+    bar_times: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count how many labels are active at each bar.
+    
+    Each label spans the bars from its sample time to its label end time,
+    inclusive.
+    
+    Args:
+        sample_times: Time each sample is observed
+        label_end_times: Time each sample's label is resolved
+        bar_times: Sorted bar times (defaults to the unique sample times)
+        
+    Returns:
+        Tuple of (concurrency per bar, first bar per label, one past last bar per label)
+    """
+    sample_times = np.asarray(sample_times)
+    label_end_times = np.asarray(label_end_times)
+    if bar_times is None:
+        # Unique sample times; sort + adjacent compare is much faster than
+        # np.unique for datetime64 input that is already (nearly) sorted
+        bar_times = np.sort(sample_times)
+        keep = np.empty(len(bar_times), dtype=bool)
+        keep[:1] = True
+        np.not_equal(bar_times[1:], bar_times[:-1], out=keep[1:])
+        bar_times = bar_times[keep]
+    else:
+        bar_times = np.asarray(bar_times)
+    n_bars = len(bar_times)
+    
+    span_start = np.searchsorted(bar_times, sample_times, side="left")
+    span_stop = np.searchsorted(bar_times, label_end_times, side="right")
+    span_stop = np.maximum(span_stop, span_start)
+    
+    # +1 where a label starts, -1 one past where it ends, then a running sum
+    delta = (
+        np.bincount(span_start, minlength=n_bars + 1)
+        - np.bincount(span_stop, minlength=n_bars + 1)
+    )
+    concurrency = np.cumsum(delta[:n_bars])
+    
+    return concurrency, span_start, span_stop
+
+
+def compute_average_uniqueness(
+    sample_times: np.ndarray,
+    label_end_times: np.ndarray,
+    bar_times: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Average uniqueness of each label (López de Prado, AFML ch. 4).
+    
+    A label's uniqueness at a bar is 1 / (number of labels active at that
+    bar); its average uniqueness is the mean over the bars it spans. Uses
+    a concurrency count and prefix sums, so it is O(n log n) rather than
+    building the bars x labels indicator matrix.
+    
+    Args:
+        sample_times: Time each sample is observed
+        label_end_times: Time each sample's label is resolved
+        bar_times: Sorted bar times (defaults to the unique sample times)
+        
+    Returns:
+        Array of average uniqueness (0 to 1); labels spanning no bar get 0
+    """
+    concurrency, span_start, span_stop = compute_label_concurrency(
+        sample_times, label_end_times, bar_times
+    )
+    
+    inverse = np.zeros(len(concurrency))
+    active = concurrency > 0
+    inverse[active] = 1.0 / concurrency[active]
+    inverse_cumsum = np.concatenate([[0.0], np.cumsum(inverse)])
+    
+    span_length = span_stop - span_start
+    total = inverse_cumsum[span_stop] - inverse_cumsum[span_start]
+    
+    return np.divide(total, span_length, out=np.zeros(len(total)), where=span_length > 0)
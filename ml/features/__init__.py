@@ -4,12 +4,14 @@ Merges engine outputs and adds technical indicators and regime features.
 """
 
 from ml.features.builder import FeatureBuilder, FeatureConfig
+from ml.features.streaming import StreamingFeatureBuilder
 from ml.features.technical import TechnicalIndicators
 from ml.features.regime import RegimeClassifier
 
 __all__ = [
     "FeatureBuilder",
     "FeatureConfig",
+    "StreamingFeatureBuilder",
     "TechnicalIndicators",
     "RegimeClassifier",
 ]
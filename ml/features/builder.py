@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Union
 import polars as pl
 from pydantic import BaseModel, Field
 
@@ -52,7 +52,7 @@ class FeatureBuilder:
         self,
         df_ohlcv: pl.DataFrame,
         hedge_outputs: Optional[List[HedgeEngineOutput]] = None,
-        liquidity_outputs: Optional[List[LiquidityEngineOutput]] = None,
+        liquidity_outputs: Optional[Union[List[LiquidityEngineOutput], pl.DataFrame]] = None,
         sentiment_outputs: Optional[List[SentimentEnvelope]] = None,
     ) -> pl.DataFrame:
         """Build complete feature matrix from engine outputs.
@@ -60,7 +60,8 @@ class FeatureBuilder:
         Args:
             df_ohlcv: Base OHLCV dataframe with timestamp
             hedge_outputs: List of HedgeEngineOutput (aligned with df_ohlcv)
-            liquidity_outputs: List of LiquidityEngineOutput (aligned with df_ohlcv)
+            liquidity_outputs: List of LiquidityEngineOutput, or the frame from
+                LiquidityEngineV1.run_history (aligned with df_ohlcv)
             sentiment_outputs: List of SentimentEnvelope (aligned with df_ohlcv)
             
         Returns:
@@ -77,7 +78,7 @@ class FeatureBuilder:
             hedge_df = self._extract_hedge_features(hedge_outputs)
             feature_df = self._merge_features(feature_df, hedge_df, "hedge")
         
-        if self.config.include_liquidity and liquidity_outputs:
+        if self.config.include_liquidity and liquidity_outputs is not None and len(liquidity_outputs):
             liquidity_df = self._extract_liquidity_features(liquidity_outputs)
             feature_df = self._merge_features(feature_df, liquidity_df, "liquidity")
         
@@ -129,9 +130,9 @@ class FeatureBuilder:
             ((pl.col("close") - pl.col("open")) / pl.col("open")).alias("body_pct"),
             
             # Wick ratios
-            ((pl.col("high") - pl.col("close").max(pl.col("open"))) / 
+            ((pl.col("high") - pl.max_horizontal("close", "open")) / 
              (pl.col("high") - pl.col("low") + 1e-8)).alias("upper_wick_ratio"),
-            ((pl.col("close").min(pl.col("open")) - pl.col("low")) / 
+            ((pl.min_horizontal("close", "open") - pl.col("low")) / 
              (pl.col("high") - pl.col("low") + 1e-8)).alias("lower_wick_ratio"),
             
             # Volume
@@ -149,86 +150,147 @@ class FeatureBuilder:
         Returns:
             DataFrame with hedge features
         """
-        rows = []
-        for output in outputs:
-            row = {
-                "hedge_pressure_up": output.pressure_up,
-                "hedge_pressure_down": output.pressure_down,
-                "hedge_net_pressure": output.net_pressure,
-                "hedge_elasticity": output.elasticity,
-                "hedge_movement_energy": output.movement_energy,
-                "hedge_elasticity_up": output.elasticity_up,
-                "hedge_elasticity_down": output.elasticity_down,
-                "hedge_movement_energy_up": output.movement_energy_up,
-                "hedge_movement_energy_down": output.movement_energy_down,
-                "hedge_energy_asymmetry": output.energy_asymmetry,
-                "hedge_gamma_pressure": output.gamma_pressure,
-                "hedge_vanna_pressure": output.vanna_pressure,
-                "hedge_charm_pressure": output.charm_pressure,
-                "hedge_dealer_gamma_sign": output.dealer_gamma_sign,
-                "hedge_confidence": output.confidence,
-                "hedge_regime_stability": output.regime_stability,
-                "hedge_cross_asset_correlation": output.cross_asset_correlation,
-            }
-            
-            # Encode categorical regimes as one-hot or ordinal
-            # For simplicity, we'll use label encoding here
-            row["hedge_primary_regime"] = self._encode_regime(output.primary_regime)
-            row["hedge_gamma_regime"] = self._encode_regime(output.gamma_regime)
-            row["hedge_vanna_regime"] = self._encode_regime(output.vanna_regime)
-            row["hedge_charm_regime"] = self._encode_regime(output.charm_regime)
-            row["hedge_jump_risk_regime"] = self._encode_regime(output.jump_risk_regime)
-            row["hedge_potential_shape"] = self._encode_potential_shape(output.potential_shape)
+        return pl.DataFrame([self._hedge_feature_row(output) for output in outputs])
+    
+    def _hedge_feature_row(self, output: HedgeEngineOutput) -> Dict[str, Any]:
+        """Extract hedge features for a single bar.
+        
+        Args:
+            output: HedgeEngineOutput
             
-            rows.append(row)
+        Returns:
+            Dictionary of hedge features
+        """
+        row = {
+            "hedge_pressure_up": output.pressure_up,
+            "hedge_pressure_down": output.pressure_down,
+            "hedge_net_pressure": output.net_pressure,
+            "hedge_elasticity": output.elasticity,
+            "hedge_movement_energy": output.movement_energy,
+            "hedge_elasticity_up": output.elasticity_up,
+            "hedge_elasticity_down": output.elasticity_down,
+            "hedge_movement_energy_up": output.movement_energy_up,
+            "hedge_movement_energy_down": output.movement_energy_down,
+            "hedge_energy_asymmetry": output.energy_asymmetry,
+            "hedge_gamma_pressure": output.gamma_pressure,
+            "hedge_vanna_pressure": output.vanna_pressure,
+            "hedge_charm_pressure": output.charm_pressure,
+            "hedge_dealer_gamma_sign": output.dealer_gamma_sign,
+            "hedge_confidence": output.confidence,
+            "hedge_regime_stability": output.regime_stability,
+            "hedge_cross_asset_correlation": output.cross_asset_correlation,
+        }
+        
+        # Encode categorical regimes as one-hot or ordinal
+        # For simplicity, we'll use label encoding here
+        row["hedge_primary_regime"] = self._encode_regime(output.primary_regime)
+        row["hedge_gamma_regime"] = self._encode_regime(output.gamma_regime)
+        row["hedge_vanna_regime"] = self._encode_regime(output.vanna_regime)
+        row["hedge_charm_regime"] = self._encode_regime(output.charm_regime)
+        row["hedge_jump_risk_regime"] = self._encode_regime(output.jump_risk_regime)
+        row["hedge_potential_shape"] = self._encode_potential_shape(output.potential_shape)
         
-        return pl.DataFrame(rows)
+        return row
     
-    def _extract_liquidity_features(self, outputs: List[LiquidityEngineOutput]) -> pl.DataFrame:
+    def _extract_liquidity_features(
+        self, outputs: Union[List[LiquidityEngineOutput], pl.DataFrame]
+    ) -> pl.DataFrame:
         """Extract features from liquidity engine outputs.
         
         Args:
-            outputs: List of LiquidityEngineOutput
+            outputs: List of LiquidityEngineOutput, or a LiquidityEngineV1.run_history frame
             
         Returns:
             DataFrame with liquidity features
         """
-        rows = []
-        for output in outputs:
-            row = {
-                "liq_score": output.liquidity_score,
-                "liq_friction_cost": output.friction_cost,
-                "liq_kyle_lambda": output.kyle_lambda,
-                "liq_amihud": output.amihud,
-                "liq_orderbook_imbalance": output.orderbook_imbalance,
-                "liq_sweep_alerts": float(output.sweep_alerts),
-                "liq_iceberg_alerts": float(output.iceberg_alerts),
-                "liq_compression_energy": output.compression_energy,
-                "liq_expansion_energy": output.expansion_energy,
-                "liq_volume_strength": output.volume_strength,
-                "liq_buying_effort": output.buying_effort,
-                "liq_selling_effort": output.selling_effort,
-                "liq_off_exchange_ratio": output.off_exchange_ratio,
-                "liq_hidden_accumulation": output.hidden_accumulation,
-                "liq_wyckoff_energy": output.wyckoff_energy,
-                "liq_polr_direction": output.polr_direction,
-                "liq_polr_strength": output.polr_strength,
-                "liq_confidence": output.confidence,
-            }
-            
-            # Encode categorical
-            row["liq_wyckoff_phase"] = self._encode_wyckoff_phase(output.wyckoff_phase)
-            row["liq_regime"] = self._encode_liquidity_regime(output.liquidity_regime)
-            row["liq_regime_confidence"] = output.regime_confidence
+        if isinstance(outputs, pl.DataFrame):
+            return self._liquidity_history_features(outputs)
+        return pl.DataFrame([self._liquidity_feature_row(output) for output in outputs])
+    
+    def _liquidity_history_features(self, history: pl.DataFrame) -> pl.DataFrame:
+        """Extract liquidity features from a run_history frame, column-wise.
+        
+        Args:
+            history: LiquidityEngineV1.run_history output, one row per bar
             
-            # Zone counts (structural features)
-            row["liq_n_absorption_zones"] = len(output.absorption_zones)
-            row["liq_n_displacement_zones"] = len(output.displacement_zones)
-            row["liq_n_voids"] = len(output.voids)
+        Returns:
+            DataFrame with the same columns as _liquidity_feature_row
+        """
+        return history.select(
+            pl.col("liquidity_score").alias("liq_score"),
+            pl.col("friction_cost").alias("liq_friction_cost"),
+            pl.col("kyle_lambda").alias("liq_kyle_lambda"),
+            pl.col("amihud_illiquidity").alias("liq_amihud"),
+            pl.col("orderbook_imbalance").alias("liq_orderbook_imbalance"),
+            pl.col("sweep_detected").alias("liq_sweep_alerts"),
+            pl.col("iceberg_detected").alias("liq_iceberg_alerts"),
+            pl.col("compression_energy").alias("liq_compression_energy"),
+            pl.col("expansion_energy").alias("liq_expansion_energy"),
+            pl.col("volume_strength").alias("liq_volume_strength"),
+            pl.col("buying_effort").alias("liq_buying_effort"),
+            pl.col("selling_effort").alias("liq_selling_effort"),
+            pl.col("off_exchange_ratio").alias("liq_off_exchange_ratio"),
+            pl.col("hidden_accumulation").alias("liq_hidden_accumulation"),
+            pl.col("wyckoff_energy").alias("liq_wyckoff_energy"),
+            pl.col("polr_direction").alias("liq_polr_direction"),
+            pl.col("polr_strength").alias("liq_polr_strength"),
+            pl.col("confidence").alias("liq_confidence"),
+            self._encode_column(history["wyckoff_phase"], self._encode_wyckoff_phase)
+            .alias("liq_wyckoff_phase"),
+            self._encode_column(history["liquidity_regime"], self._encode_liquidity_regime)
+            .alias("liq_regime"),
+            pl.col("regime_confidence").alias("liq_regime_confidence"),
+            pl.col("num_absorption_zones").cast(pl.Int64).alias("liq_n_absorption_zones"),
+            pl.col("num_displacement_zones").cast(pl.Int64).alias("liq_n_displacement_zones"),
+            pl.col("num_voids").cast(pl.Int64).alias("liq_n_voids"),
+        )
+    
+    def _encode_column(self, values: pl.Series, encoder: Callable[[str], float]) -> pl.Expr:
+        """Apply a categorical encoder once per distinct value of a column."""
+        mapping = {value: encoder(value) for value in values.drop_nulls().unique()}
+        return pl.col(values.name).replace_strict(mapping, default=None, return_dtype=pl.Float64)
+    
+    def _liquidity_feature_row(self, output: LiquidityEngineOutput) -> Dict[str, Any]:
+        """Extract liquidity features for a single bar.
+        
+        Args:
+            output: LiquidityEngineOutput
             
-            rows.append(row)
+        Returns:
+            Dictionary of liquidity features
+        """
+        row = {
+            "liq_score": output.liquidity_score,
+            "liq_friction_cost": output.friction_cost,
+            "liq_kyle_lambda": output.kyle_lambda,
+            "liq_amihud": output.amihud,
+            "liq_orderbook_imbalance": output.orderbook_imbalance,
+            "liq_sweep_alerts": float(output.sweep_alerts),
+            "liq_iceberg_alerts": float(output.iceberg_alerts),
+            "liq_compression_energy": output.compression_energy,
+            "liq_expansion_energy": output.expansion_energy,
+            "liq_volume_strength": output.volume_strength,
+            "liq_buying_effort": output.buying_effort,
+            "liq_selling_effort": output.selling_effort,
+            "liq_off_exchange_ratio": output.off_exchange_ratio,
+            "liq_hidden_accumulation": output.hidden_accumulation,
+            "liq_wyckoff_energy": output.wyckoff_energy,
+            "liq_polr_direction": output.polr_direction,
+            "liq_polr_strength": output.polr_strength,
+            "liq_confidence": output.confidence,
+        }
+        
+        # Encode categorical
+        row["liq_wyckoff_phase"] = self._encode_wyckoff_phase(output.wyckoff_phase)
+        row["liq_regime"] = self._encode_liquidity_regime(output.liquidity_regime)
+        row["liq_regime_confidence"] = output.regime_confidence
+        
+        # Zone counts (structural features)
+        row["liq_n_absorption_zones"] = len(output.absorption_zones)
+        row["liq_n_displacement_zones"] = len(output.displacement_zones)
+        row["liq_n_voids"] = len(output.voids)
         
-        return pl.DataFrame(rows)
+        return row
     
     def _extract_sentiment_features(self, outputs: List[SentimentEnvelope]) -> pl.DataFrame:
         """Extract features from sentiment engine outputs.
@@ -239,34 +301,41 @@ class FeatureBuilder:
         Returns:
             DataFrame with sentiment features
         """
-        rows = []
-        for output in outputs:
-            row = {
-                "sent_bias": self._encode_sentiment_bias(output.bias),
-                "sent_strength": output.strength,
-                "sent_energy": output.energy,
-                "sent_confidence": output.confidence,
-                "sent_n_drivers": len(output.drivers),
-            }
-            
-            # Top driver strengths (pad with zeros if fewer than 5 drivers)
-            driver_values = sorted(output.drivers.values(), reverse=True)[:5]
-            for i in range(5):
-                row[f"sent_driver_{i+1}"] = driver_values[i] if i < len(driver_values) else 0.0
-            
-            # Optional regime encoding
-            if output.wyckoff_phase:
-                row["sent_wyckoff_phase"] = self._encode_wyckoff_phase(output.wyckoff_phase)
-            if output.liquidity_regime:
-                row["sent_liquidity_regime"] = self._encode_liquidity_regime(output.liquidity_regime)
-            if output.volatility_regime:
-                row["sent_volatility_regime"] = self._encode_volatility_regime(output.volatility_regime)
-            if output.flow_regime:
-                row["sent_flow_regime"] = self._encode_flow_regime(output.flow_regime)
+        return pl.DataFrame([self._sentiment_feature_row(output) for output in outputs])
+    
+    def _sentiment_feature_row(self, output: SentimentEnvelope) -> Dict[str, Any]:
+        """Extract sentiment features for a single bar.
+        
+        Args:
+            output: SentimentEnvelope
             
-            rows.append(row)
+        Returns:
+            Dictionary of sentiment features
+        """
+        row = {
+            "sent_bias": self._encode_sentiment_bias(output.bias),
+            "sent_strength": output.strength,
+            "sent_energy": output.energy,
+            "sent_confidence": output.confidence,
+            "sent_n_drivers": len(output.drivers),
+        }
         
-        return pl.DataFrame(rows)
+        # Top driver strengths (pad with zeros if fewer than 5 drivers)
+        driver_values = sorted(output.drivers.values(), reverse=True)[:5]
+        for i in range(5):
+            row[f"sent_driver_{i+1}"] = driver_values[i] if i < len(driver_values) else 0.0
+        
+        # Optional regime encoding
+        if output.wyckoff_phase:
+            row["sent_wyckoff_phase"] = self._encode_wyckoff_phase(output.wyckoff_phase)
+        if output.liquidity_regime:
+            row["sent_liquidity_regime"] = self._encode_liquidity_regime(output.liquidity_regime)
+        if output.volatility_regime:
+            row["sent_volatility_regime"] = self._encode_volatility_regime(output.volatility_regime)
+        if output.flow_regime:
+            row["sent_flow_regime"] = self._encode_flow_regime(output.flow_regime)
+        
+        return row
     
     def _merge_features(self, base_df: pl.DataFrame, new_df: pl.DataFrame, prefix: str) -> pl.DataFrame:
         """Merge feature DataFrames with validation.
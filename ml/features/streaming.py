@@ -0,0 +1,303 @@
+"""Streaming (online) feature computation for live bars.
+
+Mirrors FeatureBuilder.build_feature_frame one bar at a time: lag buffers,
+rolling-window moments and normalizer statistics are updated in O(1) per
+bar, and each update emits the same feature vector the batch builder
+would produce for the last row of the history seen so far.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from engines.hedge.models import HedgeEngineOutput
+from engines.liquidity.models import LiquidityEngineOutput
+from engines.sentiment.models import SentimentEnvelope
+from ml.features.builder import FeatureBuilder, FeatureConfig
+
+
+class _ColumnHistory:
+    """Ring buffer of one column's recent raw values with running window sums.
+
+    Sums are kept relative to the first value seen (shifted data), which
+    keeps the rolling variance numerically stable for price-like series.
+    Nulls and NaNs are counted instead of summed so they leave the window
+    cleanly.
+    """
+
+    def __init__(self, capacity: int, windows: List[int]):
+        self._values: List[Optional[float]] = [None] * capacity
+        self._capacity = capacity
+        self._count = 0
+        self._windows = windows
+        self._shift: Optional[float] = None
+        self._sum = {w: 0.0 for w in windows}
+        self._sumsq = {w: 0.0 for w in windows}
+        self._nulls = {w: 0 for w in windows}
+        self._nans = {w: 0 for w in windows}
+
+    def push(self, value: Optional[float]) -> None:
+        if self._shift is None and value is not None and not math.isnan(value):
+            self._shift = value
+
+        for w in self._windows:
+            self._account(w, value, +1)
+            if self._count >= w:
+                self._account(w, self.lag(w - 1), -1)
+
+        self._values[self._count % self._capacity] = value
+        self._count += 1
+
+    def _account(self, window: int, value: Optional[float], sign: int) -> None:
+        if value is None:
+            self._nulls[window] += sign
+        elif math.isnan(value):
+            self._nans[window] += sign
+        else:
+            x = value - self._shift
+            self._sum[window] += sign * x
+            self._sumsq[window] += sign * x * x
+
+    def lag(self, k: int) -> Optional[float]:
+        """Value pushed k bars ago (0 = latest), None if not available yet."""
+        if k >= self._count:
+            return None
+        return self._values[(self._count - 1 - k) % self._capacity]
+
+    def rolling_mean_std(self, window: int) -> tuple[Optional[float], Optional[float]]:
+        """Rolling mean and sample std over the last ``window`` values."""
+        if self._count < window or self._nulls[window] > 0:
+            return None, None
+        if self._nans[window] > 0:
+            return math.nan, math.nan
+
+        mean = self._sum[window] / window
+        std = None
+        if window > 1:
+            var = (self._sumsq[window] - self._sum[window] * mean) / (window - 1)
+            std = math.sqrt(max(var, 0.0))
+        return mean + self._shift, std
+
+
+class _RunningNormalizer:
+    """Running statistics for one output column (z-score or min-max)."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def zscore(self, value: float) -> float:
+        if self.n < 2:
+            return value
+        std = math.sqrt(self.m2 / (self.n - 1))
+        if std > 1e-8:
+            return (value - self.mean) / std
+        return value
+
+    def minmax(self, value: float) -> float:
+        if self.max != self.min:
+            return (value - self.min) / (self.max - self.min)
+        return value
+
+
+class StreamingFeatureBuilder:
+    """Online counterpart of FeatureBuilder for live bars.
+
+    Usage:
+        state = StreamingFeatureBuilder(config)
+        for bar in stream:
+            x = state.update(bar, hedge_output, liquidity_output, sentiment_output)
+
+    Limitations (inherent to a causal, single-pass computation):
+    - ``fill_method`` must be "forward" or "zero"; "backward" and "mean"
+      look at future rows
+    - ``normalization_method="robust"`` needs running quantiles and is
+      not supported
+    - The column set (and which columns are integers, which the batch
+      builder excludes from rolling features) is fixed by the first bar
+    """
+
+    def __init__(self, config: FeatureConfig | None = None):
+        """Initialize streaming feature state.
+
+        Args:
+            config: Feature building configuration (same as the batch builder)
+        """
+        self.config = config or FeatureConfig()
+
+        if self.config.fill_method not in ("forward", "zero"):
+            raise ValueError(
+                f"fill_method={self.config.fill_method!r} needs future rows; "
+                "streaming supports 'forward' and 'zero'"
+            )
+        if self.config.normalize_features and self.config.normalization_method == "robust":
+            raise ValueError("Robust normalization is not supported in streaming mode")
+
+        self._builder = FeatureBuilder(self.config)
+        self._base_names: List[str] = []
+        self._lag_cols: List[str] = []
+        self._rolling_cols: List[str] = []
+        self._histories: Dict[str, _ColumnHistory] = {}
+        self._feature_names: List[str] = []
+        self._last_valid: List[Optional[float]] = []
+        self._normalizers: List[_RunningNormalizer] = []
+        self.n_bars = 0
+
+    def update(
+        self,
+        bar: Dict[str, Any],
+        hedge_output: Optional[HedgeEngineOutput] = None,
+        liquidity_output: Optional[LiquidityEngineOutput] = None,
+        sentiment_output: Optional[SentimentEnvelope] = None,
+    ) -> np.ndarray:
+        """Add one bar and return its feature vector.
+
+        Args:
+            bar: Dictionary with open, high, low, close, volume
+            hedge_output: Optional hedge engine output for this bar
+            liquidity_output: Optional liquidity engine output for this bar
+            sentiment_output: Optional sentiment envelope for this bar
+
+        Returns:
+            Feature vector ordered like ``feature_names``
+        """
+        raw = self._ohlcv_feature_row(bar)
+
+        if self.config.include_hedge and hedge_output is not None:
+            raw.update(self._builder._hedge_feature_row(hedge_output))
+        if self.config.include_liquidity and liquidity_output is not None:
+            raw.update(self._builder._liquidity_feature_row(liquidity_output))
+        if self.config.include_sentiment and sentiment_output is not None:
+            raw.update(self._builder._sentiment_feature_row(sentiment_output))
+
+        if self.n_bars == 0:
+            int_columns = {
+                col for col, value in {**raw, **bar}.items()
+                if isinstance(value, int) and not isinstance(value, bool)
+            }
+            self._init_columns(list(raw), int_columns)
+
+        base = [self._as_float(raw.get(col)) for col in self._base_names]
+        for col, value in zip(self._base_names, base):
+            history = self._histories.get(col)
+            if history is not None:
+                history.push(value)
+
+        values: List[Optional[float]] = list(base)
+
+        for col in self._lag_cols:
+            history = self._histories[col]
+            for lag in self.config.lag_periods:
+                values.append(history.lag(lag))
+
+        for col in self._rolling_cols:
+            history = self._histories[col]
+            for window in self.config.rolling_windows:
+                values.extend(history.rolling_mean_std(window))
+
+        out = np.empty(len(values))
+        for j, value in enumerate(values):
+            # Missing values: forward fill, then zero (same order as the batch path)
+            if value is None:
+                if self.config.fill_method == "forward" and self._last_valid[j] is not None:
+                    value = self._last_valid[j]
+                else:
+                    value = 0.0
+            else:
+                self._last_valid[j] = value
+
+            if self.config.normalize_features:
+                normalizer = self._normalizers[j]
+                normalizer.update(value)
+                if self.config.normalization_method == "zscore":
+                    value = normalizer.zscore(value)
+                else:
+                    value = normalizer.minmax(value)
+
+            out[j] = value
+
+        self.n_bars += 1
+        return out
+
+    def update_dict(self, bar: Dict[str, Any], **engine_outputs: Any) -> Dict[str, float]:
+        """Like ``update`` but returns a name -> value mapping."""
+        values = self.update(bar, **engine_outputs)
+        return dict(zip(self._feature_names, values.tolist()))
+
+    def _init_columns(self, base_names: List[str], int_columns: set) -> None:
+        """Fix the column layout from the first bar (mirrors the batch builder)."""
+        self._base_names = base_names
+
+        # Same selection and limits as FeatureBuilder: lags use every numeric
+        # column, rolling windows only float columns
+        if self.config.add_lag_features:
+            self._lag_cols = base_names[:20]
+        if self.config.add_rolling_features:
+            self._rolling_cols = [col for col in base_names if col not in int_columns][:15]
+
+        max_window = max(self.config.rolling_windows, default=1) if self._rolling_cols else 1
+        max_lag = max(self.config.lag_periods, default=0) if self._lag_cols else 0
+        capacity = max(max_window, max_lag + 1)
+        windows = list(self.config.rolling_windows) if self._rolling_cols else []
+
+        for col in dict.fromkeys(self._lag_cols + self._rolling_cols):
+            self._histories[col] = _ColumnHistory(
+                capacity, windows if col in self._rolling_cols else []
+            )
+
+        names = list(base_names)
+        for col in self._lag_cols:
+            names.extend(f"{col}_lag{lag}" for lag in self.config.lag_periods)
+        for col in self._rolling_cols:
+            for window in self.config.rolling_windows:
+                names.extend([f"{col}_ma{window}", f"{col}_std{window}"])
+
+        self._feature_names = names
+        self._last_valid = [None] * len(names)
+        self._normalizers = [_RunningNormalizer() for _ in names]
+
+    @staticmethod
+    def _ohlcv_feature_row(bar: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        """Scalar version of FeatureBuilder._build_ohlcv_features."""
+        o = np.float64(bar["open"])
+        h = np.float64(bar["high"])
+        lo = np.float64(bar["low"])
+        c = np.float64(bar["close"])
+        v = np.float64(bar["volume"])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "open": float(o),
+                "high": float(h),
+                "low": float(lo),
+                "close": float(c),
+                "volume": float(v),
+                "range_pct": float((h - lo) / c),
+                "body_pct": float((c - o) / o),
+                "upper_wick_ratio": float((h - max(c, o)) / (h - lo + 1e-8)),
+                "lower_wick_ratio": float((min(c, o) - lo) / (h - lo + 1e-8)),
+                "log_volume": float(np.log1p(v)),
+            }
+
+    @staticmethod
+    def _as_float(value: Any) -> Optional[float]:
+        return None if value is None else float(value)
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Feature names in output order (available after the first update)."""
+        return self._feature_names
@@ -134,8 +134,8 @@ class TechnicalIndicators:
         delta = df[price_col].diff()
         
         # Separate gains and losses
-        gains = delta.clip_min(0)
-        losses = (-delta).clip_min(0)
+        gains = delta.clip(lower_bound=0)
+        losses = (-delta).clip(lower_bound=0)
         
         # Calculate average gains and losses
         avg_gain = gains.rolling_mean(window_size=self.config.rsi_period)
@@ -170,14 +170,7 @@ class TechnicalIndicators:
         high_close = (df["high"] - df["close"].shift(1)).abs()
         low_close = (df["low"] - df["close"].shift(1)).abs()
         
-        # Stack and take maximum
-        tr = pl.concat([
-            high_low.to_frame("tr"),
-            high_close.to_frame("tr"),
-            low_close.to_frame("tr"),
-        ]).group_by(pl.int_range(len(df)).alias("idx") % len(df)).agg(pl.col("tr").max())
-        
-        # Simple approach: max of the three
+        # Max of the three
         tr_values = []
         for i in range(len(df)):
             tr_val = max(
@@ -331,13 +324,11 @@ class TechnicalIndicators:
         high_diff = df["high"].diff()
         low_diff = -df["low"].diff()
         
-        plus_dm = (pl.when(high_diff > low_diff)
-                   .then(high_diff.clip_min(0))
-                   .otherwise(pl.lit(0.0)))
+        high_diff = high_diff.fill_null(0.0).to_numpy()
+        low_diff = low_diff.fill_null(0.0).to_numpy()
         
-        minus_dm = (pl.when(low_diff > high_diff)
-                    .then(low_diff.clip_min(0))
-                    .otherwise(pl.lit(0.0)))
+        plus_dm = np.where(high_diff > low_diff, np.maximum(high_diff, 0.0), 0.0)
+        minus_dm = np.where(low_diff > high_diff, np.maximum(low_diff, 0.0), 0.0)
         
         # Calculate TR (True Range) - reuse from ATR
         high_low = df["high"] - df["low"]
@@ -365,10 +356,10 @@ class TechnicalIndicators:
         minus_di = 100 * smoothed_minus_dm / (smoothed_tr + 1e-8)
         
         # Calculate DX
-        dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di + 1e-8)
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-8)
         
         # ADX is smoothed DX
-        adx = self._wilder_smooth(pl.Series("_dx", dx), period)
+        adx = self._wilder_smooth(dx, period)
         
         result = df.with_columns([
             pl.Series("tech_adx", adx),
@@ -378,57 +369,62 @@ class TechnicalIndicators:
         
         return result
     
-    def _ema(self, series: pl.Series, period: int) -> list[float]:
+    def _ema(self, series: pl.Series | np.ndarray, period: int) -> np.ndarray:
         """Calculate Exponential Moving Average.
         
+        Leading NaNs (e.g. the warm-up of another EMA) are skipped, so the
+        EMA is seeded from the first ``period`` valid values.
+        
         Args:
             series: Price series
             period: EMA period
             
         Returns:
-            List of EMA values
+            Array of EMA values
         """
-        values = series.to_numpy()
-        ema = np.zeros_like(values, dtype=float)
+        values = np.asarray(series, dtype=float)
+        ema = np.full_like(values, np.nan)
+        start = self._first_valid(values)
         
         # Alpha (smoothing factor)
         alpha = 2.0 / (period + 1)
         
         # Initialize with SMA
-        if len(values) >= period:
-            ema[period - 1] = np.mean(values[:period])
+        if len(values) - start >= period:
+            ema[start + period - 1] = np.mean(values[start:start + period])
             
             # Calculate EMA
-            for i in range(period, len(values)):
+            for i in range(start + period, len(values)):
                 ema[i] = alpha * values[i] + (1 - alpha) * ema[i - 1]
         
-        # Fill leading NaNs
-        ema[:period - 1] = np.nan
-        
-        return ema.tolist()
+        return ema
     
-    def _wilder_smooth(self, series: pl.Series, period: int) -> list[float]:
+    def _wilder_smooth(self, series: pl.Series | np.ndarray, period: int) -> np.ndarray:
         """Wilder's smoothing (used in ADX calculation).
         
         Args:
-            series: Input series
+            series: Input series (leading NaNs are skipped)
             period: Smoothing period
             
         Returns:
-            List of smoothed values
+            Array of smoothed values
         """
-        values = series.to_numpy()
-        smoothed = np.zeros_like(values, dtype=float)
+        values = np.asarray(series, dtype=float)
+        smoothed = np.full_like(values, np.nan)
+        start = self._first_valid(values)
         
-        if len(values) >= period:
+        if len(values) - start >= period:
             # Initialize with sum of first period values
-            smoothed[period - 1] = np.sum(values[:period])
+            smoothed[start + period - 1] = np.sum(values[start:start + period])
             
             # Apply Wilder's smoothing
-            for i in range(period, len(values)):
+            for i in range(start + period, len(values)):
                 smoothed[i] = smoothed[i - 1] - (smoothed[i - 1] / period) + values[i]
         
-        # Fill leading values
-        smoothed[:period - 1] = np.nan
-        
-        return smoothed.tolist()
+        return smoothed
+    
+    @staticmethod
+    def _first_valid(values: np.ndarray) -> int:
+        """Index of the first non-NaN value (len(values) if none)."""
+        valid = ~np.isnan(values)
+        return int(valid.argmax()) if valid.any() else len(values)
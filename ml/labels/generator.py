@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Literal
-import numpy as np
+from typing import Callable, Dict, List, Optional
+
 import polars as pl
 from pydantic import BaseModel, Field
 
@@ -68,12 +68,25 @@ class LabelGenerator:
         """
         self.config = config or LabelConfig()
     
-    def generate(self, df: pl.DataFrame, price_col: str = "close") -> pl.DataFrame:
+    def generate(
+        self,
+        df: pl.DataFrame,
+        price_col: str = "close",
+        symbol_col: Optional[str] = None,
+    ) -> pl.DataFrame:
         """Generate all labels from price time series.
         
+        Every horizon is compiled into a single lazy Polars plan: log prices
+        and one-bar returns are computed once and shared, and each forward
+        return is a difference of cumulative log returns.
+        
         Args:
             df: DataFrame with OHLCV data and timestamp
             price_col: Column name for price (default: "close")
+            symbol_col: Optional symbol column for a stacked multi-symbol
+                frame (rows sorted by time within each symbol, symbols may
+                be interleaved). Labels are computed per symbol, same as
+                calling generate on each one, and rows keep their order.
             
         Returns:
             DataFrame with original data + all label columns
@@ -81,149 +94,169 @@ class LabelGenerator:
         if df.is_empty():
             return df
         
-        result = df.clone()
+        horizons = self.config.horizons
+        price = pl.col(price_col)
+        plan = df.lazy()
         
-        # Generate labels for each horizon
-        for horizon in self.config.horizons:
-            # 1. Forward returns
-            forward_return_col = f"return_{horizon}"
-            result = result.with_columns([
-                (
-                    (pl.col(price_col).shift(-horizon) - pl.col(price_col)) 
-                    / pl.col(price_col)
-                ).alias(forward_return_col)
+        if symbol_col is None:
+            lengths = [len(df)]
+            row = length = None
+        else:
+            lengths = df.get_column(symbol_col).value_counts().get_column("count").to_list()
+            # Make each symbol's rows contiguous (stable sort keeps time order)
+            # and note the input order to restore at the end
+            plan = plan.with_row_index("_order").sort(symbol_col, maintain_order=True)
+            # Position in and length of each symbol's series, computed once:
+            # shifts and rolling windows then run over the whole column and
+            # are masked where they would reach into a neighbouring symbol
+            plan = plan.with_columns([
+                pl.int_range(pl.len()).over(symbol_col).alias("_row"),
+                pl.len().over(symbol_col).alias("_len"),
             ])
+            row, length = pl.col("_row"), pl.col("_len")
+        
+        def shift(expr: pl.Expr, n: int) -> pl.Expr:
+            if row is None:
+                return expr.shift(n)
+            inside = row >= n if n > 0 else row - n < length
+            return pl.when(inside).then(expr.shift(n))
+        
+        # 1. Shared kernels: cumulative log return (log price) and one-bar returns
+        previous_price = shift(price, 1)
+        plan = plan.with_columns([
+            price.log().alias("_log_price"),
+            ((price - previous_price) / previous_price).alias("_return"),
+        ])
+        
+        # 2. Forward returns for every horizon from the cumulative log return
+        plan = plan.with_columns([
+            ((shift(pl.col("_log_price"), -horizon) - pl.col("_log_price")).exp() - 1)
+            .alias(f"return_{horizon}")
+            for horizon in horizons
+        ])
+        
+        # 3. Direction, volatility-adjusted returns and forward realized volatility
+        stage = []
+        for horizon in horizons:
+            forward_return = pl.col(f"return_{horizon}")
             
-            # 2. Direction labels (±1)
-            direction_col = f"direction_{horizon}"
-            result = result.with_columns([
-                pl.when(pl.col(forward_return_col) > 0)
+            stage.append(
+                pl.when(forward_return > 0)
                   .then(pl.lit(1))
-                  .when(pl.col(forward_return_col) < 0)
+                  .when(forward_return < 0)
                   .then(pl.lit(-1))
                   .otherwise(pl.lit(0))
                   .cast(pl.Int32)
-                  .alias(direction_col)
-            ])
+                  .alias(f"direction_{horizon}")
+            )
             
-            # 3. Magnitude labels (volatility-adjusted percentiles)
-            magnitude_col = f"magnitude_{horizon}"
-            result = self._generate_magnitude_labels(
-                result, forward_return_col, magnitude_col, horizon
+            # Trailing dispersion of |forward return| (window scales with series length)
+            rolling_vol = self._rolling_std(
+                forward_return.abs(),
+                lambda n: max(2, min(self.config.vol_window, n // 4)),
+                lengths,
+                row,
+                length,
+            )
+            stage.append(
+                (forward_return.abs() / (rolling_vol + 1e-8)).fill_nan(None)
+                .alias(f"_vol_adjusted_{horizon}")
             )
             
-            # 4. Forward realized volatility
-            volatility_col = f"volatility_{horizon}"
-            result = self._generate_volatility_labels(
-                result, price_col, volatility_col, horizon
+            # Forward-looking rolling standard deviation of one-bar returns
+            stage.append(
+                self._rolling_std(
+                    shift(pl.col("_return"), -horizon),
+                    lambda n, horizon=horizon: min(horizon, n // 4),
+                    lengths,
+                    row,
+                    length,
+                ).alias(f"volatility_{horizon}")
             )
+        plan = plan.with_columns(stage)
         
-        return result
+        # 4. Magnitude buckets from (per-symbol) percentiles of the adjusted
+        #    returns; thresholds get their own stage so each quantile sorts once
+        def per_symbol(expr: pl.Expr) -> pl.Expr:
+            return expr if symbol_col is None else expr.over(symbol_col)
+        
+        plan = plan.with_columns([
+            per_symbol(pl.col(f"_vol_adjusted_{horizon}").quantile(q / 100, interpolation="linear"))
+            .alias(f"_p{q}_{horizon}")
+            for horizon in horizons
+            for q in (33, 67)
+        ])
+        plan = plan.with_columns([
+            self._magnitude_expr(
+                pl.col(f"_vol_adjusted_{horizon}"), pl.col(f"_p33_{horizon}"), pl.col(f"_p67_{horizon}")
+            ).alias(f"magnitude_{horizon}")
+            for horizon in horizons
+        ])
+        
+        label_cols = [
+            f"{kind}_{horizon}"
+            for horizon in horizons
+            for kind in ("return", "direction", "magnitude", "volatility")
+        ]
+        base_cols = [col for col in df.columns if col not in label_cols]
+        
+        if symbol_col is not None:
+            plan = plan.sort("_order")
+        return plan.select(base_cols + label_cols).collect()
     
-    def _generate_magnitude_labels(
-        self, 
-        df: pl.DataFrame, 
-        return_col: str, 
-        magnitude_col: str,
-        horizon: int
-    ) -> pl.DataFrame:
-        """Generate volatility-adjusted magnitude labels.
+    def _magnitude_expr(self, vol_adjusted: pl.Expr, p33: pl.Expr, p67: pl.Expr) -> pl.Expr:
+        """Classify volatility-adjusted absolute returns into magnitude buckets.
         
         Magnitude categories:
         - 0: small move (bottom 33rd percentile of |return| / recent_vol)
         - 1: medium move (33rd-67th percentile)
         - 2: large move (top 33rd percentile)
         
-        Args:
-            df: DataFrame with return column
-            return_col: Name of return column
-            magnitude_col: Name for output magnitude column
-            horizon: Forecast horizon
-            
-        Returns:
-            DataFrame with magnitude column added
+        Rows without a valid adjusted return fall into the top bucket; a
+        series with no valid values at all is labelled medium.
         """
-        # Calculate rolling realized volatility
-        vol_window = min(self.config.vol_window, len(df) // 4)
-        if vol_window < 2:
-            vol_window = 2
-            
-        df_with_vol = df.with_columns([
-            pl.col(return_col)
-              .abs()
-              .rolling_std(window_size=vol_window)
-              .alias("_rolling_vol")
-        ])
-        
-        # Volatility-adjusted absolute return
-        df_with_vol = df_with_vol.with_columns([
-            (pl.col(return_col).abs() / (pl.col("_rolling_vol") + 1e-8))
-            .alias("_vol_adjusted_return")
-        ])
-        
-        # Calculate percentile thresholds
-        vol_adjusted = df_with_vol.select("_vol_adjusted_return").to_numpy().flatten()
-        vol_adjusted = vol_adjusted[~np.isnan(vol_adjusted)]
-        
-        if len(vol_adjusted) == 0:
-            # No valid data, assign all to medium
-            return df.with_columns([pl.lit(1).cast(pl.Int32).alias(magnitude_col)])
-        
-        p33 = float(np.percentile(vol_adjusted, 33))
-        p67 = float(np.percentile(vol_adjusted, 67))
-        
-        # Classify into magnitude buckets
-        df_result = df_with_vol.with_columns([
-            pl.when(pl.col("_vol_adjusted_return") <= p33)
+        return (
+            pl.when(p33.is_null())
+              .then(pl.lit(1))  # no valid data
+              .when(vol_adjusted <= p33)
               .then(pl.lit(0))  # small
-              .when(pl.col("_vol_adjusted_return") <= p67)
+              .when(vol_adjusted <= p67)
               .then(pl.lit(1))  # medium
               .otherwise(pl.lit(2))  # large
               .cast(pl.Int32)
-              .alias(magnitude_col)
-        ])
-        
-        # Drop temporary columns
-        df_result = df_result.drop(["_rolling_vol", "_vol_adjusted_return"])
-        
-        return df_result
+        )
     
-    def _generate_volatility_labels(
-        self,
-        df: pl.DataFrame,
-        price_col: str,
-        volatility_col: str,
-        horizon: int
-    ) -> pl.DataFrame:
-        """Generate forward realized volatility labels.
+    @staticmethod
+    def _rolling_std(
+        expr: pl.Expr,
+        window_for_length: Callable[[int], int],
+        lengths: List[int],
+        row: Optional[pl.Expr],
+        length: Optional[pl.Expr],
+    ) -> pl.Expr:
+        """Rolling std whose window depends on the length of each series.
         
-        Args:
-            df: DataFrame with price column
-            price_col: Name of price column
-            volatility_col: Name for output volatility column
-            horizon: Forecast horizon
-            
-        Returns:
-            DataFrame with volatility column added
+        Polars needs a literal window, so one rolling kernel is emitted per
+        distinct window (normally just one) and selected by series length.
+        With ``row`` (position within a symbol's series), windows that would
+        start in the previous symbol are nulled.
         """
-        # Calculate returns for rolling window
-        df_with_returns = df.with_columns([
-            (pl.col(price_col).pct_change()).alias("_return")
-        ])
+        windows: Dict[int, List[int]] = {}
+        for n in lengths:
+            windows.setdefault(window_for_length(n), []).append(n)
         
-        # Forward-looking rolling standard deviation
-        # Shift the window to look forward, not backward
-        df_result = df_with_returns.with_columns([
-            pl.col("_return")
-              .shift(-horizon)
-              .rolling_std(window_size=min(horizon, len(df) // 4))
-              .alias(volatility_col)
-        ])
+        def rolling(window: int) -> pl.Expr:
+            result = expr.rolling_std(window_size=window)
+            return result if row is None else pl.when(row >= window - 1).then(result)
         
-        # Drop temporary column
-        df_result = df_result.drop(["_return"])
+        if len(windows) == 1:
+            return rolling(next(iter(windows)))
         
-        return df_result
+        items = list(windows.items())
+        result = pl.when(length.is_in(items[0][1])).then(rolling(items[0][0]))
+        for window, window_lengths in items[1:]:
+            result = result.when(length.is_in(window_lengths)).then(rolling(window))
+        return result
     
     def generate_label_set(self, df: pl.DataFrame, price_col: str = "close") -> LabelSet:
         """Generate labels and return as structured LabelSet.
@@ -242,32 +275,18 @@ class LabelGenerator:
             n_horizons=len(self.config.horizons)
         )
         
+        targets = {
+            "return": label_set.forward_returns,
+            "direction": label_set.directions,
+            "magnitude": label_set.magnitudes,
+            "volatility": label_set.volatilities,
+        }
+        
         for horizon in self.config.horizons:
-            # Extract labels for this horizon
-            return_col = f"return_{horizon}"
-            direction_col = f"direction_{horizon}"
-            magnitude_col = f"magnitude_{horizon}"
-            volatility_col = f"volatility_{horizon}"
-            
-            if return_col in df_with_labels.columns:
-                label_set.forward_returns[return_col] = (
-                    df_with_labels.select(return_col).to_series().to_list()
-                )
-            
-            if direction_col in df_with_labels.columns:
-                label_set.directions[direction_col] = (
-                    df_with_labels.select(direction_col).to_series().to_list()
-                )
-            
-            if magnitude_col in df_with_labels.columns:
-                label_set.magnitudes[magnitude_col] = (
-                    df_with_labels.select(magnitude_col).to_series().to_list()
-                )
-            
-            if volatility_col in df_with_labels.columns:
-                label_set.volatilities[volatility_col] = (
-                    df_with_labels.select(volatility_col).to_series().to_list()
-                )
+            for kind, target in targets.items():
+                col = f"{kind}_{horizon}"
+                if col in df_with_labels.columns:
+                    target[col] = df_with_labels.get_column(col).to_list()
         
         return label_set
     
@@ -1,5 +1,7 @@
 """Model persistence with versioning and drift detection."""
 
+from ml.persistence.cache import ModelCache
+from ml.persistence.drift import DriftMonitor, DriftReference
 from ml.persistence.manager import ModelManager, ModelMetadata
 
-__all__ = ["ModelManager", "ModelMetadata"]
+__all__ = ["ModelManager", "ModelMetadata", "ModelCache", "DriftMonitor", "DriftReference"]
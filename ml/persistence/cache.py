@@ -0,0 +1,302 @@
+"""Bounded LRU model cache with background prefetch and hot-swap."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ml.persistence.manager import ModelManager, ModelMetadata
+
+TASKS = ("direction", "magnitude", "volatility")
+
+CacheKey = Tuple[str, str, int]  # (symbol, task, horizon)
+
+
+@dataclass
+class _CacheEntry:
+    """A loaded model plus bookkeeping for eviction and refresh."""
+
+    model: Any
+    metadata: ModelMetadata
+    size_bytes: int
+    checked_at: float
+
+
+class ModelCache:
+    """Size-bounded LRU cache of loaded models.
+
+    - Evicts least-recently-used models beyond ``max_entries`` or ``max_bytes``
+      (model size is estimated from the file size on disk)
+    - Prefetches models on a background thread pool so cold loads happen
+      off the trading tick
+    - Hot-swaps a cached model when a newer version is published: in-process
+      saves are pushed by the ModelManager save listener, saves from other
+      processes are picked up by polling ``latest_version`` at most every
+      ``refresh_interval_seconds`` per entry. The new model is fully loaded
+      before the entry is replaced, so readers see either version, never a
+      partial one.
+    """
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = None,
+        refresh_interval_seconds: float = 30.0,
+        prefetch_workers: int = 2,
+    ):
+        """Initialize model cache.
+
+        Args:
+            model_manager: Manager used to locate and load models
+            max_entries: Maximum number of cached models
+            max_bytes: Optional bound on the summed on-disk model size
+            refresh_interval_seconds: Minimum seconds between version checks per entry
+            prefetch_workers: Background loader threads
+        """
+        self.model_manager = model_manager
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.prefetch_workers = prefetch_workers
+
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.swaps = 0
+
+        model_manager.add_save_listener(self._on_model_saved)
+
+    def get(self, symbol: str, task: str, horizon: int) -> tuple[Any, ModelMetadata]:
+        """Return (model, metadata), loading on a miss.
+
+        Raises:
+            FileNotFoundError: If no model exists for the key
+        """
+        key = (symbol, task, horizon)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                refresh_due = time.monotonic() - entry.checked_at >= self.refresh_interval_seconds
+            else:
+                self.misses += 1
+
+        if entry is None:
+            return self._load_or_wait(key)
+
+        if refresh_due:
+            entry = self._refresh_entry(key, entry)
+
+        return entry.model, entry.metadata
+
+    def prefetch(
+        self,
+        symbols: Iterable[str],
+        horizons: Iterable[int],
+        tasks: Iterable[str] = TASKS,
+    ) -> List[Future]:
+        """Load models in the background (e.g. for the scanner's top-N symbols).
+
+        Already-cached and already-loading keys are skipped. Missing models
+        resolve their future with FileNotFoundError rather than raising.
+
+        Returns:
+            Futures for the scheduled loads
+        """
+        futures = []
+        horizons = list(horizons)
+        tasks = list(tasks)
+
+        for symbol in symbols:
+            for horizon in horizons:
+                for task in tasks:
+                    key = (symbol, task, horizon)
+                    with self._lock:
+                        if key in self._entries or key in self._inflight:
+                            continue
+                        future: Future = Future()
+                        self._inflight[key] = future
+                    self._get_executor().submit(self._load_into, key, future)
+                    futures.append(future)
+
+        return futures
+
+    def refresh(self) -> int:
+        """Check every cached model for a newer version now.
+
+        Returns:
+            Number of models swapped
+        """
+        with self._lock:
+            items = list(self._entries.items())
+
+        swaps_before = self.swaps
+        for key, entry in items:
+            self._refresh_entry(key, entry)
+        return self.swaps - swaps_before
+
+    def invalidate(self, symbol: str, task: Optional[str] = None, horizon: Optional[int] = None) -> int:
+        """Drop cached models for a symbol (optionally one task/horizon).
+
+        Returns:
+            Number of models dropped
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if key[0] == symbol
+                and (task is None or key[1] == task)
+                and (horizon is None or key[2] == horizon)
+            ]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached models."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "swaps": self.swaps,
+                "inflight": len(self._inflight),
+            }
+
+    def close(self) -> None:
+        """Stop the prefetch pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers,
+                    thread_name_prefix="model-prefetch",
+                )
+            return self._executor
+
+    def _load_or_wait(self, key: CacheKey) -> tuple[Any, ModelMetadata]:
+        """Load a missing key, or wait for an in-flight load of it."""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if owner:
+            self._load_into(key, future)
+
+        entry = future.result()
+        return entry.model, entry.metadata
+
+    def _load_into(self, key: CacheKey, future: Future) -> None:
+        """Load key from disk, insert it and resolve the future."""
+        try:
+            entry = self._load_entry(key)
+            with self._lock:
+                self._insert(key, entry)
+            future.set_result(entry)
+        except BaseException as exc:  # propagate to every waiter
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _load_entry(self, key: CacheKey, version: Optional[str] = None) -> _CacheEntry:
+        symbol, task, horizon = key
+        model, metadata = self.model_manager.load_model(symbol, task, horizon, version=version)
+
+        try:
+            size_bytes = Path(metadata.model_path).stat().st_size
+        except OSError:
+            size_bytes = 0
+
+        return _CacheEntry(model, metadata, size_bytes, time.monotonic())
+
+    def _refresh_entry(self, key: CacheKey, entry: _CacheEntry) -> _CacheEntry:
+        """Swap in a newer version of key if one has been published."""
+        symbol, task, horizon = key
+        latest = self.model_manager.latest_version(symbol, task, horizon)
+
+        if latest is None or latest == entry.metadata.version:
+            entry.checked_at = time.monotonic()
+            return entry
+
+        new_entry = self._load_entry(key, version=latest)
+        with self._lock:
+            # Only swap if nobody replaced or evicted the entry meanwhile
+            if self._entries.get(key) is entry:
+                self._insert(key, new_entry)
+                self.swaps += 1
+        return new_entry
+
+    def _insert(self, key: CacheKey, entry: _CacheEntry) -> None:
+        """Insert or replace an entry and enforce bounds (lock held)."""
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = entry
+        self._total_bytes += entry.size_bytes
+
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size_bytes
+
+    def _on_model_saved(self, metadata: ModelMetadata) -> None:
+        """Hot-swap a cached model when a newer version is saved in-process."""
+        key = (metadata.symbol, metadata.task, metadata.horizon)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or key in self._inflight:
+                return
+
+        def swap():
+            try:
+                self._refresh_entry(key, entry)
+            except Exception:
+                pass  # keep serving the current version; polling retries later
+
+        self._get_executor().submit(swap)
@@ -0,0 +1,188 @@
+"""Streaming feature drift monitoring with vectorized PSI."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Floor for bin proportions so empty bins do not blow up the log ratio
+PSI_EPSILON = 1e-4
+
+
+class DriftReference(BaseModel):
+    """Training-time feature distribution stored with the model metadata.
+    
+    Each feature is binned by its training quantiles; ``expected`` holds the
+    training proportion of each bin.
+    """
+    
+    feature_names: List[str] = Field(default_factory=list)
+    bin_edges: List[List[float]]  # n_features x (n_bins - 1) interior edges
+    expected: List[List[float]]  # n_features x n_bins training proportions
+    n_samples: int = 0
+    
+    @classmethod
+    def from_training(
+        cls,
+        X: np.ndarray,
+        feature_names: Optional[List[str]] = None,
+        n_bins: int = 10,
+    ) -> "DriftReference":
+        """Compute quantile bin edges and proportions from training features.
+        
+        Args:
+            X: Training feature matrix (may be a memmap)
+            feature_names: Feature names
+            n_bins: Bins per feature
+            
+        Returns:
+            DriftReference
+        """
+        quantiles = np.linspace(0.0, 1.0, n_bins + 1)[1:-1]
+        edges = np.empty((X.shape[1], n_bins - 1))
+        expected = np.empty((X.shape[1], n_bins))
+        
+        # One column at a time keeps memory flat for large (memmapped) X
+        for j in range(X.shape[1]):
+            column = np.asarray(X[:, j], dtype=np.float64)
+            column = column[~np.isnan(column)]
+            if len(column) == 0:
+                edges[j] = 0.0
+                expected[j] = 1.0 / n_bins
+                continue
+            edges[j] = np.quantile(column, quantiles)
+            counts = np.bincount(np.searchsorted(edges[j], column), minlength=n_bins)
+            expected[j] = counts / counts.sum()
+        
+        return cls(
+            feature_names=list(feature_names or []),
+            bin_edges=edges.tolist(),
+            expected=expected.tolist(),
+            n_samples=len(X),
+        )
+
+
+class DriftMonitor:
+    """Live per-feature histograms against a training reference.
+    
+    - ``update`` bins one prediction row (or a batch) with a single
+      vectorized comparison against all bin edges: O(features x bins)
+    - Counts decay exponentially so the histogram tracks roughly the last
+      ``window`` observations (``window=None`` keeps all of them)
+    - ``psi`` computes PSI for every feature in one array operation;
+      ``status`` is cheap enough to poll for alarms
+    """
+    
+    def __init__(
+        self,
+        reference: DriftReference,
+        window: Optional[int] = 5000,
+        threshold: float = 0.2,
+        min_observations: int = 100,
+    ):
+        """Initialize drift monitor.
+        
+        Args:
+            reference: Training distribution (bin edges and proportions)
+            window: Effective number of recent observations (None = cumulative)
+            threshold: PSI threshold for drift detection
+            min_observations: Observations required before drift is reported
+        """
+        self.reference = reference
+        self.threshold = threshold
+        self.min_observations = min_observations
+        self.decay = 1.0 if window is None else 1.0 - 1.0 / window
+        
+        self._edges = np.asarray(reference.bin_edges, dtype=np.float64)
+        self._expected = np.clip(np.asarray(reference.expected, dtype=np.float64), PSI_EPSILON, None)
+        self._counts = np.zeros_like(self._expected)
+        self._offsets = np.arange(self.n_features) * self.n_bins
+        self._lock = threading.Lock()
+        
+        self.n_observations = 0
+    
+    @property
+    def n_features(self) -> int:
+        return self._expected.shape[0]
+    
+    @property
+    def n_bins(self) -> int:
+        return self._expected.shape[1]
+    
+    def update(self, features: np.ndarray) -> None:
+        """Add one feature row (or a batch of rows) to the live histograms.
+        
+        Args:
+            features: Feature vector (n_features,) or matrix (n_rows, n_features)
+        """
+        X = np.asarray(features, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}")
+        
+        # Bin index per value: number of edges strictly below it (same as
+        # searchsorted(side="left") used for the training proportions)
+        bins = (X[:, :, None] > self._edges[None, :, :]).sum(axis=2)
+        flat = (bins + self._offsets).ravel()[~np.isnan(X).ravel()]
+        batch_counts = np.bincount(flat, minlength=self._counts.size).reshape(self._counts.shape)
+        
+        with self._lock:
+            if self.decay < 1.0:
+                self._counts *= self.decay ** len(X)
+            self._counts += batch_counts
+            self.n_observations += len(X)
+    
+    def psi(self) -> np.ndarray:
+        """PSI of every feature against the training reference.
+        
+        Returns:
+            Array of PSI scores (n_features,); zeros before any observation
+        """
+        with self._lock:
+            counts = self._counts.copy()
+        
+        totals = counts.sum(axis=1, keepdims=True)
+        actual = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+        actual = np.clip(actual, PSI_EPSILON, None)
+        
+        psi = ((actual - self._expected) * np.log(actual / self._expected)).sum(axis=1)
+        psi[totals[:, 0] == 0] = 0.0
+        return psi
+    
+    def status(self, top_n: int = 5) -> Dict[str, Any]:
+        """Drift summary for polling and alarms.
+        
+        Args:
+            top_n: Number of most-drifted features to include
+            
+        Returns:
+            Dictionary with overall/max PSI, drift flag and top features
+        """
+        psi = self.psi()
+        overall_psi = float(psi.mean()) if len(psi) else 0.0
+        ready = self.n_observations >= self.min_observations
+        
+        top = np.argsort(psi)[::-1][:top_n]
+        names = self.reference.feature_names
+        
+        return {
+            "overall_psi": overall_psi,
+            "max_psi": float(psi.max()) if len(psi) else 0.0,
+            "threshold": self.threshold,
+            "drift_detected": ready and overall_psi > self.threshold,
+            "n_features_drifted": int((psi > self.threshold).sum()) if ready else 0,
+            "n_observations": self.n_observations,
+            "top_features": {
+                (names[i] if i < len(names) else str(i)): float(psi[i]) for i in top
+            },
+        }
+    
+    def reset(self) -> None:
+        """Clear the live histograms."""
+        with self._lock:
+            self._counts[:] = 0.0
+            self.n_observations = 0
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import json
+import os
 import pickle
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from pydantic import BaseModel, Field
 import numpy as np
 
+from ml.persistence.drift import DriftMonitor, DriftReference
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:
+    LIGHTGBM_AVAILABLE = False
+    lgb = None
+
 
 class ModelMetadata(BaseModel):
     """Metadata for persisted model."""
@@ -35,6 +45,12 @@ class ModelMetadata(BaseModel):
     # File paths
     model_path: str
     metadata_path: str
+    
+    # On-disk format: "pickle" or "lightgbm_text" (native Booster text format)
+    model_format: str = Field(default="pickle")
+    
+    # Training feature distribution for drift monitoring
+    drift_reference: Optional[DriftReference] = None
 
 
 class ModelManager:
@@ -48,6 +64,17 @@ class ModelManager:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Called with the new metadata after every save (e.g. cache hot-swap)
+        self._save_listeners: List[Callable[[ModelMetadata], None]] = []
+    
+    def add_save_listener(self, listener: Callable[[ModelMetadata], None]) -> None:
+        """Register a callback invoked after a model version is saved.
+        
+        Args:
+            listener: Callable receiving the saved model's metadata
+        """
+        self._save_listeners.append(listener)
     
     def save_model(
         self,
@@ -61,6 +88,7 @@ class ModelManager:
         hyperparameters: Dict[str, Any],
         n_train_samples: int,
         version: Optional[str] = None,
+        drift_reference: Optional[DriftReference] = None,
     ) -> ModelMetadata:
         """Save model with metadata.
         
@@ -75,6 +103,7 @@ class ModelManager:
             hyperparameters: Model hyperparameters
             n_train_samples: Number of training samples
             version: Optional version string (auto-generated if None)
+            drift_reference: Optional training feature bins for drift monitoring
             
         Returns:
             ModelMetadata for saved model
@@ -87,16 +116,27 @@ class ModelManager:
         model_dir = self.base_dir / symbol / task
         model_dir.mkdir(parents=True, exist_ok=True)
         
+        # LightGBM boosters are stored in their native text format, which the
+        # C++ loader parses directly; anything else falls back to pickle
+        is_booster = LIGHTGBM_AVAILABLE and isinstance(model, lgb.Booster)
+        model_format = "lightgbm_text" if is_booster else "pickle"
+        model_suffix = ".txt" if is_booster else ".pkl"
+        
         # File paths
-        model_filename = f"{model_type}_horizon{horizon}_v{version}.pkl"
+        model_filename = f"{model_type}_horizon{horizon}_v{version}{model_suffix}"
         metadata_filename = f"{model_type}_horizon{horizon}_v{version}.json"
         
         model_path = model_dir / model_filename
         metadata_path = model_dir / metadata_filename
         
-        # Save model
-        with open(model_path, "wb") as f:
-            pickle.dump(model, f)
+        # Save model (temp file + rename so readers never see a partial file)
+        tmp_model_path = model_path.with_name(model_path.name + ".tmp")
+        if is_booster:
+            model.save_model(str(tmp_model_path))
+        else:
+            with open(tmp_model_path, "wb") as f:
+                pickle.dump(model, f)
+        os.replace(tmp_model_path, model_path)
         
         # Create metadata
         metadata = ModelMetadata(
@@ -113,11 +153,18 @@ class ModelManager:
             hyperparameters=hyperparameters,
             model_path=str(model_path),
             metadata_path=str(metadata_path),
+            model_format=model_format,
+            drift_reference=drift_reference,
         )
         
-        # Save metadata
-        with open(metadata_path, "w") as f:
+        # Save metadata last: its appearance publishes the new version
+        tmp_metadata_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        with open(tmp_metadata_path, "w") as f:
             json.dump(metadata.model_dump(), f, indent=2, default=str)
+        os.replace(tmp_metadata_path, metadata_path)
+        
+        for listener in self._save_listeners:
+            listener(metadata)
         
         return metadata
     
@@ -139,37 +186,96 @@ class ModelManager:
         Returns:
             Tuple of (model, metadata)
         """
+        metadata_path = self._find_metadata_path(symbol, task, horizon, version)
+        
+        # Load metadata
+        with open(metadata_path, "r") as f:
+            metadata_dict = json.load(f)
+        
+        metadata = ModelMetadata(**metadata_dict)
+        
+        # Load model (resolved next to the metadata so a moved base_dir still works)
+        model_path = metadata_path.parent / Path(metadata.model_path).name
+        model = self._load_model_file(model_path, metadata.model_format)
+        
+        return model, metadata
+    
+    def load_metadata(
+        self,
+        symbol: str,
+        task: str,
+        horizon: int,
+        version: Optional[str] = None,
+    ) -> ModelMetadata:
+        """Load only a model's metadata (no model file).
+        
+        Args:
+            symbol: Trading symbol
+            task: Task name
+            horizon: Forecast horizon
+            version: Specific version (latest if None)
+            
+        Returns:
+            ModelMetadata
+        """
+        metadata_path = self._find_metadata_path(symbol, task, horizon, version)
+        with open(metadata_path, "r") as f:
+            return ModelMetadata(**json.load(f))
+    
+    def latest_version(self, symbol: str, task: str, horizon: int) -> Optional[str]:
+        """Return the newest published version without loading anything.
+        
+        Only lists the model directory, so it is cheap enough to poll.
+        
+        Args:
+            symbol: Trading symbol
+            task: Task name
+            horizon: Forecast horizon
+            
+        Returns:
+            Version string, or None if no model exists
+        """
+        try:
+            metadata_path = self._find_metadata_path(symbol, task, horizon)
+        except FileNotFoundError:
+            return None
+        return metadata_path.stem.rsplit("_v", 1)[-1]
+    
+    def _find_metadata_path(
+        self,
+        symbol: str,
+        task: str,
+        horizon: int,
+        version: Optional[str] = None,
+    ) -> Path:
+        """Locate the metadata file for a model version (latest if None)."""
         model_dir = self.base_dir / symbol / task
         
         if not model_dir.exists():
             raise FileNotFoundError(f"No models found for {symbol}/{task}")
         
-        # Find model file
         if version is None:
             # Load latest version
-            model_files = sorted(model_dir.glob(f"*_horizon{horizon}_v*.pkl"))
-            if not model_files:
+            metadata_files = sorted(model_dir.glob(f"*_horizon{horizon}_v*.json"))
+            if not metadata_files:
                 raise FileNotFoundError(f"No models found for horizon {horizon}")
-            model_path = model_files[-1]
-        else:
-            # Load specific version
-            model_files = list(model_dir.glob(f"*_horizon{horizon}_v{version}.pkl"))
-            if not model_files:
-                raise FileNotFoundError(f"Model version {version} not found")
-            model_path = model_files[0]
-        
-        # Load model
-        with open(model_path, "rb") as f:
-            model = pickle.load(f)
-        
-        # Load metadata
-        metadata_path = model_path.with_suffix(".json")
-        with open(metadata_path, "r") as f:
-            metadata_dict = json.load(f)
+            return metadata_files[-1]
         
-        metadata = ModelMetadata(**metadata_dict)
+        # Load specific version
+        metadata_files = list(model_dir.glob(f"*_horizon{horizon}_v{version}.json"))
+        if not metadata_files:
+            raise FileNotFoundError(f"Model version {version} not found")
+        return metadata_files[0]
+    
+    def _load_model_file(self, model_path: Path, model_format: str) -> Any:
+        """Load a model file in its recorded on-disk format."""
+        if model_format == "lightgbm_text":
+            if not LIGHTGBM_AVAILABLE:
+                raise ImportError("LightGBM not installed. Install with: pip install lightgbm")
+            return lgb.Booster(model_file=str(model_path))
         
-        return model, metadata
+        with open(model_path, "rb") as f:
+            return pickle.load(f)
     
     def list_models(self, symbol: str, task: Optional[str] = None) -> List[ModelMetadata]:
         """List all available models for a symbol.
@@ -231,18 +337,20 @@ class ModelManager:
             Tuple of (drift_detected, psi_score, drift_details)
         """
         # Load model metadata to get training statistics
-        _, metadata = self.load_model(symbol, task, horizon)
-        
-        # Compute PSI for each feature
-        psi_scores = []
-        
-        for i in range(X_recent.shape[1]):
-            feature_recent = X_recent[:, i]
-            
-            # For simplicity, compute basic distribution stats
-            # In production, use proper binning and PSI calculation
-            psi = self._compute_feature_psi(feature_recent)
-            psi_scores.append(psi)
+        metadata = self.load_metadata(symbol, task, horizon)
+        
+        if metadata.drift_reference is not None:
+            # PSI of every feature against the stored training bins
+            monitor = DriftMonitor(
+                metadata.drift_reference, window=None, threshold=threshold, min_observations=0
+            )
+            monitor.update(X_recent)
+            psi_scores = monitor.psi().tolist()
+        else:
+            # Older models without a reference: per-feature dispersion proxy
+            psi_scores = [
+                self._compute_feature_psi(X_recent[:, i]) for i in range(X_recent.shape[1])
+            ]
         
         # Overall PSI
         overall_psi = float(np.mean(psi_scores))
@@ -259,6 +367,31 @@ class ModelManager:
         
         return drift_detected, overall_psi, drift_details
     
+    def create_drift_monitor(
+        self,
+        symbol: str,
+        task: str,
+        horizon: int,
+        version: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[DriftMonitor]:
+        """Create a streaming drift monitor from a model's stored training bins.
+        
+        Args:
+            symbol: Trading symbol
+            task: Task name
+            horizon: Forecast horizon
+            version: Specific version (latest if None)
+            **kwargs: Passed to DriftMonitor (window, threshold, min_observations)
+            
+        Returns:
+            DriftMonitor, or None if the model was saved without a drift reference
+        """
+        metadata = self.load_metadata(symbol, task, horizon, version)
+        if metadata.drift_reference is None:
+            return None
+        return DriftMonitor(metadata.drift_reference, **kwargs)
+    
     def _compute_feature_psi(self, feature: np.ndarray) -> float:
         """Compute PSI for a single feature.
         
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import numpy as np
 from pydantic import BaseModel, Field
 
 
+# Direction, magnitude, volatility weights for the overall confidence
+OVERALL_CONFIDENCE_WEIGHTS = (0.5, 0.3, 0.2)
+
+
 class PredictionConfig(BaseModel):
     """Configuration for prediction pipeline."""
     
@@ -117,6 +121,125 @@ class Predictor:
             feature_count=X.shape[1],
         )
     
+    def predict_batch(
+        self,
+        models: Sequence[Dict[str, Any]],
+        X: np.ndarray,
+        movement_energy: Optional[Sequence[Optional[float]]] = None,
+    ) -> List[PredictionResult]:
+        """Make predictions for many rows (e.g. one per symbol) at once.
+        
+        Rows that share a model object are scored together, so each distinct
+        model runs one ``predict`` per task for the whole batch. Calibration,
+        confidence and energy adjustment are applied vectorized. Results are
+        identical to calling ``predict`` row by row.
+        
+        Args:
+            models: Per-row model dictionaries (same shape as ``predict``'s ``models``)
+            X: Feature matrix (n_rows x n_features)
+            movement_energy: Optional per-row movement energy (None entries skip adjustment)
+            
+        Returns:
+            One PredictionResult per row, in row order
+        """
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        
+        n_rows = X.shape[0]
+        if len(models) != n_rows:
+            raise ValueError(f"Got {len(models)} model sets for {n_rows} feature rows")
+        
+        # Direction (defaults match _predict_direction with no model)
+        dir_prob = np.full(n_rows, 0.5)
+        has_direction = np.zeros(n_rows, dtype=bool)
+        for model, rows in self._group_rows_by_model(models, "direction"):
+            dir_prob[rows] = model.predict(X[rows])
+            has_direction[rows] = True
+        
+        if self.config.use_calibration:
+            dir_prob = np.where(has_direction, self._calibrate_probabilities(dir_prob), dir_prob)
+        
+        direction = np.where(dir_prob > 0.5, 1, -1)
+        direction[~has_direction] = 0
+        dir_conf = np.where(has_direction, np.abs(dir_prob - 0.5) * 2, 0.0)
+        
+        # Magnitude
+        mag_probs = np.tile([0.33, 0.34, 0.33], (n_rows, 1))
+        has_magnitude = np.zeros(n_rows, dtype=bool)
+        for model, rows in self._group_rows_by_model(models, "magnitude"):
+            mag_probs[rows] = model.predict(X[rows])
+            has_magnitude[rows] = True
+        
+        magnitude = np.where(has_magnitude, np.argmax(mag_probs, axis=1), 1)
+        mag_conf = np.where(has_magnitude, mag_probs.max(axis=1), 0.0)
+        
+        # Volatility
+        volatility = np.full(n_rows, 0.01)
+        vol_conf = np.zeros(n_rows)
+        for model, rows in self._group_rows_by_model(models, "volatility"):
+            volatility[rows] = model.predict(X[rows])
+            vol_conf[rows] = 0.7
+        
+        # Overall confidence (same weights as _compute_overall_confidence)
+        overall_conf = np.average(
+            np.column_stack([dir_conf, mag_conf, vol_conf]),
+            axis=1,
+            weights=OVERALL_CONFIDENCE_WEIGHTS,
+        )
+        
+        # Energy adjustment
+        energy = np.full(n_rows, np.nan)
+        if movement_energy is not None:
+            energy = np.array(
+                [np.nan if e is None else e for e in movement_energy], dtype=float
+            )
+        has_energy = ~np.isnan(energy)
+        adjusted_conf = self._apply_energy_adjustments(overall_conf, np.nan_to_num(energy))
+        apply_energy = self.config.use_energy_adjustment & has_energy
+        
+        results = []
+        for i in range(n_rows):
+            results.append(PredictionResult(
+                direction=int(direction[i]),
+                direction_probability=float(dir_prob[i]),
+                direction_confidence=float(dir_conf[i]),
+                magnitude=int(magnitude[i]),
+                magnitude_probabilities={k: float(p) for k, p in enumerate(mag_probs[i])},
+                magnitude_confidence=float(mag_conf[i]),
+                predicted_volatility=float(volatility[i]),
+                volatility_confidence=float(vol_conf[i]),
+                overall_confidence=float(overall_conf[i]),
+                movement_energy=float(energy[i]) if has_energy[i] else None,
+                energy_adjusted_confidence=float(adjusted_conf[i]) if apply_energy[i] else None,
+                feature_count=X.shape[1],
+            ))
+        
+        return results
+    
+    @staticmethod
+    def _group_rows_by_model(
+        models: Sequence[Dict[str, Any]],
+        task: str,
+    ) -> List[tuple[Any, np.ndarray]]:
+        """Group row indices by the (identical) model object used for a task.
+        
+        Args:
+            models: Per-row model dictionaries
+            task: Task name
+            
+        Returns:
+            List of (model, row_indices) pairs, skipping rows without a model
+        """
+        groups: Dict[int, tuple[Any, List[int]]] = {}
+        for i, row_models in enumerate(models):
+            model = row_models.get(task)
+            if model is None:
+                continue
+            groups.setdefault(id(model), (model, []))[1].append(i)
+        
+        return [(model, np.asarray(rows)) for model, rows in groups.values()]
+    
     def _predict_direction(
         self,
         model: Any,
@@ -224,7 +347,7 @@ class Predictor:
             Overall confidence
         """
         # Weighted average (direction is most important)
-        weights = np.array([0.5, 0.3, 0.2])
+        weights = np.array(OVERALL_CONFIDENCE_WEIGHTS)
         confs = np.array([dir_conf, mag_conf, vol_conf])
         
         overall = float(np.average(confs, weights=weights))
@@ -248,16 +371,32 @@ class Predictor:
         Returns:
             Energy-adjusted confidence
         """
+        return float(self._apply_energy_adjustments(confidence, movement_energy))
+    
+    def _apply_energy_adjustments(
+        self,
+        confidence: np.ndarray | float,
+        movement_energy: np.ndarray | float,
+    ) -> np.ndarray:
+        """Vectorized energy adjustment (see ``_apply_energy_adjustment``).
+        
+        Args:
+            confidence: Base confidences
+            movement_energy: Movement energy values
+            
+        Returns:
+            Energy-adjusted confidences
+        """
         # Normalize energy to [0, 1] range (assume typical range 0-100)
-        energy_norm = np.clip(movement_energy / 100.0, 0.0, 1.0)
+        energy_norm = np.clip(np.asarray(movement_energy) / 100.0, 0.0, 1.0)
         
         # Adjustment factor: high energy → lower confidence
         energy_penalty = energy_norm * self.config.energy_weight
         
         # Apply adjustment
-        adjusted = confidence * (1.0 - energy_penalty)
+        adjusted = np.asarray(confidence) * (1.0 - energy_penalty)
         
-        return float(np.clip(adjusted, 0.0, 1.0))
+        return np.clip(adjusted, 0.0, 1.0)
     
     def _calibrate_probability(self, prob: float) -> float:
         """Calibrate probability using simple method.
@@ -270,12 +409,27 @@ class Predictor:
         Returns:
             Calibrated probability
         """
+        if self.config.calibration_method == "beta":
+            return float(self._calibrate_probabilities(np.asarray(prob)))
+        
+        # Default: return as-is
+        return prob
+    
+    def _calibrate_probabilities(self, probs: np.ndarray) -> np.ndarray:
+        """Vectorized calibration (see ``_calibrate_probability``).
+        
+        Args:
+            probs: Raw probabilities
+            
+        Returns:
+            Calibrated probabilities
+        """
         # Simple beta calibration: push probabilities away from 0.5
         if self.config.calibration_method == "beta":
             alpha, beta = 2.0, 2.0
             # Beta transform
-            prob_cal = prob ** alpha / (prob ** alpha + (1 - prob) ** beta)
-            return float(np.clip(prob_cal, 0.0, 1.0))
+            probs_cal = probs ** alpha / (probs ** alpha + (1 - probs) ** beta)
+            return np.clip(probs_cal, 0.0, 1.0)
         
         # Default: return as-is
-        return prob
+        return probs
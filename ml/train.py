@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence
+
 import polars as pl
-from typing import Dict, List, Optional
 
 from ml.labels.generator import LabelGenerator, LabelConfig
 from ml.features.builder import FeatureBuilder, FeatureConfig
@@ -12,6 +16,7 @@ from ml.features.regime import RegimeClassifier
 from ml.dataset.builder import DatasetBuilder, DatasetConfig
 from ml.trainer.lightgbm_trainer import LightGBMTrainer, LightGBMConfig
 from ml.persistence.manager import ModelManager
+from ml.persistence.drift import DriftReference
 from ml.trainer.core import TrainingResult
 
 
@@ -69,6 +74,151 @@ class MLTrainingOrchestrator:
         Returns:
             Dictionary of training results by task
         """
+        return self.train_horizons(
+            df_ohlcv,
+            symbol,
+            horizons=[horizon],
+            hedge_outputs=hedge_outputs,
+            liquidity_outputs=liquidity_outputs,
+            sentiment_outputs=sentiment_outputs,
+            vix_series=vix_series,
+            spx_series=spx_series,
+        )[horizon]
+    
+    def train_horizons(
+        self,
+        df_ohlcv: pl.DataFrame,
+        symbol: str,
+        horizons: Sequence[int],
+        hedge_outputs: Optional[List] = None,
+        liquidity_outputs: Optional[List] = None,
+        sentiment_outputs: Optional[List] = None,
+        vix_series: Optional[pl.Series] = None,
+        spx_series: Optional[pl.Series] = None,
+    ) -> Dict[int, Dict[str, TrainingResult]]:
+        """Train every horizon for a symbol from one labels/features pass.
+        
+        Labels for all horizons and the feature frame are built once and
+        shared; only dataset building and model training run per horizon.
+        
+        Args:
+            df_ohlcv: OHLCV dataframe
+            symbol: Trading symbol
+            horizons: Forecast horizons (must be in the label config)
+            hedge_outputs: Optional hedge engine outputs
+            liquidity_outputs: Optional liquidity engine outputs
+            sentiment_outputs: Optional sentiment engine outputs
+            vix_series: Optional VIX data
+            spx_series: Optional SPX data
+            
+        Returns:
+            Dictionary mapping horizon to training results by task
+        """
+        df_ml = self._build_ml_frame(
+            df_ohlcv,
+            symbol,
+            hedge_outputs=hedge_outputs,
+            liquidity_outputs=liquidity_outputs,
+            sentiment_outputs=sentiment_outputs,
+            vix_series=vix_series,
+            spx_series=spx_series,
+        )
+        
+        return {horizon: self._train_horizon(df_ml, symbol, horizon) for horizon in horizons}
+    
+    def train_universe(
+        self,
+        data: Dict[str, pl.DataFrame],
+        horizons: Sequence[int],
+        max_workers: Optional[int] = None,
+        total_threads: Optional[int] = None,
+    ) -> Dict[str, Dict[int, Dict[str, TrainingResult]]]:
+        """Retrain many symbols in parallel worker processes.
+        
+        Each worker trains one symbol at a time (all horizons and tasks, see
+        ``train_horizons``). ``total_threads`` is split evenly across workers
+        and passed to LightGBM, so workers x threads never oversubscribes
+        the machine.
+        
+        Args:
+            data: OHLCV dataframe per symbol
+            horizons: Forecast horizons to train
+            max_workers: Worker processes (default: one per symbol, capped by
+                the thread budget)
+            total_threads: Global LightGBM thread budget (default: CPU count)
+            
+        Returns:
+            Dictionary mapping symbol to results by horizon and task. Symbols
+            whose training failed are reported and omitted.
+        """
+        total_threads = total_threads or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers or len(data), len(data), total_threads))
+        threads_per_worker = max(1, total_threads // max_workers)
+        
+        if max_workers == 1:
+            return self._train_symbols(data, horizons, threads_per_worker)
+        
+        results: Dict[str, Dict[int, Dict[str, TrainingResult]]] = {}
+        
+        # Spawned (not forked) workers: forking after LightGBM/OpenMP has
+        # started threads in the parent can deadlock the child
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _train_symbol_job, self, df_ohlcv, symbol, list(horizons), threads_per_worker
+                ): symbol
+                for symbol, df_ohlcv in data.items()
+            }
+            
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    print(f"[ML Train] {symbol} failed: {e}")
+        
+        return {symbol: results[symbol] for symbol in data if symbol in results}
+    
+    def _train_symbols(
+        self,
+        data: Dict[str, pl.DataFrame],
+        horizons: Sequence[int],
+        num_threads: int,
+    ) -> Dict[str, Dict[int, Dict[str, TrainingResult]]]:
+        """In-process fallback for ``train_universe`` with a single worker."""
+        previous_threads = self.trainer.config.num_threads
+        self.trainer.config.num_threads = num_threads
+        
+        results = {}
+        try:
+            for symbol, df_ohlcv in data.items():
+                try:
+                    results[symbol] = self.train_horizons(df_ohlcv, symbol, horizons)
+                except Exception as e:
+                    print(f"[ML Train] {symbol} failed: {e}")
+        finally:
+            self.trainer.config.num_threads = previous_threads
+        
+        return results
+    
+    def _build_ml_frame(
+        self,
+        df_ohlcv: pl.DataFrame,
+        symbol: str,
+        hedge_outputs: Optional[List] = None,
+        liquidity_outputs: Optional[List] = None,
+        sentiment_outputs: Optional[List] = None,
+        vix_series: Optional[pl.Series] = None,
+        spx_series: Optional[pl.Series] = None,
+    ) -> pl.DataFrame:
+        """Generate labels for all horizons and the full feature frame.
+        
+        Returns:
+            Labels joined with features on timestamp
+        """
         # Step 1: Generate labels
         print(f"[ML Train] Generating labels for {symbol}...")
         df_with_labels = self.label_generator.generate(df_ohlcv)
@@ -95,8 +245,19 @@ class MLTrainingOrchestrator:
         )
         
         # Step 5: Merge labels back
-        df_ml = df_with_labels.join(df_features, on="timestamp", how="inner")
+        return df_with_labels.join(df_features, on="timestamp", how="inner")
+    
+    def _train_horizon(
+        self,
+        df_ml: pl.DataFrame,
+        symbol: str,
+        horizon: int,
+    ) -> Dict[str, TrainingResult]:
+        """Build, split, train, save and test one horizon's models.
         
+        Returns:
+            Dictionary of training results by task
+        """
         # Step 6: Build dataset
         print(f"[ML Train] Building dataset...")
         dataset = self.dataset_builder.build_dataset(df_ml, horizon=horizon)
@@ -109,7 +270,7 @@ class MLTrainingOrchestrator:
         print(f"[ML Train] Test samples: {test_dataset.n_samples}")
         print(f"[ML Train] Features: {train_dataset.n_features}")
         
-        # Step 8: Train models
+        # Step 8: Train models (one binned dataset shared by all tasks)
         print(f"[ML Train] Training models...")
         results = self.trainer.train_multi_task(
             train_dataset=train_dataset,
@@ -118,8 +279,11 @@ class MLTrainingOrchestrator:
             horizon=horizon,
         )
         
-        # Step 9: Save models
+        # Step 9: Save models (with training bins for live drift monitoring)
         print(f"[ML Train] Saving models...")
+        drift_reference = DriftReference.from_training(
+            train_dataset.X, train_dataset.feature_names
+        )
         for task, result in results.items():
             self.model_manager.save_model(
                 model=result.model,
@@ -131,6 +295,7 @@ class MLTrainingOrchestrator:
                 metrics=result.metrics,
                 hyperparameters=result.hyperparameters,
                 n_train_samples=train_dataset.n_samples,
+                drift_reference=drift_reference,
             )
             
             print(f"[ML Train] {task.capitalize()} model saved:")
@@ -197,3 +362,15 @@ class MLTrainingOrchestrator:
             }
         
         return test_metrics
+
+
+def _train_symbol_job(
+    orchestrator: MLTrainingOrchestrator,
+    df_ohlcv: pl.DataFrame,
+    symbol: str,
+    horizons: List[int],
+    num_threads: int,
+) -> Dict[int, Dict[str, TrainingResult]]:
+    """Worker-process entry point for ``MLTrainingOrchestrator.train_universe``."""
+    orchestrator.trainer.config.num_threads = num_threads
+    return orchestrator.train_horizons(df_ohlcv, symbol, horizons)
@@ -43,6 +43,7 @@ class LightGBMConfig(BaseModel):
     
     # Device
     device: str = Field(default="cpu", pattern="^(cpu|gpu|cuda)$")
+    num_threads: int = Field(default=0, ge=0, description="LightGBM threads (0 = library default)")
 
 
 class LightGBMTrainer(ModelTrainer):
@@ -68,6 +69,9 @@ class LightGBMTrainer(ModelTrainer):
     ) -> Dict[str, TrainingResult]:
         """Train all tasks (direction, magnitude, volatility).
         
+        The feature matrices are binned once and shared by every task;
+        only the labels are swapped between models.
+        
         Args:
             train_dataset: Training dataset
             valid_dataset: Validation dataset
@@ -78,33 +82,106 @@ class LightGBMTrainer(ModelTrainer):
             Dictionary mapping task name to TrainingResult
         """
         results = {}
+        lgb_datasets = self.build_lgb_datasets(train_dataset, valid_dataset)
         
         # Train direction classifier
         if self.config.train_direction:
             results["direction"] = self.train_direction_model(
-                train_dataset, valid_dataset, symbol, horizon
+                train_dataset, valid_dataset, symbol, horizon, lgb_datasets
             )
         
         # Train magnitude classifier
         if self.config.train_magnitude:
             results["magnitude"] = self.train_magnitude_model(
-                train_dataset, valid_dataset, symbol, horizon
+                train_dataset, valid_dataset, symbol, horizon, lgb_datasets
             )
         
         # Train volatility regressor
         if self.config.train_volatility:
             results["volatility"] = self.train_volatility_model(
-                train_dataset, valid_dataset, symbol, horizon
+                train_dataset, valid_dataset, symbol, horizon, lgb_datasets
             )
         
         return results
     
+    def build_lgb_datasets(
+        self,
+        train_dataset: MLDataset,
+        valid_dataset: MLDataset,
+    ) -> Tuple[Any, Any]:
+        """Bin the feature matrices once for reuse across tasks.
+        
+        The validation set is binned with the training set's bin edges
+        (``reference=``). Labels are placeholders; each ``train_*_model``
+        call sets its own before training.
+        
+        Args:
+            train_dataset: Training dataset
+            valid_dataset: Validation dataset
+            
+        Returns:
+            Tuple of constructed (train, valid) lgb.Dataset
+        """
+        params = self._get_base_params()
+        
+        train_data = lgb.Dataset(
+            train_dataset.X,
+            label=np.zeros(train_dataset.n_samples),
+            weight=train_dataset.weights,
+            feature_name=train_dataset.feature_names,
+            params=params,
+        )
+        
+        valid_data = lgb.Dataset(
+            valid_dataset.X,
+            label=np.zeros(valid_dataset.n_samples),
+            weight=valid_dataset.weights,
+            feature_name=valid_dataset.feature_names,
+            reference=train_data,
+            params=params,
+        )
+        
+        train_data.construct()
+        valid_data.construct()
+        
+        return train_data, valid_data
+    
+    def _task_datasets(
+        self,
+        train_dataset: MLDataset,
+        valid_dataset: MLDataset,
+        y_train: np.ndarray,
+        y_valid: np.ndarray,
+        lgb_datasets: Optional[Tuple[Any, Any]],
+    ) -> Tuple[Any, Any]:
+        """Label shared binned datasets for a task, or build fresh ones.
+        
+        Args:
+            train_dataset: Training dataset
+            valid_dataset: Validation dataset
+            y_train: Task labels for training
+            y_valid: Task labels for validation
+            lgb_datasets: Shared datasets from ``build_lgb_datasets`` (optional)
+            
+        Returns:
+            Tuple of (train, valid) lgb.Dataset carrying the task labels
+        """
+        if lgb_datasets is None:
+            lgb_datasets = self.build_lgb_datasets(train_dataset, valid_dataset)
+        
+        train_data, valid_data = lgb_datasets
+        train_data.set_label(y_train)
+        valid_data.set_label(y_valid)
+        
+        return train_data, valid_data
+    
     def train_direction_model(
         self,
         train_dataset: MLDataset,
         valid_dataset: MLDataset,
         symbol: str,
         horizon: int,
+        lgb_datasets: Optional[Tuple[Any, Any]] = None,
     ) -> TrainingResult:
         """Train binary direction classifier (±1).
         
@@ -113,6 +190,7 @@ class LightGBMTrainer(ModelTrainer):
             valid_dataset: Validation dataset
             symbol: Symbol
             horizon: Forecast horizon
+            lgb_datasets: Shared binned datasets from ``build_lgb_datasets`` (optional)
             
         Returns:
             TrainingResult with trained model
@@ -123,20 +201,9 @@ class LightGBMTrainer(ModelTrainer):
         y_train = (train_dataset.y_direction > 0).astype(int)
         y_valid = (valid_dataset.y_direction > 0).astype(int)
         
-        # Create LightGBM datasets
-        train_data = lgb.Dataset(
-            train_dataset.X,
-            label=y_train,
-            weight=train_dataset.weights,
-            feature_name=train_dataset.feature_names,
-        )
-        
-        valid_data = lgb.Dataset(
-            valid_dataset.X,
-            label=y_valid,
-            weight=valid_dataset.weights,
-            feature_name=valid_dataset.feature_names,
-            reference=train_data,
+        # Create (or relabel shared) LightGBM datasets
+        train_data, valid_data = self._task_datasets(
+            train_dataset, valid_dataset, y_train, y_valid, lgb_datasets
         )
         
         # Train model
@@ -198,6 +265,7 @@ class LightGBMTrainer(ModelTrainer):
         valid_dataset: MLDataset,
         symbol: str,
         horizon: int,
+        lgb_datasets: Optional[Tuple[Any, Any]] = None,
     ) -> TrainingResult:
         """Train multiclass magnitude classifier (small/medium/large).
         
@@ -206,26 +274,16 @@ class LightGBMTrainer(ModelTrainer):
             valid_dataset: Validation dataset
             symbol: Symbol
             horizon: Forecast horizon
+            lgb_datasets: Shared binned datasets from ``build_lgb_datasets`` (optional)
             
         Returns:
             TrainingResult with trained model
         """
         start_time = time.time()
         
-        # Create LightGBM datasets
-        train_data = lgb.Dataset(
-            train_dataset.X,
-            label=train_dataset.y_magnitude,
-            weight=train_dataset.weights,
-            feature_name=train_dataset.feature_names,
-        )
-        
-        valid_data = lgb.Dataset(
-            valid_dataset.X,
-            label=valid_dataset.y_magnitude,
-            weight=valid_dataset.weights,
-            feature_name=valid_dataset.feature_names,
-            reference=train_data,
+        # Create (or relabel shared) LightGBM datasets
+        train_data, valid_data = self._task_datasets(
+            train_dataset, valid_dataset, train_dataset.y_magnitude, valid_dataset.y_magnitude, lgb_datasets
         )
         
         # Train model
@@ -288,6 +346,7 @@ class LightGBMTrainer(ModelTrainer):
         valid_dataset: MLDataset,
         symbol: str,
         horizon: int,
+        lgb_datasets: Optional[Tuple[Any, Any]] = None,
     ) -> TrainingResult:
         """Train volatility regressor.
         
@@ -296,26 +355,16 @@ class LightGBMTrainer(ModelTrainer):
             valid_dataset: Validation dataset
             symbol: Symbol
             horizon: Forecast horizon
+            lgb_datasets: Shared binned datasets from ``build_lgb_datasets`` (optional)
             
         Returns:
             TrainingResult with trained model
         """
         start_time = time.time()
         
-        # Create LightGBM datasets
-        train_data = lgb.Dataset(
-            train_dataset.X,
-            label=train_dataset.y_volatility,
-            weight=train_dataset.weights,
-            feature_name=train_dataset.feature_names,
-        )
-        
-        valid_data = lgb.Dataset(
-            valid_dataset.X,
-            label=valid_dataset.y_volatility,
-            weight=valid_dataset.weights,
-            feature_name=valid_dataset.feature_names,
-            reference=train_data,
+        # Create (or relabel shared) LightGBM datasets
+        train_data, valid_data = self._task_datasets(
+            train_dataset, valid_dataset, train_dataset.y_volatility, valid_dataset.y_volatility, lgb_datasets
         )
         
         # Train model
@@ -376,7 +425,7 @@ class LightGBMTrainer(ModelTrainer):
         Returns:
             Dictionary of parameters
         """
-        return {
+        params = {
             "num_leaves": self.config.num_leaves,
             "max_depth": self.config.max_depth,
             "learning_rate": self.config.learning_rate,
@@ -389,6 +438,11 @@ class LightGBMTrainer(ModelTrainer):
             "device": self.config.device,
             "force_row_wise": True,  # Avoid warnings
         }
+        
+        if self.config.num_threads > 0:
+            params["num_threads"] = self.config.num_threads
+        
+        return params
     
     def _compute_direction_metrics(
         self,
@@ -2,20 +2,35 @@
 Lookahead Transformer for Price Movement Prediction
 
 Tiny 4-layer Transformer that predicts price changes from hedge snapshots.
-Trains in background thread, adds prediction as vote to Composer Agent.
+Trains in a background process, adds prediction as vote to Composer Agent.
+
+Training sequences go through a shared-memory ring buffer; the trainer
+process publishes weights atomically and the live process swaps in a
+frozen inference copy, so training never touches the model being served.
+Loading and compiling published weights runs on a background thread; the
+predict path only swaps a reference.
 
 Author: Super Gnosis AI Developer
 Created: 2025-11-19
 """
 
 from __future__ import annotations
+
+import copy
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 import numpy as np
 import torch
 import torch.nn as nn
-from typing import Dict, List, Tuple, Optional
-from collections import deque
-import threading
-import time
+
+from models.sequence_ring import SharedSequenceRing
 
 try:
     TORCH_AVAILABLE = True
@@ -23,6 +38,28 @@ except ImportError:
     TORCH_AVAILABLE = False
     print("⚠️  PyTorch not available, lookahead model disabled")
 
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Hedge snapshot features in model input order, with defaults for missing keys
+FEATURE_DEFAULTS: Tuple[Tuple[str, float], ...] = (
+    ('elasticity', 1.0),
+    ('movement_energy', 0.0),
+    ('movement_energy_up', 0.0),
+    ('movement_energy_down', 0.0),
+    ('energy_asymmetry', 0.0),
+    ('dealer_gamma_sign', 0.0),
+    ('pressure_up', 0.0),
+    ('pressure_down', 0.0),
+    ('net_pressure', 0.0),
+    ('gamma_pressure', 0.0),
+)
+
+INFERENCE_BACKENDS = ("eager", "torchscript", "compile", "onnx")
+
 
 class TransformerPredictor(nn.Module):
     """
@@ -91,12 +128,223 @@ class TransformerPredictor(nn.Module):
         return out
 
 
+def _fit(
+    model: nn.Module,
+    optimizer: torch.optim.Optimizer,
+    criterion: nn.Module,
+    X_tensor: torch.Tensor,
+    y_tensor: torch.Tensor,
+    epochs: int,
+    batch_size: int,
+) -> float:
+    """
+    Mini-batch training loop.
+    
+    Returns:
+        Mean loss of the last epoch
+    """
+    model.train()
+    total_loss = 0.0
+    
+    for epoch in range(epochs):
+        # Shuffle data
+        indices = torch.randperm(len(X_tensor))
+        X_shuffled = X_tensor[indices]
+        y_shuffled = y_tensor[indices]
+        
+        epoch_loss = 0.0
+        num_batches = 0
+        
+        # Mini-batch training
+        for i in range(0, len(X_shuffled), batch_size):
+            batch_X = X_shuffled[i:i+batch_size]
+            batch_y = y_shuffled[i:i+batch_size]
+            
+            # Forward pass
+            optimizer.zero_grad()
+            predictions = model(batch_X)
+            loss = criterion(predictions, batch_y)
+            
+            # Backward pass
+            loss.backward()
+            optimizer.step()
+            
+            epoch_loss += loss.item()
+            num_batches += 1
+        
+        total_loss = epoch_loss / max(1, num_batches)
+    
+    return total_loss
+
+
+def _evaluate(model: nn.Module, X: torch.Tensor, y: torch.Tensor) -> Tuple[float, float]:
+    """
+    Compute validation metrics.
+    
+    Returns:
+        Tuple of (MAE, direction accuracy %)
+    """
+    model.eval()
+    with torch.inference_mode():
+        predictions = model(X)
+        
+        # MAE
+        mae = torch.abs(predictions - y).mean().item()
+        
+        # Direction accuracy
+        pred_direction = (predictions > 0).float()
+        true_direction = (y > 0).float()
+        direction_acc = (pred_direction == true_direction).float().mean().item()
+    
+    return mae, direction_acc * 100.0
+
+
+def _weights_path(weights_dir: str, version: int) -> str:
+    """Double-buffered weights file: versions alternate between two files."""
+    return os.path.join(weights_dir, f"lookahead_weights_{version % 2}.pt")
+
+
+def _publish_weights(state_dict: Dict[str, torch.Tensor], weights_dir: str, version: int) -> str:
+    """Write weights to a temp file and atomically move them into place."""
+    path = _weights_path(weights_dir, version)
+    tmp_path = f"{path}.tmp"
+    torch.save(state_dict, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _training_process(
+    ring_name: str,
+    capacity: int,
+    sequence_length: int,
+    input_dim: int,
+    model_kwargs: Dict[str, Any],
+    weights_dir: str,
+    interval_seconds: float,
+    epochs: int,
+    batch_size: int,
+    num_threads: int,
+    stop_event,
+    initial_state: Optional[Dict[str, torch.Tensor]] = None,
+):
+    """
+    Trainer process: snapshot the ring, train, publish weights, repeat.
+    
+    Owns its own model (seeded with the live weights) and optimizer; the
+    live process only ever sees complete weight files.
+    """
+    torch.set_num_threads(num_threads)
+    ring = SharedSequenceRing(capacity, sequence_length, input_dim, name=ring_name)
+    model = TransformerPredictor(input_dim=input_dim, **model_kwargs)
+    if initial_state is not None:
+        model.load_state_dict(initial_state)
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
+    criterion = nn.MSELoss()
+    version = ring.weights_version
+    
+    try:
+        while not stop_event.wait(interval_seconds):
+            X, y = ring.snapshot()
+            if len(X) < batch_size:
+                continue
+            
+            try:
+                X_tensor = torch.from_numpy(X)
+                y_tensor = torch.from_numpy(y).unsqueeze(1)
+                train_loss = _fit(model, optimizer, criterion, X_tensor, y_tensor, epochs, batch_size)
+                mae, direction_accuracy = _evaluate(model, X_tensor, y_tensor)
+                
+                version += 1
+                _publish_weights(model.state_dict(), weights_dir, version)
+                ring.publish(version, train_loss, mae, direction_accuracy)
+            except Exception as e:
+                print(f"⚠️  Lookahead training error: {e}")
+    finally:
+        ring.close()
+
+
+def _compile_for_inference(
+    model: nn.Module,
+    backend: str,
+    example: torch.Tensor,
+    num_threads: Optional[int] = None,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Wrap a frozen eval-mode model as a batch function (B, seq, dim) -> (B,).
+    
+    Falls back to eager execution if the requested backend fails to build.
+    
+    Args:
+        model: Frozen model
+        backend: One of INFERENCE_BACKENDS
+        example: Example input used for tracing/export
+        num_threads: Intra-op threads for the ONNX Runtime session
+    """
+    def eager(X: np.ndarray) -> np.ndarray:
+        with torch.inference_mode():
+            return model(torch.from_numpy(X))[:, 0].numpy()
+    
+    try:
+        if backend == "torchscript":
+            with torch.no_grad():
+                scripted = torch.jit.freeze(torch.jit.trace(model, example, check_trace=False))
+            
+            def run(X: np.ndarray) -> np.ndarray:
+                with torch.inference_mode():
+                    return scripted(torch.from_numpy(X))[:, 0].numpy()
+            return run
+        
+        if backend == "compile":
+            compiled = torch.compile(model, dynamic=True)
+            
+            def run(X: np.ndarray) -> np.ndarray:
+                with torch.inference_mode():
+                    return compiled(torch.from_numpy(X))[:, 0].numpy()
+            return run
+        
+        if backend == "onnx":
+            if not ONNX_AVAILABLE:
+                raise ImportError("onnxruntime not installed")
+            buffer = io.BytesIO()
+            torch.onnx.export(
+                model, example, buffer,
+                input_names=["x"], output_names=["y"],
+                dynamic_axes={"x": {0: "batch"}, "y": {0: "batch"}},
+            )
+            options = ort.SessionOptions()
+            if num_threads:
+                options.intra_op_num_threads = num_threads
+                options.inter_op_num_threads = 1
+            session = ort.InferenceSession(
+                buffer.getvalue(), options, providers=["CPUExecutionProvider"]
+            )
+            
+            def run(X: np.ndarray) -> np.ndarray:
+                return session.run(None, {"x": X})[0][:, 0]
+            return run
+    except Exception as e:
+        print(f"⚠️  Lookahead {backend} build failed, using eager: {e}")
+    
+    return eager
+
+
+def _release(ring: SharedSequenceRing, weights_dir: Optional[str]):
+    """Free the shared-memory ring and the temporary weights dir (finalizer)."""
+    ring.close()
+    if weights_dir is not None:
+        shutil.rmtree(weights_dir, ignore_errors=True)
+
+
 class LookaheadTransformer:
     """
     Lookahead model manager with background training.
     
     Trains on historical ledger data to predict price movements.
-    Runs training in separate thread to avoid blocking main loop.
+    Runs training in a separate process to avoid blocking main loop;
+    ``predict`` always uses a frozen copy of the last published weights.
+    
+    The shared-memory ring and a temporary weights dir are released by
+    ``close()``, or when the instance is garbage collected.
     """
     
     def __init__(
@@ -106,7 +354,14 @@ class LookaheadTransformer:
         num_layers: int = 4,
         num_heads: int = 4,
         train_every_minutes: int = 10,
-        prediction_weight: float = 0.3
+        prediction_weight: float = 0.3,
+        buffer_size: int = 1000,
+        weights_dir: Optional[str] = None,
+        trainer_threads: int = 1,
+        inference_backend: str = "torchscript",
+        inference_threads: Optional[int] = None,
+        pin_torch_threads: bool = False,
+        enabled: bool = True,
     ):
         """
         Initialize lookahead model.
@@ -118,8 +373,24 @@ class LookaheadTransformer:
             num_heads: Number of attention heads
             train_every_minutes: Background training interval
             prediction_weight: Weight in Composer vote
+            buffer_size: Training sequences kept in the ring buffer
+            weights_dir: Directory for published weights (temp dir if None)
+            trainer_threads: Torch intra-op threads for the trainer process
+            inference_backend: "eager", "torchscript", "compile" or "onnx"
+            inference_threads: Intra-op threads of the ONNX Runtime session
+            pin_torch_threads: Also set torch's process-wide intra-op thread
+                count to ``inference_threads`` (affects all torch use in the process)
+            enabled: False builds a disabled placeholder (no buffer, no trainer)
         """
-        if not TORCH_AVAILABLE:
+        self.prediction_weight = prediction_weight
+        self.is_trained = False
+        self.train_loss = 0.0
+        self.mae = 0.0
+        self.direction_accuracy = 0.0
+        self.predictions_count = 0
+        self.training_process = None
+        
+        if not TORCH_AVAILABLE or not enabled:
             self.enabled = False
             return
         
@@ -129,39 +400,51 @@ class LookaheadTransformer:
         self.num_layers = num_layers
         self.num_heads = num_heads
         self.train_every_minutes = train_every_minutes
-        self.prediction_weight = prediction_weight
+        self.buffer_size = buffer_size
+        self.trainer_threads = trainer_threads
+        self.weights_dir = weights_dir or tempfile.mkdtemp(prefix="lookahead_")
+        
+        if inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"inference_backend must be one of {INFERENCE_BACKENDS}")
+        self.inference_backend = inference_backend
+        self.inference_threads = inference_threads
+        if pin_torch_threads and inference_threads is not None:
+            # Small batched forwards are latency-bound; oversubscribed
+            # thread pools only add wake-up jitter
+            torch.set_num_threads(inference_threads)
         
         # Feature dimension (hedge snapshot features)
         self.input_dim = 10  # elasticity, energy, asymmetry, gamma, pressure, etc.
         
-        # Model
-        self.model = TransformerPredictor(
-            input_dim=self.input_dim,
-            hidden_dim=hidden_dim,
-            num_layers=num_layers,
-            num_heads=num_heads
-        )
+        # Model (trained in-process by train_model)
+        self.model = TransformerPredictor(input_dim=self.input_dim, **self._model_kwargs())
+        
+        # Frozen copy used by predict and its compiled batch function;
+        # replaced wholesale, never mutated
+        self.inference_model: Optional[TransformerPredictor] = None
+        self.inference_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self.weights_version = 0
+        
+        # Background build of published weights; poll_weights installs the result
+        self._builder: Optional[threading.Thread] = None
+        self._built: Optional[Tuple[int, TransformerPredictor, Callable, Tuple[float, float, float]]] = None
+        
+        # Reused (B, seq_len, input_dim) input block for batched predictions
+        self._batch_X = np.empty((0, sequence_length, self.input_dim), dtype=np.float32)
         
         # Optimizer
         self.optimizer = torch.optim.Adam(self.model.parameters(), lr=0.001)
         self.criterion = nn.MSELoss()
         
-        # Training data buffer
-        self.sequence_buffer: deque = deque(maxlen=1000)  # Sequences
-        self.target_buffer: deque = deque(maxlen=1000)  # Price changes
-        
-        # Model trained flag
-        self.is_trained = False
-        
-        # Training metrics
-        self.train_loss = 0.0
-        self.mae = 0.0
-        self.direction_accuracy = 0.0
-        self.predictions_count = 0
+        # Training data ring buffer (sequences + price changes), shared with the trainer
+        self.sequence_buffer = SharedSequenceRing(buffer_size, sequence_length, self.input_dim)
+        self._features_scratch = np.empty((sequence_length, self.input_dim), dtype=np.float32)
+        self._finalizer = weakref.finalize(
+            self, _release, self.sequence_buffer, None if weights_dir else self.weights_dir
+        )
         
-        # Background training thread
-        self.training_thread = None
-        self.stop_training = False
+        # Background training process
+        self._stop_event = None
     
     def add_sequence(
         self,
@@ -182,11 +465,11 @@ class LookaheadTransformer:
         recent_snapshots = hedge_snapshots[-self.sequence_length:]
         
         # Extract features from each snapshot
-        features = [self._extract_features(snap) for snap in recent_snapshots]
+        features = self._features_scratch
+        self._fill_sequence(recent_snapshots, features)
         
-        # Add to buffer
-        self.sequence_buffer.append(features)
-        self.target_buffer.append(price_change_pct)
+        # Add to buffer (copied into the preallocated shared slot)
+        self.sequence_buffer.append(features, price_change_pct)
     
     def _extract_features(self, hedge_snapshot: Dict[str, float]) -> np.ndarray:
         """
@@ -198,24 +481,25 @@ class LookaheadTransformer:
         Returns:
             Feature array
         """
-        features = [
-            hedge_snapshot.get('elasticity', 1.0),
-            hedge_snapshot.get('movement_energy', 0.0),
-            hedge_snapshot.get('movement_energy_up', 0.0),
-            hedge_snapshot.get('movement_energy_down', 0.0),
-            hedge_snapshot.get('energy_asymmetry', 0.0),
-            hedge_snapshot.get('dealer_gamma_sign', 0.0),
-            hedge_snapshot.get('pressure_up', 0.0),
-            hedge_snapshot.get('pressure_down', 0.0),
-            hedge_snapshot.get('net_pressure', 0.0),
-            hedge_snapshot.get('gamma_pressure', 0.0)
-        ]
+        features = [hedge_snapshot.get(key, default) for key, default in FEATURE_DEFAULTS]
         
         return np.array(features, dtype=np.float32)
     
+    @staticmethod
+    def _fill_sequence(snapshots: List[Dict[str, float]], out: np.ndarray):
+        """Write a sequence of snapshots into a preallocated (seq_len, input_dim) block."""
+        out[:] = [[snap.get(key, default) for key, default in FEATURE_DEFAULTS] for snap in snapshots]
+    
+    def _model_kwargs(self) -> Dict[str, Any]:
+        return {
+            'hidden_dim': self.hidden_dim,
+            'num_layers': self.num_layers,
+            'num_heads': self.num_heads,
+        }
+    
     def train_model(self, epochs: int = 10, batch_size: int = 32):
         """
-        Train model on buffered data.
+        Train model on buffered data (in this process) and publish it.
         
         Args:
             epochs: Number of training epochs
@@ -226,75 +510,112 @@ class LookaheadTransformer:
         
         try:
             # Prepare data
-            X = np.array(list(self.sequence_buffer))  # (N, seq_len, input_dim)
-            y = np.array(list(self.target_buffer))  # (N,)
+            X, y = self.sequence_buffer.snapshot()  # (N, seq_len, input_dim), (N,)
             
             # Convert to tensors
-            X_tensor = torch.FloatTensor(X)
-            y_tensor = torch.FloatTensor(y).unsqueeze(1)
-            
-            # Training loop
-            self.model.train()
-            total_loss = 0.0
-            
-            for epoch in range(epochs):
-                # Shuffle data
-                indices = torch.randperm(len(X_tensor))
-                X_shuffled = X_tensor[indices]
-                y_shuffled = y_tensor[indices]
-                
-                epoch_loss = 0.0
-                num_batches = 0
-                
-                # Mini-batch training
-                for i in range(0, len(X_shuffled), batch_size):
-                    batch_X = X_shuffled[i:i+batch_size]
-                    batch_y = y_shuffled[i:i+batch_size]
-                    
-                    # Forward pass
-                    self.optimizer.zero_grad()
-                    predictions = self.model(batch_X)
-                    loss = self.criterion(predictions, batch_y)
-                    
-                    # Backward pass
-                    loss.backward()
-                    self.optimizer.step()
-                    
-                    epoch_loss += loss.item()
-                    num_batches += 1
-                
-                total_loss = epoch_loss / max(1, num_batches)
+            X_tensor = torch.from_numpy(X)
+            y_tensor = torch.from_numpy(y).unsqueeze(1)
             
-            self.train_loss = total_loss
-            self.is_trained = True
+            self.train_loss = _fit(
+                self.model, self.optimizer, self.criterion, X_tensor, y_tensor, epochs, batch_size
+            )
             
             # Compute validation metrics
-            self._compute_metrics(X_tensor, y_tensor)
+            self.mae, self.direction_accuracy = _evaluate(self.model, X_tensor, y_tensor)
+            
+            self._swap_inference_model(self.model.state_dict())
             
         except Exception as e:
             print(f"⚠️  Lookahead training error: {e}")
     
-    def _compute_metrics(self, X: torch.Tensor, y: torch.Tensor):
+    def _build_inference_model(
+        self, state_dict: Dict[str, torch.Tensor]
+    ) -> Tuple[TransformerPredictor, Callable[[np.ndarray], np.ndarray]]:
+        """Build a frozen eval-mode copy from weights and its warmed-up batch function."""
+        model = TransformerPredictor(input_dim=self.input_dim, **self._model_kwargs())
+        model.load_state_dict(copy.deepcopy(state_dict))
+        model.eval()
+        model.requires_grad_(False)
+        
+        example = torch.zeros(1, self.sequence_length, self.input_dim)
+        inference_fn = _compile_for_inference(
+            model, self.inference_backend, example, self.inference_threads
+        )
+        # First call pays for lazy compilation (torch.compile) here, not in predict
+        inference_fn(example.numpy())
+        return model, inference_fn
+    
+    def _install(self, model: TransformerPredictor, inference_fn: Callable[[np.ndarray], np.ndarray]):
+        # Single reference assignment: predict sees the old or the new model
+        self.inference_model = model
+        self.inference_fn = inference_fn
+        self.is_trained = True
+    
+    def _swap_inference_model(self, state_dict: Dict[str, torch.Tensor]):
+        """Build a frozen eval-mode copy from weights and swap it in."""
+        self._install(*self._build_inference_model(state_dict))
+    
+    def _build_published(self, version: int):
+        """Load and build published weights (runs on the builder thread)."""
+        metrics = self.sequence_buffer.metrics()
+        try:
+            state_dict = torch.load(_weights_path(self.weights_dir, version), map_location="cpu")
+            model, inference_fn = self._build_inference_model(state_dict)
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️  Lookahead weights load error: {e}")
+            return
+        self._built = (version, model, inference_fn, metrics)
+    
+    def poll_weights(self, wait: bool = False) -> bool:
         """
-        Compute validation metrics.
+        Swap in weights published by the trainer process, if newer.
+        
+        New weights are loaded and compiled on a background thread; a later
+        call swaps the finished model in. Cheap when nothing changed (one
+        shared-memory integer read).
         
         Args:
-            X: Input tensor
-            y: Target tensor
+            wait: Build in the calling thread and swap immediately
+        
+        Returns:
+            True if a new model was swapped in
         """
-        self.model.eval()
-        with torch.no_grad():
-            predictions = self.model(X)
-            
-            # MAE
-            mae = torch.abs(predictions - y).mean().item()
-            self.mae = mae
-            
-            # Direction accuracy
-            pred_direction = (predictions > 0).float()
-            true_direction = (y > 0).float()
-            direction_acc = (pred_direction == true_direction).float().mean().item()
-            self.direction_accuracy = direction_acc * 100.0
+        if not self.enabled:
+            return False
+        
+        builder = self._builder
+        if builder is not None:
+            if wait:
+                builder.join()
+            elif builder.is_alive():
+                return False
+            self._builder = None
+        
+        swapped = self._install_built()
+        version = self.sequence_buffer.weights_version
+        if version <= self.weights_version:
+            return swapped
+        
+        if wait:
+            self._build_published(version)
+            return self._install_built() or swapped
+        
+        self._builder = threading.Thread(
+            target=self._build_published, args=(version,), name="lookahead-weights", daemon=True
+        )
+        self._builder.start()
+        return swapped
+    
+    def _install_built(self) -> bool:
+        """Swap in the model finished by the builder, if any (builder not running)."""
+        built, self._built = self._built, None
+        if built is None or built[0] <= self.weights_version:
+            return False
+        version, model, inference_fn, metrics = built
+        self._install(model, inference_fn)
+        self.weights_version = version
+        self.train_loss, self.mae, self.direction_accuracy = metrics
+        return True
     
     def predict(
         self,
@@ -309,53 +630,117 @@ class LookaheadTransformer:
         Returns:
             Predicted price change % or None if not ready
         """
-        if not self.enabled or not self.is_trained or len(hedge_snapshots) < self.sequence_length:
-            return None
+        return self.predict_batch({None: hedge_snapshots})[None]
+    
+    def predict_batch(
+        self,
+        histories: Dict[Any, List[Dict[str, float]]]
+    ) -> Dict[Any, Optional[float]]:
+        """
+        Predict price change % for many symbols in one forward pass.
+        
+        All sequences are stacked into one (B, seq_len, input_dim) block and
+        scored by the compiled inference model. Not thread-safe: the input
+        block is reused between calls.
+        
+        Args:
+            histories: Symbol -> recent hedge snapshots (oldest to newest)
+        
+        Returns:
+            Symbol -> predicted price change % (None if not ready)
+        """
+        results: Dict[Any, Optional[float]] = dict.fromkeys(histories)
+        if not self.enabled:
+            return results
+        
+        if self.training_process is not None:
+            self.poll_weights()
+        
+        inference_fn = self.inference_fn
+        ready = [key for key, snaps in histories.items() if len(snaps) >= self.sequence_length]
+        if inference_fn is None or not ready:
+            return results
         
         try:
-            # Take last sequence_length snapshots
-            recent_snapshots = hedge_snapshots[-self.sequence_length:]
-            
-            # Extract features
-            features = [self._extract_features(snap) for snap in recent_snapshots]
-            
-            # Convert to tensor
-            X = torch.FloatTensor([features])  # (1, seq_len, input_dim)
+            # Stack sequences into the reusable input block
+            if len(ready) > len(self._batch_X):
+                self._batch_X = np.empty(
+                    (max(len(ready), 2 * len(self._batch_X)), self.sequence_length, self.input_dim),
+                    dtype=np.float32,
+                )
+            X = self._batch_X[:len(ready)]
+            for i, key in enumerate(ready):
+                self._fill_sequence(histories[key][-self.sequence_length:], X[i])
             
             # Predict
-            self.model.eval()
-            with torch.no_grad():
-                prediction = self.model(X)
+            predictions = inference_fn(X)
             
-            self.predictions_count += 1
-            
-            return float(prediction[0, 0].item())
+            self.predictions_count += len(ready)
+            results.update(zip(ready, predictions.tolist()))
             
         except Exception as e:
             print(f"⚠️  Lookahead prediction error: {e}")
-            return None
+        
+        return results
     
-    def start_background_training(self):
+    def start_background_training(self, epochs: int = 5, batch_size: int = 32):
         """
-        Start background training thread.
+        Start the background training process.
+        
+        Args:
+            epochs: Epochs per training round
+            batch_size: Batch size (also the minimum buffered sequences)
         """
-        if not self.enabled or self.training_thread is not None:
+        if not self.enabled or self.training_process is not None:
             return
         
-        def training_loop():
-            while not self.stop_training:
-                time.sleep(self.train_every_minutes * 60)
-                if len(self.sequence_buffer) >= 32:
-                    self.train_model(epochs=5, batch_size=32)
-        
-        self.training_thread = threading.Thread(target=training_loop, daemon=True)
-        self.training_thread.start()
+        # Continue from the weights being served (or the in-process model)
+        current = self.inference_model if self.inference_model is not None else self.model
+        
+        ctx = multiprocessing.get_context("spawn")
+        self._stop_event = ctx.Event()
+        self.training_process = ctx.Process(
+            target=_training_process,
+            args=(
+                self.sequence_buffer.name,
+                self.buffer_size,
+                self.sequence_length,
+                self.input_dim,
+                self._model_kwargs(),
+                self.weights_dir,
+                self.train_every_minutes * 60,
+                epochs,
+                batch_size,
+                self.trainer_threads,
+                self._stop_event,
+                copy.deepcopy(current.state_dict()),
+            ),
+            daemon=True,
+        )
+        self.training_process.start()
     
     def stop_background_training(self):
-        """Stop background training thread"""
-        self.stop_training = True
-        if self.training_thread:
-            self.training_thread.join(timeout=5)
+        """Stop background training process and pick up its last weights"""
+        if self.training_process is None:
+            return
+        
+        self._stop_event.set()
+        self.training_process.join(timeout=5)
+        if self.training_process.is_alive():
+            self.training_process.terminate()
+            self.training_process.join()
+        
+        self.training_process = None
+        self.poll_weights(wait=True)
+    
+    def close(self):
+        """Stop training and release the shared-memory buffer (and temp weights dir)."""
+        if not self.enabled:
+            return
+        self.stop_background_training()
+        if self._builder is not None:
+            self._builder.join()
+        self._finalizer()
     
     def get_stats(self) -> Dict:
         """
@@ -370,7 +755,7 @@ class LookaheadTransformer:
             'mae': self.mae,
             'direction_accuracy': self.direction_accuracy,
             'predictions_count': self.predictions_count,
-            'sequences': len(self.sequence_buffer),
+            'sequences': len(self.sequence_buffer) if self.enabled else 0,
             'weight': self.prediction_weight
         }
     
@@ -411,9 +796,7 @@ class LookaheadTransformer:
             Restored LookaheadTransformer instance
         """
         if not data.get('enabled', False) or not TORCH_AVAILABLE:
-            instance = cls()
-            instance.enabled = False
-            return instance
+            return cls(enabled=False)
         
         instance = cls(
             sequence_length=data.get('sequence_length', 20),
@@ -0,0 +1,146 @@
+"""
+Shared-memory ring buffer of training sequences.
+
+Single writer (the live process appends sequences), any number of readers
+(the trainer process snapshots the buffer between training rounds). All
+arrays are preallocated float32 blocks in one SharedMemory segment, so
+appending never allocates and reading never re-stacks Python lists.
+
+Layout of the segment:
+    header   int64[4]    write count, published weights version, reserved
+    metrics  float64[4]  train_loss, mae, direction_accuracy, reserved
+    X        float32[capacity, seq_len, dim]
+    y        float32[capacity]
+"""
+
+from __future__ import annotations
+
+import weakref
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+_HEADER_SLOTS = 4
+_METRIC_SLOTS = 4
+
+# Header slots
+_COUNT = 0
+_WEIGHTS_VERSION = 1
+
+
+class SharedSequenceRing:
+    """Fixed-capacity ring of (sequence, target) pairs in shared memory."""
+
+    def __init__(
+        self,
+        capacity: int,
+        seq_len: int,
+        dim: int,
+        name: Optional[str] = None,
+    ):
+        """
+        Create a new ring, or attach to an existing one by name.
+
+        Args:
+            capacity: Number of sequences kept (oldest overwritten first)
+            seq_len: Snapshots per sequence
+            dim: Features per snapshot
+            name: Shared memory name to attach to (None = create)
+        """
+        self.capacity = capacity
+        self.seq_len = seq_len
+        self.dim = dim
+
+        header_bytes = 8 * (_HEADER_SLOTS + _METRIC_SLOTS)
+        x_bytes = 4 * capacity * seq_len * dim
+        size = header_bytes + x_bytes + 4 * capacity
+
+        self._owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        # The creator unlinks the segment even if close() is never called
+        self._unlink = weakref.finalize(self, self.shm.unlink) if self._owner else None
+
+        buf = self.shm.buf
+        self._header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=buf)
+        self._metrics = np.ndarray(
+            (_METRIC_SLOTS,), dtype=np.float64, buffer=buf, offset=8 * _HEADER_SLOTS
+        )
+        self._X = np.ndarray(
+            (capacity, seq_len, dim), dtype=np.float32, buffer=buf, offset=header_bytes
+        )
+        self._y = np.ndarray(
+            (capacity,), dtype=np.float32, buffer=buf, offset=header_bytes + x_bytes
+        )
+
+        if self._owner:
+            self._header[:] = 0
+            self._metrics[:] = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def count(self) -> int:
+        """Total sequences ever appended."""
+        return int(self._header[_COUNT])
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, sequence: np.ndarray, target: float):
+        """
+        Append one sequence (writer side only).
+
+        The slot is filled before the count is advanced, so readers never
+        see a half-written sequence as valid.
+        """
+        count = int(self._header[_COUNT])
+        slot = count % self.capacity
+        self._X[slot] = sequence
+        self._y[slot] = target
+        self._header[_COUNT] = count + 1
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy out the valid sequences, oldest first.
+
+        Sequences overwritten (or being written) while copying are dropped,
+        so the result is consistent without locking the writer.
+
+        Returns:
+            Tuple of (X, y) with shapes (n, seq_len, dim) and (n,)
+        """
+        before = self.count
+        X = self._X.copy()
+        y = self._y.copy()
+        after = self.count
+
+        # The slot for sequence ``after`` may be mid-write, hence the +1
+        first = max(0, after + 1 - self.capacity)
+        order = np.arange(first, before) % self.capacity
+        return X[order], y[order]
+
+    @property
+    def weights_version(self) -> int:
+        """Version of the most recently published model weights (0 = none)."""
+        return int(self._header[_WEIGHTS_VERSION])
+
+    def publish(self, version: int, train_loss: float, mae: float, direction_accuracy: float):
+        """Record training metrics, then advance the published weights version."""
+        self._metrics[:3] = (train_loss, mae, direction_accuracy)
+        self._header[_WEIGHTS_VERSION] = version
+
+    def metrics(self) -> Tuple[float, float, float]:
+        """Metrics of the last published weights: (train_loss, mae, direction_accuracy)."""
+        train_loss, mae, direction_accuracy = self._metrics[:3].tolist()
+        return train_loss, mae, direction_accuracy
+
+    def close(self):
+        """Detach; the creating side also frees the segment."""
+        # Drop views before closing, otherwise the buffer is still exported
+        self._header = self._metrics = self._X = self._y = None
+        self.shm.close()
+        if self._unlink is not None:
+            self._unlink()
@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 os.environ["ENABLE_TRADING"] = "true"
 
 from gnosis.scanner import MultiTimeframeScanner
-from gnosis.trading.live_bot import LiveTradingBot
+from gnosis.trading.multi_symbol_runtime import create_live_runtime
 from loguru import logger
 import yaml
 
@@ -35,7 +35,8 @@ class FullTradingSystem:
     
     def __init__(self):
         self.scanner = None
-        self.trading_bots = {}
+        self.runtime = None
+        self.position_mgr = None
         self.running = False
         self.trades_executed = 0
         self.alerts_triggered = 0
@@ -80,24 +81,25 @@ class FullTradingSystem:
         logger.info("Initializing multi-timeframe scanner...")
         self.scanner = MultiTimeframeScanner()
         
-        # Initialize primary trading bots for top symbols
+        # One multiplexed runtime for the primary symbols: one stream
+        # subscription, shared position/risk managers, a worker per symbol
         # Start with SPY, QQQ, and top tech stocks
         primary_symbols = ['SPY', 'QQQ', 'AAPL', 'NVDA', 'TSLA']
         
-        for symbol in primary_symbols:
-            logger.info(f"Initializing trading bot for {symbol}...")
-            self.trading_bots[symbol] = LiveTradingBot(
-                symbol=symbol,
-                bar_interval="1Min",
-                enable_memory=True,
-                enable_trading=True,  # TRADING IS ENABLED
-                paper_mode=True
-            )
+        logger.info(f"Initializing trading runtime for {', '.join(primary_symbols)}...")
+        self.runtime, self.position_mgr, _ = create_live_runtime(
+            primary_symbols,
+            bar_interval="1Min",
+            enable_memory=True,
+            enable_trading=True,  # TRADING IS ENABLED
+            paper_mode=True,
+            max_positions=3,
+        )
         
         print(f"""
 ✅ SYSTEM INITIALIZED:
    • Scanner: {len(self.symbols)} symbols configured
-   • Trading Bots: {len(self.trading_bots)} active ({', '.join(self.trading_bots.keys())})
+   • Trading Symbols: {len(self.runtime.symbols)} active ({', '.join(self.runtime.symbols)})
    • Timeframes: 7 (1m, 5m, 15m, 30m, 1h, 4h, 1d)
    • Data Source: Unusual Whales (primary) + Alpaca (market data)
    • Risk Management: Active (2% stop-loss, 3 position max)
@@ -131,7 +133,7 @@ class FullTradingSystem:
                             
                             # If we have a bot for this symbol, it will handle trading
                             # Otherwise, log for potential future action
-                            if alert.symbol not in self.trading_bots:
+                            if alert.symbol not in self.runtime.channels:
                                 logger.info(f"   → Consider adding {alert.symbol} to active trading")
                     
                     # Show top opportunities
@@ -178,6 +180,15 @@ class FullTradingSystem:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """)
                 
+                runtime = self.runtime.metrics()
+                latency = runtime["bar_to_decision"]
+                if latency["count"]:
+                    logger.info(
+                        f"Runtime: {runtime['processed']} bars processed, {runtime['dropped']} shed, "
+                        f"queue depth {runtime['queue_depth']}, "
+                        f"bar-to-decision p50={latency['p50_ms']:.1f}ms p99={latency['p99_ms']:.1f}ms"
+                    )
+                
                 if positions:
                     logger.info("Open positions:")
                     for pos in positions[:5]:  # Show first 5
@@ -204,11 +215,9 @@ class FullTradingSystem:
             scanner_task = asyncio.create_task(self.run_scanner_loop())
             tasks.append(scanner_task)
             
-            # Trading bot tasks
-            for symbol, bot in self.trading_bots.items():
-                logger.info(f"Starting {symbol} trading bot...")
-                bot_task = asyncio.create_task(bot.run())
-                tasks.append(bot_task)
+            # Trading runtime task (all symbols)
+            logger.info(f"Starting trading runtime ({len(self.runtime.symbols)} symbols)...")
+            tasks.append(asyncio.create_task(self.runtime.run()))
             
             # Performance monitor
             monitor_task = asyncio.create_task(self.monitor_performance())
@@ -244,10 +253,12 @@ Press Ctrl+C to stop gracefully.
         logger.info("Initiating graceful shutdown...")
         self.running = False
         
-        # Stop all trading bots
-        for symbol, bot in self.trading_bots.items():
-            logger.info(f"Stopping {symbol} bot...")
-            bot.running = False
+        # Stop the trading runtime
+        if self.runtime:
+            logger.info("Stopping trading runtime...")
+            await self.runtime.stop()
+        if self.position_mgr:
+            self.position_mgr.close()
         
         # Final report
         try:
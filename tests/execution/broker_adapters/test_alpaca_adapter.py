@@ -326,6 +326,40 @@ class TestAlpacaBrokerAdapterOrderManagement:
         assert result.avg_fill_price == 455.50
         assert len(result.fills) == 1
     
+    def test_list_orders_since_single_request(self, mock_adapter):
+        """Test bulk order status retrieval."""
+        orders = []
+        for i, status in enumerate(["new", "filled"]):
+            mock_order = Mock()
+            mock_order.id = f"order_{i}"
+            mock_order.symbol = "SPY"
+            mock_order.qty = "10"
+            mock_order.side = "buy"
+            mock_order.order_type = "limit"
+            mock_order.status = status
+            mock_order.filled_qty = "10" if status == "filled" else "0"
+            mock_order.filled_avg_price = "455.50" if status == "filled" else None
+            mock_order.submitted_at = datetime.now(timezone.utc)
+            mock_order.filled_at = None
+            mock_order.asset_class = "us_equity"
+            orders.append(mock_order)
+        
+        mock_adapter.client.get_orders.return_value = orders
+        
+        results = mock_adapter.list_orders_since(datetime.now(timezone.utc))
+        
+        assert mock_adapter.client.get_orders.call_count == 1
+        assert [r.order_id for r in results] == ["order_0", "order_1"]
+        assert results[0].status == OrderStatus.SUBMITTED
+        assert results[1].status == OrderStatus.FILLED
+    
+    def test_list_orders_since_failure(self, mock_adapter):
+        """Test bulk order status failure."""
+        mock_adapter.client.get_orders.side_effect = Exception("API error")
+        
+        with pytest.raises(BrokerError, match="Failed to list orders"):
+            mock_adapter.list_orders_since(datetime.now(timezone.utc))
+    
     def test_cancel_order_success(self, mock_adapter):
         """Test successful order cancellation."""
         mock_adapter.client.cancel_order_by_id.return_value = None
@@ -0,0 +1,251 @@
+# tests/execution/test_async_orchestrator.py
+
+"""
+Tests for the async submission pipeline of ExecutionOrchestrator.
+
+Runs against a local simulated broker with configurable latency and
+injected network errors.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from agents.portfolio.schemas import OrderAction, OrderInstruction
+from agents.trade_agent.schemas import StrategyType
+from execution.broker.base import AbstractBrokerAdapter, InvalidOrderError, NetworkError
+from execution.orchestrator import ExecutionOrchestrator
+from execution.registry import ExecutionRegistry
+from execution.schemas import BrokerResponse, OrderStatus
+
+
+class FlakyBroker(AbstractBrokerAdapter):
+    """Simulated broker: fixed latency, per-asset injected failures."""
+
+    def __init__(self, latency_seconds: float = 0.0, failures: dict | None = None):
+        self.latency_seconds = latency_seconds
+        self.failures = dict(failures or {})  # asset -> network errors before success
+        self.calls = defaultdict(int)
+        self.ack_order: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def submit_order(self, envelope):
+        asset = envelope.instruction.asset
+        with self._lock:
+            self.calls[asset] += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency_seconds)
+            if asset == "BAD":
+                raise InvalidOrderError("bad symbol")
+            with self._lock:
+                if self.failures.get(asset, 0) > 0:
+                    self.failures[asset] -= 1
+                    raise NetworkError("connection reset")
+                self.ack_order.append(asset)
+            return BrokerResponse(
+                success=True,
+                status=OrderStatus.SUBMITTED,
+                broker_order_id=f"SIM-{asset}-{envelope.idempotency_key[:6]}",
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def fetch_status(self, broker_order_id):
+        raise NotImplementedError
+
+    def cancel_order(self, broker_order_id):
+        raise NotImplementedError
+
+    def get_account_info(self):
+        return {}
+
+
+def instruction(asset: str, size: int = 1) -> OrderInstruction:
+    return OrderInstruction(
+        action=OrderAction.OPEN,
+        asset=asset,
+        strategy_type=StrategyType.STOCK,
+        size_delta=size,
+        notional_risk=100.0,
+        reason="test",
+    )
+
+
+@pytest.fixture
+def make_orchestrator(tmp_path):
+    created = []
+
+    def make(broker, **kwargs):
+        kwargs.setdefault("retry_delay_seconds", 0.01)
+        orchestrator = ExecutionOrchestrator(
+            broker, registry=ExecutionRegistry(tmp_path / f"registry_{len(created)}.db"), **kwargs
+        )
+        created.append(orchestrator)
+        return orchestrator
+
+    yield make
+    for orchestrator in created:
+        orchestrator.close()
+
+
+async def test_orders_submitted_concurrently(make_orchestrator):
+    broker = FlakyBroker(latency_seconds=0.05)
+    orchestrator = make_orchestrator(broker, max_in_flight=4)
+    await orchestrator.start()
+
+    envelopes = await asyncio.gather(
+        *(orchestrator.submit_async(instruction(f"S{i}"), limit_price=10.0) for i in range(8))
+    )
+    await orchestrator.stop()
+
+    assert all(e.status == OrderStatus.SUBMITTED for e in envelopes)
+    assert broker.max_active == 4
+
+
+async def test_network_errors_retried_without_blocking_other_orders(make_orchestrator):
+    broker = FlakyBroker(latency_seconds=0.01, failures={"FLAKY": 2})
+    orchestrator = make_orchestrator(broker, max_in_flight=2, retry_delay_seconds=0.05)
+    await orchestrator.start()
+
+    flaky = orchestrator.submit_nowait(instruction("FLAKY"), limit_price=10.0)
+    others = [orchestrator.submit_nowait(instruction(f"S{i}"), limit_price=10.0) for i in range(3)]
+    results = await asyncio.gather(flaky, *others)
+    await orchestrator.stop()
+
+    assert [e.status for e in results] == [OrderStatus.SUBMITTED] * 4
+    assert results[0].retry_count == 2
+    assert broker.calls["FLAKY"] == 3
+    # Healthy orders were acknowledged while FLAKY was backing off
+    assert broker.ack_order[-1] == "FLAKY"
+
+
+async def test_max_retries_exceeded_marks_error(make_orchestrator):
+    broker = FlakyBroker(failures={"DOWN": 10})
+    orchestrator = make_orchestrator(broker, max_retries=3)
+    await orchestrator.start()
+
+    envelope = await orchestrator.submit_async(instruction("DOWN"), limit_price=10.0)
+    await orchestrator.stop()
+
+    assert envelope.status == OrderStatus.ERROR
+    assert envelope.retry_count == 3
+    assert "Max retries exceeded" in envelope.error_message
+    assert broker.calls["DOWN"] == 3
+
+
+async def test_non_retryable_error_not_retried(make_orchestrator):
+    broker = FlakyBroker()
+    orchestrator = make_orchestrator(broker)
+    await orchestrator.start()
+
+    envelope = await orchestrator.submit_async(instruction("BAD"), limit_price=10.0)
+    await orchestrator.stop()
+
+    assert envelope.status == OrderStatus.ERROR
+    assert broker.calls["BAD"] == 1
+
+
+async def test_duplicate_instructions_submitted_once(make_orchestrator):
+    broker = FlakyBroker(latency_seconds=0.02)
+    orchestrator = make_orchestrator(broker)
+    await orchestrator.start()
+
+    first, second = await asyncio.gather(
+        orchestrator.submit_async(instruction("SPY"), limit_price=10.0),
+        orchestrator.submit_async(instruction("SPY"), limit_price=10.0),
+    )
+    # Already acknowledged: served from the registry
+    third = await orchestrator.submit_async(instruction("SPY"), limit_price=10.0)
+    await orchestrator.stop()
+
+    assert broker.calls["SPY"] == 1
+    assert first.order_id == second.order_id == third.order_id
+    assert third.status == OrderStatus.SUBMITTED
+
+
+async def test_bounded_queue_rejects_when_full(make_orchestrator):
+    broker = FlakyBroker(latency_seconds=0.05)
+    orchestrator = make_orchestrator(broker, max_in_flight=1, max_queue_size=2)
+    await orchestrator.start()
+
+    futures = [orchestrator.submit_nowait(instruction(f"S{i}"), limit_price=10.0) for i in range(2)]
+    await asyncio.sleep(0.01)  # dispatcher moves S0 in flight, S1 stays queued
+    futures.append(orchestrator.submit_nowait(instruction("S2"), limit_price=10.0))
+
+    with pytest.raises(asyncio.QueueFull):
+        orchestrator.submit_nowait(instruction("S3"), limit_price=10.0)
+    assert orchestrator.queue_depth == 2
+    assert len(orchestrator.registry.get_all()) == 3  # S3 was never persisted
+
+    await asyncio.gather(*futures)
+    await orchestrator.stop()
+
+
+async def test_latency_histograms(make_orchestrator):
+    broker = FlakyBroker(latency_seconds=0.01, failures={"S0": 1})
+    orchestrator = make_orchestrator(broker)
+    await orchestrator.start()
+
+    await asyncio.gather(
+        *(orchestrator.submit_async(instruction(f"S{i}"), limit_price=10.0) for i in range(5))
+    )
+    await orchestrator.stop()
+
+    stats = orchestrator.latency_stats()
+    assert stats["submit_to_ack"]["count"] == 5
+    assert stats["broker_call"]["count"] == 6
+    assert stats["submit_to_ack"]["p50_ms"] >= 10.0
+    assert stats["submit_to_ack"]["max_ms"] >= stats["submit_to_ack"]["p99_ms"]
+
+
+async def test_pipeline_flushes_idle_write_behind_registry(tmp_path):
+    registry = ExecutionRegistry(
+        tmp_path / "registry.db", write_behind=True, flush_interval_seconds=0.05
+    )
+    orchestrator = ExecutionOrchestrator(FlakyBroker(), registry=registry)
+    await orchestrator.start()
+
+    await orchestrator.submit_async(instruction("SPY"), limit_price=10.0)
+    await asyncio.sleep(0.2)  # no further writes
+
+    assert registry._dirty == set()
+    assert registry._conn.execute("SELECT count(*) FROM orders").fetchone()[0] == 1
+    await orchestrator.stop()
+    orchestrator.close()
+
+
+async def test_submit_requires_start(make_orchestrator):
+    orchestrator = make_orchestrator(FlakyBroker())
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.submit_async(instruction("SPY"), limit_price=10.0)
+
+
+def test_sync_submit_retries_with_backoff(make_orchestrator):
+    broker = FlakyBroker(failures={"FLAKY": 1})
+    orchestrator = make_orchestrator(broker)
+
+    envelope = orchestrator.submit(instruction("FLAKY"), limit_price=10.0)
+
+    assert envelope.status == OrderStatus.SUBMITTED
+    assert envelope.retry_count == 1
+    assert orchestrator.latency["submit_to_ack"].count == 1
+
+
+def test_backoff_is_exponential_capped_and_jittered(make_orchestrator):
+    orchestrator = make_orchestrator(
+        FlakyBroker(), retry_delay_seconds=1.0, max_retry_delay_seconds=5.0, retry_jitter=0.5
+    )
+
+    for attempt, nominal in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+        delays = [orchestrator._backoff_delay(attempt) for _ in range(50)]
+        assert all(nominal * 0.5 <= d <= nominal for d in delays)
+        assert len(set(delays)) > 1
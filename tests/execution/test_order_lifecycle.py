@@ -0,0 +1,272 @@
+# tests/execution/test_order_lifecycle.py
+
+"""
+Tests for OrderLifecycleController order tracking.
+
+Covers event-driven updates from broker trade updates, bulk polling as a
+fallback, the next-action queue, and cancel/replace repricing. Uses the
+simulated broker with resting limit orders.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from execution.broker_adapters.base import BrokerError
+from execution.broker_adapters.simulated_adapter import SimulatedBrokerAdapter
+from execution.order_controller import OrderLifecycleController
+from execution.schemas import (
+    AssetClass,
+    OrderRequest,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Quote,
+)
+
+
+def make_quote(symbol: str, bid: float, ask: float) -> Quote:
+    return Quote(
+        symbol=symbol,
+        bid=bid,
+        ask=ask,
+        mid=(bid + ask) / 2,
+        last=(bid + ask) / 2,
+        bid_size=100,
+        ask_size=100,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+def buy(symbol: str, quantity: int = 10) -> OrderRequest:
+    return OrderRequest(
+        asset_class=AssetClass.STOCK,
+        symbol=symbol,
+        side=OrderSide.BUY,
+        quantity=quantity,
+        order_type=OrderType.LIMIT,
+    )
+
+
+class CountingBroker(SimulatedBrokerAdapter):
+    """Simulated broker that counts status requests."""
+
+    def __init__(self, **kwargs):
+        super().__init__(immediate_fills=False, **kwargs)
+        self.bulk_calls = 0
+        self.status_calls = 0
+        self.cancel_calls = 0
+
+    def list_orders_since(self, since):
+        self.bulk_calls += 1
+        return super().list_orders_since(since)
+
+    def get_order_status(self, order_id):
+        self.status_calls += 1
+        return super().get_order_status(order_id)
+
+    def cancel_order(self, order_id):
+        self.cancel_calls += 1
+        return super().cancel_order(order_id)
+
+
+@pytest.fixture
+def broker():
+    broker = CountingBroker()
+    for symbol in ["SPY", "QQQ", "IWM"]:
+        broker.set_quote(symbol, make_quote(symbol, 99.0, 101.0))  # 2% spread -> limit at 100.2
+    return broker
+
+
+def submit(controller, broker, symbol, quantity=10):
+    return controller.submit_order(buy(symbol, quantity), broker.get_quote(symbol))
+
+
+def test_resting_order_is_tracked(broker):
+    controller = OrderLifecycleController(broker)
+
+    result = submit(controller, broker, "SPY")
+
+    assert result.status == OrderStatus.SUBMITTED
+    assert controller.get_active_orders() == {result.order_id: result}
+    assert broker.working_orders[result.order_id].limit_price == pytest.approx(100.2)
+
+
+def test_trade_update_fills_without_polling(broker):
+    controller = OrderLifecycleController(broker)
+    result = submit(controller, broker, "SPY")
+
+    broker.set_quote("SPY", make_quote("SPY", 99.9, 100.1))  # crosses the 100.2 bid
+
+    assert controller.get_active_orders() == {}
+    updates = controller.check_and_manage_orders()
+    assert updates[result.order_id].status == OrderStatus.FILLED
+    assert broker.bulk_calls == 0
+    assert broker.status_calls == 0
+
+
+def test_without_stream_one_bulk_poll_per_check(broker):
+    controller = OrderLifecycleController(broker, use_trade_updates=False)
+    results = [submit(controller, broker, symbol) for symbol in ["SPY", "QQQ", "IWM"]]
+    broker.set_quote("QQQ", make_quote("QQQ", 99.9, 100.1))
+
+    updates = controller.check_and_manage_orders()
+
+    assert broker.bulk_calls == 1
+    assert broker.status_calls == 0
+    assert set(updates) == {r.order_id for r in results}
+    assert updates[results[1].order_id].status == OrderStatus.FILLED
+    assert set(controller.get_active_orders()) == {results[0].order_id, results[2].order_id}
+
+
+def test_stream_polls_only_when_quiet(broker):
+    controller = OrderLifecycleController(broker, poll_interval_sec=30)
+    submit(controller, broker, "SPY")  # the SUBMITTED event counts as activity
+    now = datetime.now(timezone.utc)
+
+    controller.check_and_manage_orders(now=now + timedelta(seconds=5))
+    assert broker.bulk_calls == 0
+
+    controller.check_and_manage_orders(now=now + timedelta(seconds=40))
+    assert broker.bulk_calls == 1
+
+
+def test_only_due_orders_are_acted_on(broker):
+    controller = OrderLifecycleController(broker, reprice_interval_sec=60)
+    submit(controller, broker, "SPY")
+    now = datetime.now(timezone.utc)
+
+    assert controller.check_and_manage_orders(now=now + timedelta(seconds=10)) == {}
+    assert broker.cancel_calls == 0
+
+
+def test_stale_limit_order_is_cancelled_and_replaced(broker):
+    controller = OrderLifecycleController(broker, reprice_interval_sec=60)
+    original = submit(controller, broker, "SPY")
+    broker.set_quote("SPY", make_quote("SPY", 101.0, 103.0))  # market moves away
+    now = datetime.now(timezone.utc)
+
+    updates = controller.check_and_manage_orders(now=now + timedelta(seconds=61))
+
+    replacement_id = controller.replacements[original.order_id]
+    assert updates[original.order_id].status == OrderStatus.CANCELLED
+    assert broker.get_order_status(original.order_id).status == OrderStatus.CANCELLED
+    assert broker.working_orders[replacement_id].limit_price == pytest.approx(102.2)
+    assert set(controller.get_active_orders()) == {replacement_id}
+    # Lifetime still measured from the first submission
+    assert controller.order_timestamps[replacement_id] <= now
+
+    broker.set_quote("SPY", make_quote("SPY", 101.5, 102.0))
+    assert controller.get_active_orders() == {}
+    assert broker.get_order_status(replacement_id).status == OrderStatus.FILLED
+
+
+def test_partially_filled_order_replaces_remaining_quantity(broker):
+    controller = OrderLifecycleController(broker, reprice_interval_sec=60, poll_interval_sec=3600)
+    original = submit(controller, broker, "SPY", quantity=10)
+    controller.on_trade_update(
+        original.model_copy(update={"status": OrderStatus.PARTIAL_FILL, "filled_quantity": 4})
+    )
+    now = datetime.now(timezone.utc)
+
+    controller.check_and_manage_orders(now=now + timedelta(seconds=61))
+
+    replacement_id = controller.replacements[original.order_id]
+    assert controller.get_active_orders()[replacement_id].quantity == 6
+
+
+def test_expired_order_is_cancelled(broker):
+    controller = OrderLifecycleController(
+        broker, reprice_interval_sec=60, max_order_lifetime_sec=90
+    )
+    original = submit(controller, broker, "SPY")
+    now = datetime.now(timezone.utc)
+
+    controller.check_and_manage_orders(now=now + timedelta(seconds=61))  # repriced once
+    replacement_id = controller.replacements[original.order_id]
+
+    updates = controller.check_and_manage_orders(now=now + timedelta(seconds=91))
+
+    assert replacement_id in updates
+    assert controller.get_active_orders() == {}
+    assert broker.get_order_status(replacement_id).status == OrderStatus.CANCELLED
+    assert broker.working_orders == {}
+
+
+def test_untracked_updates_are_ignored(broker):
+    controller = OrderLifecycleController(broker)
+    other = broker.place_order(buy("QQQ").model_copy(update={"limit_price": 100.0}))
+
+    broker.cancel_order(other.order_id)
+
+    assert controller.check_and_manage_orders() == {}
+
+
+class RacingBroker(CountingBroker):
+    """Partially fills an order just before cancelling it; can fail placements."""
+
+    def __init__(self, fill_on_cancel: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.fill_on_cancel = fill_on_cancel
+        self.fail_placements = False
+        self.controller = None
+        self.lock_held = []
+
+    def _held(self):
+        # The controller lock must be free for the trade-update thread
+        lock = self.controller._lock
+        free = lock.acquire(blocking=False)
+        if free:
+            lock.release()
+        return not free
+
+    def cancel_order(self, order_id):
+        if self.controller is not None:
+            self.lock_held.append(self._held())
+        if self.fill_on_cancel and order_id in self.working_orders:
+            self.orders[order_id] = self.orders[order_id].model_copy(
+                update={"status": OrderStatus.PARTIAL_FILL, "filled_quantity": self.fill_on_cancel}
+            )
+        return super().cancel_order(order_id)
+
+    def place_order(self, order):
+        if self.controller is not None:
+            self.lock_held.append(self._held())
+        if self.fail_placements:
+            raise BrokerError("order rejected by gateway")
+        return super().place_order(order)
+
+
+def racing_controller(fill_on_cancel: int = 0):
+    broker = RacingBroker(fill_on_cancel=fill_on_cancel)
+    broker.set_quote("SPY", make_quote("SPY", 99.0, 101.0))
+    controller = OrderLifecycleController(broker, reprice_interval_sec=60, poll_interval_sec=3600)
+    original = submit(controller, broker, "SPY", quantity=10)
+    broker.controller = controller
+    return controller, broker, original
+
+
+def test_fill_during_cancel_is_not_resubmitted():
+    controller, broker, original = racing_controller(fill_on_cancel=7)
+    now = datetime.now(timezone.utc)
+
+    updates = controller.check_and_manage_orders(now=now + timedelta(seconds=61))
+
+    assert updates[original.order_id].status == OrderStatus.CANCELLED
+    assert updates[original.order_id].filled_quantity == 7
+    replacement_id = controller.replacements[original.order_id]
+    assert controller.get_active_orders()[replacement_id].quantity == 3
+    assert broker.lock_held == [False, False]
+
+
+def test_failed_replacement_is_reported():
+    controller, broker, original = racing_controller()
+    broker.fail_placements = True
+    now = datetime.now(timezone.utc)
+
+    updates = controller.check_and_manage_orders(now=now + timedelta(seconds=61))
+
+    assert updates[original.order_id].status == OrderStatus.CANCELLED
+    assert "order rejected by gateway" in updates[original.order_id].error_message
+    assert original.order_id not in controller.replacements
+    assert controller.get_active_orders() == {}
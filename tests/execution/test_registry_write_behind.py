@@ -0,0 +1,229 @@
+# tests/execution/test_registry_write_behind.py
+
+"""
+Tests for write-behind ExecutionRegistry persistence.
+
+Covers in-memory indexes, batched flushes on size/time thresholds, and
+crash recovery by replaying the write-ahead log.
+"""
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from agents.portfolio.schemas import OrderAction, OrderInstruction
+from agents.trade_agent.schemas import StrategyType
+from execution.registry import ExecutionRegistry, generate_idempotency_key
+from execution.schemas import OrderEnvelope, OrderStatus
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def envelope(asset: str) -> OrderEnvelope:
+    instruction = OrderInstruction(
+        action=OrderAction.OPEN,
+        asset=asset,
+        strategy_type=StrategyType.STOCK,
+        size_delta=1,
+        notional_risk=100.0,
+        reason="test",
+    )
+    return OrderEnvelope(
+        idempotency_key=generate_idempotency_key(instruction),
+        instruction=instruction,
+        limit_price=10.0,
+    )
+
+
+def db_count(registry: ExecutionRegistry) -> int:
+    return registry._conn.execute("SELECT count(*) FROM orders").fetchone()[0]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "registry.db"
+
+
+def test_writes_batched_until_size_threshold(db_path):
+    registry = ExecutionRegistry(
+        db_path, write_behind=True, flush_max_records=5, flush_interval_seconds=3600
+    )
+
+    for i in range(4):
+        registry.create_envelope(envelope(f"S{i}"))
+    assert db_count(registry) == 0
+    assert registry.wal_path.stat().st_size > 0
+
+    registry.create_envelope(envelope("S4"))  # fifth dirty record triggers the flush
+    assert db_count(registry) == 5
+    assert registry.wal_path.stat().st_size == 0
+    registry.close()
+
+
+def test_time_threshold_flushes(db_path):
+    registry = ExecutionRegistry(
+        db_path, write_behind=True, flush_max_records=1000, flush_interval_seconds=0.0
+    )
+    registry.create_envelope(envelope("SPY"))
+    assert db_count(registry) == 1
+    registry.close()
+
+
+def test_idle_changes_flushed_when_due(db_path):
+    registry = ExecutionRegistry(
+        db_path, write_behind=True, flush_max_records=1000, flush_interval_seconds=0.05
+    )
+    registry.create_envelope(envelope("SPY"))
+    assert registry.flush_if_due() == 0
+    assert db_count(registry) == 0
+
+    time.sleep(0.06)
+
+    assert registry.flush_if_due() == 1
+    assert db_count(registry) == 1
+    registry.close()
+
+
+def test_lookups_served_from_memory(db_path, monkeypatch):
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    created, is_new = registry.create_envelope(envelope("SPY"))
+    assert is_new
+
+    def no_db(*args, **kwargs):
+        raise AssertionError("DuckDB queried for an in-memory order")
+
+    monkeypatch.setattr(registry, "_select_by_id", no_db)
+    registry.update_status(created.order_id, OrderStatus.SUBMITTED, broker_order_id="B-1")
+    assert registry.increment_retry(created.order_id) == 1
+
+    record = registry.get_by_id(created.order_id)
+    assert record.status == OrderStatus.SUBMITTED
+    assert record.broker_order_id == "B-1"
+    assert record.retry_count == 1
+
+    duplicate, is_new = registry.create_envelope(envelope("SPY"))
+    assert not is_new
+    assert duplicate.order_id == created.order_id
+    monkeypatch.undo()
+    registry.close()
+
+
+def test_terminal_orders_evicted_after_flush(db_path):
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    open_order, _ = registry.create_envelope(envelope("OPEN"))
+    filled, _ = registry.create_envelope(envelope("DONE"))
+    registry.update_status(filled.order_id, OrderStatus.FILLED, fill_price=10.0, filled_quantity=1)
+
+    assert registry.flush() == 2
+    assert str(open_order.order_id) in registry._records
+    assert str(filled.order_id) not in registry._records
+
+    # Evicted orders are still found (from DuckDB) and deduplicated
+    assert registry.get_by_id(filled.order_id).status == OrderStatus.FILLED
+    assert not registry.create_envelope(envelope("DONE"))[1]
+    assert [r.order_id for r in registry.get_by_status(OrderStatus.FILLED)] == [filled.order_id]
+    registry.close()
+
+
+def test_crash_recovery_replays_wal(db_path):
+    # Writer process dies (no close/flush) after acknowledging every change
+    script = textwrap.dedent(f"""
+        import os, sys
+        sys.path.insert(0, {str(PROJECT_ROOT)!r})
+        from tests.execution.test_registry_write_behind import envelope
+        from execution.registry import ExecutionRegistry
+        from execution.schemas import OrderStatus
+
+        registry = ExecutionRegistry(
+            {str(db_path)!r}, write_behind=True,
+            flush_max_records=3, flush_interval_seconds=3600,
+        )
+        ids = []
+        for asset in ["A", "B", "C", "D", "E"]:
+            ids.append(registry.create_envelope(envelope(asset))[0].order_id)
+        registry.update_status(ids[0], OrderStatus.FILLED, fill_price=10.5, filled_quantity=1)
+        registry.update_status(ids[3], OrderStatus.SUBMITTED, broker_order_id="B-D")
+        registry.increment_retry(ids[4])
+        print(",".join(str(i) for i in ids))
+        os._exit(1)
+    """)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+    )
+    ids = result.stdout.strip().split(",")
+    assert len(ids) == 5, result.stderr
+
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+
+    assert db_count(registry) == 5  # replayed entries flushed on startup
+    assert registry.wal_path.stat().st_size == 0
+    assert registry.get_by_id(ids[0]).status == OrderStatus.FILLED
+    assert registry.get_by_id(ids[0]).fill_price == 10.5
+    assert registry.get_by_id(ids[3]).broker_order_id == "B-D"
+    assert registry.get_by_id(ids[4]).retry_count == 1
+    assert len(registry.get_by_id(ids[0]).status_history) == 2
+    # Open orders are loaded back into memory
+    assert set(registry._records) == set(ids[1:])
+    registry.close()
+
+
+def test_torn_wal_tail_is_skipped(db_path):
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    created, _ = registry.create_envelope(envelope("SPY"))
+    registry._wal.close()
+    registry._conn.close()
+
+    with open(registry.wal_path, "a") as f:
+        f.write('{"order_id": "trunc')
+
+    recovered = ExecutionRegistry(db_path, write_behind=True)
+    assert recovered.get_by_id(created.order_id) is not None
+    assert db_count(recovered) == 1
+    recovered.close()
+
+
+def test_writes_after_torn_wal_tail_survive_restart(db_path):
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    registry.create_envelope(envelope("SPY"))
+    registry.close()
+    with open(registry.wal_path, "a") as f:
+        f.write('{"order_id": "trunc')
+
+    recovered = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    created, _ = recovered.create_envelope(envelope("QQQ"))
+    recovered._wal.close()
+    recovered._conn.close()  # crash: QQQ only in the WAL
+
+    again = ExecutionRegistry(db_path, write_behind=True)
+    assert again.get_by_id(created.order_id) is not None
+    assert db_count(again) == 2
+    again.close()
+
+
+def test_failed_wal_append_leaves_record_unchanged(db_path):
+    registry = ExecutionRegistry(db_path, write_behind=True, flush_interval_seconds=3600)
+    created, _ = registry.create_envelope(envelope("SPY"))
+
+    wal = registry._wal
+    registry._wal = None  # appends now fail
+    with pytest.raises(AttributeError):
+        registry.increment_retry(created.order_id)
+    registry._wal = wal
+
+    assert registry.get_by_id(created.order_id).retry_count == 0
+    assert registry.increment_retry(created.order_id) == 1
+    registry.close()
+
+
+def test_default_mode_unchanged(db_path):
+    registry = ExecutionRegistry(db_path)
+    created, _ = registry.create_envelope(envelope("SPY"))
+
+    assert db_count(registry) == 1
+    assert not registry.wal_path.exists()
+    assert registry.get_by_id(created.order_id).status == OrderStatus.PENDING
+    registry.close()
@@ -0,0 +1,68 @@
+"""Tests for the live bot's columnar bar ring buffer."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gnosis.trading.bar_buffer import BarBuffer
+
+
+def make_bar(i: int) -> dict:
+    return {
+        "t_event": datetime(2024, 10, 1, 14, 30, tzinfo=timezone.utc) + timedelta(minutes=i),
+        "symbol": "SPY",
+        "price": 580.0 + i,
+        "volume": 1000 + i,
+        "high": 581.0 + i,
+        "low": 579.0 + i,
+        "open": 580.5 + i,
+    }
+
+
+def test_columns_are_views_of_the_last_bars():
+    buffer = BarBuffer(capacity=5)
+    for i in range(3):
+        buffer.append(make_bar(i))
+
+    assert len(buffer) == 3
+    assert buffer.column("price").tolist() == [580.0, 581.0, 582.0]
+
+    for i in range(3, 12):
+        buffer.append(make_bar(i))
+
+    prices = buffer.column("price")
+    assert len(buffer) == 5
+    assert prices.tolist() == [587.0, 588.0, 589.0, 590.0, 591.0]
+    assert buffer.column("volume", 2).tolist() == [1010.0, 1011.0]
+    assert buffer.last("high") == 592.0
+    assert np.shares_memory(prices, buffer.column("price"))
+    with pytest.raises(ValueError):
+        prices[0] = 0.0
+
+
+def test_rows_and_frame_round_trip():
+    buffer = BarBuffer(capacity=4, symbol="SPY")
+    bars = [make_bar(i) for i in range(7)]
+    for bar in bars:
+        buffer.append(bar)
+
+    assert buffer[-1] == {**bars[-1], "volume": 1006.0}
+    assert buffer[0]["t_event"] == bars[3]["t_event"]
+    with pytest.raises(IndexError):
+        buffer[4]
+
+    frame = buffer.to_frame()
+    expected = pd.DataFrame(bars[3:])[frame.columns]
+    expected["volume"] = expected["volume"].astype(float)
+    expected["t_event"] = pd.to_datetime(expected["t_event"]).dt.as_unit("ns")
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_naive_timestamps_stay_naive():
+    buffer = BarBuffer(capacity=3)
+    buffer.append({**make_bar(0), "t_event": datetime(2024, 10, 1, 9, 30)})
+
+    assert buffer[0]["t_event"] == datetime(2024, 10, 1, 9, 30)
+    assert buffer.to_frame()["t_event"].dt.tz is None
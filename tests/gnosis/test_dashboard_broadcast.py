@@ -0,0 +1,169 @@
+"""Tests for coalesced, throttled websocket fan-out in the dashboard server."""
+
+import asyncio
+import json
+
+from gnosis.dashboard.dashboard_server import ClientConnection, ConnectionManager
+
+
+class FakeWebSocket:
+    """Records frames; can stall or fail on send."""
+
+    def __init__(self, stall: bool = False, fail: bool = False):
+        self.stall = stall
+        self.fail = fail
+        self.frames = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.stall:
+            await asyncio.Event().wait()
+        self.frames.append(frame)
+
+    async def close(self):
+        self.closed = True
+
+    def messages(self):
+        return [json.loads(frame) for frame in self.frames]
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_updates_coalesced_latest_value_wins():
+    manager = ConnectionManager(max_hz=1000)
+    ws = FakeWebSocket()
+    await manager.connect(ws)
+
+    for i in range(5):
+        manager.publish("positions", {"n": i})
+    manager.publish("trade", {"id": 1})
+    manager.publish("trade", {"id": 2})
+    await asyncio.sleep(0.01)
+
+    messages = ws.messages()
+    assert [m["type"] for m in messages] == ["positions", "trade", "trade"]
+    assert [m["data"] for m in messages] == [{"n": 4}, {"id": 1}, {"id": 2}]
+    manager.close()
+
+
+def test_flush_keeps_publish_order():
+    manager = ConnectionManager()
+
+    manager.publish("positions", {"n": 1})
+    manager.publish("trade", {"id": 1})
+    manager.publish("regime", {"primary": "trending"})
+    manager.publish("positions", {"n": 2})
+    manager.publish("trade", {"id": 2})
+    ws = FakeWebSocket()
+    client = manager.clients[ws] = ClientConnection(ws, max_queue_size=64)
+
+    assert manager.flush() == 4
+    # A trade stays after the positions update published before it
+    assert [(m["type"], m["data"]) for m in map(json.loads, client.queue)] == [
+        ("trade", {"id": 1}),
+        ("regime", {"primary": "trending"}),
+        ("positions", {"n": 2}),
+        ("trade", {"id": 2}),
+    ]
+
+
+def test_pending_events_capped_without_flusher():
+    manager = ConnectionManager(max_pending_events=5)
+
+    for i in range(20):
+        manager.publish("trade", {"id": i})
+    manager.publish("positions", {})
+
+    assert manager.stats()["dropped_events"] == 15
+    ws = FakeWebSocket()
+    client = manager.clients[ws] = ClientConnection(ws, max_queue_size=64)
+    assert manager.flush() == 6
+    assert [m["data"] for m in map(json.loads, client.queue)][:5] == [{"id": i} for i in range(15, 20)]
+
+
+async def test_flush_rate_limited():
+    manager = ConnectionManager(max_hz=10)
+    ws = FakeWebSocket()
+    await manager.connect(ws)
+
+    for i in range(50):
+        manager.publish("bar", {"i": i})
+        await asyncio.sleep(0.001)
+    await settle()
+
+    # Leading-edge flush, then nothing until the 100ms interval elapses
+    assert 1 <= len(ws.frames) <= 2
+    await asyncio.sleep(0.15)
+    assert ws.messages()[-1]["data"] == {"i": 49}
+    manager.close()
+
+
+async def test_frame_serialized_once_for_all_clients():
+    manager = ConnectionManager()
+    clients = [FakeWebSocket() for _ in range(3)]
+    for ws in clients:
+        await manager.connect(ws)
+
+    manager.publish("regime", {"primary": "trending"})
+    manager.flush()
+    await settle()
+
+    first = clients[0].frames[0]
+    assert all(ws.frames[0] is first for ws in clients)
+    manager.close()
+
+
+async def test_slow_client_drops_oldest_without_blocking_others():
+    manager = ConnectionManager(max_queue_size=3)
+    slow, fast = FakeWebSocket(stall=True), FakeWebSocket()
+    slow_client = await manager.connect(slow)
+    await manager.connect(fast)
+
+    for i in range(10):
+        manager.publish("trade", {"id": i})
+        manager.flush()
+        await settle()
+
+    assert [m["data"]["id"] for m in fast.messages()] == list(range(10))
+    # First frame is stuck in send; the queue keeps only the newest three
+    assert [json.loads(f)["data"]["id"] for f in slow_client.queue] == [7, 8, 9]
+    assert manager.stats()["dropped_frames"] == 6
+    manager.close()
+
+
+async def test_failed_and_stalled_clients_evicted():
+    manager = ConnectionManager(send_timeout=0.05)
+    dead, stalled, healthy = FakeWebSocket(fail=True), FakeWebSocket(stall=True), FakeWebSocket()
+    for ws in (dead, stalled, healthy):
+        await manager.connect(ws)
+
+    manager.publish("bar", {"i": 1})
+    manager.flush()
+    await asyncio.sleep(0.1)
+
+    assert manager.active_connections == [healthy]
+    assert manager.stats()["evicted"] == 2
+    assert dead.closed and stalled.closed
+
+    manager.publish("bar", {"i": 2})
+    manager.flush()
+    await settle()
+    assert [m["data"]["i"] for m in healthy.messages()] == [1, 2]
+    manager.close()
+
+
+def test_publish_without_event_loop_is_deferred():
+    manager = ConnectionManager()
+
+    manager.publish("positions", {})
+
+    assert manager.stats()["clients"] == 0
+    assert manager.flush() == 1
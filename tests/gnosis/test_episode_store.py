@@ -0,0 +1,187 @@
+"""Tests for the typed (v2) episode memory store."""
+
+import json
+from datetime import datetime
+
+import duckdb
+import polars as pl
+import pytest
+
+from gnosis.memory.schema import AgentView, Episode
+from gnosis.memory.store import EpisodeStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = EpisodeStore(str(tmp_path / "episodes.duckdb"))
+    yield s
+    s.close()
+
+
+def make_episode(episode_id: str = "ep-1", symbol: str = "SPY") -> Episode:
+    return Episode(
+        episode_id=episode_id,
+        symbol=symbol,
+        t_open=datetime(2024, 10, 1, 10, 0),
+        price_open=580.0,
+        features_digest={"hedge_gamma": 0.5, "liq_amihud": 0.02, "custom": 1.5},
+        agent_views=[
+            AgentView("hedge", 1, 0.7, "Gamma wall", {"gamma": 0.5}),
+            AgentView("liquidity", -1, 0.6, "Wide spreads", {"amihud": 0.02}),
+            AgentView("wyckoff", 1, 0.5, "Phase: markup", {"phase": "markup"}),
+        ],
+        decision=1,
+        decision_confidence=0.65,
+        position_size=0.1,
+        consensus_logic="2-of-3 agree",
+        embedding=[0.25, -0.5, 1.0],
+    )
+
+
+def close_episode(ep: Episode, pnl: float = 0.45) -> Episode:
+    ep.update_outcome(
+        t_close=datetime(2024, 10, 1, 14, 0),
+        price_close=583.0 if pnl > 0 else 577.0,
+        exit_reason="TP" if pnl > 0 else "SL",
+        pnl=pnl,
+        hit_target=pnl > 0,
+    )
+    ep.regime_label = "trending_up"
+    return ep
+
+
+def test_round_trip_matches_episode(store):
+    ep = make_episode()
+    store.write(ep)
+
+    assert store.read("ep-1").to_dict() == ep.to_dict()
+
+    close_episode(ep)
+    store.write(ep)
+
+    assert store.read("ep-1").to_dict() == ep.to_dict()
+    assert store.read("missing") is None
+
+
+def test_non_numeric_features_round_trip(store):
+    ep = make_episode()
+    ep.features_digest.update({"wyckoff_phase": "markup", "gap_up": True, "sent_score": None})
+    store.write(ep)
+
+    assert store.read("ep-1").features_digest == ep.features_digest
+    assert store.fetch_frame(columns=["hedge_gamma"]).item() == 0.5
+
+
+def test_hot_features_are_typed_columns(store):
+    store.write(make_episode())
+
+    frame = store.fetch_frame(columns=["episode_id", "hedge_gamma", "liq_amihud", "sent_momentum"])
+
+    assert isinstance(frame, pl.DataFrame)
+    assert frame["hedge_gamma"].dtype == pl.Float64
+    assert frame.row(0) == ("ep-1", 0.5, 0.02, None)
+
+
+def test_read_paths_filter_and_order(store):
+    store.write_many([
+        close_episode(make_episode("win", "SPY"), pnl=1.0),
+        close_episode(make_episode("loss", "SPY"), pnl=-0.5),
+        close_episode(make_episode("other", "QQQ"), pnl=0.2),
+        make_episode("open", "SPY"),
+    ])
+
+    assert {ep.episode_id for ep in store.read_recent("SPY")} == {"win", "loss"}
+    assert len(store.read_recent("SPY", closed_only=False)) == 3
+    assert [ep.episode_id for ep in store.read_by_outcome()] == ["win", "other", "loss"]
+    assert [ep.episode_id for ep in store.read_by_outcome(hit_target_only=True, symbol="SPY")] == ["win"]
+    assert store.fetch_frame(closed_only=True).height == 3
+
+
+def test_stats_and_agent_stats(store):
+    store.write_many([
+        close_episode(make_episode("win"), pnl=1.0),
+        close_episode(make_episode("loss"), pnl=-0.5),
+    ])
+
+    stats = store.get_stats()
+    assert stats["closed_episodes"] == 2
+    assert stats["win_rate"] == 0.5
+
+    agents = {row["agent_name"]: row for row in store.get_agent_stats().to_dicts()}
+    # Hedge voted long both times: right on the winner, wrong on the loser
+    assert agents["hedge"]["votes"] == 2
+    assert agents["hedge"]["accuracy"] == pytest.approx(0.5)
+    assert agents["liquidity"]["agreement_rate"] == pytest.approx(0.0)
+
+
+def write_v1_table(db_path: str, ep: Episode):
+    conn = duckdb.connect(db_path)
+    conn.execute("""
+        CREATE TABLE episodes (
+            episode_id VARCHAR PRIMARY KEY,
+            symbol VARCHAR,
+            t_open TIMESTAMP,
+            t_close TIMESTAMP,
+            decision INTEGER,
+            decision_confidence DOUBLE,
+            pnl DOUBLE,
+            return_pct DOUBLE,
+            hit_target BOOLEAN,
+            exit_reason VARCHAR,
+            regime_label VARCHAR,
+            data JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute(
+        """
+        INSERT INTO episodes (
+            episode_id, symbol, t_open, t_close, decision, decision_confidence,
+            pnl, return_pct, hit_target, exit_reason, regime_label, data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            ep.episode_id, ep.symbol, ep.t_open, ep.t_close, ep.decision,
+            ep.decision_confidence, ep.pnl, ep.return_pct, ep.hit_target,
+            ep.exit_reason, ep.regime_label, json.dumps(ep.to_dict()),
+        ],
+    )
+    conn.close()
+
+
+def test_migrates_v1_json_table(tmp_path):
+    db_path = str(tmp_path / "legacy.duckdb")
+    ep = close_episode(make_episode())
+    ep.features_digest["wyckoff_phase"] = "markup"
+    write_v1_table(db_path, ep)
+
+    store = EpisodeStore(db_path)
+    try:
+        assert "data" not in store._table_columns("episodes")
+        assert store.read(ep.episode_id).to_dict() == ep.to_dict()
+        assert store.fetch_frame(columns=["hedge_gamma"]).item() == 0.5
+    finally:
+        store.close()
+
+
+def test_migrated_non_numeric_features_match_written_rows(tmp_path):
+    db_path = str(tmp_path / "legacy.duckdb")
+    ep = close_episode(make_episode("legacy"))
+    ep.features_digest.update({"hedge_gamma": "n/a", "liq_amihud": True, "wyckoff_phase": "markup"})
+    write_v1_table(db_path, ep)
+
+    store = EpisodeStore(db_path)
+    try:
+        written = close_episode(make_episode("written"))
+        written.features_digest = dict(ep.features_digest)
+        store.write(written)
+
+        rows = dict(store.conn.execute(
+            "SELECT episode_id, (features, hedge_gamma, liq_amihud) FROM episodes"
+        ).fetchall())
+        assert rows["legacy"] == rows["written"]
+        assert rows["legacy"] == ({"custom": 1.5}, None, None)
+        assert store.read("legacy").features_digest == ep.features_digest
+    finally:
+        store.close()
@@ -0,0 +1,147 @@
+"""Tests for the multiplexed multi-symbol live runtime."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from gnosis.trading.multi_symbol_runtime import MultiSymbolRuntime
+
+
+class RecordingHandler:
+    """Records bars like LiveTradingBot.record_bar; process_bar optionally waits."""
+
+    def __init__(self, symbol: str, gate: asyncio.Event = None):
+        self.symbol = symbol
+        self.gate = gate
+        self.recorded = []
+        self.processed = []
+
+    def record_bar(self, bar) -> dict:
+        if bar.close is None:
+            raise TypeError("bar without close")
+        bar_data = {"t_event": bar.timestamp, "symbol": bar.symbol, "price": bar.close}
+        self.recorded.append(bar_data)
+        return bar_data
+
+    async def process_bar(self, bar_data: dict):
+        if self.gate is not None:
+            await self.gate.wait()
+        if bar_data["price"] < 0:
+            raise ValueError("bad bar")
+        self.processed.append(bar_data["price"])
+
+
+class FakeStream:
+    def __init__(self, bars):
+        self.bars = bars
+        self.subscriptions = []
+        self.stopped = False
+
+    def subscribe_bars(self, handler, *symbols):
+        self.subscriptions.append(symbols)
+        self.handler = handler
+
+    async def _run_forever(self):
+        for bar in self.bars:
+            if self.stopped:
+                return
+            await self.handler(bar)
+            await asyncio.sleep(0)
+
+    async def stop_ws(self):
+        self.stopped = True
+
+
+class EndlessStream(FakeStream):
+    """Keeps the connection open until stopped, like the live stream."""
+
+    async def _run_forever(self):
+        await super()._run_forever()
+        while not self.stopped:
+            await asyncio.sleep(0.001)
+
+
+def make_bar(symbol: str, i: int, price: float = None):
+    return SimpleNamespace(
+        symbol=symbol,
+        timestamp=datetime(2024, 10, 1, 14, 30, tzinfo=timezone.utc) + timedelta(minutes=i),
+        close=100.0 + i if price is None else price,
+    )
+
+
+async def test_one_subscription_fans_out_200_symbols_in_order():
+    symbols = [f"S{i:03d}" for i in range(200)]
+    handlers = [RecordingHandler(symbol) for symbol in symbols]
+    bars = [make_bar(symbol, i) for i in range(20) for symbol in symbols]
+    stream = FakeStream(bars + [make_bar("UNKNOWN", 0)])
+    runtime = MultiSymbolRuntime(handlers, stream=stream, queue_size=64)
+
+    await runtime.start()
+    stream.subscribe_bars(runtime.on_bar, *runtime.symbols)
+    await stream._run_forever()
+    await runtime.drain()
+    await runtime.stop()
+
+    assert len(stream.subscriptions) == 1 and len(stream.subscriptions[0]) == 200
+    for handler in handlers:
+        assert handler.processed == [100.0 + i for i in range(20)]
+    metrics = runtime.metrics()
+    assert metrics["processed"] == 4000
+    assert metrics["dropped"] == 0
+    assert metrics["unrouted"] == 1
+    assert metrics["bar_to_decision"]["count"] == 4000
+
+
+async def test_full_queue_sheds_oldest_but_records_every_bar():
+    gate = asyncio.Event()
+    handler = RecordingHandler("SPY", gate)
+    runtime = MultiSymbolRuntime([handler], queue_size=3)
+    await runtime.start()
+    await asyncio.sleep(0)  # Worker waiting on the queue
+
+    await runtime.on_bar(make_bar("SPY", 0))
+    await asyncio.sleep(0)  # Worker takes bar 0 and blocks on the gate
+    for i in range(1, 10):
+        await runtime.on_bar(make_bar("SPY", i))
+
+    # The worker holds bar 0; bars 1..6 were shed as newer ones arrived
+    assert len(handler.recorded) == 10
+    metrics = runtime.metrics()["per_symbol"]["SPY"]
+    assert metrics["queue_depth"] == 3
+    assert metrics["max_queue_depth"] == 3
+    assert metrics["dropped"] == 6
+
+    gate.set()
+    await runtime.drain()
+    await runtime.stop()
+    assert handler.processed == [100.0, 107.0, 108.0, 109.0]
+
+
+async def test_handler_errors_are_counted_and_the_worker_continues():
+    handler = RecordingHandler("SPY")
+    runtime = MultiSymbolRuntime([handler])
+    await runtime.start()
+
+    await runtime.on_bar(make_bar("SPY", 0, price=-1.0))
+    await runtime.on_bar(make_bar("SPY", 1))
+    await runtime.drain()
+    await runtime.stop()
+
+    assert handler.processed == [101.0]
+    assert runtime.metrics()["errors"] == 1
+
+
+async def test_stop_ends_run_and_bad_bars_do_not_break_the_stream():
+    handler = RecordingHandler("SPY")
+    stream = EndlessStream([make_bar("SPY", 0), SimpleNamespace(symbol="SPY", timestamp=None, close=None), make_bar("SPY", 2)])
+    runtime = MultiSymbolRuntime([handler], stream=stream)
+
+    run = asyncio.create_task(runtime.run())
+    await asyncio.sleep(0.01)
+    await runtime.drain()
+    await runtime.stop()
+    await asyncio.wait_for(run, timeout=1)
+
+    assert handler.processed == [100.0, 102.0]
+    metrics = runtime.metrics()
+    assert (metrics["received"], metrics["errors"]) == (3, 1)
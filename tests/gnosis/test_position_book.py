@@ -0,0 +1,137 @@
+"""Tests for the array-backed position book behind PositionManager."""
+
+import copy
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from gnosis.trading.position_book import PositionBook
+from gnosis.trading.position_manager import Position, PositionManager
+from gnosis.trading.risk_manager import RiskManager
+
+
+def make_positions(n: int, seed: int = 3) -> list:
+    rng = np.random.default_rng(seed)
+    positions = []
+    for i in range(n):
+        entry = float(rng.uniform(20, 500))
+        side = int(rng.choice([1, -1]))
+        positions.append(Position(
+            position_id=f"S{i}_1",
+            symbol=f"S{i}",
+            side=side,
+            size=float(rng.uniform(0.01, 0.15)),
+            entry_price=entry,
+            entry_time=datetime(2024, 10, 1, 14, 30),
+            entry_confidence=0.7,
+            # Some positions without stops, one with a zero (unset) stop
+            stop_loss=None if i % 5 == 0 else 0.0 if i % 7 == 0 else entry * (1 - side * 0.02),
+            take_profit=None if i % 4 == 0 else entry * (1 + side * 0.04),
+            max_bars=int(rng.integers(3, 12)),
+        ))
+    return positions
+
+
+def test_mark_and_exits_match_position_objects():
+    rng = np.random.default_rng(7)
+    reference = {p.symbol: p for p in make_positions(60)}
+    book = PositionBook(capacity=4)
+    for symbol, position in reference.items():
+        book[symbol] = copy.deepcopy(position)
+
+    for tick in range(15):
+        # A random subset of symbols (plus one without a position) ticks
+        prices = {
+            symbol: position.entry_price * float(rng.uniform(0.95, 1.05))
+            for symbol, position in reference.items()
+            if rng.random() < 0.6
+        }
+        prices["ZZZ"] = 10.0
+        for symbol, price in prices.items():
+            if symbol in reference:
+                reference[symbol].update(price)
+
+        assert book.mark(prices) == [symbol for symbol in prices if symbol in reference]
+        expected = [
+            (symbol, position.check_exit_conditions())
+            for symbol, position in reference.items()
+            if position.check_exit_conditions()
+        ]
+        assert book.exits() == expected
+
+        for symbol, position in reference.items():
+            assert book[symbol].to_dict() == position.to_dict()
+        assert book.unrealized_pnl == pytest.approx(sum(p.unrealized_pnl for p in reference.values()))
+        assert book.total_size == pytest.approx(sum(p.size for p in reference.values()))
+
+        # Close the exits, like the live loop
+        for symbol, _ in expected:
+            del reference[symbol]
+            del book[symbol]
+        assert list(book) == list(reference)
+
+
+def test_delete_moves_last_row():
+    book = PositionBook()
+    positions = make_positions(3)
+    for position in positions:
+        book[position.symbol] = position
+    book.mark({"S0": 100.0, "S1": 200.0, "S2": 300.0})
+
+    del book["S0"]
+
+    assert book.symbols == ["S2", "S1"]
+    assert book["S2"].current_price == 300.0
+    assert book.column("current_price").tolist() == [300.0, 200.0]
+    assert book.total_size == pytest.approx(positions[1].size + positions[2].size)
+
+    book.clear()
+    assert len(book) == 0
+    assert (book.total_size, book.unrealized_pnl) == (0.0, 0.0)
+
+
+def test_manager_and_risk_summary_use_book(tmp_path):
+    manager = PositionManager(state_file=str(tmp_path / "state.json"), max_positions=5)
+    manager.open_position("SPY", 1, 0.1, 580.0, 0.7, stop_loss=570.0, take_profit=600.0)
+    manager.open_position("QQQ", 1, 0.05, 490.0, 0.6, stop_loss=480.0)
+
+    manager.update_positions({"SPY": 603.0, "QQQ": 490.0})
+    manager.update_positions({"QQQ": 485.0})
+
+    assert manager.check_exits() == [("SPY", "take_profit")]
+    assert manager.positions["QQQ"].bars_held == 2
+    summary = manager.get_portfolio_summary()
+    assert summary["unrealized_pnl"] == pytest.approx(0.1 * 23 / 580 - 0.05 * 5 / 490)
+    risk = RiskManager().get_risk_summary(manager.positions)
+    assert risk["total_risk"] == pytest.approx(0.15)
+    assert risk["total_risk"] == pytest.approx(RiskManager().get_risk_summary(dict(manager.positions.items()))["total_risk"])
+
+
+def test_held_positions_track_the_book(tmp_path):
+    manager = PositionManager(state_file=str(tmp_path / "state.json"))
+    position = manager.open_position("SPY", 1, 0.1, 580.0, 0.7, stop_loss=570.0)
+
+    manager.update_positions({"SPY": 585.8})
+    assert position.bars_held == 1
+    assert position.unrealized_pnl == pytest.approx(0.1 * 5.8 / 580)
+
+    # Edits on the object reach the book
+    position.take_profit = 585.0
+    position.update(586.0)
+    assert manager.positions.column("bars_held").tolist() == [2]
+    assert manager.positions.unrealized_pnl == pytest.approx(0.1 * 6 / 580)
+    assert manager.check_exits() == [("SPY", "take_profit")]
+
+    detached = copy.deepcopy(position)
+    detached.update(500.0)
+    assert position.current_price == 586.0
+
+    manager.close_position("SPY", 586.0, "take_profit")
+    assert (position.current_price, position.bars_held) == (586.0, 2)
+
+    # A position belongs to one book at a time
+    book = PositionBook()
+    book["SPY"] = detached
+    with pytest.raises(ValueError):
+        PositionBook()["SPY"] = detached
@@ -0,0 +1,156 @@
+"""Tests for PositionManager persistence: atomic snapshots and journal mode."""
+
+import json
+
+import pytest
+
+from gnosis.trading.position_manager import PositionManager
+
+
+def make_manager(tmp_path, **kwargs) -> PositionManager:
+    kwargs.setdefault("journal", True)
+    return PositionManager(state_file=str(tmp_path / "state.json"), max_positions=5, **kwargs)
+
+
+def journal_lines(manager: PositionManager) -> list:
+    return manager.journal_file.read_text().splitlines()
+
+
+def assert_same_state(actual: PositionManager, expected: PositionManager):
+    assert actual.positions.keys() == expected.positions.keys()
+    for symbol, position in expected.positions.items():
+        assert actual.positions[symbol].to_dict() == position.to_dict()
+    assert actual.daily_pnl == pytest.approx(expected.daily_pnl)
+    assert actual.daily_trades == expected.daily_trades
+    assert actual.last_reset == expected.last_reset
+
+
+def trade(manager: PositionManager):
+    manager.open_position("SPY", 1, 0.1, 580.0, 0.7)
+    manager.open_position("QQQ", -1, 0.05, 490.0, 0.6)
+    manager.update_positions({"SPY": 582.0, "QQQ": 488.0})
+    manager.update_positions({"SPY": 583.5})
+    manager.close_position("QQQ", 487.0, "take_profit")
+
+
+def test_events_are_appended_not_snapshotted(tmp_path):
+    manager = make_manager(tmp_path)
+
+    trade(manager)
+
+    assert json.loads(manager.state_file.read_text())["positions"] == {}
+    events = [json.loads(line)["event"] for line in journal_lines(manager)]
+    assert events == ["open", "open", "mark", "mark", "close"]
+
+
+def test_restart_replays_journal(tmp_path):
+    manager = make_manager(tmp_path)
+    trade(manager)
+
+    # No close(): simulates a crash after the last append
+    recovered = make_manager(tmp_path)
+
+    assert_same_state(recovered, manager)
+    assert recovered.positions["SPY"].bars_held == 2
+    # Recovery compacts the replayed tail into the snapshot
+    assert json.loads(recovered.state_file.read_text())["seq"] == 5
+    assert journal_lines(recovered) == []
+
+
+def test_torn_final_line_is_skipped(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.open_position("SPY", 1, 0.1, 580.0, 0.7)
+    with manager.journal_file.open("a") as f:
+        f.write('{"seq":2,"event":"upd')
+
+    recovered = make_manager(tmp_path)
+
+    assert_same_state(recovered, manager)
+
+
+def test_events_after_torn_line_survive_restart(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.open_position("SPY", 1, 0.1, 580.0, 0.7)
+    manager.close()
+    with manager.journal_file.open("a") as f:
+        f.write('{"seq":2,"event":"op')
+
+    recovered = make_manager(tmp_path)
+    recovered.open_position("BBB", 1, 0.05, 50.0, 0.6)
+
+    # No close(): crash after the append
+    again = make_manager(tmp_path)
+
+    assert set(again.positions) == {"SPY", "BBB"}
+    assert_same_state(again, recovered)
+
+
+def test_snapshot_every_compacts_journal(tmp_path):
+    manager = make_manager(tmp_path, snapshot_every=4)
+
+    trade(manager)
+
+    assert manager.state_file.exists()
+    assert len(journal_lines(manager)) == 1
+    assert_same_state(make_manager(tmp_path), manager)
+
+
+def test_snapshot_due_mid_batch_does_not_replay_marks(tmp_path):
+    manager = make_manager(tmp_path, snapshot_every=3)
+    for symbol, price in (("AAA", 10.0), ("BBB", 20.0), ("CCC", 30.0), ("DDD", 40.0)):
+        manager.open_position(symbol, 1, 0.05, price, 0.6)
+    for tick in range(1, 8):
+        manager.update_positions({"AAA": 10.0 + tick, "BBB": 20.0 + tick, "CCC": 30.0, "DDD": 40.0 - tick})
+
+    # No close(): crash with snapshots taken between batches
+    recovered = make_manager(tmp_path)
+
+    assert_same_state(recovered, manager)
+    assert recovered.positions["DDD"].bars_held == 7
+
+
+def test_legacy_update_events_replay(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.open_position("SPY", 1, 0.1, 580.0, 0.7)
+    with manager.journal_file.open("a") as f:
+        f.write('{"seq":2,"event":"update","symbol":"SPY","price":582.0}\n')
+
+    recovered = make_manager(tmp_path)
+
+    assert recovered.positions["SPY"].bars_held == 1
+    assert recovered.positions["SPY"].current_price == 582.0
+
+
+def test_events_already_in_snapshot_are_not_replayed(tmp_path):
+    manager = make_manager(tmp_path)
+    trade(manager)
+    stale = manager.journal_file.read_text()
+
+    # Crash after the snapshot rename but before the journal truncation
+    manager.save_state()
+    manager.journal_file.write_text(stale)
+
+    assert_same_state(make_manager(tmp_path), manager)
+
+
+def test_close_and_reset_survive_restart(tmp_path):
+    manager = make_manager(tmp_path)
+    trade(manager)
+    manager.last_reset = manager.last_reset.replace(year=2000)
+    manager.reset_daily()
+    manager.close()
+
+    recovered = make_manager(tmp_path)
+
+    assert_same_state(recovered, manager)
+    assert recovered.daily_trades == 0
+
+
+def test_snapshot_mode_writes_atomically(tmp_path):
+    manager = make_manager(tmp_path, journal=False)
+
+    trade(manager)
+
+    assert json.loads(manager.state_file.read_text())["positions"].keys() == {"SPY"}
+    assert not manager.journal_file.exists()
+    assert list(tmp_path.iterdir()) == [manager.state_file]
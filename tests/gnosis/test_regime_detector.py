@@ -0,0 +1,62 @@
+"""Tests for the incremental (per-bar) regime detector."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gnosis.regime import IncrementalRegimeDetector, RegimeDetector
+
+
+def make_bars(n: int = 1000, seed: int = 3) -> list:
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.02, 0.0, 0.02], n // 100 + 1), 100)[:n]
+    scale = rng.choice([0.003, 0.03], n)
+    price = 580 * np.exp(np.cumsum(rng.normal(0, 1, n) * scale + drift))
+    spread = rng.random(n) * 2
+    # A quiet, tight stretch after a jump, for the range and calm regimes
+    price[600:800] = 580 + np.sin(np.arange(200) / 5) * 0.5
+    spread[600:800] = 0.5
+    return [
+        {"price": p, "high": p + s, "low": p - s, "volume": float(v)}
+        for p, s, v in zip(price, spread, rng.integers(1_000, 10_000, n))
+    ]
+
+
+def assert_same_state(actual, expected):
+    assert actual.primary == expected.primary
+    assert actual.confidence == pytest.approx(expected.confidence)
+    assert actual.sub_regimes == pytest.approx(expected.sub_regimes)
+    assert actual.volatility == pytest.approx(expected.volatility, rel=1e-9, nan_ok=True)
+    assert actual.trend_strength == pytest.approx(expected.trend_strength, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("windows", [{}, {"trend_window": 7, "vol_window": 30}])
+def test_update_matches_batch_detect(windows):
+    batch = RegimeDetector(**windows)
+    incremental = IncrementalRegimeDetector(**windows)
+    history = []
+    primaries = set()
+
+    for bar in make_bars():
+        history = (history + [bar])[-100:]
+        expected = batch.detect(pd.DataFrame(history))
+        assert_same_state(incremental.update(bar), expected)
+        primaries.add(expected.primary)
+
+    assert primaries == {"ranging", "volatile", "trending_up", "trending_down"}
+
+
+def test_warm_up_and_reset():
+    detector = IncrementalRegimeDetector(trend_window=5, vol_window=10)
+    bars = make_bars()[:30]
+
+    for bar in bars[:9]:
+        state = detector.update(bar)
+        assert state.sub_regimes == {"ranging": 1.0}
+        assert state.volatility == 0.15
+
+    # At exactly vol_window bars the batch path sees vol_window - 1 returns
+    assert_same_state(detector.update(bars[9]), RegimeDetector(5, 10).detect(pd.DataFrame(bars[:10])))
+
+    detector.reset()
+    assert detector.update(bars[10]).sub_regimes == {"ranging": 1.0}
@@ -0,0 +1,119 @@
+"""Tests for out-of-core dataset building from partitioned Parquet."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from ml.dataset.builder import DatasetBuilder, DatasetConfig
+
+
+def make_partition(n: int, seed: int, symbol: str) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    feat_a = rng.normal(size=n)
+    feat_a[rng.integers(0, n, size=n // 20)] = np.nan
+    return pl.DataFrame({
+        "timestamp": [datetime(2024, 1, 2) + timedelta(minutes=seed * n + i) for i in range(n)],
+        "symbol": [symbol] * n,
+        "close": 100 + rng.normal(size=n),
+        "feat_a": feat_a,
+        "feat_b": rng.integers(0, 10, size=n),
+        "hedge_movement_energy": rng.uniform(0.1, 2.0, size=n),
+        "direction_5": rng.choice([-1, 0, 1], size=n).astype(np.int32),
+        "magnitude_5": rng.integers(0, 3, size=n).astype(np.int32),
+        "volatility_5": np.where(rng.uniform(size=n) < 0.05, np.nan, rng.uniform(size=n)),
+    })
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    frames = []
+    for i, symbol in enumerate(["AAA", "BBB", "CCC"]):
+        frame = make_partition(300 + 50 * i, seed=i, symbol=symbol)
+        part_dir = tmp_path / "bars" / f"part={i}"
+        part_dir.mkdir(parents=True)
+        frame.write_parquet(part_dir / "data.parquet")
+        frames.append(frame)
+    return tmp_path / "bars", frames
+
+
+def test_parquet_dataset_matches_in_memory_build(partitions, tmp_path):
+    source, frames = partitions
+    builder = DatasetBuilder(DatasetConfig(min_valid_samples=10))
+
+    expected = builder.build_dataset(pl.concat(frames), horizon=5)
+    dataset = builder.build_dataset_from_parquet(source, tmp_path / "ds", horizon=5)
+
+    assert isinstance(dataset.X, np.memmap)
+    assert dataset.X.dtype == np.float32
+    assert dataset.feature_names == expected.feature_names
+    assert dataset.n_samples == expected.n_samples
+    np.testing.assert_allclose(dataset.X, expected.X, rtol=1e-6)
+    np.testing.assert_array_equal(dataset.y_direction, expected.y_direction)
+    np.testing.assert_array_equal(dataset.y_magnitude, expected.y_magnitude)
+    np.testing.assert_allclose(dataset.y_volatility, expected.y_volatility, rtol=1e-6)
+    np.testing.assert_allclose(dataset.weights, expected.weights, rtol=1e-5)
+    np.testing.assert_array_equal(dataset.timestamps, expected.timestamps)
+
+    reopened = DatasetBuilder.load_memmap_dataset(tmp_path / "ds")
+    np.testing.assert_array_equal(reopened.X, dataset.X)
+    assert reopened.feature_names == dataset.feature_names
+
+
+def test_transform_runs_per_partition(partitions, tmp_path):
+    source, frames = partitions
+    builder = DatasetBuilder(DatasetConfig(min_valid_samples=10, use_energy_weighting=False))
+    seen = []
+
+    def transform(df):
+        seen.append(len(df))
+        return df.with_columns((pl.col("close") - pl.col("close").mean()).alias("close_demeaned"))
+
+    dataset = builder.build_dataset_from_parquet(source, tmp_path / "ds", transform=transform)
+
+    assert seen == [len(frame) for frame in frames]
+    assert "close_demeaned" in dataset.feature_names
+    assert dataset.weights is None
+    assert not (tmp_path / "ds" / "weights.bin").exists()
+
+
+def test_trainer_consumes_memmap_dataset(partitions, tmp_path):
+    from ml.trainer.lightgbm_trainer import LightGBMConfig, LightGBMTrainer
+
+    source, _ = partitions
+    builder = DatasetBuilder(DatasetConfig(min_valid_samples=10))
+    dataset = builder.build_dataset_from_parquet(source, tmp_path / "ds")
+    train, valid, _ = builder.temporal_split(dataset)
+
+    results = LightGBMTrainer(LightGBMConfig(n_estimators=5)).train_multi_task(train, valid, "AAA", 5)
+
+    assert set(results) == {"direction", "magnitude", "volatility"}
+
+
+def test_partition_missing_features_raises(tmp_path):
+    make_partition(100, 0, "AAA").write_parquet(tmp_path / "a.parquet")
+    make_partition(100, 1, "BBB").drop("feat_b").write_parquet(tmp_path / "b.parquet")
+
+    with pytest.raises(ValueError, match="missing feature columns"):
+        DatasetBuilder(DatasetConfig(min_valid_samples=10)).build_dataset_from_parquet(
+            str(tmp_path / "*.parquet"), tmp_path / "ds"
+        )
+
+
+def test_missing_labels_kept_as_nan_without_drop_na(tmp_path):
+    frame = make_partition(200, 0, "AAA").with_columns(
+        pl.when(pl.int_range(pl.len()) % 10 == 0).then(None).otherwise(pl.col("direction_5")).alias("direction_5"),
+        pl.when(pl.int_range(pl.len()) % 15 == 0).then(None).otherwise(pl.col("magnitude_5")).alias("magnitude_5"),
+    )
+    frame.write_parquet(tmp_path / "a.parquet")
+    builder = DatasetBuilder(DatasetConfig(min_valid_samples=10, drop_na=False))
+
+    dataset = builder.build_dataset_from_parquet(tmp_path / "a.parquet", tmp_path / "ds")
+
+    assert dataset.n_samples == 200
+    assert dataset.y_direction.dtype == np.float32
+    assert np.isnan(dataset.y_direction).sum() == 20
+    assert np.isnan(dataset.y_magnitude).sum() == 14
+    np.testing.assert_array_equal(dataset.y_direction, builder.build_dataset(frame).y_direction.astype(np.float32))
+    assert DatasetBuilder.load_memmap_dataset(tmp_path / "ds").y_magnitude.dtype == np.float32
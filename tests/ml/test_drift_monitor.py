@@ -0,0 +1,125 @@
+"""Tests for streaming drift monitoring with vectorized PSI."""
+
+import numpy as np
+import pytest
+
+from ml.persistence.drift import PSI_EPSILON, DriftMonitor, DriftReference
+from ml.persistence.manager import ModelManager
+
+
+def reference_psi(train: np.ndarray, live: np.ndarray, n_bins: int = 10) -> float:
+    """Textbook single-feature PSI with training quantile bins."""
+    edges = np.quantile(train, np.linspace(0, 1, n_bins + 1)[1:-1])
+    expected = np.bincount(np.searchsorted(edges, train), minlength=n_bins) / len(train)
+    actual = np.bincount(np.searchsorted(edges, live), minlength=n_bins) / len(live)
+    expected = np.clip(expected, PSI_EPSILON, None)
+    actual = np.clip(actual, PSI_EPSILON, None)
+    return float(((actual - expected) * np.log(actual / expected)).sum())
+
+
+@pytest.fixture
+def train_X():
+    return np.random.default_rng(0).normal(size=(5000, 6))
+
+
+def test_reference_bins_cover_training_distribution(train_X):
+    reference = DriftReference.from_training(train_X, [f"f{i}" for i in range(6)])
+
+    expected = np.asarray(reference.expected)
+    assert np.asarray(reference.bin_edges).shape == (6, 9)
+    assert expected.shape == (6, 10)
+    np.testing.assert_allclose(expected.sum(axis=1), 1.0)
+    np.testing.assert_allclose(expected, 0.1, atol=0.01)
+    assert reference.n_samples == 5000
+
+
+def test_vectorized_psi_matches_per_feature_reference(train_X):
+    live = np.random.default_rng(1).normal(loc=[0, 0.5, 1, 0, -1, 2], size=(800, 6))
+    monitor = DriftMonitor(DriftReference.from_training(train_X), window=None)
+
+    monitor.update(live)
+
+    expected = [reference_psi(train_X[:, j], live[:, j]) for j in range(6)]
+    np.testing.assert_allclose(monitor.psi(), expected, rtol=1e-10)
+
+
+def test_row_updates_match_batch_update(train_X):
+    reference = DriftReference.from_training(train_X)
+    live = np.random.default_rng(2).normal(size=(300, 6))
+
+    batch = DriftMonitor(reference, window=None)
+    batch.update(live)
+    streaming = DriftMonitor(reference, window=None)
+    for row in live:
+        streaming.update(row)
+
+    np.testing.assert_allclose(streaming.psi(), batch.psi())
+    assert streaming.n_observations == 300
+
+
+def test_status_flags_shifted_features(train_X):
+    names = [f"f{i}" for i in range(6)]
+    monitor = DriftMonitor(
+        DriftReference.from_training(train_X, names), window=1000, min_observations=100
+    )
+    rng = np.random.default_rng(3)
+
+    monitor.update(rng.normal(size=(50, 6)))
+    assert not monitor.status()["drift_detected"]  # below min_observations
+
+    monitor.update(rng.normal(size=(1000, 6)))
+    status = monitor.status()
+    assert not status["drift_detected"]
+    assert status["overall_psi"] < 0.05
+
+    # Shift every feature: the decayed histograms follow the new regime
+    monitor.update(rng.normal(loc=2.0, size=(3000, 6)))
+    status = monitor.status(top_n=3)
+    assert status["drift_detected"]
+    assert status["n_features_drifted"] == 6
+    assert len(status["top_features"]) == 3
+    assert set(status["top_features"]) <= set(names)
+
+
+def test_nan_features_are_skipped(train_X):
+    monitor = DriftMonitor(DriftReference.from_training(train_X), window=None)
+    row = np.zeros(6)
+    row[2] = np.nan
+
+    monitor.update(row)
+
+    psi = monitor.psi()
+    assert psi[2] == 0.0
+    assert psi[0] > 0.0
+
+    with pytest.raises(ValueError):
+        monitor.update(np.zeros(4))
+
+
+def test_reference_round_trips_through_model_metadata(tmp_path, train_X):
+    manager = ModelManager(tmp_path)
+    reference = DriftReference.from_training(train_X, [f"f{i}" for i in range(6)])
+    manager.save_model(
+        model={"weights": [1, 2, 3]},
+        symbol="SPY",
+        model_type="dummy",
+        task="direction",
+        horizon=5,
+        feature_names=reference.feature_names,
+        metrics={},
+        hyperparameters={},
+        n_train_samples=len(train_X),
+        drift_reference=reference,
+    )
+
+    loaded = manager.load_metadata("SPY", "direction", 5).drift_reference
+    assert loaded == reference
+
+    live = np.random.default_rng(4).normal(loc=1.5, size=(500, 6))
+    drift_detected, psi_score, details = manager.detect_drift("SPY", "direction", 5, live)
+    assert drift_detected
+    assert details["n_features_drifted"] == 6
+
+    monitor = manager.create_drift_monitor("SPY", "direction", 5, window=None)
+    monitor.update(live)
+    assert monitor.psi().mean() == pytest.approx(psi_score)
@@ -0,0 +1,122 @@
+"""Parity tests for single-plan and multi-symbol label generation."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from ml.labels.generator import LabelConfig, LabelGenerator
+
+
+def legacy_generate(df: pl.DataFrame, config: LabelConfig, price_col: str = "close") -> pl.DataFrame:
+    """Per-horizon reference (the implementation before the single lazy plan)."""
+    result = df.clone()
+    price = pl.col(price_col)
+
+    for horizon in config.horizons:
+        ret = f"return_{horizon}"
+        result = result.with_columns(((price.shift(-horizon) - price) / price).alias(ret))
+        result = result.with_columns(
+            pl.when(pl.col(ret) > 0).then(1).when(pl.col(ret) < 0).then(-1).otherwise(0)
+            .cast(pl.Int32).alias(f"direction_{horizon}")
+        )
+
+        vol_window = max(2, min(config.vol_window, len(result) // 4))
+        adjusted = (
+            result[ret].abs() / (result[ret].abs().rolling_std(window_size=vol_window) + 1e-8)
+        )
+        valid = adjusted.to_numpy()
+        valid = valid[~np.isnan(valid)]
+        if len(valid) == 0:
+            magnitude = pl.repeat(1, len(result), dtype=pl.Int32, eager=True)
+        else:
+            p33, p67 = np.percentile(valid, 33), np.percentile(valid, 67)
+            magnitude = result.select(
+                pl.when(adjusted <= p33).then(0).when(adjusted <= p67).then(1).otherwise(2)
+                .cast(pl.Int32)
+            ).to_series()
+        result = result.with_columns(magnitude.alias(f"magnitude_{horizon}"))
+
+        result = result.with_columns(
+            price.pct_change().shift(-horizon)
+            .rolling_std(window_size=min(horizon, len(result) // 4))
+            .alias(f"volatility_{horizon}")
+        )
+
+    return result
+
+
+def make_bars(n: int, seed: int, symbol: str | None = None) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(scale=0.002, size=n)))
+    close[rng.integers(0, n, size=n // 10)] = np.round(close[0], 2)  # some flat moves
+    data = {
+        "timestamp": [datetime(2024, 1, 2) + timedelta(minutes=i) for i in range(n)],
+        "close": close,
+        "volume": rng.uniform(1e3, 1e4, size=n),
+    }
+    if symbol is not None:
+        data["symbol"] = [symbol] * n
+    return pl.DataFrame(data)
+
+
+def assert_frames_match(actual: pl.DataFrame, expected: pl.DataFrame):
+    assert actual.columns == expected.columns
+    for col in expected.columns:
+        a, e = actual[col], expected[col]
+        if e.dtype.is_float():
+            np.testing.assert_allclose(
+                a.to_numpy(), e.to_numpy(), rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=col
+            )
+            assert a.is_null().to_list() == e.is_null().to_list(), col
+        else:
+            assert a.to_list() == e.to_list(), col
+
+
+@pytest.mark.parametrize("n", [400, 60, 9])
+def test_single_plan_matches_per_horizon_reference(n):
+    config = LabelConfig(horizons=[1, 5, 15])
+    df = make_bars(n, seed=n)
+
+    assert_frames_match(LabelGenerator(config).generate(df), legacy_generate(df, config))
+
+
+def test_multi_symbol_mode_matches_per_symbol_generation():
+    config = LabelConfig(horizons=[5, 15, 60])
+    generator = LabelGenerator(config)
+    # Different lengths exercise the per-symbol rolling windows
+    frames = [make_bars(n, seed=i, symbol=f"S{i}") for i, n in enumerate([500, 300, 40])]
+    stacked = pl.concat(frames)
+
+    expected = pl.concat([generator.generate(frame) for frame in frames])
+    actual = generator.generate(stacked, symbol_col="symbol")
+
+    assert_frames_match(actual, expected)
+
+
+def test_multi_symbol_mode_handles_interleaved_rows():
+    config = LabelConfig(horizons=[1, 5, 15])
+    generator = LabelGenerator(config)
+    frames = [make_bars(n, seed=i, symbol=f"S{i}") for i, n in enumerate([200, 120])]
+    # Stacked by timestamp, as a cross-sectional bar feed arrives
+    interleaved = pl.concat(frames).sort("timestamp", "symbol")
+
+    actual = generator.generate(interleaved, symbol_col="symbol")
+
+    assert actual.select("timestamp", "symbol").equals(interleaved.select("timestamp", "symbol"))
+    for frame in frames:
+        symbol = frame["symbol"][0]
+        assert_frames_match(actual.filter(pl.col("symbol") == symbol), generator.generate(frame))
+
+
+def test_label_set_uses_generated_columns():
+    config = LabelConfig(horizons=[5])
+    df = make_bars(100, seed=3)
+
+    label_set = LabelGenerator(config).generate_label_set(df)
+    labels = LabelGenerator(config).generate(df)
+
+    assert label_set.n_horizons == 1
+    assert label_set.directions["direction_5"] == labels["direction_5"].to_list()
+    assert label_set.magnitudes["magnitude_5"] == labels["magnitude_5"].to_list()
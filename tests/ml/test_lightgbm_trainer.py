@@ -0,0 +1,102 @@
+"""Tests for shared-dataset multi-task LightGBM training."""
+
+import numpy as np
+import pytest
+
+from ml.dataset.builder import MLDataset
+from ml.trainer.lightgbm_trainer import LightGBMConfig, LightGBMTrainer
+
+
+def make_dataset(n: int, seed: int) -> MLDataset:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 8))
+    return MLDataset(
+        X=X,
+        y_direction=np.where(X[:, 0] + 0.3 * rng.normal(size=n) > 0, 1, -1),
+        y_magnitude=np.digitize(X[:, 1], [-0.5, 0.5]),
+        y_volatility=np.abs(X[:, 2]) * 0.01,
+        weights=rng.uniform(0.5, 1.5, size=n),
+        feature_names=[f"f{i}" for i in range(8)],
+    )
+
+
+@pytest.fixture(scope="module")
+def datasets():
+    return make_dataset(1500, 0), make_dataset(400, 1)
+
+
+def test_shared_dataset_matches_per_task_datasets(datasets):
+    train, valid = datasets
+    trainer = LightGBMTrainer(LightGBMConfig(n_estimators=30, num_threads=1))
+
+    shared = trainer.train_multi_task(train, valid, "SPY", 5)
+    separate = {
+        "direction": trainer.train_direction_model(train, valid, "SPY", 5),
+        "magnitude": trainer.train_magnitude_model(train, valid, "SPY", 5),
+        "volatility": trainer.train_volatility_model(train, valid, "SPY", 5),
+    }
+
+    assert set(shared) == set(separate)
+    for task in shared:
+        np.testing.assert_allclose(
+            shared[task].model.predict(valid.X), separate[task].model.predict(valid.X)
+        )
+        assert shared[task].metrics == pytest.approx(separate[task].metrics)
+
+
+def test_shared_datasets_are_binned_once(datasets, monkeypatch):
+    train, valid = datasets
+    trainer = LightGBMTrainer(LightGBMConfig(n_estimators=5))
+
+    calls = []
+    original = trainer.build_lgb_datasets
+    monkeypatch.setattr(
+        trainer, "build_lgb_datasets", lambda *a: calls.append(a) or original(*a)
+    )
+
+    trainer.train_multi_task(train, valid, "SPY", 5)
+
+    assert len(calls) == 1
+
+
+def test_num_threads_passed_only_when_set():
+    assert "num_threads" not in LightGBMTrainer(LightGBMConfig())._get_base_params()
+    assert LightGBMTrainer(LightGBMConfig(num_threads=3))._get_base_params()["num_threads"] == 3
+
+
+def test_train_universe_in_process(tmp_path):
+    from datetime import datetime, timedelta
+
+    import polars as pl
+
+    from ml.labels.generator import LabelConfig
+    from ml.train import MLTrainingOrchestrator
+
+    def bars(seed):
+        rng = np.random.default_rng(seed)
+        close = 100.0 * np.exp(np.cumsum(rng.normal(scale=0.002, size=800)))
+        return pl.DataFrame({
+            "timestamp": [datetime(2024, 1, 2) + timedelta(minutes=i) for i in range(800)],
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.uniform(1e4, 1e5, size=800),
+        })
+
+    orchestrator = MLTrainingOrchestrator(
+        label_config=LabelConfig(horizons=[5, 15]),
+        lgbm_config=LightGBMConfig(n_estimators=5),
+        models_dir=str(tmp_path),
+    )
+
+    results = orchestrator.train_universe(
+        {"AAA": bars(0), "BBB": bars(1)}, horizons=[5, 15], max_workers=1, total_threads=2
+    )
+
+    assert list(results) == ["AAA", "BBB"]
+    assert all(set(results[s]) == {5, 15} for s in results)
+    assert set(results["AAA"][15]) == {"direction", "magnitude", "volatility"}
+    assert results["AAA"][5]["direction"].hyperparameters["num_threads"] == 2
+    assert orchestrator.trainer.config.num_threads == 0
+    assert orchestrator.model_manager.latest_version("BBB", "volatility", 15) is not None
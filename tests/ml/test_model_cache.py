@@ -0,0 +1,152 @@
+"""Tests for native model persistence and the bounded model cache."""
+
+import numpy as np
+import pytest
+
+lgb = pytest.importorskip("lightgbm")
+
+from ml.agents.ml_agent import MLAgent, MLAgentConfig
+from ml.persistence.cache import ModelCache
+from ml.persistence.manager import ModelManager
+
+
+def train_booster(seed: int = 0, n_features: int = 5) -> "lgb.Booster":
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, n_features))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=200) > 0).astype(int)
+    return lgb.train(
+        {"objective": "binary", "verbose": -1, "num_leaves": 4},
+        lgb.Dataset(X, label=y),
+        num_boost_round=5,
+    )
+
+
+def save(manager: ModelManager, model, symbol="SPY", task="direction", horizon=5, version="20240101_000000"):
+    return manager.save_model(
+        model=model,
+        symbol=symbol,
+        model_type="lightgbm",
+        task=task,
+        horizon=horizon,
+        feature_names=[f"f{i}" for i in range(5)],
+        metrics={"accuracy": 0.6},
+        hyperparameters={},
+        n_train_samples=200,
+        version=version,
+    )
+
+
+def test_booster_saved_in_native_format(tmp_path):
+    manager = ModelManager(tmp_path)
+    booster = train_booster()
+
+    metadata = save(manager, booster)
+
+    assert metadata.model_format == "lightgbm_text"
+    assert metadata.model_path.endswith(".txt")
+
+    loaded, loaded_meta = manager.load_model("SPY", "direction", 5)
+    X = np.random.default_rng(1).normal(size=(10, 5))
+    np.testing.assert_allclose(loaded.predict(X), booster.predict(X))
+    assert loaded_meta.version == "20240101_000000"
+    assert manager.latest_version("SPY", "direction", 5) == "20240101_000000"
+    assert manager.latest_version("QQQ", "direction", 5) is None
+
+
+def test_non_booster_falls_back_to_pickle(tmp_path):
+    manager = ModelManager(tmp_path)
+
+    metadata = save(manager, {"weights": [1, 2, 3]})
+
+    assert metadata.model_format == "pickle"
+    model, _ = manager.load_model("SPY", "direction", 5)
+    assert model == {"weights": [1, 2, 3]}
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    manager = ModelManager(tmp_path)
+    for symbol in ("A", "B", "C"):
+        save(manager, train_booster(), symbol=symbol)
+
+    cache = ModelCache(manager, max_entries=2)
+    cache.get("A", "direction", 5)
+    cache.get("B", "direction", 5)
+    cache.get("A", "direction", 5)  # B is now least recently used
+    cache.get("C", "direction", 5)
+
+    assert ("A", "direction", 5) in cache
+    assert ("B", "direction", 5) not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 1
+
+    with pytest.raises(FileNotFoundError):
+        cache.get("missing", "direction", 5)
+
+
+def test_cache_hot_swaps_new_version(tmp_path):
+    manager = ModelManager(tmp_path)
+    save(manager, train_booster(seed=0), version="20240101_000000")
+
+    cache = ModelCache(manager, refresh_interval_seconds=3600)
+    _, metadata = cache.get("SPY", "direction", 5)
+    assert metadata.version == "20240101_000000"
+
+    # A save from another process is only visible through polling
+    other_process = ModelManager(tmp_path)
+    save(other_process, train_booster(seed=1), version="20240102_000000")
+    assert cache.get("SPY", "direction", 5)[1].version == "20240101_000000"
+    assert cache.refresh() == 1
+    assert cache.get("SPY", "direction", 5)[1].version == "20240102_000000"
+
+    # An in-process save is pushed through the save listener
+    save(manager, train_booster(seed=2), version="20240103_000000")
+    cache.close()  # waits for the background swap
+    assert cache.get("SPY", "direction", 5)[1].version == "20240103_000000"
+    assert cache.stats()["swaps"] == 2
+
+
+def test_ml_agent_prefetch_and_process(tmp_path):
+    manager = ModelManager(tmp_path)
+    save(manager, train_booster(), symbol="SPY")
+
+    agent = MLAgent(MLAgentConfig(models_dir=str(tmp_path)))
+    futures = agent.prefetch_models(["SPY"], horizons=[5])
+    for future in futures:
+        future.exception()  # magnitude/volatility models do not exist
+
+    assert ("SPY", "direction", 5) in agent.model_cache
+
+    output = agent.process("SPY", np.zeros(5))
+    assert output.models_loaded
+    assert agent.model_cache.stats()["hits"] >= 1
+
+
+def test_ml_agent_tracks_drift_for_loaded_model(tmp_path):
+    from ml.persistence.drift import DriftReference
+
+    manager = ModelManager(tmp_path)
+    X_train = np.random.default_rng(0).normal(size=(500, 5))
+    manager.save_model(
+        model=train_booster(),
+        symbol="SPY",
+        model_type="lightgbm",
+        task="direction",
+        horizon=5,
+        feature_names=[f"f{i}" for i in range(5)],
+        metrics={},
+        hyperparameters={},
+        n_train_samples=500,
+        drift_reference=DriftReference.from_training(X_train),
+    )
+
+    agent = MLAgent(MLAgentConfig(models_dir=str(tmp_path), drift_min_observations=10))
+    assert agent.drift_status("SPY") is None
+
+    for row in np.random.default_rng(1).normal(loc=3.0, size=(20, 5)):
+        agent.process("SPY", row)
+    agent.process_batch(["SPY"], np.full((1, 5), 3.0))
+
+    status = agent.drift_status("SPY")
+    assert status["n_observations"] == 21
+    assert status["drift_detected"]
+    assert list(agent.drift_statuses()) == [("SPY", 5)]
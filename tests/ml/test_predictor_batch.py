@@ -0,0 +1,81 @@
+"""Parity tests for batched ML prediction."""
+
+import numpy as np
+import pytest
+
+lgb = pytest.importorskip("lightgbm")
+
+from ml.prediction.predictor import PredictionConfig, Predictor
+
+
+def train_models(seed: int, n_features: int = 6) -> dict:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, n_features))
+    params = {"verbose": -1, "num_leaves": 4}
+    direction = lgb.train(
+        {**params, "objective": "binary"},
+        lgb.Dataset(X, label=(X[:, 0] > 0).astype(int)),
+        num_boost_round=5,
+    )
+    magnitude = lgb.train(
+        {**params, "objective": "multiclass", "num_class": 3},
+        lgb.Dataset(X, label=np.digitize(X[:, 1], [-0.5, 0.5])),
+        num_boost_round=5,
+    )
+    volatility = lgb.train(
+        {**params, "objective": "regression"},
+        lgb.Dataset(X, label=np.abs(X[:, 2]) * 0.01),
+        num_boost_round=5,
+    )
+    return {"direction": direction, "magnitude": magnitude, "volatility": volatility}
+
+
+@pytest.mark.parametrize("calibration_method", ["platt", "beta"])
+def test_predict_batch_matches_per_row(calibration_method):
+    shared = train_models(0)
+    other = train_models(1)
+    partial = {"direction": other["direction"]}
+    row_models = [shared, other, shared, partial, {}, shared]
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(len(row_models), 6))
+    energy = [10.0, None, 250.0, 40.0, 5.0, None]
+
+    predictor = Predictor(PredictionConfig(calibration_method=calibration_method))
+    batched = predictor.predict_batch(row_models, X, energy)
+
+    for i, result in enumerate(batched):
+        expected = predictor.predict(row_models[i], X[i], energy[i]).model_dump()
+        actual = result.model_dump()
+        for field, value in expected.items():
+            if isinstance(value, float):
+                assert actual[field] == pytest.approx(value), field
+            elif field == "magnitude_probabilities":
+                assert actual[field] == pytest.approx(value)
+            else:
+                assert actual[field] == value, field
+
+
+def test_predict_batch_groups_rows_by_model():
+    shared = train_models(0)
+    calls = []
+
+    class CountingModel:
+        def __init__(self, model):
+            self.model = model
+
+        def predict(self, X):
+            calls.append(len(X))
+            return self.model.predict(X)
+
+    counting = {task: CountingModel(model) for task, model in shared.items()}
+    X = np.random.default_rng(0).normal(size=(50, 6))
+
+    Predictor().predict_batch([counting] * 50, X)
+
+    assert calls == [50, 50, 50]
+
+
+def test_predict_batch_rejects_mismatched_rows():
+    with pytest.raises(ValueError):
+        Predictor().predict_batch([{}], np.zeros((2, 3)))
@@ -0,0 +1,127 @@
+"""Tests for vectorized uniqueness and purged CV against brute-force references."""
+
+import numpy as np
+import pytest
+
+from ml.dataset.cv import (
+    PurgedKFold,
+    compute_average_uniqueness,
+    compute_sample_uniqueness,
+)
+
+
+def uniqueness_reference(timestamps, lookback_window):
+    overlaps = np.array([
+        ((timestamps >= t - lookback_window) & (timestamps <= t + lookback_window)).sum()
+        for t in timestamps
+    ])
+    uniqueness = 1.0 / np.maximum(1, overlaps)
+    return uniqueness / uniqueness.max()
+
+
+def average_uniqueness_reference(t0, t1, bars):
+    # Indicator matrix from AFML ch. 4: bars x labels
+    indicator = (bars[:, None] >= t0[None, :]) & (bars[:, None] <= t1[None, :])
+    concurrency = indicator.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_bar = np.where(indicator, 1.0 / concurrency[:, None], 0.0)
+    return per_bar.sum(axis=0) / indicator.sum(axis=0)
+
+
+def test_sample_uniqueness_matches_quadratic_scan():
+    rng = np.random.default_rng(0)
+    timestamps = np.sort(rng.integers(0, 2_000, size=500))
+    rng.shuffle(timestamps)
+
+    np.testing.assert_allclose(
+        compute_sample_uniqueness(timestamps, lookback_window=15),
+        uniqueness_reference(timestamps, 15),
+    )
+
+
+def test_sample_uniqueness_datetime64():
+    timestamps = np.datetime64("2024-01-02T09:30") + np.arange(100) * np.timedelta64(1, "m")
+
+    result = compute_sample_uniqueness(timestamps, lookback_window=np.timedelta64(5, "m"))
+
+    np.testing.assert_allclose(result, uniqueness_reference(timestamps, np.timedelta64(5, "m")))
+
+
+def test_average_uniqueness_matches_indicator_matrix():
+    rng = np.random.default_rng(1)
+    bars = np.arange(300)
+    t0 = np.sort(rng.choice(bars, size=120, replace=False))
+    t1 = np.minimum(t0 + rng.integers(0, 20, size=120), bars[-1])
+
+    np.testing.assert_allclose(
+        compute_average_uniqueness(t0, t1, bar_times=bars),
+        average_uniqueness_reference(t0, t1, bars),
+    )
+
+
+def test_average_uniqueness_non_overlapping_labels_are_unique():
+    t0 = np.array([0, 10, 20])
+    t1 = np.array([5, 15, 25])
+
+    np.testing.assert_allclose(
+        compute_average_uniqueness(t0, t1, bar_times=np.arange(30)), [1.0, 1.0, 1.0]
+    )
+
+
+@pytest.mark.parametrize("n_samples,purge_bars,embargo_bars", [(103, 5, 10), (50, 0, 0), (64, 8, 3)])
+def test_bar_purging_matches_mask_reference(n_samples, purge_bars, embargo_bars):
+    cv = PurgedKFold(n_splits=5, purge_bars=purge_bars, embargo_bars=embargo_bars)
+    X = np.zeros((n_samples, 2))
+    indices = np.arange(n_samples)
+
+    folds = list(cv.split(X))
+    assert len(folds) == cv.get_n_splits()
+    np.testing.assert_array_equal(np.concatenate([v for _, v in folds]), indices)
+
+    for train_idx, valid_idx in folds:
+        lo, hi = valid_idx.min(), valid_idx.max()
+        outside = (indices < lo - purge_bars) | (indices > hi + max(purge_bars, embargo_bars))
+        np.testing.assert_array_equal(train_idx, indices[outside])
+
+
+def test_time_purging_removes_overlapping_labels():
+    rng = np.random.default_rng(2)
+    n = 400
+    sample_times = np.datetime64("2024-01-02T09:30") + np.arange(n) * np.timedelta64(1, "m")
+    horizons = rng.integers(1, 30, size=n) * np.timedelta64(1, "m")
+    label_end_times = sample_times + horizons
+
+    cv = PurgedKFold(n_splits=4, embargo_bars=5)
+    for train_idx, valid_idx in cv.split(
+        np.zeros(n), label_end_times=label_end_times, sample_times=sample_times
+    ):
+        valid_t0 = sample_times[valid_idx[0]]
+        valid_t1 = label_end_times[valid_idx].max()
+
+        # No training label interval overlaps the validation label span
+        overlaps = (sample_times[train_idx] <= valid_t1) & (label_end_times[train_idx] >= valid_t0)
+        assert not overlaps.any()
+
+        # Embargo still applies after the fold
+        after = train_idx[train_idx > valid_idx[-1]]
+        assert after.size == 0 or after[0] > valid_idx[-1] + 5
+
+        # Everything non-overlapping before the fold is kept
+        before = np.arange(valid_idx[0])
+        expected_before = before[label_end_times[before] < valid_t0]
+        np.testing.assert_array_equal(train_idx[train_idx < valid_idx[0]], expected_before)
+
+
+def test_time_purging_accepts_bar_index_end_times():
+    cv = PurgedKFold(n_splits=2, embargo_bars=0)
+    label_end_times = np.arange(10) + 2  # each label resolves two bars later
+
+    (train_a, valid_a), (train_b, valid_b) = cv.split(np.zeros(10), label_end_times=label_end_times)
+
+    np.testing.assert_array_equal(train_a, [7, 8, 9])
+    np.testing.assert_array_equal(train_b, [0, 1, 2])
+
+
+def test_split_rejects_mismatched_label_times():
+    with pytest.raises(ValueError):
+        next(PurgedKFold(n_splits=2).split(np.zeros(10), label_end_times=np.arange(5)))
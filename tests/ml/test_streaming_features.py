@@ -0,0 +1,97 @@
+"""Parity tests: streaming feature state vs the batch FeatureBuilder."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from engines.sentiment.models import SentimentEnvelope
+from ml.features.builder import FeatureBuilder, FeatureConfig
+from ml.features.streaming import StreamingFeatureBuilder
+
+
+def make_bars(n: int, seed: int = 7, int_volume: bool = False) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    close = 450.0 + np.cumsum(rng.normal(scale=0.5, size=n))
+    open_ = close + rng.normal(scale=0.2, size=n)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 0.5, size=n)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 0.5, size=n)
+    volume = rng.integers(1_000, 50_000, size=n)
+    start = datetime(2024, 1, 2, 9, 30)
+
+    return [
+        {
+            "timestamp": start + timedelta(minutes=i),
+            "open": float(open_[i]),
+            "high": float(high[i]),
+            "low": float(low[i]),
+            "close": float(close[i]),
+            "volume": int(volume[i]) if int_volume else float(volume[i]),
+        }
+        for i in range(n)
+    ]
+
+
+def make_envelopes(n: int, seed: int = 3) -> list[SentimentEnvelope]:
+    rng = np.random.default_rng(seed)
+    return [
+        SentimentEnvelope(
+            bias=["bullish", "bearish", "neutral"][i % 3],
+            strength=float(rng.uniform()),
+            energy=float(rng.uniform(0, 2)),
+            confidence=float(rng.uniform()),
+            drivers={f"d{k}": float(rng.uniform()) for k in range(1 + i % 4)},
+        )
+        for i in range(n)
+    ]
+
+
+def assert_replay_parity(config: FeatureConfig, bars: list[dict], envelopes=None):
+    builder = FeatureBuilder(config)
+    state = StreamingFeatureBuilder(config)
+
+    for t, bar in enumerate(bars):
+        kwargs = {"sentiment_output": envelopes[t]} if envelopes else {}
+        online = state.update(bar, **kwargs)
+
+        batch = builder.build_feature_frame(
+            pl.DataFrame(bars[: t + 1]),
+            sentiment_outputs=envelopes[: t + 1] if envelopes else None,
+        )
+        expected = batch.drop("timestamp").row(-1)
+
+        assert state.feature_names == batch.drop("timestamp").columns
+        np.testing.assert_allclose(online, expected, rtol=1e-6, atol=1e-8, err_msg=f"bar {t}")
+
+
+@pytest.mark.parametrize("normalization_method", ["zscore", "minmax"])
+def test_replay_matches_batch_builder(normalization_method):
+    config = FeatureConfig(
+        normalization_method=normalization_method,
+        lag_periods=[1, 2, 5],
+        rolling_windows=[3, 10],
+    )
+    assert_replay_parity(config, make_bars(40))
+
+
+def test_replay_matches_with_engine_features_and_int_volume():
+    config = FeatureConfig(lag_periods=[1, 3], rolling_windows=[5])
+    assert_replay_parity(config, make_bars(25, int_volume=True), make_envelopes(25))
+
+
+def test_replay_matches_without_normalization_or_derived_features():
+    config = FeatureConfig(
+        normalize_features=False,
+        add_lag_features=False,
+        add_rolling_features=False,
+        fill_method="zero",
+    )
+    assert_replay_parity(config, make_bars(10))
+
+
+def test_rejects_non_causal_settings():
+    with pytest.raises(ValueError):
+        StreamingFeatureBuilder(FeatureConfig(fill_method="backward"))
+    with pytest.raises(ValueError):
+        StreamingFeatureBuilder(FeatureConfig(normalization_method="robust"))
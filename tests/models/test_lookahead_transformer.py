@@ -0,0 +1,141 @@
+"""Tests for LookaheadTransformer training and weight publishing."""
+
+import gc
+import os
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from models.lookahead_transformer import FEATURE_DEFAULTS, LookaheadTransformer, _publish_weights
+from models.sequence_ring import SharedSequenceRing
+
+
+def snapshots(rng, n):
+    keys = ["elasticity", "movement_energy", "energy_asymmetry", "net_pressure"]
+    return [{key: float(rng.normal()) for key in keys} for _ in range(n)]
+
+
+@pytest.fixture
+def model(tmp_path):
+    model = LookaheadTransformer(
+        sequence_length=5, hidden_dim=16, num_layers=1, num_heads=2,
+        buffer_size=64, weights_dir=str(tmp_path),
+    )
+    yield model
+    model.close()
+
+
+def test_predict_uses_frozen_copy(model):
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        model.add_sequence(snapshots(rng, 5), float(rng.normal()))
+    history = snapshots(rng, 5)
+
+    assert model.predict(history) is None
+    model.train_model(epochs=1, batch_size=8)
+    before = model.predict(history)
+    assert before is not None
+
+    # Further training mutates self.model only, never the served copy
+    served = model.inference_model
+    with torch.no_grad():
+        for param in model.model.parameters():
+            param.add_(1.0)
+    assert model.inference_model is served
+    assert model.predict(history) == pytest.approx(before)
+    assert not any(p.requires_grad for p in served.parameters())
+
+
+def test_poll_weights_swaps_in_published_version(model):
+    rng = np.random.default_rng(1)
+    history = snapshots(rng, 5)
+    assert not model.poll_weights()
+
+    _publish_weights(model.model.state_dict(), model.weights_dir, version=1)
+    model.sequence_buffer.publish(1, train_loss=0.2, mae=0.1, direction_accuracy=60.0)
+
+    # The first poll only starts the build, off the predict path
+    assert not model.poll_weights()
+    assert model.inference_fn is None
+    model._builder.join()
+
+    assert model.poll_weights()
+    assert model.weights_version == 1
+    assert model.mae == pytest.approx(0.1)
+    assert model.predict(history) is not None
+    assert not model.poll_weights()
+
+    _publish_weights(model.model.state_dict(), model.weights_dir, version=2)
+    model.sequence_buffer.publish(2, train_loss=0.1, mae=0.05, direction_accuracy=70.0)
+    assert model.poll_weights(wait=True)
+    assert model.weights_version == 2
+
+
+@pytest.mark.parametrize("backend", ["eager", "torchscript"])
+def test_predict_batch_matches_single_predictions(tmp_path, backend):
+    model = LookaheadTransformer(
+        sequence_length=5, hidden_dim=16, num_layers=1, num_heads=2,
+        buffer_size=8, weights_dir=str(tmp_path), inference_backend=backend,
+    )
+    try:
+        model._swap_inference_model(model.model.state_dict())
+        rng = np.random.default_rng(2)
+        histories = {f"S{i}": snapshots(rng, 8) for i in range(20)}
+        histories["SHORT"] = snapshots(rng, 3)
+
+        batch = model.predict_batch(histories)
+
+        assert batch["SHORT"] is None
+        for symbol, history in histories.items():
+            if symbol != "SHORT":
+                assert batch[symbol] == pytest.approx(model.predict(history), abs=1e-5)
+        assert model.predictions_count == 40
+
+        # Same outputs as the eager model the backend was built from
+        X = np.stack([
+            [[snap.get(key, default) for key, default in FEATURE_DEFAULTS] for snap in history[-5:]]
+            for symbol, history in histories.items() if symbol != "SHORT"
+        ]).astype(np.float32)
+        with torch.inference_mode():
+            eager = model.model.eval()(torch.from_numpy(X))[:, 0].numpy()
+        np.testing.assert_allclose(
+            [batch[symbol] for symbol in histories if symbol != "SHORT"], eager, atol=1e-5
+        )
+    finally:
+        model.close()
+
+
+def test_unknown_inference_backend_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LookaheadTransformer(weights_dir=str(tmp_path), inference_backend="tensorrt")
+
+
+def test_unclosed_model_releases_ring_and_temp_dir():
+    model = LookaheadTransformer(sequence_length=5, hidden_dim=16, num_layers=1, num_heads=2, buffer_size=8)
+    ring_name, weights_dir = model.sequence_buffer.name, model.weights_dir
+    assert os.path.isdir(weights_dir)
+
+    del model
+    gc.collect()
+
+    assert not os.path.exists(weights_dir)
+    with pytest.raises(FileNotFoundError):
+        SharedSequenceRing(8, 5, 10, name=ring_name)
+
+
+def test_caller_weights_dir_is_kept(tmp_path):
+    model = LookaheadTransformer(buffer_size=8, weights_dir=str(tmp_path))
+    model.close()
+    assert tmp_path.is_dir()
+
+
+def test_disabled_from_dict_allocates_nothing():
+    model = LookaheadTransformer.from_dict({'enabled': False})
+
+    assert not model.enabled
+    assert not hasattr(model, "sequence_buffer")
+    assert model.predict([{}] * 20) is None
+    assert model.get_stats()['sequences'] == 0
+    model.close()
@@ -0,0 +1,71 @@
+"""Tests for the shared-memory training sequence ring."""
+
+import gc
+
+import numpy as np
+import pytest
+
+from models.sequence_ring import SharedSequenceRing
+
+
+@pytest.fixture
+def ring():
+    ring = SharedSequenceRing(capacity=4, seq_len=3, dim=2)
+    yield ring
+    ring.close()
+
+
+def sequence(value: float) -> np.ndarray:
+    return np.full((3, 2), value, dtype=np.float32)
+
+
+def test_snapshot_returns_sequences_oldest_first(ring):
+    for i in range(3):
+        ring.append(sequence(i), target=i * 10)
+
+    X, y = ring.snapshot()
+
+    assert X.shape == (3, 3, 2)
+    np.testing.assert_array_equal(X[:, 0, 0], [0, 1, 2])
+    np.testing.assert_array_equal(y, [0, 10, 20])
+    assert len(ring) == 3
+
+
+def test_wraparound_keeps_newest_sequences(ring):
+    for i in range(7):
+        ring.append(sequence(i), target=i)
+
+    X, y = ring.snapshot()
+
+    # One slot is held back as the next write target
+    np.testing.assert_array_equal(y, [4, 5, 6])
+    np.testing.assert_array_equal(X[:, -1, -1], [4, 5, 6])
+    assert ring.count == 7
+    assert len(ring) == 4
+
+
+def test_attached_reader_sees_writes_and_published_weights(ring):
+    reader = SharedSequenceRing(4, 3, 2, name=ring.name)
+    try:
+        ring.append(sequence(1.5), target=0.25)
+        X, y = reader.snapshot()
+        np.testing.assert_array_equal(X, sequence(1.5)[None])
+        np.testing.assert_array_equal(y, [0.25])
+
+        assert ring.weights_version == 0
+        reader.publish(version=3, train_loss=0.5, mae=0.1, direction_accuracy=55.0)
+        assert ring.weights_version == 3
+        assert ring.metrics() == (0.5, 0.1, 55.0)
+    finally:
+        reader.close()
+
+
+def test_unclosed_ring_is_unlinked_when_collected():
+    ring = SharedSequenceRing(capacity=4, seq_len=3, dim=2)
+    name = ring.name
+
+    del ring
+    gc.collect()
+
+    with pytest.raises(FileNotFoundError):
+        SharedSequenceRing(capacity=4, seq_len=3, dim=2, name=name)
@@ -0,0 +1,189 @@
+"""Tests for options chain deltas and HedgeEngineV3's incremental (per-strike aggregate) mode."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+from engines.hedge.hedge_engine_v3 import HedgeEngineV3
+from engines.inputs.options_chain_adapter import SnapshotDeltaAdapter
+
+CONFIG = {
+    # Scaled to the synthetic chain so the dealer sign and regimes engage
+    "gamma_sign_threshold": 500.0,
+    "gamma_squeeze_threshold": 5e3,
+    "gamma_pin_threshold": 1e3,
+    "vanna_flow_threshold": 200.0,
+    "vanna_high_threshold": 2e3,
+    "charm_high_threshold": 200.0,
+    "charm_decay_threshold": 50.0,
+    "pin_oi_threshold": 8_000,
+}
+
+
+class ChainAdapter:
+    """Serves whatever chain the test last set."""
+
+    def __init__(self, chain: pl.DataFrame):
+        self.chain = chain
+
+    def fetch_chain(self, symbol: str, now: datetime) -> pl.DataFrame:
+        return self.chain
+
+
+def make_chain(rng: np.random.Generator, spot: float = 100.0, types=("C", "P")) -> pl.DataFrame:
+    strikes = np.arange(80.0, 121.0)
+    expiries = ["2025-01-10", "2025-01-17", "2025-02-21"]
+    rows = [(k, e, t) for k in strikes for e in expiries for t in types]
+    n = len(rows)
+    return pl.DataFrame({
+        "symbol": ["SPY"] * n,
+        "strike": [r[0] for r in rows],
+        "expiry": [r[1] for r in rows],
+        "option_type": [r[2] for r in rows],
+        "gamma": rng.uniform(0.0, 0.05, n),
+        "vanna": rng.normal(0.0, 0.02, n),
+        "charm": rng.normal(0.0, 0.01, n),
+        "open_interest": rng.integers(0, 10_000, n),
+        "days_to_expiry": rng.choice([3.0, 10.0, 45.0], n),
+        "underlying_price": [spot] * n,
+        "vix": [18.0] * n,
+        "vol_of_vol": [0.6] * n,
+    })
+
+
+def tick(chain: pl.DataFrame, rng: np.random.Generator, share: float = 0.02, spot_move: float = 0.0) -> pl.DataFrame:
+    """Change ``share`` of the contracts and move spot."""
+    changed = pl.Series(rng.random(chain.height) < share)
+    n = chain.height
+    return chain.with_columns(
+        pl.when(changed).then(pl.Series(rng.uniform(0.0, 0.05, n))).otherwise(pl.col("gamma")).alias("gamma"),
+        pl.when(changed).then(pl.Series(rng.integers(0, 10_000, n))).otherwise(pl.col("open_interest")).alias("open_interest"),
+        (pl.col("underlying_price") + spot_move).alias("underlying_price"),
+    )
+
+
+def assert_same_output(actual, expected):
+    assert actual.regime == expected.regime
+    assert actual.confidence == pytest.approx(expected.confidence, rel=1e-9)
+    stability = float(expected.metadata["regime_stability"])
+    assert float(actual.metadata.pop("regime_stability")) == pytest.approx(stability, rel=1e-9)
+    assert actual.metadata == {k: v for k, v in expected.metadata.items() if k != "regime_stability"}
+    assert actual.features.keys() == expected.features.keys()
+    for name, value in expected.features.items():
+        assert actual.features[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+@pytest.mark.parametrize("types", [("C", "P"), ("call", "put")])
+def test_incremental_matches_full_recompute(types):
+    rng = np.random.default_rng(3)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    source = ChainAdapter(make_chain(rng, types=types))
+    full = HedgeEngineV3(source, CONFIG)
+    incremental = HedgeEngineV3(SnapshotDeltaAdapter(source), CONFIG)
+
+    assert not full.incremental and incremental.incremental
+    signs = set()
+    for i in range(40):
+        if i:
+            source.chain = tick(source.chain, rng, spot_move=float(rng.normal(0.0, 1.5)))
+        if i == 10:
+            # Delist the far strikes, list a new one
+            listed = source.chain.filter(pl.col("strike") != 80.0)
+            source.chain = pl.concat([listed, make_chain(rng, types=types).filter(pl.col("strike") == 120.0)
+                                      .with_columns(pl.lit(121.0).alias("strike"),
+                                                    pl.lit(source.chain["underlying_price"][0]).alias("underlying_price"))])
+        now += timedelta(minutes=1)
+
+        expected = full.run("SPY", now)
+        assert_same_output(incremental.run("SPY", now), expected)
+        signs.add(expected.features["dealer_gamma_sign"])
+
+    # Dealer sign only counts "C"/"P" rows
+    assert any(signs) == (types[0] == "C")
+
+
+def test_delta_holds_only_changed_contracts():
+    rng = np.random.default_rng(5)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    source = ChainAdapter(make_chain(rng))
+    adapter = SnapshotDeltaAdapter(source)
+
+    assert adapter.fetch_chain_delta("SPY", now).snapshot
+
+    # A spot move alone changes no contract
+    source.chain = tick(source.chain, rng, share=0.0, spot_move=1.0)
+    delta = adapter.fetch_chain_delta("SPY", now)
+    assert not delta.snapshot and len(delta) == 0
+    assert delta.market["underlying_price"] == 101.0
+
+    source.chain = tick(source.chain, rng, share=0.1).filter(pl.col("strike") != 90.0)
+    delta = adapter.fetch_chain_delta("SPY", now)
+    assert delta.removed.height == 6
+    assert 0 < delta.upserts.height < source.chain.height
+    assert delta.removed.columns == list(delta.key)
+
+    assert adapter.fetch_chain_delta("SPY", now, full=True).snapshot
+
+
+def test_incremental_degraded_inputs():
+    rng = np.random.default_rng(7)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    source = ChainAdapter(make_chain(rng).clear())
+    engine = HedgeEngineV3(SnapshotDeltaAdapter(source), CONFIG)
+
+    assert engine.run("SPY", now).metadata["degraded_reason"] == "no_data"
+
+    source.chain = make_chain(rng).drop("underlying_price")
+    assert engine.run("SPY", now).metadata["degraded_reason"] == "missing_underlying_price"
+
+    source.chain = make_chain(rng)
+    assert engine.run("SPY", now).regime != "degraded"
+
+
+def test_rebuild_matches_running_sums():
+    rng = np.random.default_rng(9)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    source = ChainAdapter(make_chain(rng))
+    engine = HedgeEngineV3(SnapshotDeltaAdapter(source), CONFIG)
+    engine.run("SPY", now)
+    for _ in range(20):
+        source.chain = tick(source.chain, rng, share=0.2)
+        engine.run("SPY", now)
+
+    aggregates = engine.aggregates["SPY"]
+    running = {name: aggregates.total(name) for name in ("gamma_oi", "vanna_oi", "oi", "oi_sq")}
+    weighted = aggregates.weighted_split("gamma_oi", 100.0, 0.05)
+    aggregates.rebuild()
+
+    for name, value in running.items():
+        assert value == pytest.approx(aggregates.total(name), rel=1e-12)
+    assert weighted == pytest.approx(aggregates.weighted_split("gamma_oi", 100.0, 0.05), rel=1e-12)
+    assert aggregates.total("oi") == source.chain["open_interest"].sum()
+
+
+@pytest.mark.parametrize("unkeyed", ["no_key_columns", "duplicate_keys"])
+def test_unkeyed_chains_fall_back_to_full_recompute(unkeyed):
+    rng = np.random.default_rng(11)
+    now = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    chain = make_chain(rng)
+    source = ChainAdapter(chain)
+    full = HedgeEngineV3(source, CONFIG)
+    incremental = HedgeEngineV3(SnapshotDeltaAdapter(source), CONFIG)
+
+    for i in range(5):
+        if i == 2 or unkeyed == "no_key_columns":
+            # Keyed at first, then the chain stops being keyable mid-stream
+            source.chain = (
+                chain.drop("expiry", "option_type") if unkeyed == "no_key_columns"
+                else pl.concat([chain, chain.head(30).with_columns(pl.col("open_interest") + 500)])
+            )
+        now += timedelta(minutes=1)
+        expected = full.run("SPY", now)
+        actual = incremental.run("SPY", now)
+
+        assert actual.regime != "degraded"
+        assert_same_output(actual, expected)
+        chain = tick(chain, rng, share=0.1, spot_move=0.5)
+    assert "SPY" not in incremental.aggregates
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+"""Tests for the shared liquidity bar-statistics kernel."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+import engines.liquidity.liquidity_engine_v1 as liquidity_module
+from engines.inputs.stub_adapters import StaticMarketDataAdapter
+from engines.liquidity.liquidity_engine_v1 import LiquidityEngineV1
+from engines.liquidity.processors import (
+    BarStatistics,
+    ImpactProcessor,
+    MicrostructureProcessor,
+    OrderFlowProcessor,
+    StructureProcessor,
+    VolatilityLiquidityProcessor,
+    VolumeProcessor,
+    WyckoffLiquidityProcessor,
+)
+
+
+@pytest.fixture
+def bars() -> pl.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 60)))
+    spread = np.abs(rng.normal(0, 0.2, 60)) + 0.01
+    return pl.DataFrame({
+        "open": close,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 20_000, 60),
+    })
+
+
+def test_statistics_match_polars(bars):
+    stats = BarStatistics(bars)
+
+    assert stats.mean("volume", 20) == pytest.approx(bars["volume"].tail(20).mean())
+    assert stats.std("close", 20) == pytest.approx(bars["close"].tail(20).std())
+    assert stats.mean("volume", 10, head=True) == pytest.approx(bars["volume"].head(10).mean())
+    assert stats.mean("range", 10) == pytest.approx((bars["high"] - bars["low"]).tail(10).mean())
+    assert stats.max("high") == pytest.approx(bars["high"].max())
+    assert stats.last("close", 1) == pytest.approx(bars["close"][-2])
+    # The leading diff/return is null in Polars and skipped by reductions
+    assert stats.mean("close_diff") == pytest.approx(bars["close"].diff().mean())
+    assert stats.mean("returns", 60) == pytest.approx(bars["close"].pct_change().mean())
+
+
+def test_nulls_skipped_like_polars(bars):
+    with_nulls = bars.with_columns(
+        pl.when(pl.int_range(pl.len()) == 55).then(None).otherwise(pl.col("volume")).alias("volume")
+    )
+    stats = BarStatistics(with_nulls)
+
+    assert stats.mean("volume", 10) == pytest.approx(with_nulls["volume"].tail(10).mean())
+    assert stats.sum("volume") == pytest.approx(with_nulls["volume"].sum())
+
+
+def test_window_statistics_cached(bars):
+    stats = BarStatistics(bars)
+
+    stats.mean("volume", 10)
+    stats.mean("volume", 10)
+    stats.mean("volume", 20)
+
+    assert len(stats._cache) == 2
+    # Columns are zero-copy views of the frame
+    assert not stats.columns["close"].flags.writeable
+
+
+@pytest.mark.parametrize("processor", [
+    VolumeProcessor(),
+    OrderFlowProcessor(),
+    MicrostructureProcessor(),
+    ImpactProcessor(),
+    StructureProcessor(),
+    WyckoffLiquidityProcessor(),
+    VolatilityLiquidityProcessor(),
+])
+def test_shared_statistics_give_same_result(bars, processor):
+    shared = BarStatistics(bars)
+
+    assert processor.process(bars, {}, shared) == processor.process(bars, {})
+
+
+def test_engine_builds_statistics_once_per_run(monkeypatch):
+    built = []
+
+    class CountingStatistics(BarStatistics):
+        def __init__(self, data):
+            built.append(data.height)
+            super().__init__(data)
+
+    monkeypatch.setattr(liquidity_module, "BarStatistics", CountingStatistics)
+    engine = LiquidityEngineV1(StaticMarketDataAdapter(), {})
+
+    output = engine.run("SPY", datetime.now(timezone.utc))
+
+    assert built == [100]
+    assert output.regime != "degraded"
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+"""Tests for LiquidityEngineV1.run_history (one feature row per bar) and run_universe."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+from engines.liquidity.liquidity_engine_v1 import LiquidityEngineV1
+from engines.liquidity.processors import BarStatistics
+from ml.features.builder import FeatureBuilder, FeatureConfig
+
+
+class SlicingAdapter:
+    """Serves the bars of one frame up to ``now``, like a historical fetch."""
+
+    def __init__(self, frame: pl.DataFrame):
+        self.frame = frame
+
+    def fetch_ohlcv(self, symbol: str, lookback: int, now: datetime) -> pl.DataFrame:
+        return self.frame.filter(pl.col("timestamp") <= now).tail(lookback)
+
+
+@pytest.fixture
+def bars() -> pl.DataFrame:
+    rng = np.random.default_rng(5)
+    n = 160
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    spread = np.abs(rng.normal(0, 0.2, n)) + 0.01
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    return pl.DataFrame({
+        "timestamp": [start + timedelta(minutes=i) for i in range(n)],
+        "open": np.roll(close, 1),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 50_000, n).astype(float),
+    })
+
+
+def assert_rows_match_run(engine: LiquidityEngineV1, bars: pl.DataFrame, history: pl.DataFrame):
+    for timestamp, row in zip(bars["timestamp"], history.iter_rows(named=True)):
+        output = engine.run("SPY", timestamp)
+
+        assert row["liquidity_regime"] == output.regime
+        assert row["confidence"] == pytest.approx(output.confidence)
+        for name, value in output.features.items():
+            assert row[name] == pytest.approx(value, rel=1e-9), (timestamp, name)
+        if output.regime != "degraded":
+            assert row["wyckoff_phase"] == output.metadata["wyckoff_phase"]
+            assert row["rvol"] == pytest.approx(float(output.metadata["rvol"]))
+
+
+@pytest.mark.parametrize("lookback", [100, 20])
+def test_history_matches_per_bar_run(bars, lookback):
+    engine = LiquidityEngineV1(SlicingAdapter(bars), {"lookback_bars": lookback})
+
+    history = engine.run_history(bars)
+
+    assert history.height == bars.height
+    assert history["timestamp"].to_list() == bars["timestamp"].to_list()
+    assert_rows_match_run(engine, bars, history)
+
+
+def test_history_handles_nulls_and_zero_volume(bars):
+    index = pl.int_range(pl.len())
+    bars = bars.with_columns(
+        pl.when(index < 12).then(0.0)
+        .when(index.is_in([60, 61])).then(None)
+        .otherwise(pl.col("volume")).alias("volume"),
+        pl.when(index == 90).then(None).otherwise(pl.col("close")).alias("close"),
+    )
+    engine = LiquidityEngineV1(SlicingAdapter(bars), {})
+
+    assert_rows_match_run(engine, bars, engine.run_history(bars))
+
+
+def test_degraded_bars_keep_degraded_values(bars):
+    # With 5-bar windows the impact slope always sees the window's leading null
+    engine = LiquidityEngineV1(SlicingAdapter(bars), {"lookback_bars": 5})
+
+    history = engine.run_history(bars)
+
+    degraded = history.filter(pl.col("liquidity_regime") == "degraded")
+    assert degraded.height == bars.height - 4
+    assert degraded["liquidity_score"].unique().to_list() == [0.5]
+    assert degraded["confidence"].unique().to_list() == [0.0]
+    assert degraded["volume_strength"].null_count() == degraded.height
+
+
+def test_empty_frame(bars):
+    engine = LiquidityEngineV1(SlicingAdapter(bars), {})
+
+    assert engine.run_history(bars.clear()).is_empty()
+
+
+def test_feature_builder_accepts_history_frame(bars):
+    engine = LiquidityEngineV1(SlicingAdapter(bars), {})
+    history = engine.run_history(bars)
+    builder = FeatureBuilder()
+
+    # Per-bar LiquidityEngineOutput for the last bars, fused the way run() does
+    outputs = []
+    for end in range(bars.height - 5, bars.height):
+        window = bars.slice(max(0, end - 99), min(end + 1, 100))
+        stats = BarStatistics(window)
+        outputs.append(engine._fuse_results(*(
+            processor.process(window, engine.config, stats)
+            for processor in (
+                engine.volume_proc, engine.orderflow_proc, engine.micro_proc,
+                engine.impact_proc, engine.darkpool_proc, engine.structure_proc,
+                engine.wyckoff_proc, engine.vol_liq_proc,
+            )
+        )))
+
+    from_frame = builder._extract_liquidity_features(history.tail(5))
+    from_outputs = builder._extract_liquidity_features(outputs)
+
+    assert from_frame.columns == from_outputs.columns
+    for column in from_frame.columns:
+        assert from_frame[column].to_list() == pytest.approx(from_outputs[column].to_list())
+
+    features = FeatureBuilder(FeatureConfig(normalize_features=False)).build_feature_frame(
+        bars, liquidity_outputs=history
+    )
+    assert features.height == bars.height
+    assert "liq_score" in features.columns
+
+
+class UniverseAdapter:
+    """Serves each symbol's bars of a stacked frame, like a live fetch."""
+
+    def __init__(self, frame: pl.DataFrame):
+        self.frame = frame
+
+    def fetch_ohlcv(self, symbol: str, lookback: int, now: datetime) -> pl.DataFrame:
+        return self.frame.filter(pl.col("symbol") == symbol).drop("symbol").tail(lookback)
+
+
+@pytest.fixture
+def universe(bars) -> pl.DataFrame:
+    # Full, warm-up length and single-bar series, interleaved by timestamp
+    rng = np.random.default_rng(11)
+    frames = []
+    for symbol, length in (("AAA", 160), ("BBB", 40), ("CCC", 1), ("DDD", 120)):
+        scale = rng.uniform(0.5, 2.0)
+        frames.append(bars.tail(length).with_columns(
+            pl.lit(symbol).alias("symbol"),
+            *(pl.col(name) * scale for name in ("open", "high", "low", "close")),
+        ))
+    return pl.concat(frames).sort("timestamp")
+
+
+@pytest.mark.parametrize("lookback", [100, 20])
+def test_universe_matches_per_symbol_run(universe, lookback):
+    engine = LiquidityEngineV1(UniverseAdapter(universe), {"lookback_bars": lookback})
+    now = universe["timestamp"].max()
+
+    outputs = engine.run_universe(universe, now)
+    many = engine.run_many(["AAA", "BBB", "CCC", "DDD", "EEE"], now)
+
+    assert sorted(outputs) == ["AAA", "BBB", "CCC", "DDD"]
+    assert many["EEE"].metadata["degraded_reason"] == "no_data"
+    for symbol, output in outputs.items():
+        expected = engine.run(symbol, now)
+        for actual in (output, many[symbol]):
+            assert actual.regime == expected.regime
+            assert actual.confidence == pytest.approx(expected.confidence)
+            assert actual.features.keys() == expected.features.keys()
+            for name, value in expected.features.items():
+                assert actual.features[name] == pytest.approx(value, rel=1e-9), (symbol, name)
+            assert actual.metadata.keys() == expected.metadata.keys()
+
+
+def test_universe_empty_frame(universe):
+    engine = LiquidityEngineV1(UniverseAdapter(universe), {})
+
+    assert engine.run_universe(universe.clear(), datetime.now(timezone.utc)) == {}
@@ -0,0 +1,180 @@
+"""Tests for SentimentEngineV1.process_history (one envelope row per bar) and process_universe."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+from engines.sentiment.models import SentimentEngineConfig
+from engines.sentiment.sentiment_engine_v1_full import SentimentEngineV1
+
+
+class SlicingAdapter:
+    """Serves the bars of one frame up to ``now``, like a historical fetch."""
+
+    def __init__(self, frame: pl.DataFrame):
+        self.frame = frame
+
+    def fetch_ohlcv(self, symbol: str, lookback: int, now: datetime) -> pl.DataFrame:
+        return self.frame.filter(pl.col("timestamp") <= now).tail(lookback)
+
+
+@pytest.fixture
+def bars() -> pl.DataFrame:
+    rng = np.random.default_rng(5)
+    n = 160
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.5, n)) + 0.01
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    return pl.DataFrame({
+        "timestamp": [start + timedelta(minutes=i) for i in range(n)],
+        "open": np.roll(close, 1),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 50_000, n),
+    })
+
+
+@pytest.fixture
+def short_config() -> SentimentEngineConfig:
+    # Short enough that the breadth processor and Keltner's width history engage
+    config = SentimentEngineConfig()
+    config.wyckoff.lookback_periods = 50
+    config.breadth.ma_periods = [10, 40]
+    config.volatility.kc_period = 10
+    config.oscillators.stoch_d_period = 5
+    return config
+
+
+def assert_rows_match_process(engine: SentimentEngineV1, bars: pl.DataFrame, history: pl.DataFrame, **inputs):
+    assert history.height == bars.height
+    assert history["timestamp"].to_list() == bars["timestamp"].to_list()
+    for timestamp, row in zip(bars["timestamp"], history.iter_rows(named=True)):
+        envelope = engine.process("SPY", timestamp, **inputs)
+
+        assert row["bias"] == envelope.bias, timestamp
+        assert row["strength"] == pytest.approx(envelope.strength, rel=1e-9)
+        assert row["energy"] == pytest.approx(envelope.energy, rel=1e-9)
+        assert row["confidence"] == pytest.approx(envelope.confidence, rel=1e-9)
+        assert row["wyckoff_phase"] == envelope.wyckoff_phase
+        assert row["liquidity_regime"] == envelope.liquidity_regime
+        assert row["volatility_regime"] == envelope.volatility_regime
+        assert row["flow_regime"] == envelope.flow_regime
+        for driver in ("wyckoff", "oscillators", "volatility", "flow", "breadth", "energy"):
+            expected = envelope.drivers.get(driver)
+            if expected is None:
+                assert row[f"driver_{driver}"] is None, (timestamp, driver)
+            else:
+                assert row[f"driver_{driver}"] == pytest.approx(expected, rel=1e-9), (timestamp, driver)
+
+
+def test_history_matches_per_bar_process(bars):
+    engine = SentimentEngineV1(SlicingAdapter(bars))
+
+    assert_rows_match_process(engine, bars, engine.process_history(bars))
+
+
+def test_history_matches_with_darkpool_and_breadth(bars, short_config):
+    engine = SentimentEngineV1(SlicingAdapter(bars), short_config)
+    inputs = {
+        "darkpool_data": {"dix": 0.47, "gex": -2.0},
+        "breadth_data": {"advances": 300, "declines": 100},
+    }
+
+    history = engine.process_history(bars, **inputs)
+
+    assert history["liquidity_regime"].null_count() == 0
+    assert_rows_match_process(engine, bars, history, **inputs)
+
+
+def test_history_matches_on_flat_prices_gaps_and_nulls(bars, short_config):
+    index = pl.int_range(pl.len())
+    bars = bars.with_columns(
+        pl.when(index < 40).then(100.0).otherwise(pl.col(name)).alias(name)
+        for name in ("open", "high", "low", "close")
+    ).with_columns(
+        pl.when(index.is_between(100, 130)).then(0).otherwise(pl.col("volume")).alias("volume"),
+        pl.when(index == 120).then(None).otherwise(pl.col("close")).alias("close"),
+    )
+
+    for config in (None, short_config):
+        engine = SentimentEngineV1(SlicingAdapter(bars), config)
+        history = engine.process_history(bars)
+
+        # A null close drops the processors it reaches from the fusion
+        assert history["driver_oscillators"].null_count() > 0
+        assert_rows_match_process(engine, bars, history)
+
+
+def test_series_shorter_than_lookback(bars):
+    bars = bars.head(12)
+    engine = SentimentEngineV1(SlicingAdapter(bars))
+
+    assert_rows_match_process(engine, bars, engine.process_history(bars))
+
+
+def test_empty_frame(bars):
+    engine = SentimentEngineV1(SlicingAdapter(bars))
+
+    assert engine.process_history(bars.clear()).is_empty()
+
+
+class UniverseAdapter:
+    """Serves each symbol's bars of a stacked frame, like a live fetch."""
+
+    def __init__(self, frame: pl.DataFrame):
+        self.frame = frame
+
+    def fetch_ohlcv(self, symbol: str, lookback: int, now: datetime) -> pl.DataFrame:
+        return self.frame.filter(pl.col("symbol") == symbol).drop("symbol").tail(lookback)
+
+
+@pytest.fixture
+def universe(bars) -> pl.DataFrame:
+    # Full, exactly-lookback, warm-up length and flat series, interleaved by timestamp
+    frames = [
+        bars.tail(length).with_columns(pl.lit(symbol).alias("symbol"))
+        for symbol, length in (("AAA", 160), ("BBB", 30), ("CCC", 12), ("DDD", 1))
+    ]
+    frames.append(bars.tail(60).with_columns(
+        pl.lit("EEE").alias("symbol"),
+        *(pl.lit(50.0).alias(name) for name in ("open", "high", "low", "close")),
+    ))
+    return pl.concat(frames).sort("timestamp")
+
+
+def test_universe_matches_per_symbol_process(universe, short_config):
+    inputs = {
+        "darkpool_data": {"dix": 0.47, "gex": -2.0},
+        "breadth_data": {"advances": 300, "declines": 100},
+    }
+    now = universe["timestamp"].max()
+
+    for config, kwargs in ((None, {}), (short_config, inputs)):
+        engine = SentimentEngineV1(UniverseAdapter(universe), config)
+        envelopes = engine.process_universe(universe, **kwargs)
+        many = engine.process_many(["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"], now, **kwargs)
+
+        assert sorted(envelopes) == ["AAA", "BBB", "CCC", "DDD", "EEE"]
+        assert many["FFF"].drivers == {"no_data": 0.0}
+        for symbol, envelope in envelopes.items():
+            expected = engine.process(symbol, now, **kwargs)
+            for actual in (envelope, many[symbol]):
+                assert actual.bias == expected.bias, symbol
+                assert actual.strength == pytest.approx(expected.strength, rel=1e-9)
+                assert actual.energy == pytest.approx(expected.energy, rel=1e-9)
+                assert actual.confidence == pytest.approx(expected.confidence, rel=1e-9)
+                assert list(actual.drivers) == list(expected.drivers), symbol
+                assert list(actual.drivers.values()) == pytest.approx(list(expected.drivers.values()), rel=1e-9)
+                assert actual.wyckoff_phase == expected.wyckoff_phase
+                assert actual.liquidity_regime == expected.liquidity_regime
+                assert actual.volatility_regime == expected.volatility_regime
+                assert actual.flow_regime == expected.flow_regime
+
+
+def test_universe_empty_frame(universe):
+    engine = SentimentEngineV1(UniverseAdapter(universe))
+
+    assert engine.process_universe(universe.clear()) == {}